@@ -0,0 +1,83 @@
+"""Micro-benchmark for the workflow expression evaluator.
+
+Compares evaluating templates through the compiled-expression cache
+against compiling them from scratch on every call, i.e. re-parsing each
+template per evaluation. Run from the repository root:
+
+    python benchmarks/bench_expressions.py [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from specify_cli.workflows import expressions  # noqa: E402
+from specify_cli.workflows.base import StepContext  # noqa: E402
+
+CASES = {
+    "loop condition": (
+        "{{ steps.review.output.choice == 'edit' and "
+        "steps.review.output.attempts < 5 or inputs.force }}"
+    ),
+    "multi-expression interpolation": (
+        "Implement {{ item.file }} for {{ inputs.spec }} "
+        "({{ steps.tasks.output.task_list | map('file') | join(', ') }}) "
+        "run={{ context.run_id }}"
+    ),
+    "filter chain": "{{ steps.plan.output.summary | default('none') }}",
+}
+
+
+def _context() -> StepContext:
+    return StepContext(
+        inputs={"spec": "auth", "force": False},
+        steps={
+            "review": {"output": {"choice": "edit", "attempts": 2}},
+            "tasks": {"output": {"task_list": [{"file": "a.md"}, {"file": "b.md"}]}},
+            "plan": {"output": {"summary": ""}},
+        },
+        item={"file": "a.md"},
+        run_id="bench",
+    )
+
+
+def _uncached(template: str, context: StepContext) -> object:
+    """Evaluate *template* with every compile cache cleared first."""
+    expressions.compile_template.cache_clear()
+    expressions._compile_simple_expression.cache_clear()
+    return expressions.evaluate_expression(template, context)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    context = _context()
+    print(f"{'case':<32} {'uncached':>12} {'cached':>12} {'speedup':>8}")
+    for name, template in CASES.items():
+        assert _uncached(template, context) == expressions.evaluate_expression(
+            template, context
+        )
+        uncached = timeit.timeit(
+            lambda: _uncached(template, context), number=args.iterations
+        )
+        cached = timeit.timeit(
+            lambda: expressions.evaluate_expression(template, context),
+            number=args.iterations,
+        )
+        per_call = 1e6 / args.iterations
+        print(
+            f"{name:<32} {uncached * per_call:>9.2f} µs {cached * per_call:>9.2f} µs"
+            f" {uncached / cached:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""Cold-start benchmark for the ``specify`` CLI, with a regression budget.
+
+Runs each case in fresh interpreters under ``python -X importtime`` and
+reports the median import time it adds over a bare interpreter, including
+modules imported lazily while the command runs, plus the slowest modules
+``import specify_cli`` pulls in. Exits with status 1 when the median for any
+case exceeds ``--budget-ms``, so it can gate CI. Run from the repository
+root:
+
+    python benchmarks/bench_startup.py [--runs N] [--budget-ms MS] [--top N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+_CLI = (
+    "import sys; from specify_cli import main; "
+    "sys.argv[0] = 'specify'; sys.argv[1:] = {args!r}\n"
+    "try:\n    main()\nexcept SystemExit:\n    pass"
+)
+
+CASES = {
+    "import specify_cli": "import specify_cli",
+    "specify --version": _CLI.format(args=["--version"]),
+    "specify feature --help": _CLI.format(args=["feature", "--help"]),
+}
+
+# ``import specify_cli`` took ~160 ms here once the command groups became
+# lazy (~625 ms before); the default leaves room for slower runners and for
+# typer's help rendering while still catching an eager import creeping back.
+DEFAULT_BUDGET_MS = 400.0
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Return module -> cumulative µs for the top-level imports in *stderr*.
+
+    Nested imports are folded into the cumulative time of the top-level
+    import that triggered them, so the values add up to the total.
+    """
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _importtime(code: str) -> str:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{result.stderr[-2000:]}")
+    return result.stderr
+
+
+def total_ms(code: str) -> float:
+    return sum(parse_importtime(_importtime(code)).values()) / 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=8, help="slowest modules to list")
+    args = parser.parse_args()
+
+    total_ms("import specify_cli")  # warm the bytecode cache
+    baseline = statistics.median(total_ms("pass") for _ in range(args.runs))
+    print(f"{'case':<26} {'median':>10} {'min':>10}   budget {args.budget_ms:.0f} ms")
+    over_budget = []
+    for name, code in CASES.items():
+        samples = [total_ms(code) - baseline for _ in range(args.runs)]
+        median = statistics.median(samples)
+        flag = "  OVER BUDGET" if median > args.budget_ms else ""
+        print(f"{name:<26} {median:>7.1f} ms {min(samples):>7.1f} ms{flag}")
+        if flag:
+            over_budget.append(name)
+
+    nested = []
+    for line in _importtime("import specify_cli").splitlines():
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and name.startswith("  "):
+            nested.append((int(cumulative), name.strip()))
+    print("\nslowest imports under `import specify_cli` (cumulative):")
+    for micros, module in sorted(nested, reverse=True)[: args.top]:
+        print(f"  {micros / 1000:>7.1f} ms  {module}")
+
+    if over_budget:
+        print(f"\nover budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
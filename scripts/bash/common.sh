@@ -118,7 +118,41 @@ _persist_feature_json() {
     fi
 }
 
+# Whether to hand work from these helpers to the `specify` CLI. Opt-in with
+# SPECKIT_NATIVE_CLI=1: starting the Python CLI costs more than the shell,
+# jq and git calls it replaces, so the shell implementations stay the default.
+_specify_cli_available() {
+    [ "${SPECKIT_NATIVE_CLI:-}" = "1" ] && command -v specify >/dev/null 2>&1
+}
+
+# Compute the feature context through `specify feature context`. Prints
+# get_feature_paths' assignments plus lines seeding the invoke separator cache,
+# and returns 0 or 1 (error already reported on stderr); returns 2 when not
+# enabled or the CLI is missing or too old, so the caller falls back.
+_feature_paths_native() {
+    _specify_cli_available || return 2
+    local script_dir="${BASH_SOURCE[0]%/*}"
+    [ "$script_dir" = "${BASH_SOURCE[0]}" ] && script_dir="."
+    local out status=0
+    out=$(specify feature context --shell --fallback-root "$script_dir/../../..") || status=$?
+    case "$status" in
+        0)
+            printf '%s\n' "$out"
+            # Expanded by the caller's eval, after REPO_ROOT/INVOKE_SEPARATOR are set.
+            printf '%s\n' '_SPECIFY_INVOKE_SEPARATOR_CACHE_REPO_ROOT="$REPO_ROOT"'
+            printf '%s\n' '_SPECIFY_INVOKE_SEPARATOR_CACHE_VALUE="$INVOKE_SEPARATOR"'
+            return 0
+            ;;
+        1) return 1 ;;
+        *) return 2 ;;
+    esac
+}
+
 get_feature_paths() {
+    local native_status=0
+    _feature_paths_native || native_status=$?
+    [ "$native_status" -eq 2 ] || return "$native_status"
+
     local repo_root=$(get_repo_root)
     local current_branch=$(get_current_branch)
 
@@ -276,6 +310,23 @@ json_escape() {
 check_file() { [[ -f "$1" ]] && echo "  ✓ $2" || echo "  ✗ $2"; }
 check_dir() { [[ -d "$1" && -n $(ls -A "$1" 2>/dev/null) ]] && echo "  ✓ $2" || echo "  ✗ $2"; }
 
+# Resolve through `specify resolve` (opt-in, see _specify_cli_available): one
+# process for the whole priority stack instead of a python3 call per registry
+# and manifest. Prints the result and returns 0 (found) or 1 (not found);
+# returns 2 when not enabled or the CLI is missing or too old, so callers fall
+# back to the shell lookup.
+_resolve_template_native() {
+    _specify_cli_available || return 2
+    local out status=0
+    # The trailing "x" keeps command substitution from eating final newlines.
+    out=$(specify resolve "$@" --project-only 2>/dev/null && printf x) || status=$?
+    case "$status" in
+        0) printf '%s' "${out%x}"; return 0 ;;
+        1) return 1 ;;
+        *) return 2 ;;
+    esac
+}
+
 # Resolve a template name to a file path using the priority stack:
 #   1. .specify/templates/overrides/
 #   2. .specify/presets/<preset-id>/templates/ (sorted by priority from .registry)
@@ -286,6 +337,10 @@ resolve_template() {
     local repo_root="$2"
     local base="$repo_root/.specify/templates"
 
+    local native_status=0
+    _resolve_template_native "$template_name" --root "$repo_root" || native_status=$?
+    [ "$native_status" -eq 2 ] || return "$native_status"
+
     # Priority 1: Project overrides
     local override="$base/overrides/${template_name}.md"
     [ -f "$override" ] && echo "$override" && return 0
@@ -370,6 +425,10 @@ resolve_template_content() {
     local repo_root="$2"
     local base="$repo_root/.specify/templates"
 
+    local native_status=0
+    _resolve_template_native "$template_name" --root "$repo_root" --content || native_status=$?
+    [ "$native_status" -eq 2 ] || return "$native_status"
+
     # Collect all layers (highest priority first)
     local -a layer_paths=()
     local -a layer_strategies=()
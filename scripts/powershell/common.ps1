@@ -100,7 +100,61 @@ function Save-FeatureJson {
     [System.IO.File]::WriteAllText($fjPath, $json, $utf8NoBom)
 }
 
+# Whether to hand work from these helpers to the `specify` CLI. Opt-in with
+# SPECKIT_NATIVE_CLI=1: starting the Python CLI costs more than the reads it
+# replaces, so the PowerShell implementations stay the default.
+function Test-SpecifyCli {
+    if ($env:SPECKIT_NATIVE_CLI -ne '1') { return $false }
+    return [bool](Get-Command specify -ErrorAction SilentlyContinue)
+}
+
+# Compute the feature context through `specify feature context`. Returns the
+# parsed context, exits 1 when the CLI reports an error (already written to
+# stderr), or returns $null when not enabled or the CLI is missing or too old
+# so the caller falls back.
+function Get-FeaturePathsNative {
+    if (-not (Test-SpecifyCli)) { return $null }
+
+    $fallbackRoot = Join-Path $PSScriptRoot '../../..'
+    try {
+        $output = & specify feature context --json --fallback-root $fallbackRoot
+    } catch {
+        return $null
+    }
+    $status = $LASTEXITCODE
+    $lines = @($output | ForEach-Object { "$_" })
+    if ($status -eq 1) { exit 1 }
+    if ($status -ne 0) { return $null }
+    try {
+        $context = ($lines -join "`n") | ConvertFrom-Json
+    } catch {
+        return $null
+    }
+
+    if ($null -eq $script:SpecKitInvokeSeparatorCache) {
+        $script:SpecKitInvokeSeparatorCache = @{}
+    }
+    $script:SpecKitInvokeSeparatorCache[$context.REPO_ROOT] = [string]$context.INVOKE_SEPARATOR
+    return $context
+}
+
 function Get-FeaturePathsEnv {
+    $native = Get-FeaturePathsNative
+    if ($native) {
+        return [PSCustomObject]@{
+            REPO_ROOT      = $native.REPO_ROOT
+            CURRENT_BRANCH = $native.CURRENT_BRANCH
+            FEATURE_DIR    = $native.FEATURE_DIR
+            FEATURE_SPEC   = $native.FEATURE_SPEC
+            IMPL_PLAN      = $native.IMPL_PLAN
+            TASKS          = $native.TASKS
+            RESEARCH       = $native.RESEARCH
+            DATA_MODEL     = $native.DATA_MODEL
+            QUICKSTART     = $native.QUICKSTART
+            CONTRACTS_DIR  = $native.CONTRACTS_DIR
+        }
+    }
+
     $repoRoot = Get-RepoRoot
     $currentBranch = Get-CurrentBranch
 
@@ -243,6 +297,36 @@ function Get-Python3Command {
     return $null
 }
 
+# Resolve through `specify resolve` (opt-in, see Test-SpecifyCli): one process
+# for the whole priority stack. Returns @{ Status = 0|1; Output = ... } when
+# the CLI answered (found / not found), or $null when not enabled or the CLI is
+# missing or too old so callers fall back to the PowerShell lookup.
+function Invoke-NativeResolve {
+    param(
+        [Parameter(Mandatory=$true)][string]$TemplateName,
+        [Parameter(Mandatory=$true)][string]$RepoRoot,
+        [switch]$Content
+    )
+
+    if (-not (Test-SpecifyCli)) { return $null }
+
+    $resolveArgs = @('resolve', $TemplateName, '--root', $RepoRoot, '--project-only')
+    if ($Content) { $resolveArgs += '--content' }
+    try {
+        $output = & specify @resolveArgs 2>$null | Out-String
+    } catch {
+        return $null
+    }
+    switch ($LASTEXITCODE) {
+        0 {
+            if (-not $Content) { $output = $output.Trim() }
+            return @{ Status = 0; Output = $output }
+        }
+        1 { return @{ Status = 1; Output = $null } }
+        default { return $null }
+    }
+}
+
 # Resolve a template name to a file path using the priority stack:
 #   1. .specify/templates/overrides/
 #   2. .specify/presets/<preset-id>/templates/ (sorted by priority from .registry)
@@ -254,6 +338,9 @@ function Resolve-Template {
         [Parameter(Mandatory=$true)][string]$RepoRoot
     )
 
+    $native = Invoke-NativeResolve -TemplateName $TemplateName -RepoRoot $RepoRoot
+    if ($native) { return $native.Output }
+
     $base = Join-Path $RepoRoot '.specify/templates'
 
     # Priority 1: Project overrides
@@ -320,6 +407,9 @@ function Resolve-TemplateContent {
         [Parameter(Mandatory=$true)][string]$RepoRoot
     )
 
+    $native = Invoke-NativeResolve -TemplateName $TemplateName -RepoRoot $RepoRoot -Content
+    if ($native) { return $native.Output }
+
     $base = Join-Path $RepoRoot '.specify/templates'
 
     # Collect all layers (highest priority first)
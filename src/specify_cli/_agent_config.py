@@ -1,7 +1,11 @@
 """Agent configuration constants derived from the integration registry."""
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Built on first access by ``__getattr__`` below.
+    AGENT_CONFIG: dict[str, dict[str, Any]]
 
 
 def _build_agent_config() -> dict[str, dict[str, Any]]:
@@ -13,8 +17,14 @@ def _build_agent_config() -> dict[str, dict[str, Any]]:
     return config
 
 
-AGENT_CONFIG: dict[str, dict[str, Any]] = _build_agent_config()
-
 DEFAULT_INIT_INTEGRATION = "copilot"
 
 SCRIPT_TYPE_CHOICES: dict[str, str] = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
+
+
+def __getattr__(name: str) -> Any:
+    # AGENT_CONFIG is built lazily: deriving it imports every integration.
+    if name != "AGENT_CONFIG":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = _build_agent_config()
+    return value
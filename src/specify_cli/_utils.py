@@ -8,7 +8,6 @@ import shutil
 import stat
 import subprocess
 import tempfile
-import yaml
 from pathlib import Path
 from typing import Any
 from ._console import console
@@ -24,6 +23,8 @@ def dump_frontmatter(data: dict[str, Any]) -> str:
     preserves Unicode descriptions and ``sort_keys=False`` keeps key order, so no
     call site can silently drop either.
     """
+    import yaml
+
     return yaml.safe_dump(data, sort_keys=False, allow_unicode=True).strip()
 
 
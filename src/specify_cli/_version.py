@@ -1427,3 +1427,8 @@ def self_upgrade(
         f"Upgraded specify-cli: {pre_upgrade_display} → {verified_display}",
         soft_wrap=True,
     )
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the ``self`` command group to the root Typer app."""
+    app.add_typer(self_app, name="self")
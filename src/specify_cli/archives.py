@@ -0,0 +1,122 @@
+"""Single-pass, bounded extraction of extension and preset ZIPs.
+
+:func:`extract_zip` validates each member name lexically and streams the
+member straight to its place under the destination directory. Names are
+rejected if they are absolute, carry a drive letter, or contain ``..``
+(or ``:`` on Windows). The destination is a fresh directory and nothing
+extracted is a symlink, so a lexically contained name cannot resolve
+outside it, and no ``realpath`` call is needed per member.
+
+Archives with more than ``MAX_ENTRIES`` members, or whose members add up
+to more than ``MAX_TOTAL_BYTES`` uncompressed, are rejected before anything
+is written. This guards against zip bombs; zipfile itself stops reading a
+member at its declared size, so a member cannot exceed it.
+
+:func:`staged_extraction` extracts into a hidden staging directory next to
+the install destination. The installers can then move the tree into place
+with one atomic rename instead of copying it a second time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import Iterator
+
+#: Most members an extension or preset ZIP may have.
+MAX_ENTRIES = 10_000
+
+#: Largest total uncompressed size of an extension or preset ZIP (256 MiB).
+MAX_TOTAL_BYTES = 256 * 1024 * 1024
+
+#: Name prefix of the directories :func:`staged_extraction` creates.
+STAGING_PREFIX = ".staging-"
+
+_COPY_BUFFER = 64 * 1024
+
+
+class ArchiveError(Exception):
+    """A ZIP archive is unsafe, too large, or unreadable."""
+
+
+def _member_parts(name: str) -> tuple[str, ...]:
+    """Return the path components of member *name*, rejecting unsafe names."""
+    normalized = name.replace("\\", "/")
+    if "\x00" in normalized:
+        raise ArchiveError(f"Unsafe path in ZIP archive: {name!r} (NUL byte)")
+    if PurePosixPath(normalized).is_absolute() or PureWindowsPath(normalized).drive:
+        raise ArchiveError(f"Unsafe path in ZIP archive: {name} (potential path traversal)")
+    parts = tuple(part for part in normalized.split("/") if part not in ("", "."))
+    if ".." in parts or (os.name == "nt" and any(":" in part for part in parts)):
+        raise ArchiveError(f"Unsafe path in ZIP archive: {name} (potential path traversal)")
+    return parts
+
+
+def extract_zip(
+    zip_path: Path,
+    dest: Path,
+    *,
+    max_entries: int = MAX_ENTRIES,
+    max_total_bytes: int = MAX_TOTAL_BYTES,
+) -> None:
+    """Extract *zip_path* into the existing directory *dest* in one pass.
+
+    Raises:
+        ArchiveError: If a member name is unsafe, the archive exceeds the
+            entry-count or size limits, or it is not a valid ZIP file
+    """
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            members = zf.infolist()
+            if len(members) > max_entries:
+                raise ArchiveError(
+                    f"ZIP archive has {len(members)} entries (limit {max_entries})"
+                )
+            total = sum(member.file_size for member in members)
+            if total > max_total_bytes:
+                raise ArchiveError(
+                    f"ZIP archive expands to {total} bytes (limit {max_total_bytes})"
+                )
+
+            created: set[tuple[str, ...]] = set()
+
+            def _make_dirs(parts: tuple[str, ...]) -> None:
+                if parts and parts not in created:
+                    dest.joinpath(*parts).mkdir(parents=True, exist_ok=True)
+                    for i in range(1, len(parts) + 1):
+                        created.add(parts[:i])
+
+            for member in members:
+                parts = _member_parts(member.filename)
+                if not parts:
+                    continue
+                if member.is_dir():
+                    _make_dirs(parts)
+                    continue
+                _make_dirs(parts[:-1])
+                with zf.open(member) as src, open(dest.joinpath(*parts), "wb") as out:
+                    shutil.copyfileobj(src, out, _COPY_BUFFER)
+    except zipfile.BadZipFile as exc:
+        raise ArchiveError(f"Invalid ZIP file {zip_path.name}: {exc}") from exc
+
+
+@contextlib.contextmanager
+def staged_extraction(zip_path: Path, parent: Path) -> Iterator[Path]:
+    """Extract *zip_path* into a hidden staging directory under *parent*.
+
+    Staging next to the install destination keeps both on one filesystem,
+    so the extracted tree (or a subdirectory of it) can be moved into
+    place with :func:`os.replace`. Whatever is left of the staging
+    directory is removed on exit.
+    """
+    parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=parent))
+    try:
+        extract_zip(zip_path, staging)
+        yield staging
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
@@ -6,9 +6,13 @@ import base64
 import json as _json
 import os
 import subprocess
+import time
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from . import token_cache
 from .base import AuthProvider
+from .token_cache import AccessToken
 
 if TYPE_CHECKING:
     from .config import AuthConfigEntry
@@ -43,17 +47,44 @@ class AzureDevOpsAuth(AuthProvider):
         )
 
     def resolve_token(self, entry: AuthConfigEntry) -> str | None:
-        """Resolve token, with special handling for azure-cli and azure-ad."""
+        """Resolve token, with special handling for azure-cli and azure-ad.
+
+        Tokens acquired for azure-cli and azure-ad are reused until shortly
+        before they expire (see :mod:`.token_cache`).
+        """
         if entry.auth == "azure-cli":
-            return self._acquire_via_az_cli()
+            return token_cache.get_token(entry, self._acquire_via_az_cli)
         if entry.auth == "azure-ad":
-            return self._acquire_via_client_credentials(entry)
+            return token_cache.get_token(
+                entry, lambda: self._acquire_via_client_credentials(entry)
+            )
         return super().resolve_token(entry)
 
     # -- Token acquisition ------------------------------------------------
 
     @staticmethod
-    def _acquire_via_az_cli() -> str | None:
+    def _az_cli_expiry(payload: dict) -> float | None:
+        """Return the expiry of an ``az account get-access-token`` payload.
+
+        Newer ``az`` releases report ``expires_on`` as a POSIX timestamp;
+        older ones only report ``expiresOn`` as a local date-time string.
+        """
+        expires_on = payload.get("expires_on")
+        if expires_on is not None:
+            try:
+                return float(expires_on)
+            except (TypeError, ValueError):
+                pass
+        expires_on = payload.get("expiresOn")
+        if isinstance(expires_on, str):
+            try:
+                return datetime.fromisoformat(expires_on).timestamp()
+            except ValueError:
+                pass
+        return None
+
+    @staticmethod
+    def _acquire_via_az_cli() -> AccessToken | None:
         """Run ``az account get-access-token`` and return the access token."""
         try:
             result = subprocess.run(  # noqa: S603, S607
@@ -75,12 +106,14 @@ class AzureDevOpsAuth(AuthProvider):
                 return None
             payload = _json.loads(result.stdout)
             token = payload.get("accessToken", "").strip()
-            return token or None
+            if not token:
+                return None
+            return AccessToken(token, AzureDevOpsAuth._az_cli_expiry(payload))
         except (OSError, subprocess.TimeoutExpired, _json.JSONDecodeError, KeyError):
             return None
 
     @staticmethod
-    def _acquire_via_client_credentials(entry: AuthConfigEntry) -> str | None:
+    def _acquire_via_client_credentials(entry: AuthConfigEntry) -> AccessToken | None:
         """Acquire a token via OAuth2 client credentials flow."""
         import urllib.error
         import urllib.request
@@ -112,6 +145,12 @@ class AzureDevOpsAuth(AuthProvider):
             with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
                 payload = _json.loads(resp.read().decode("utf-8"))
                 token = payload.get("access_token", "").strip()
-                return token or None
+                if not token:
+                    return None
+                try:
+                    expires_at = time.time() + float(payload["expires_in"])
+                except (KeyError, TypeError, ValueError):
+                    expires_at = None
+                return AccessToken(token, expires_at)
         except (urllib.error.URLError, OSError, _json.JSONDecodeError, KeyError):
             return None
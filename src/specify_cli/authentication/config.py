@@ -29,6 +29,8 @@ class AuthConfigEntry:
     tenant_id: str | None = None
     client_id: str | None = None
     client_secret_env: str | None = None
+    # Token caching for azure-cli / azure-ad: "memory" (default), "shared", "off"
+    token_cache: str | None = None
 
 
 def _default_config_path() -> Path:
@@ -176,6 +178,15 @@ def load_auth_config(
                     )
         # azure-cli needs no extra fields
 
+        token_cache = entry_raw.get("token_cache")
+        if token_cache is not None:
+            from .token_cache import TOKEN_CACHE_MODES
+            if token_cache not in TOKEN_CACHE_MODES:
+                raise ValueError(
+                    f"providers[{i}]: 'token_cache' must be one of "
+                    f"{list(TOKEN_CACHE_MODES)}, got {token_cache!r}"
+                )
+
         entries.append(
             AuthConfigEntry(
                 hosts=tuple(hosts),
@@ -186,6 +197,7 @@ def load_auth_config(
                 tenant_id=entry_raw.get("tenant_id"),
                 client_id=entry_raw.get("client_id"),
                 client_secret_env=entry_raw.get("client_secret_env"),
+                token_cache=token_cache,
             )
         )
 
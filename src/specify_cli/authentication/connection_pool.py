@@ -0,0 +1,252 @@
+"""Keep-alive HTTP(S) connections shared by every ``open_url`` call.
+
+urllib opens a new connection for every request, and a new TLS handshake
+for every HTTPS request, and it sends ``Connection: close``. Catalog
+refreshes, GitHub release-asset lookups and ZIP downloads mostly go to the
+same few hosts. :func:`handlers` returns urllib handlers that keep
+connections open instead. A connection is handed to the next request for
+the same scheme, host and port for as long as the process runs.
+
+A connection goes back to the pool once its response body has been read to
+the end. A response closed early, or one the server marks
+``Connection: close``, closes its connection. If the server has dropped a
+reused connection, a GET or HEAD request on it is retried once on a new
+connection. :func:`stats` counts connections opened and reused.
+"""
+
+from __future__ import annotations
+
+import atexit
+import http.client
+import select
+import threading
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import Any, Callable
+
+#: Idle connections kept per scheme, host and port.
+MAX_IDLE_PER_HOST = 4
+
+_RETRYABLE_METHODS = ("GET", "HEAD")
+
+# How a request fails on a connection the server closed while it was idle
+# (http.client.RemoteDisconnected is a ConnectionResetError).
+_DROPPED_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+PoolKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Connections opened and reused by the pool since it was created."""
+
+    opened: int
+    reused: int
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """Response that hands its connection back to the pool when drained."""
+
+    _release: Callable[[bool], None] | None = None
+
+    def _close_conn(self) -> None:
+        # Called by http.client once the body has been read to the end,
+        # and by close() otherwise.
+        super()._close_conn()
+        self._finish(reusable=True)
+
+    def close(self) -> None:
+        if self.fp is not None and self.length != 0:
+            # Unread body bytes are still on the socket; it cannot carry
+            # another request.
+            self._finish(reusable=False)
+        super().close()
+
+    def _finish(self, reusable: bool) -> None:
+        release, self._release = self._release, None
+        if release is not None:
+            release(reusable and not self.will_close)
+
+
+class _PooledHTTPConnection(http.client.HTTPConnection):
+    response_class = _PooledResponse
+
+
+class _PooledHTTPSConnection(http.client.HTTPSConnection):
+    response_class = _PooledResponse
+
+
+def _is_reusable(conn: http.client.HTTPConnection) -> bool:
+    """Return False if the server closed *conn* while it was idle."""
+    if conn.sock is None:
+        return False
+    try:
+        # An idle keep-alive socket has nothing to read; readable means
+        # the server closed it (or sent something unexpected).
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return False
+    return not readable
+
+
+class ConnectionPool:
+    """Idle keep-alive connections keyed by scheme and ``host[:port]``."""
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST) -> None:
+        self._max_idle = max_idle_per_host
+        self._idle: dict[PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._reused = 0
+
+    def acquire(self, key: PoolKey) -> http.client.HTTPConnection | None:
+        """Check out an idle connection for *key*, or None if there is none."""
+        stale = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate = idle.pop()
+                if _is_reusable(candidate):
+                    conn = candidate
+                    self._reused += 1
+                    break
+                stale.append(candidate)
+        for candidate in stale:
+            candidate.close()
+        return conn
+
+    def connect(
+        self, conn_class: type[http.client.HTTPConnection], host: str, timeout: Any, **kwargs: Any
+    ) -> http.client.HTTPConnection:
+        """Create a new connection (opened lazily by its first request)."""
+        conn = conn_class(host, timeout=timeout, **kwargs)
+        with self._lock:
+            self._opened += 1
+        return conn
+
+    def release(self, key: PoolKey, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        """Return *conn* to the pool, or close it when it cannot be reused."""
+        if reusable and conn.sock is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._max_idle:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(opened=self._opened, reused=self._reused)
+
+    def clear(self) -> None:
+        """Close every idle connection and reset the counters."""
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+            self._opened = self._reused = 0
+        for conn in idle:
+            conn.close()
+
+
+class _PooledHandlerMixin:
+    """Replacement for ``AbstractHTTPHandler.do_open`` that reuses connections."""
+
+    _pool: ConnectionPool
+
+    def _pooled_open(
+        self, conn_class: type[http.client.HTTPConnection], fallback_class: type, req: Any, **conn_args: Any
+    ) -> http.client.HTTPResponse:
+        if req._tunnel_host:
+            # HTTPS through a proxy CONNECT tunnel: leave it to urllib.
+            return self.do_open(fallback_class, req, **conn_args)
+        host = req.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+        key = (req.type, host.lower())
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): val for name, val in headers.items()}
+        method = req.get_method()
+
+        while True:
+            conn = self._pool.acquire(key)
+            retryable = conn is not None and method in _RETRYABLE_METHODS
+            if conn is None:
+                conn = self._pool.connect(conn_class, host, req.timeout, **conn_args)
+            else:
+                conn.timeout = req.timeout
+                conn.sock.settimeout(req.timeout)
+            try:
+                try:
+                    conn.request(
+                        method, req.selector, req.data, headers,
+                        encode_chunked=req.has_header("Transfer-encoding"),
+                    )
+                except OSError as err:
+                    if retryable and isinstance(err, _DROPPED_ERRORS):
+                        conn.close()
+                        continue
+                    raise urllib.error.URLError(err)
+                try:
+                    response = conn.getresponse()
+                except _DROPPED_ERRORS:
+                    if retryable:
+                        conn.close()
+                        continue
+                    raise
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        response._release = lambda reusable: self._pool.release(key, conn, reusable)
+        response.url = req.get_full_url()
+        # urllib clients expect the reason in .msg (see urllib's do_open).
+        response.msg = response.reason
+        return response
+
+
+class PooledHTTPHandler(_PooledHandlerMixin, urllib.request.HTTPHandler):
+    def __init__(self, pool: ConnectionPool) -> None:
+        super().__init__()
+        self._pool = pool
+
+    def http_open(self, req: Any) -> http.client.HTTPResponse:
+        return self._pooled_open(_PooledHTTPConnection, http.client.HTTPConnection, req)
+
+
+class PooledHTTPSHandler(_PooledHandlerMixin, urllib.request.HTTPSHandler):
+    def __init__(self, pool: ConnectionPool) -> None:
+        super().__init__()
+        self._pool = pool
+
+    def https_open(self, req: Any) -> http.client.HTTPResponse:
+        return self._pooled_open(
+            _PooledHTTPSConnection, http.client.HTTPSConnection, req, context=self._context
+        )
+
+
+_POOL = ConnectionPool()
+atexit.register(_POOL.clear)
+
+
+def handlers() -> list[urllib.request.BaseHandler]:
+    """Return urllib handlers that use the process-wide connection pool.
+
+    Pass them to :func:`urllib.request.build_opener`; they replace its
+    default HTTP and HTTPS handlers.
+    """
+    return [PooledHTTPHandler(_POOL), PooledHTTPSHandler(_POOL)]
+
+
+def stats() -> PoolStats:
+    """Return how many connections the pool has opened and reused."""
+    return _POOL.stats()
+
+
+def clear() -> None:
+    """Close idle connections and reset the counters."""
+    _POOL.clear()
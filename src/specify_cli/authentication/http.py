@@ -7,6 +7,9 @@ class, and attaches auth headers.  Redirect safety is enforced:
 the ``Authorization`` header is stripped when a redirect leaves the
 entry's declared hosts.  On 401/403 the next matching entry is tried,
 then unauthenticated.
+
+Requests go over keep-alive connections shared for the life of the
+process (see :mod:`.connection_pool`).
 """
 
 from __future__ import annotations
@@ -17,7 +20,7 @@ from fnmatch import fnmatch
 from typing import Callable
 from urllib.parse import urlparse
 
-from . import get_provider
+from . import connection_pool, get_provider, token_cache
 from .config import AuthConfigEntry, _default_config_path, find_entries_for_url, load_auth_config
 
 
@@ -95,6 +98,20 @@ class _StripAuthOnRedirect(urllib.request.HTTPRedirectHandler):
         return new_req
 
 
+def _build_opener(
+    hosts: tuple[str, ...], redirect_validator: RedirectValidator | None = None
+) -> urllib.request.OpenerDirector:
+    """Build an opener using the shared connection pool and redirect stripping."""
+    return urllib.request.build_opener(
+        _StripAuthOnRedirect(hosts, redirect_validator), *connection_pool.handlers()
+    )
+
+
+def _urlopen(req: urllib.request.Request, timeout: int = 10):
+    """Open *req* unauthenticated over the shared connection pool."""
+    return urllib.request.build_opener(*connection_pool.handlers()).open(req, timeout=timeout)
+
+
 def build_request(url: str, extra_headers: dict[str, str] | None = None) -> urllib.request.Request:
     """Build a :class:`~urllib.request.Request`, attaching auth when config matches.
 
@@ -128,7 +145,9 @@ def open_url(
 
     1. Find ``auth.json`` entries whose hosts match the URL.
     2. For each entry, resolve the token and try the request.
-    3. On 401/403 move to the next matching entry.
+    3. On 401/403 move to the next matching entry.  A 401 also drops the
+       entry's cached token; if the provider then resolves a different
+       token, the entry is retried once with it.
     4. After all entries exhausted (or none matched), try unauthenticated.
     5. Non-auth errors (404, 500, network) raise immediately.
 
@@ -153,22 +172,27 @@ def open_url(
         if provider is None:
             continue
         token = provider.resolve_token(entry)
-        if not token:
-            continue
-
-        req = _make_req(provider.auth_headers(token, entry.auth))
-        opener = urllib.request.build_opener(_StripAuthOnRedirect(entry.hosts, redirect_validator))
-        try:
-            return opener.open(req, timeout=timeout)
-        except urllib.error.HTTPError as exc:
-            if exc.code in (401, 403):
+        retried = False
+        while token:
+            req = _make_req(provider.auth_headers(token, entry.auth))
+            opener = _build_opener(entry.hosts, redirect_validator)
+            try:
+                return opener.open(req, timeout=timeout)
+            except urllib.error.HTTPError as exc:
+                if exc.code not in (401, 403):
+                    raise
                 exc.close()
-                continue  # try next entry
-            raise
+                status = exc.code
+            # A cached token may have been revoked or expired early:
+            # re-acquire it once before moving on.
+            if status != 401 or retried or not token_cache.invalidate(entry, token):
+                break  # try next entry
+            retried = True
+            fresh = provider.resolve_token(entry)
+            token = fresh if fresh != token else None
 
     # No entry worked (or none matched) — unauthenticated fallback
     req = _make_req({})
     if redirect_validator is not None:
-        opener = urllib.request.build_opener(_StripAuthOnRedirect((), redirect_validator))
-        return opener.open(req, timeout=timeout)
-    return urllib.request.urlopen(req, timeout=timeout)  # noqa: S310
+        return _build_opener((), redirect_validator).open(req, timeout=timeout)
+    return _urlopen(req, timeout=timeout)
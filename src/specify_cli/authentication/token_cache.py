@@ -0,0 +1,214 @@
+"""Cache of dynamically acquired access tokens, keyed by ``auth.json`` entry.
+
+``azure-cli`` tokens come from an ``az`` subprocess and ``azure-ad`` tokens
+from an OAuth2 round trip, so re-acquiring one for every request is slow.
+Acquired tokens are kept in memory until shortly before they expire
+(``REFRESH_MARGIN_SECONDS``); a token rejected with 401 is dropped so the
+next request acquires a new one.
+
+An entry with ``"token_cache": "shared"`` also stores its token in
+``~/.specify/token-cache.json`` (mode 0600) so later ``specify`` processes
+can reuse it; ``"token_cache": "off"`` disables caching for the entry.
+Static ``token``/``token_env`` credentials are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .config import AuthConfigEntry
+
+TOKEN_CACHE_MODES = ("memory", "shared", "off")
+
+# Refresh a cached token this long before it expires, so it does not run
+# out in the middle of a catalog refresh or download.
+REFRESH_MARGIN_SECONDS = 300
+
+# Lifetime assumed for tokens whose expiry the issuer did not report.
+DEFAULT_LIFETIME_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class AccessToken:
+    """An acquired token and when it expires (POSIX time, if known)."""
+
+    token: str
+    expires_at: float | None = None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Return True while the token is outside the refresh margin."""
+        if self.expires_at is None:
+            return False
+        now = time.time() if now is None else now
+        return self.expires_at - now > REFRESH_MARGIN_SECONDS
+
+
+_MEMORY: dict[str, AccessToken] = {}
+# Guards _MEMORY and _ENTRY_LOCKS only; never held while acquiring a token.
+_LOCK = threading.Lock()
+# One lock per auth entry, held while that entry's token is acquired, so
+# concurrent callers for one entry share an acquisition while other
+# entries (other hosts) acquire theirs in parallel.
+_ENTRY_LOCKS: dict[str, threading.Lock] = {}
+# Serializes read-modify-write of the shared cache file.
+_SHARED_LOCK = threading.Lock()
+
+
+def _default_cache_path() -> Path:
+    """Return ``~/.specify/token-cache.json``."""
+    return Path.home() / ".specify" / "token-cache.json"
+
+
+def _entry_key(entry: AuthConfigEntry) -> str:
+    """Identify *entry* by the fields that determine which token it gets."""
+    identity = [
+        entry.provider,
+        entry.auth,
+        sorted(entry.hosts),
+        entry.tenant_id,
+        entry.client_id,
+        entry.client_secret_env,
+    ]
+    return hashlib.sha256(json.dumps(identity).encode("utf-8")).hexdigest()
+
+
+def _entry_lock(key: str) -> threading.Lock:
+    with _LOCK:
+        return _ENTRY_LOCKS.setdefault(key, threading.Lock())
+
+
+def _cached(key: str) -> AccessToken | None:
+    with _LOCK:
+        cached = _MEMORY.get(key)
+    return cached if cached is not None and cached.is_fresh() else None
+
+
+def _read_shared() -> dict[str, dict]:
+    try:
+        data = json.loads(_default_cache_path().read_text(encoding="utf-8"))
+    except (OSError, UnicodeError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_shared(data: dict[str, dict]) -> None:
+    path = _default_cache_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, path)
+    except OSError:
+        # The shared cache is best-effort; the token is still cached in memory.
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _load_shared(key: str) -> AccessToken | None:
+    raw = _read_shared().get(key)
+    if not isinstance(raw, dict):
+        return None
+    token, expires_at = raw.get("token"), raw.get("expires_at")
+    if not isinstance(token, str) or not token:
+        return None
+    if isinstance(expires_at, bool) or not isinstance(expires_at, (int, float)):
+        return None
+    return AccessToken(token, float(expires_at))
+
+
+def _store_shared(key: str, cached: AccessToken | None) -> None:
+    with _SHARED_LOCK:
+        data = _read_shared()
+        now = time.time()
+        # Drop entries that have expired while we are rewriting the file anyway.
+        data = {
+            k: v for k, v in data.items()
+            if isinstance(v, dict) and isinstance(v.get("expires_at"), (int, float))
+            and v["expires_at"] > now
+        }
+        if cached is None:
+            data.pop(key, None)
+        else:
+            data[key] = {"token": cached.token, "expires_at": cached.expires_at}
+        _write_shared(data)
+
+
+def get_token(
+    entry: AuthConfigEntry, acquire: Callable[[], AccessToken | None]
+) -> str | None:
+    """Return a cached token for *entry*, calling *acquire* when needed.
+
+    *acquire* runs when there is no cached token or the cached one is
+    within ``REFRESH_MARGIN_SECONDS`` of expiring. Failed acquisitions
+    (``None``) are not cached. Concurrent callers for the same entry share
+    one acquisition; acquisitions for different entries run in parallel.
+    """
+    mode = entry.token_cache or "memory"
+    if mode == "off":
+        acquired = acquire()
+        return acquired.token if acquired else None
+
+    key = _entry_key(entry)
+    cached = _cached(key)
+    if cached is not None:
+        return cached.token
+
+    with _entry_lock(key):
+        # Another caller may have acquired it while we waited.
+        cached = _cached(key)
+        if cached is not None:
+            return cached.token
+        if mode == "shared":
+            cached = _load_shared(key)
+            if cached is not None and cached.is_fresh():
+                with _LOCK:
+                    _MEMORY[key] = cached
+                return cached.token
+
+        acquired = acquire()
+        if acquired is None:
+            with _LOCK:
+                _MEMORY.pop(key, None)
+            return None
+        if acquired.expires_at is None:
+            acquired = AccessToken(acquired.token, time.time() + DEFAULT_LIFETIME_SECONDS)
+        with _LOCK:
+            _MEMORY[key] = acquired
+        if mode == "shared":
+            _store_shared(key, acquired)
+        return acquired.token
+
+
+def invalidate(entry: AuthConfigEntry, token: str | None = None) -> bool:
+    """Drop the cached token for *entry* (only if it is *token*, when given).
+
+    Called when a request with the token is answered with 401. Returns
+    True if a cached token was dropped.
+    """
+    key = _entry_key(entry)
+    with _LOCK:
+        cached = _MEMORY.get(key)
+        if cached is None or (token is not None and cached.token != token):
+            return False
+        del _MEMORY[key]
+    if entry.token_cache == "shared":
+        _store_shared(key, None)
+    return True
+
+
+def clear() -> None:
+    """Forget every token cached in memory in this process."""
+    with _LOCK:
+        _MEMORY.clear()
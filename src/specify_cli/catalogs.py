@@ -3,17 +3,34 @@
 Catalog-backed features use the same local config shape and URL validation
 rules. This module keeps those narrow primitives in one place while individual
 catalog types keep their active source resolution, fetch, cache, and
-domain-specific validation behavior.
+domain-specific validation behavior. ``fetch_catalogs`` is the shared engine
+that fetches every active catalog of a stack concurrently, and
+``open_catalog`` performs the conditional (ETag / Last-Modified) request
+each catalog type uses to refresh an expired cache. ``CatalogSearchIndex``
+backs ``search`` and id lookups over the merged entries of a stack.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextlib
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, Callable, ClassVar, Mapping, Sequence
 
 import yaml
 
+#: Upper bound on catalogs fetched at the same time.
+MAX_PARALLEL_FETCHES = 8
+
 
 @dataclass
 class CatalogEntry:
@@ -24,6 +41,9 @@ class CatalogEntry:
     priority: int
     install_allowed: bool
     description: str = ""
+    #: Seconds an expired cache may still be served while it is refreshed in
+    #: the background. ``0`` disables stale-while-revalidate.
+    max_stale: int = 0
 
 
 class CatalogStackBase:
@@ -40,6 +60,10 @@ class CatalogStackBase:
 
     CONFIG_FILENAME: ClassVar[str]
 
+    #: Whether the catalog type serves expired caches per ``max_stale``;
+    #: configs for other types that set it are rejected.
+    SUPPORTS_MAX_STALE: ClassVar[bool] = False
+
     @classmethod
     def _error(cls, message: str) -> Exception:
         return cls.ERROR_TYPE(message)
@@ -57,6 +81,7 @@ class CatalogStackBase:
         priority: int,
         install_allowed: bool,
         description: str = "",
+        max_stale: int = 0,
     ) -> CatalogEntry:
         return cls.ENTRY_CLASS(
             url=url,
@@ -64,6 +89,7 @@ class CatalogStackBase:
             priority=priority,
             install_allowed=install_allowed,
             description=description,
+            max_stale=max_stale,
         )
 
     @classmethod
@@ -149,6 +175,24 @@ class CatalogStackBase:
                     f"expected integer, got {raw_priority!r}"
                 )
 
+            raw_max_stale = item.get("max_stale", 0)
+            if "max_stale" in item and not self.SUPPORTS_MAX_STALE:
+                raise self._validation_error(
+                    f"Invalid catalog config {config_path}: "
+                    f"max_stale is not supported for catalog '{item.get('name', idx + 1)}' "
+                    f"(only extension catalogs serve stale caches)"
+                )
+            if (
+                isinstance(raw_max_stale, bool)
+                or not isinstance(raw_max_stale, int)
+                or raw_max_stale < 0
+            ):
+                raise self._validation_error(
+                    f"Invalid catalog config {config_path}: "
+                    f"Invalid max_stale for catalog '{item.get('name', idx + 1)}': "
+                    f"expected a non-negative integer (seconds), got {raw_max_stale!r}"
+                )
+
             raw_install = item.get("install_allowed", False)
             if isinstance(raw_install, str):
                 install_allowed = raw_install.strip().lower() in ("true", "yes", "1")
@@ -167,6 +211,7 @@ class CatalogStackBase:
                     priority=priority,
                     install_allowed=install_allowed,
                     description=str(item.get("description", "")),
+                    max_stale=raw_max_stale,
                 )
             )
 
@@ -178,3 +223,493 @@ class CatalogStackBase:
                 f"were skipped). Each catalog entry must have a 'url' field."
             )
         return entries
+
+
+@dataclass
+class CatalogFetchResult:
+    """Outcome of fetching one catalog in a stack."""
+
+    #: The catalog's entry (any entry type with ``name`` and ``url``).
+    entry: Any
+    data: dict[str, Any] | None = None
+    error: Exception | None = None
+    #: Wall-clock seconds spent in the fetch (cache hits included).
+    elapsed: float = 0.0
+    #: True when the catalog was not read because the persisted search
+    #: index built from its cache answered instead.
+    from_index: bool = False
+    #: Seconds since the catalog's cache was written, when known.
+    cache_age: float | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fetch_catalogs(
+    entries: Sequence[Any],
+    fetch: Callable[[Any], dict[str, Any]],
+    error_types: type[Exception] | tuple[type[Exception], ...],
+    max_workers: int = MAX_PARALLEL_FETCHES,
+) -> list[CatalogFetchResult]:
+    """Fetch every catalog in *entries* concurrently.
+
+    *fetch* is the catalog's single-entry fetcher (usually a bound
+    ``_fetch_single_catalog``). Exceptions matching *error_types* are
+    recorded on the result so callers can skip that catalog; any other
+    exception is re-raised once all fetches have finished.
+
+    Results come back in the order of *entries*, not completion order, so
+    priority-based merging stays deterministic.
+    """
+
+    def run(entry: Any) -> CatalogFetchResult:
+        started = time.perf_counter()
+        try:
+            data = fetch(entry)
+        except error_types as exc:
+            return CatalogFetchResult(
+                entry, error=exc, elapsed=time.perf_counter() - started
+            )
+        return CatalogFetchResult(
+            entry, data=data, elapsed=time.perf_counter() - started
+        )
+
+    if len(entries) <= 1 or max_workers <= 1:
+        return [run(entry) for entry in entries]
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(entries)),
+        thread_name_prefix="catalog-fetch",
+    ) as pool:
+        futures = [pool.submit(run, entry) for entry in entries]
+    return [future.result() for future in futures]
+
+
+def cache_age(metadata: Mapping[str, Any]) -> float | None:
+    """Return seconds since *metadata*'s ``cached_at``, or ``None`` if unset."""
+    try:
+        cached_at = datetime.fromisoformat(metadata.get("cached_at", ""))
+    except (TypeError, ValueError):
+        return None
+    if cached_at.tzinfo is None:
+        cached_at = cached_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - cached_at).total_seconds()
+
+
+def index_fetch_report(
+    entries: Sequence[Any], meta_file_for: Callable[[Any], Path]
+) -> list[CatalogFetchResult]:
+    """Describe catalogs answered from a persisted search index.
+
+    Nothing is fetched in that case, so each result only records that the
+    index served the catalog and how old the cache behind it is;
+    *meta_file_for* maps an entry to its cache metadata file.
+    """
+    return [
+        CatalogFetchResult(
+            entry,
+            from_index=True,
+            cache_age=cache_age(read_cache_metadata(meta_file_for(entry))),
+        )
+        for entry in entries
+    ]
+
+
+def _format_age(seconds: float) -> str:
+    if seconds < 60:
+        return f"{max(seconds, 0):.0f} s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f} min"
+    return f"{seconds / 3600:.1f} h"
+
+
+def format_fetch_report(results: Sequence[CatalogFetchResult]) -> list[str]:
+    """Return one human-readable timing line per fetched catalog."""
+    lines = []
+    for result in results:
+        if result.from_index:
+            age = (
+                "unknown age"
+                if result.cache_age is None
+                else f"cached {_format_age(result.cache_age)} ago"
+            )
+            lines.append(
+                f"{result.entry.name}: from search index, {age} "
+                f"[{result.entry.url}]"
+            )
+            continue
+        status = "ok" if result.ok else f"failed ({result.error})"
+        lines.append(
+            f"{result.entry.name}: {result.elapsed * 1000:.0f} ms, {status} "
+            f"[{result.entry.url}]"
+        )
+    return lines
+
+
+# -- Conditional revalidation ---------------------------------------------
+#
+# Cache metadata files store the ``ETag`` / ``Last-Modified`` validators of
+# the response they were written from (as ``etag`` / ``last_modified``).
+# Refreshing an expired cache sends them back as ``If-None-Match`` /
+# ``If-Modified-Since``; a ``304 Not Modified`` answer means the cached
+# payload is still current and only its timestamp needs bumping.
+
+@dataclass
+class CatalogResponse:
+    """Result of :func:`open_catalog`."""
+
+    #: Raw response body (empty when ``not_modified``).
+    body: bytes = b""
+    #: Final URL after redirects.
+    url: str = ""
+    #: Cache validators to persist in the metadata file.
+    validators: dict[str, str] = field(default_factory=dict)
+    #: True when the server answered ``304 Not Modified``.
+    not_modified: bool = False
+
+
+def read_cache_metadata(meta_file: Path) -> dict[str, Any]:
+    """Return the parsed cache metadata mapping, or ``{}`` if unusable."""
+    try:
+        metadata = json.loads(meta_file.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def write_cache_file(path: Path, text: str) -> None:
+    """Atomically replace *path* with UTF-8 *text* via a temp file.
+
+    A writer interrupted part-way (for instance a daemon refresh thread
+    killed at interpreter exit) leaves the previous file intact instead of
+    a truncated one. Raises ``OSError`` on failure.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        temp_path.write_text(text, encoding="utf-8")
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+        raise
+
+
+def write_cache_metadata(meta_file: Path, metadata: Mapping[str, Any]) -> None:
+    """Write cache metadata as UTF-8 JSON; failures are ignored (best-effort)."""
+    try:
+        write_cache_file(meta_file, json.dumps(dict(metadata), indent=2))
+    except OSError:
+        pass
+
+
+def revalidation_headers(metadata: Mapping[str, Any]) -> dict[str, str]:
+    """Return conditional request headers for the validators in *metadata*."""
+    headers: dict[str, str] = {}
+    etag = metadata.get("etag")
+    if isinstance(etag, str) and etag:
+        headers["If-None-Match"] = etag
+    last_modified = metadata.get("last_modified")
+    if isinstance(last_modified, str) and last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def response_validators(response: Any) -> dict[str, str]:
+    """Return the ``etag`` / ``last_modified`` validators of *response*."""
+    headers = getattr(response, "headers", None)
+    validators: dict[str, str] = {}
+    if headers is None:
+        return validators
+    for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+        value = headers.get(header)
+        if isinstance(value, str) and value:
+            validators[key] = value
+    return validators
+
+
+def open_catalog(
+    open_url: Callable[..., Any],
+    url: str,
+    *,
+    timeout: int,
+    metadata: Mapping[str, Any] | None = None,
+) -> CatalogResponse:
+    """Fetch *url*, revalidating against cached *metadata* when given.
+
+    *open_url* is the catalog's opener (``authentication.http.open_url``
+    or a wrapper around it). Pass the metadata of an existing cache file
+    to make the request conditional; pass ``None`` for a plain fetch.
+    HTTP and network errors other than ``304`` propagate unchanged.
+    """
+    headers = revalidation_headers(metadata or {})
+    try:
+        with open_url(url, timeout=timeout, extra_headers=headers or None) as response:
+            body = response.read()
+            final_url = response.geturl()
+            return CatalogResponse(
+                body=body,
+                url=final_url if isinstance(final_url, str) else url,
+                validators=response_validators(response),
+            )
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and headers:
+            exc.close()
+            return CatalogResponse(url=url, not_modified=True)
+        raise
+
+
+# -- Search index -----------------------------------------------------------
+#
+# ``search`` and ``get_*_info`` used to rebuild and linearly scan the merged
+# entry list on every call. ``CatalogSearchIndex`` precomputes what those
+# scans recomputed: an id map, the lowercased searchable text of each entry,
+# an inverted token index, and tag / author facets. The index is persisted
+# next to the catalog caches under a fingerprint of their metadata, so it is
+# rebuilt exactly when one of the caches is refreshed.
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+#: Default fields whose values make up an entry's searchable text.
+SEARCH_FIELDS: tuple[str, ...] = ("name", "description", "id", "tags")
+
+
+def search_index_fingerprint(parts: Sequence[Any]) -> str:
+    """Return a stable digest of the sources a search index is built from."""
+    payload = json.dumps(list(parts), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CatalogSearchIndex:
+    """Precomputed lookups over the merged entries of a catalog stack.
+
+    Matching keeps the historical semantics — a query matches when it is a
+    case-insensitive substring of the entry's searchable text — but the
+    token index narrows the candidates first, and matches are ranked: an
+    exact id, then an exact name, then an id or name prefix, then whole-word
+    matches, then matching tags, then any other substring. Ties keep the
+    catalog's merged order.
+    """
+
+    FORMAT_VERSION: ClassVar[int] = 1
+
+    def __init__(
+        self,
+        entries: Sequence[Mapping[str, Any]],
+        fields: Sequence[str] = SEARCH_FIELDS,
+    ) -> None:
+        self.fields = tuple(fields)
+        self.entries = [dict(entry) for entry in entries]
+        self.texts = [self._searchable_text(entry) for entry in self.entries]
+        self.tokens: dict[str, list[int]] = {}
+        self.tags: dict[str, list[int]] = {}
+        self.authors: dict[str, list[int]] = {}
+        for pos, entry in enumerate(self.entries):
+            for token in dict.fromkeys(_SEARCH_TOKEN.findall(self.texts[pos])):
+                self.tokens.setdefault(token, []).append(pos)
+            for tag in dict.fromkeys(_tag_values(entry)):
+                self.tags.setdefault(tag, []).append(pos)
+            author = entry.get("author")
+            if isinstance(author, str) and author:
+                self.authors.setdefault(author.lower(), []).append(pos)
+        self._finish()
+
+    def _finish(self) -> None:
+        self.ids = {
+            str(entry.get("id")): pos
+            for pos, entry in reversed(list(enumerate(self.entries)))
+            if entry.get("id") is not None
+        }
+        self._term_matches: dict[str, frozenset[int]] = {}
+
+    def _searchable_text(self, entry: Mapping[str, Any]) -> str:
+        parts: list[str] = []
+        for name in self.fields:
+            value = entry.get(name)
+            if isinstance(value, (list, tuple)):
+                parts.extend(str(item) for item in value if item is not None)
+            else:
+                parts.append("" if value is None else str(value))
+        return " ".join(parts).lower()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, entry_id: str) -> dict[str, Any] | None:
+        """Return a copy of the entry with *entry_id*, or ``None``."""
+        pos = self.ids.get(entry_id)
+        return dict(self.entries[pos]) if pos is not None else None
+
+    def search(
+        self,
+        query: str | None = None,
+        *,
+        tag: str | None = None,
+        author: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return copies of the entries matching every given filter, ranked."""
+        candidates: set[int] | None = None
+        if tag:
+            candidates = set(self.tags.get(tag.lower(), ()))
+        if author:
+            matches = set(self.authors.get(author.lower(), ()))
+            candidates = matches if candidates is None else candidates & matches
+        if not query:
+            positions = (
+                range(len(self.entries)) if candidates is None else sorted(candidates)
+            )
+            return [dict(self.entries[pos]) for pos in positions]
+
+        q = query.lower()
+        terms = list(dict.fromkeys(_SEARCH_TOKEN.findall(q)))
+        for term in terms:
+            matches = self._positions_containing(term)
+            candidates = set(matches) if candidates is None else candidates & matches
+            if not candidates:
+                return []
+        if candidates is None:  # Query without word characters.
+            candidates = set(range(len(self.entries)))
+        hits = [pos for pos in candidates if q in self.texts[pos]]
+        hits.sort(key=lambda pos: (-self._rank(pos, q, terms), pos))
+        return [dict(self.entries[pos]) for pos in hits]
+
+    def _positions_containing(self, term: str) -> frozenset[int]:
+        """Entries with a token containing *term* (a superset of the matches)."""
+        found = self._term_matches.get(term)
+        if found is None:
+            positions: set[int] = set()
+            for token, postings in self.tokens.items():
+                if term in token:
+                    positions.update(postings)
+            found = self._term_matches[term] = frozenset(positions)
+        return found
+
+    def _rank(self, pos: int, q: str, terms: Sequence[str]) -> int:
+        entry = self.entries[pos]
+        entry_id = str(entry.get("id") or "").lower()
+        name = str(entry.get("name") or "").lower()
+        if entry_id == q:
+            return 5
+        if name == q:
+            return 4
+        if entry_id.startswith(q) or name.startswith(q):
+            return 3
+        if terms and all(pos in self._exact(term) for term in terms):
+            return 2
+        if q in _tag_values(entry):
+            return 1
+        return 0
+
+    def _exact(self, term: str) -> frozenset[int]:
+        key = "=" + term
+        found = self._term_matches.get(key)
+        if found is None:
+            found = self._term_matches[key] = frozenset(self.tokens.get(term, ()))
+        return found
+
+    # -- Persistence --------------------------------------------------------
+
+    def save(self, path: Path, fingerprint: str) -> None:
+        """Write the index to *path*; failures are ignored (best-effort)."""
+        payload = {
+            "format_version": self.FORMAT_VERSION,
+            "fingerprint": fingerprint,
+            "fields": list(self.fields),
+            "entries": self.entries,
+            "texts": self.texts,
+            "tokens": self.tokens,
+            "tags": self.tags,
+            "authors": self.authors,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            tmp.replace(path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str) -> CatalogSearchIndex | None:
+        """Return the index saved at *path* for *fingerprint*, else ``None``."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError, UnicodeError, ValueError):
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format_version") != cls.FORMAT_VERSION
+            or payload.get("fingerprint") != fingerprint
+        ):
+            return None
+        try:
+            index = cls.__new__(cls)
+            index.fields = tuple(payload["fields"])
+            index.entries = list(payload["entries"])
+            index.texts = list(payload["texts"])
+            index.tokens = dict(payload["tokens"])
+            index.tags = dict(payload["tags"])
+            index.authors = dict(payload["authors"])
+            if len(index.texts) != len(index.entries) or not all(
+                isinstance(entry, dict) for entry in index.entries
+            ):
+                return None
+            index._finish()
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return index
+
+
+def _tag_values(entry: Mapping[str, Any]) -> list[str]:
+    tags = entry.get("tags")
+    if not isinstance(tags, (list, tuple)):
+        return []
+    return [tag.lower() for tag in tags if isinstance(tag, str)]
+
+
+class SearchIndexStore:
+    """Memoizes and persists the :class:`CatalogSearchIndex` of one stack.
+
+    Each catalog type owns one store and derives the fingerprint from its
+    own cache metadata, returning ``None`` while any active catalog lacks a
+    fresh cache — in that case the index is rebuilt from the merged entries
+    and not persisted.
+    """
+
+    def __init__(self, path: Path, fields: Sequence[str] = SEARCH_FIELDS) -> None:
+        self.path = path
+        self.fields = tuple(fields)
+        self._fingerprint: str | None = None
+        self._index: CatalogSearchIndex | None = None
+
+    def lookup(self, fingerprint: str | None) -> CatalogSearchIndex | None:
+        """Return the index stored for *fingerprint* (memory, then disk)."""
+        if fingerprint is None:
+            return None
+        if self._index is not None and self._fingerprint == fingerprint:
+            return self._index
+        index = CatalogSearchIndex.load(self.path, fingerprint)
+        if index is not None and index.fields == self.fields:
+            self._fingerprint, self._index = fingerprint, index
+            return index
+        return None
+
+    def build(
+        self, entries: Sequence[Mapping[str, Any]], fingerprint: str | None
+    ) -> CatalogSearchIndex:
+        """Index *entries*, persisting the result when *fingerprint* is known."""
+        index = CatalogSearchIndex(entries, self.fields)
+        if fingerprint is not None:
+            index.save(self.path, fingerprint)
+            self._fingerprint, self._index = fingerprint, index
+        return index
+
+    def clear(self) -> None:
+        """Forget the memoized index and delete the persisted one."""
+        self._fingerprint = self._index = None
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            pass
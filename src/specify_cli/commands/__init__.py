@@ -2,6 +2,7 @@
 
 Implemented command modules expose a ``register(app)`` function. Placeholder
 modules are import-only anchors for command groups that still live in the main
-application module.
+application module. The root ``specify`` group imports most of them lazily
+(see ``_lazy.py``), so each module is only loaded when its command runs.
 """
 from __future__ import annotations
@@ -0,0 +1,64 @@
+"""Root command group that imports command modules on first use.
+
+Each command module exposes ``register(app)``. Instead of importing all of
+them when ``specify`` starts, the root group maps subcommand names to their
+module and calls ``register`` on a scratch Typer app the first time one of
+those names is looked up — when the subcommand runs, or when ``specify
+--help`` lists every command.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import typer
+from typer.core import TyperGroup
+from typer.main import get_command
+
+from .._console import BannerGroup
+
+# module name -> commands built from its register(app), shared by every
+# root group instance (typer builds a new one per invocation).
+_LOADED: dict[str, dict[str, Any]] = {}
+
+
+def load_commands(module_name: str) -> dict[str, Any]:
+    """Import *module_name* and return the click commands it registers."""
+    commands = _LOADED.get(module_name)
+    if commands is None:
+        module = importlib.import_module(module_name)
+        scratch = typer.Typer(add_completion=False)
+        module.register(scratch)
+        group = get_command(scratch)
+        if isinstance(group, TyperGroup):
+            commands = dict(group.commands)
+        else:
+            # A module registering a single command (e.g. ``sync``).
+            commands = {group.name: group}
+        _LOADED[module_name] = commands
+    return commands
+
+
+class LazyCommandGroup(BannerGroup):
+    """Banner group whose ``lazy_commands`` are imported on demand.
+
+    ``lazy_commands`` maps a subcommand name to the module registering it;
+    several names may share a module. Lazy names are listed after the
+    eagerly registered commands, in mapping order.
+    """
+
+    lazy_commands: dict[str, str] = {}
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        names = list(super().list_commands(ctx))
+        names += [name for name in self.lazy_commands if name not in names]
+        return names
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+        command = load_commands(self.lazy_commands[cmd_name]).get(cmd_name)
+        if command is not None:
+            self.add_command(command, cmd_name)
+        return command
@@ -0,0 +1,102 @@
+"""specify cache * command handlers — inspect and prune the download cache.
+
+The cache itself lives in :mod:`specify_cli.download_cache`; it is shared by
+every project on the machine, so these commands do not need a project.
+"""
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import typer
+from rich.table import Table
+
+from .._console import console
+
+cache_app = typer.Typer(
+    name="cache",
+    help="Inspect and prune the shared download cache",
+    add_completion=False,
+)
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+@cache_app.command("info")
+def cache_info():
+    """Show where the download cache is and how full it is."""
+    from .. import download_cache
+
+    entries = download_cache.list_entries()
+    console.print(f"[bold]Location:[/bold] {download_cache.cache_dir()}")
+    console.print(f"[bold]Entries:[/bold]  {len(entries)}")
+    console.print(
+        f"[bold]Size:[/bold]     {_format_size(download_cache.total_size())} "
+        f"of {_format_size(download_cache.max_bytes())}"
+    )
+
+
+@cache_app.command("list")
+def cache_list():
+    """List cached downloads, most recently used first."""
+    from .. import download_cache
+
+    entries = download_cache.list_entries()
+    if not entries:
+        console.print("[yellow]The download cache is empty.[/yellow]")
+        return
+
+    table = Table(title="Download Cache")
+    table.add_column("URL", style="cyan", overflow="fold")
+    table.add_column("Version")
+    table.add_column("SHA-256")
+    table.add_column("Size", justify="right")
+    table.add_column("Last Used")
+    for entry in entries:
+        table.add_row(
+            entry.url,
+            entry.version or "",
+            entry.sha256[:12],
+            _format_size(entry.size),
+            time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.last_used)),
+        )
+    console.print(table)
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_size: Optional[float] = typer.Option(
+        None, "--max-size", min=0, help="Evict least recently used downloads until the cache fits in this many MiB"
+    ),
+    older_than: Optional[int] = typer.Option(
+        None, "--older-than", min=0, help="Remove downloads not used in this many days"
+    ),
+):
+    """Evict old downloads until the cache fits in its size limit."""
+    from .. import download_cache
+
+    removed, freed = download_cache.prune(
+        limit=None if max_size is None else int(max_size * 1024 * 1024),
+        older_than=None if older_than is None else older_than * 86400,
+    )
+    console.print(f"[green]✓[/green] Removed {removed} cached download(s), freed {_format_size(freed)}")
+
+
+@cache_app.command("clear")
+def cache_clear():
+    """Remove every cached download."""
+    from .. import download_cache
+
+    freed = download_cache.clear()
+    console.print(f"[green]✓[/green] Download cache cleared, freed {_format_size(freed)}")
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the cache command group to the root Typer app."""
+    app.add_typer(cache_app, name="cache")
@@ -0,0 +1,68 @@
+"""specify feature * commands."""
+
+from __future__ import annotations
+
+import json
+import shlex
+
+import typer
+
+feature_app = typer.Typer(
+    name="feature",
+    help="Inspect the active feature",
+    add_completion=False,
+)
+
+
+@feature_app.command("context")
+def feature_context(
+    json_output: bool = typer.Option(False, "--json", help="Print the context as a JSON object"),
+    shell: bool = typer.Option(False, "--shell", help="Print shell assignments (KEY=value) for eval"),
+    include_tasks: bool = typer.Option(False, "--include-tasks", help="Include tasks.md in AVAILABLE_DOCS"),
+    require_plan: bool = typer.Option(False, "--require-plan", help="Fail unless plan.md exists"),
+    require_spec: bool = typer.Option(False, "--require-spec", help="Fail unless spec.md exists"),
+    require_tasks: bool = typer.Option(False, "--require-tasks", help="Fail unless tasks.md exists"),
+    fallback_root: str = typer.Option(
+        None,
+        "--fallback-root",
+        hidden=True,
+        help="Project root to use when no .specify/ directory is found above the working directory",
+    ),
+):
+    """Print the feature paths, available docs and invoke separator.
+
+    Output is plain text for scripts; errors go to stderr with exit code 1.
+    """
+    from ..feature_context import FeatureContextError, resolve_feature_context
+
+    if json_output and shell:
+        raise typer.BadParameter("--json and --shell are mutually exclusive", param_hint="--shell")
+
+    try:
+        context = resolve_feature_context(fallback_root=fallback_root)
+        context.validate(
+            require_plan=require_plan,
+            require_spec=require_spec,
+            require_tasks=require_tasks,
+        )
+    except (FeatureContextError, OSError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1)
+
+    data = context.to_dict(include_tasks=include_tasks)
+    if json_output:
+        typer.echo(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    elif shell:
+        for key, value in data.items():
+            if key == "AVAILABLE_DOCS":
+                value = " ".join(value)
+            typer.echo(f"{key}={shlex.quote(value)}")
+    else:
+        for key, value in data.items():
+            if key == "AVAILABLE_DOCS":
+                value = ", ".join(value) or "(none)"
+            typer.echo(f"{key}: {value}")
+
+
+def register(app: typer.Typer) -> None:
+    app.add_typer(feature_app, name="feature")
@@ -12,11 +12,7 @@ import typer
 from rich.live import Live
 from rich.panel import Panel
 
-from .._agent_config import (
-    AGENT_CONFIG,
-    DEFAULT_INIT_INTEGRATION,
-    SCRIPT_TYPE_CHOICES,
-)
+from .._agent_config import DEFAULT_INIT_INTEGRATION, SCRIPT_TYPE_CHOICES
 from .._assets import (
     _locate_bundled_extension,
     _locate_bundled_preset,
@@ -175,6 +171,7 @@ def register(app: typer.Typer) -> None:
             ensure_executable_scripts,
             save_init_options,
         )
+        from .._agent_config import AGENT_CONFIG
         from ..integration_runtime import (
             with_integration_setting as _with_integration_setting,
         )
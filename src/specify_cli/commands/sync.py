@@ -0,0 +1,219 @@
+"""specify sync — install the extensions and presets pinned in the lockfile.
+
+``.specify/lock.yml`` lists the extensions and presets a project expects,
+with their version and priority::
+
+    schema_version: "1.0"
+    extensions:
+      git: {version: 1.0.0, priority: 10}
+    presets:
+      lean: {version: 1.0.0, priority: 10}
+
+``specify sync --write-lock`` records what is currently installed;
+``specify sync`` installs whatever is missing in one transaction: catalog
+packages are downloaded in parallel, every manifest is validated before
+anything is installed, and if any install fails everything installed by
+the run is removed again. Packages that are already installed are left
+alone, and packages installed but not in the lockfile are not removed.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import typer
+import yaml
+
+from .._console import console
+
+LOCKFILE_NAME = "lock.yml"
+LOCKFILE_SCHEMA_VERSION = "1.0"
+
+
+def _lockfile_path(project_root: Path) -> Path:
+    return project_root / ".specify" / LOCKFILE_NAME
+
+
+def _read_lockfile(path: Path) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Return ``{"extensions": {...}, "presets": {...}}`` from *path*.
+
+    Raises:
+        ValueError: If the lockfile is malformed
+    """
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    except (OSError, UnicodeError, yaml.YAMLError) as e:
+        raise ValueError(f"Could not read {path.name}: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"{path.name} must be a mapping")
+    if str(data.get("schema_version", LOCKFILE_SCHEMA_VERSION)) != LOCKFILE_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported {path.name} schema_version: {data.get('schema_version')} "
+            f"(expected {LOCKFILE_SCHEMA_VERSION})"
+        )
+
+    lock: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for section in ("extensions", "presets"):
+        entries = data.get(section) or {}
+        if not isinstance(entries, dict):
+            raise ValueError(f"'{section}' in {path.name} must be a mapping of IDs")
+        lock[section] = {}
+        for package_id, entry in entries.items():
+            entry = entry or {}
+            if not isinstance(entry, dict):
+                raise ValueError(f"Entry '{package_id}' in '{section}' must be a mapping")
+            priority = entry.get("priority", 10)
+            if isinstance(priority, bool) or not isinstance(priority, int) or priority < 1:
+                raise ValueError(
+                    f"Entry '{package_id}' in '{section}' has an invalid priority: {priority!r}"
+                )
+            version = entry.get("version")
+            lock[section][str(package_id)] = {
+                "version": None if version is None else str(version),
+                "priority": priority,
+            }
+    return lock
+
+
+def _locked_entries(registry) -> Dict[str, Dict[str, Any]]:
+    entries: Dict[str, Dict[str, Any]] = {}
+    for package_id, metadata in sorted(registry.list_by_priority(include_disabled=True)):
+        entries[package_id] = {
+            "version": metadata.get("version"),
+            "priority": metadata["priority"],
+        }
+    return entries
+
+
+def _write_lockfile(project_root: Path) -> Path:
+    from ..extensions import ExtensionManager
+    from ..presets import PresetManager
+
+    path = _lockfile_path(project_root)
+    data = {
+        "schema_version": LOCKFILE_SCHEMA_VERSION,
+        "extensions": _locked_entries(ExtensionManager(project_root).registry),
+        "presets": _locked_entries(PresetManager(project_root).registry),
+    }
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def _plan(
+    kind: str, locked: Dict[str, Dict[str, Any]], registry
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Return the locked entries still to install, warning about drift."""
+    missing = []
+    for package_id, entry in locked.items():
+        installed = registry.get(package_id)
+        if installed is None:
+            missing.append((package_id, entry))
+        elif entry["version"] is not None and str(installed.get("version")) != entry["version"]:
+            console.print(
+                f"[yellow]Warning:[/yellow] {kind} '{package_id}' is installed at "
+                f"v{installed.get('version')} but locked to v{entry['version']}; "
+                f"remove it and run 'specify sync' again to install the locked version"
+            )
+    for package_id in registry.keys():
+        if package_id not in locked:
+            console.print(f"[dim]{kind} '{package_id}' is installed but not in the lockfile[/dim]")
+    return missing
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the ``sync`` command to the root Typer app."""
+
+    @app.command("sync")
+    def sync(
+        write_lock: bool = typer.Option(
+            False, "--write-lock", help="Write the lockfile from the installed extensions and presets"
+        ),
+    ):
+        """Install the extensions and presets pinned in .specify/lock.yml."""
+        import tempfile
+
+        from .. import _require_specify_project, get_speckit_version
+        from ..extensions import CompatibilityError, ExtensionError, ExtensionManager, ValidationError
+        from ..presets import PresetCompatibilityError, PresetError, PresetManager, PresetValidationError
+        from ..presets._commands import _stage_presets
+        from .extension import _stage_extensions
+
+        project_root = _require_specify_project()
+        if write_lock:
+            path = _write_lockfile(project_root)
+            console.print(f"[green]✓[/green] Wrote {path.relative_to(project_root).as_posix()}")
+            return
+
+        path = _lockfile_path(project_root)
+        if not path.exists():
+            console.print(f"[red]Error:[/red] No lockfile found at .specify/{LOCKFILE_NAME}")
+            console.print("Run 'specify sync --write-lock' to create one from the installed packages.")
+            raise typer.Exit(1)
+        try:
+            lock = _read_lockfile(path)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+
+        ext_manager = ExtensionManager(project_root)
+        preset_manager = PresetManager(project_root)
+        extensions = _plan("Extension", lock["extensions"], ext_manager.registry)
+        presets = _plan("Preset", lock["presets"], preset_manager.registry)
+        if not extensions and not presets:
+            console.print("[green]✓[/green] Everything in the lockfile is installed")
+            return
+
+        speckit_version = get_speckit_version()
+        installed_extensions: List[str] = []
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                with console.status(
+                    f"[cyan]Installing {len(extensions)} extension(s) and {len(presets)} preset(s)[/cyan]"
+                ):
+                    # Resolve and download everything before installing
+                    # anything, so an unknown package fails the whole run.
+                    ext_sources = _stage_extensions(
+                        [package_id for package_id, _ in extensions],
+                        project_root,
+                        Path(tmpdir) / "extensions",
+                        versions={i: e["version"] for i, e in extensions if e["version"]},
+                    )
+                    preset_sources = _stage_presets(
+                        [package_id for package_id, _ in presets],
+                        project_root,
+                        Path(tmpdir) / "presets",
+                        versions={i: e["version"] for i, e in presets if e["version"]},
+                    )
+
+                    ext_manifests = []
+                    if extensions:
+                        ext_manifests = ext_manager.install_many(
+                            [(source, entry["priority"]) for source, (_, entry) in zip(ext_sources, extensions)],
+                            speckit_version,
+                        )
+                        installed_extensions = [manifest.id for manifest in ext_manifests]
+                    preset_manifests = []
+                    if presets:
+                        preset_manifests = preset_manager.install_many(
+                            [(source, entry["priority"]) for source, (_, entry) in zip(preset_sources, presets)],
+                            speckit_version,
+                        )
+        except (ExtensionError, PresetError) as e:
+            # Extensions are installed first; undo them if the presets fail.
+            ext_manager.rollback_install(installed_extensions)
+            label = "Error"
+            if isinstance(e, (ValidationError, PresetValidationError)):
+                label = "Validation Error"
+            elif isinstance(e, (CompatibilityError, PresetCompatibilityError)):
+                label = "Compatibility Error"
+            console.print(f"[red]{label}:[/red] {e}")
+            console.print("Nothing was installed.")
+            raise typer.Exit(1)
+        except BaseException:
+            ext_manager.rollback_install(installed_extensions)
+            raise
+
+        for manifest in ext_manifests:
+            console.print(f"[green]✓[/green] Extension '{manifest.name}' v{manifest.version} installed")
+        for manifest in preset_manifests:
+            console.print(f"[green]✓[/green] Preset '{manifest.name}' v{manifest.version} installed")
@@ -0,0 +1,483 @@
+"""Content-addressed cache of catalog downloads, shared by every project.
+
+Extension and preset ZIPs, workflow definitions and custom step files
+downloaded from a catalog are kept in a user-level store (platformdirs'
+user cache directory, or ``$SPECIFY_CACHE_DIR``) so other projects and CI
+workspaces on the same machine do not download the same artifact again.
+
+Files are stored once per content digest under ``blobs/<aa>/<sha256>``;
+``index.json`` maps each ``(url, version, sha256)`` key to a blob along with
+its size and when it was last used. Only versioned or checksummed artifacts
+are cached, since a bare URL may serve different content over time. When
+the store grows past its size limit (``$SPECIFY_CACHE_MAX_MB``, 1 GiB by
+default; ``0`` turns caching off) the least recently used blobs are
+evicted.
+
+The cache is best-effort: a missing, corrupt or unwritable store only means
+the artifact is downloaded again. Blobs are re-hashed on every hit, so a
+damaged blob is dropped rather than installed.
+
+Several threads (batch installs download in parallel) and several processes
+(CI workspaces sharing one store) may update the store at once. Every
+read-modify-write of ``index.json`` holds a process-wide lock plus an
+exclusive lock on ``index.lock``, and temporary files get unique names.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .downloads import CHUNK_SIZE, DownloadError, normalize_sha256
+
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+LOCK_NAME = "index.lock"
+
+#: Default size limit of the store (1 GiB).
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+_UNVERSIONED = ("", "unknown")
+
+_INDEX_LOCK = threading.Lock()
+
+# prune() leaves temporary files younger than this alone: they may be a
+# concurrent store() still copying a blob.
+_TMP_GRACE_SECONDS = 3600
+
+Entries = dict[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """One cached artifact as recorded in ``index.json``."""
+
+    key: str
+    url: str
+    version: str | None
+    sha256: str
+    size: int
+    last_used: float
+
+
+def _default_cache_dir() -> Path:
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("specify-cli", appauthor=False)) / "downloads"
+
+
+def cache_dir() -> Path:
+    """Return the directory of the store (``$SPECIFY_CACHE_DIR`` if set)."""
+    override = os.environ.get("SPECIFY_CACHE_DIR")
+    return Path(override).expanduser() if override else _default_cache_dir()
+
+
+def max_bytes() -> int:
+    """Return the size limit of the store (``$SPECIFY_CACHE_MAX_MB`` if valid)."""
+    raw = os.environ.get("SPECIFY_CACHE_MAX_MB")
+    if raw:
+        try:
+            value = float(raw)
+        except ValueError:
+            value = -1
+        if value >= 0:
+            return int(value * 1024 * 1024)
+    return DEFAULT_MAX_BYTES
+
+
+def _cache_key(url: str, version: str | None, sha256: str | None) -> str:
+    return hashlib.sha256(json.dumps([url, version or "", sha256 or ""]).encode("utf-8")).hexdigest()
+
+
+def _normalize_version(version: Any) -> str | None:
+    if version is None or str(version) in _UNVERSIONED:
+        return None
+    return str(version)
+
+
+def _blob_path(root: Path, digest: str) -> Path:
+    return root / "blobs" / digest[:2] / digest
+
+
+def _read_index(root: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads((root / INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, UnicodeError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        key: raw for key, raw in entries.items()
+        if isinstance(raw, dict)
+        and isinstance(raw.get("sha256"), str)
+        and isinstance(raw.get("size"), int)
+        and isinstance(raw.get("last_used"), (int, float))
+    }
+
+
+def _temp_path(directory: Path, prefix: str) -> Path:
+    """Create an empty, uniquely named temporary file in *directory*."""
+    fd, name = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=directory)
+    os.close(fd)
+    return Path(name)
+
+
+def _unlink(path: Path | None) -> None:
+    if path is None:
+        return
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _lock_file(fh: Any) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(fh: Any) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _locked(root: Path) -> Iterator[None]:
+    """Hold the store's lock across threads and processes.
+
+    If the lock file cannot be opened or locked the block still runs: the
+    worst outcome of an unlocked update is a lost index entry.
+    """
+    with _INDEX_LOCK:
+        fh = None
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+            fh = open(root / LOCK_NAME, "a+b")
+            _lock_file(fh)
+        except OSError:
+            if fh is not None:
+                fh.close()
+            fh = None
+        try:
+            yield
+        finally:
+            if fh is not None:
+                try:
+                    _unlock_file(fh)
+                except OSError:
+                    pass
+                fh.close()
+
+
+def _write_index(root: Path, entries: Entries) -> None:
+    tmp = None
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        tmp = _temp_path(root, f"{INDEX_NAME}.")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "entries": entries}), encoding="utf-8")
+        os.replace(tmp, root / INDEX_NAME)
+    except OSError:
+        _unlink(tmp)
+
+
+def _update_index(root: Path, update: Callable[[Entries], Entries]) -> Entries:
+    """Apply *update* to the current index under the store's lock."""
+    with _locked(root):
+        entries = update(_read_index(root))
+        _write_index(root, entries)
+    return entries
+
+
+def _file_digest(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _remove_blob(root: Path, digest: str) -> None:
+    try:
+        _blob_path(root, digest).unlink()
+    except OSError:
+        pass
+
+
+def _cacheable(version: str | None, sha256: str | None) -> bool:
+    return version is not None or sha256 is not None
+
+
+def lookup(url: str, version: Any = None, sha256: Any = None) -> Path | None:
+    """Return the cached blob for *url* at *version*, or None on a miss.
+
+    A hit refreshes the entry's last-used time. A blob whose content no
+    longer matches its digest is removed and reported as a miss.
+    """
+    version = _normalize_version(version)
+    try:
+        expected = normalize_sha256(sha256)
+    except DownloadError:
+        return None
+    if not _cacheable(version, expected) or max_bytes() == 0:
+        return None
+
+    root = cache_dir()
+    key = _cache_key(url, version, expected)
+    raw = _read_index(root).get(key)
+    if raw is None:
+        return None
+    digest = raw["sha256"]
+    blob = _blob_path(root, digest)
+    # Hash outside the lock; only the index update is serialized.
+    try:
+        valid = blob.stat().st_size == raw["size"] and _file_digest(blob) == digest
+    except OSError:
+        valid = False
+
+    if not valid:
+        def drop(entries: Entries) -> Entries:
+            _remove_blob(root, digest)
+            return {k: v for k, v in entries.items() if v["sha256"] != digest}
+
+        _update_index(root, drop)
+        return None
+
+    def touch(entries: Entries) -> Entries:
+        if key in entries:
+            entries[key]["last_used"] = time.time()
+        return entries
+
+    _update_index(root, touch)
+    return blob
+
+
+def store(url: str, version: Any, path: Path, sha256: Any = None) -> Path | None:
+    """Add the file at *path* to the cache under ``(url, version, sha256)``.
+
+    Returns the blob path, or None when the artifact is not cacheable, does
+    not match *sha256*, or the store cannot be written.
+    """
+    version = _normalize_version(version)
+    try:
+        expected = normalize_sha256(sha256)
+    except DownloadError:
+        return None
+    limit = max_bytes()
+    if not _cacheable(version, expected) or limit == 0:
+        return None
+
+    root = cache_dir()
+    tmp = None
+    try:
+        digest = _file_digest(path)
+        if expected is not None and digest != expected:
+            return None
+        blob = _blob_path(root, digest)
+        if not blob.is_file():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = _temp_path(blob.parent, f"{digest}.")
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, blob)
+    except OSError:
+        _unlink(tmp)
+        return None
+
+    stored = False
+
+    def add(entries: Entries) -> Entries:
+        nonlocal stored
+        try:
+            size = blob.stat().st_size
+        except OSError:
+            return entries  # Evicted or pruned by another writer meanwhile.
+        entries[_cache_key(url, version, expected)] = {
+            "url": url,
+            "version": version,
+            "sha256": digest,
+            "size": size,
+            "last_used": time.time(),
+        }
+        stored = True
+        return _evict(root, entries, limit, keep=digest)
+
+    _update_index(root, add)
+    return blob if stored else None
+
+
+def read_bytes(url: str, version: Any = None, sha256: Any = None) -> bytes | None:
+    """Return the cached content of *url* at *version*, or None on a miss."""
+    blob = lookup(url, version, sha256)
+    if blob is None:
+        return None
+    try:
+        return blob.read_bytes()
+    except OSError:
+        return None
+
+
+def store_bytes(url: str, version: Any, data: bytes, sha256: Any = None) -> None:
+    """Add *data* downloaded from *url* to the cache (best-effort)."""
+    if not _cacheable(_normalize_version(version), sha256 or None):
+        return
+    root = cache_dir()
+    tmp = None
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        tmp = _temp_path(root, "incoming.")
+        tmp.write_bytes(data)
+        store(url, version, tmp, sha256)
+    except OSError:
+        pass
+    finally:
+        _unlink(tmp)
+
+
+def fetch(url: str, version: Any, sha256: Any, dest: Path) -> Path | None:
+    """Copy the cached artifact for *url* at *version* to *dest*.
+
+    Returns *dest* on a hit and None on a miss, in which case the caller
+    downloads the artifact and adds it with :func:`store`.
+    """
+    blob = lookup(url, version, sha256)
+    if blob is None:
+        return None
+    tmp = None
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _temp_path(dest.parent, f"{dest.name}.")
+        shutil.copyfile(blob, tmp)
+        os.replace(tmp, dest)
+    except OSError:
+        _unlink(tmp)
+        return None
+    return dest
+
+
+def _evict(root: Path, entries: Entries, limit: int, keep: str | None = None) -> Entries:
+    """Drop least recently used blobs until the store fits in *limit* bytes."""
+    blobs: dict[str, dict[str, Any]] = {}
+    for raw in entries.values():
+        blob = blobs.setdefault(raw["sha256"], {"size": raw["size"], "last_used": 0.0})
+        blob["last_used"] = max(blob["last_used"], raw["last_used"])
+    total = sum(blob["size"] for blob in blobs.values())
+    if total <= limit:
+        return entries
+
+    evicted = set()
+    for digest, blob in sorted(blobs.items(), key=lambda item: item[1]["last_used"]):
+        if total <= limit:
+            break
+        if digest == keep:
+            continue
+        _remove_blob(root, digest)
+        evicted.add(digest)
+        total -= blob["size"]
+    return {k: v for k, v in entries.items() if v["sha256"] not in evicted}
+
+
+def list_entries() -> list[CacheEntry]:
+    """Return every cached artifact, most recently used first."""
+    entries = [
+        CacheEntry(
+            key=key,
+            url=str(raw.get("url", "")),
+            version=raw.get("version"),
+            sha256=raw["sha256"],
+            size=raw["size"],
+            last_used=float(raw["last_used"]),
+        )
+        for key, raw in _read_index(cache_dir()).items()
+    ]
+    return sorted(entries, key=lambda entry: entry.last_used, reverse=True)
+
+
+def total_size() -> int:
+    """Return the size in bytes of the blobs referenced by the index."""
+    sizes = {entry.sha256: entry.size for entry in list_entries()}
+    return sum(sizes.values())
+
+
+def prune(limit: int | None = None, older_than: float | None = None) -> tuple[int, int]:
+    """Evict entries and stray files; return ``(blobs removed, bytes freed)``.
+
+    Entries not used in the last *older_than* seconds are dropped, then
+    least recently used blobs are evicted until the store fits in *limit*
+    bytes (the configured size limit by default). Blobs no longer in the
+    index and leftover temporary files are removed as well.
+    """
+    root = cache_dir()
+    with _locked(root):
+        entries = _read_index(root)
+        before = {raw["sha256"]: raw["size"] for raw in entries.values()}
+        if older_than is not None:
+            cutoff = time.time() - older_than
+            entries = {k: v for k, v in entries.items() if v["last_used"] >= cutoff}
+        entries = _evict(root, entries, max_bytes() if limit is None else limit)
+        kept = {raw["sha256"] for raw in entries.values()}
+        _write_index(root, entries)
+
+        removed = freed = 0
+        for digest, size in before.items():
+            if digest not in kept:
+                _remove_blob(root, digest)
+                removed += 1
+                freed += size
+        blobs_dir = root / "blobs"
+        if blobs_dir.is_dir():
+            stale_tmp = time.time() - _TMP_GRACE_SECONDS
+            for path in blobs_dir.glob("*/*"):
+                if path.name in kept:
+                    continue
+                try:
+                    st = path.stat()
+                    if path.suffix == ".tmp" and st.st_mtime > stale_tmp:
+                        continue  # Possibly another writer's copy in progress.
+                    path.unlink()
+                except OSError:
+                    continue
+                if path.name not in before:
+                    removed += 1
+                    freed += st.st_size
+    return removed, freed
+
+
+def clear() -> int:
+    """Remove the whole store; return the number of bytes freed."""
+    root = cache_dir()
+    freed = 0
+    if root.is_dir():
+        with _locked(root):
+            for path in root.rglob("*"):
+                try:
+                    if path.is_file():
+                        freed += path.stat().st_size
+                except OSError:
+                    pass
+            shutil.rmtree(root, ignore_errors=True)
+    return freed
@@ -0,0 +1,258 @@
+"""Streaming, resumable downloads of extension and preset ZIPs.
+
+``download_file`` streams a response to ``<dest>.part`` in fixed-size
+chunks, so memory use does not grow with the archive, and renames it to
+*dest* only once it is complete (and matches the catalog's ``sha256``, when
+one is given). If a transfer is interrupted the partial file is kept, along
+with the response's ``ETag``/``Last-Modified`` in ``<dest>.part.json``; the
+next download of the same URL to the same path asks the server for the
+remaining bytes with an HTTP ``Range`` request guarded by ``If-Range``, and
+starts over when the server answers with the full file instead.
+
+Large transfers show a progress bar on the shared Rich console when it is
+a terminal and no other live display (such as a status spinner) is active.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import urllib.error
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable
+
+#: Bytes read from the response and written to disk at a time.
+CHUNK_SIZE = 64 * 1024
+
+#: Transfers smaller than this do not get a progress bar.
+PROGRESS_MIN_BYTES = 1024 * 1024
+
+_SHA256_RE = re.compile(r"^(?:sha256:)?([0-9a-fA-F]{64})$")
+_CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+OpenUrl = Callable[..., Any]
+
+
+class DownloadError(Exception):
+    """A download was interrupted, truncated, or failed verification."""
+
+
+def normalize_sha256(value: Any) -> str | None:
+    """Return the lowercase hex digest of a catalog ``sha256`` value.
+
+    Accepts ``<hex>`` and ``sha256:<hex>``; ``None`` or an empty string
+    means no checksum was published.
+
+    Raises:
+        DownloadError: If *value* is not a SHA-256 digest
+    """
+    if value is None or value == "":
+        return None
+    match = _SHA256_RE.match(str(value).strip())
+    if not match:
+        raise DownloadError(f"Invalid sha256 checksum in catalog entry: {value!r}")
+    return match.group(1).lower()
+
+
+def _header(response: Any, name: str) -> str | None:
+    headers = getattr(response, "headers", None)
+    value = headers.get(name) if headers is not None else None
+    return value if isinstance(value, str) else None
+
+
+def _int_header(response: Any, name: str) -> int | None:
+    value = _header(response, name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _validator(response: Any) -> str | None:
+    """Return a validator usable in ``If-Range`` (strong ETag or Last-Modified)."""
+    etag = _header(response, "ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return _header(response, "Last-Modified")
+
+
+def _read_resume_state(meta_file: Path, url: str) -> str | None:
+    try:
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+    except (OSError, UnicodeError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return None
+    validator = meta.get("validator")
+    return validator if isinstance(validator, str) and validator else None
+
+
+def _discard(*paths: Path) -> None:
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _hash_file(path: Path, hasher: Any) -> None:
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+
+
+def _progress(description: str, total: int | None, completed: int):
+    """Return a Rich progress bar context, or a no-op one when unsuitable."""
+    if total is None or total - completed < PROGRESS_MIN_BYTES:
+        return nullcontext(None)
+    from rich.errors import LiveError
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        TextColumn,
+        TransferSpeedColumn,
+    )
+
+    from ._console import console
+
+    if not console.is_terminal:
+        return nullcontext(None)
+    progress = Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=console,
+        transient=True,
+    )
+    try:
+        progress.start()
+    except LiveError:
+        # Another live display (e.g. console.status) owns the terminal.
+        return nullcontext(None)
+    progress.add_task(description, total=total, completed=completed)
+    return _StartedProgress(progress)
+
+
+class _StartedProgress:
+    def __init__(self, progress: Any) -> None:
+        self.progress = progress
+
+    def __enter__(self) -> Any:
+        return self.progress
+
+    def __exit__(self, *exc: Any) -> None:
+        self.progress.stop()
+
+
+def download_file(
+    open_url: OpenUrl,
+    url: str,
+    dest: Path,
+    *,
+    timeout: int = 60,
+    extra_headers: dict[str, str] | None = None,
+    sha256: str | None = None,
+    description: str | None = None,
+) -> Path:
+    """Download *url* to *dest*, resuming an earlier partial download.
+
+    *open_url* is :func:`specify_cli.authentication.http.open_url` (or a
+    catalog's wrapper around it) and receives *timeout* and the merged
+    *extra_headers*. When *sha256* is given the completed file must match
+    it. Returns *dest*.
+
+    Raises:
+        urllib.error.URLError: If the request fails
+        DownloadError: If the transfer is interrupted or truncated (the
+            partial file is kept for the next attempt) or the checksum does
+            not match (the partial file is removed)
+        OSError: If the file cannot be written
+    """
+    expected = normalize_sha256(sha256)
+    part = dest.with_name(f"{dest.name}.part")
+    meta_file = dest.with_name(f"{dest.name}.part.json")
+
+    offset = part.stat().st_size if part.is_file() else 0
+    validator = _read_resume_state(meta_file, url) if offset else None
+    if offset and validator is None:
+        # Without a validator there is no way to tell whether the server's
+        # copy changed since the partial download; start over.
+        _discard(part, meta_file)
+        offset = 0
+
+    headers = dict(extra_headers or {})
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    try:
+        response = open_url(url, timeout=timeout, extra_headers=headers)
+    except urllib.error.HTTPError as exc:
+        if exc.code != 416 or not offset:
+            raise
+        # The partial file no longer fits the remote one; start over.
+        exc.close()
+        _discard(part, meta_file)
+        offset = 0
+        headers.pop("Range")
+        headers.pop("If-Range")
+        response = open_url(url, timeout=timeout, extra_headers=headers)
+
+    with response:
+        hasher = hashlib.sha256()
+        content_range = _CONTENT_RANGE_RE.match(_header(response, "Content-Range") or "")
+        resumed = (
+            offset > 0
+            and getattr(response, "status", None) == 206
+            and content_range is not None
+            and int(content_range.group(1)) == offset
+        )
+        if resumed:
+            _hash_file(part, hasher)
+        else:
+            offset = 0
+
+        length = _int_header(response, "Content-Length")
+        total = offset + length if length is not None else None
+
+        validator = _validator(response)
+        if validator:
+            meta_file.write_text(json.dumps({"url": url, "validator": validator}), encoding="utf-8")
+        else:
+            _discard(meta_file)
+
+        received = offset
+        label = description or dest.name
+        try:
+            with part.open("ab" if resumed else "wb") as out, _progress(label, total, offset) as bar:
+                for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                    out.write(chunk)
+                    hasher.update(chunk)
+                    received += len(chunk)
+                    if bar is not None:
+                        bar.update(bar.task_ids[0], completed=received)
+        except (http.client.HTTPException, urllib.error.URLError, TimeoutError, ConnectionError) as exc:
+            raise DownloadError(
+                f"Download of {url} was interrupted after {received} bytes ({exc}); "
+                "run the command again to resume it"
+            ) from exc
+
+    if total is not None and received != total:
+        raise DownloadError(
+            f"Download of {url} is incomplete: got {received} of {total} bytes; "
+            "run the command again to resume it"
+        )
+    if expected is not None and hasher.hexdigest() != expected:
+        _discard(part, meta_file)
+        raise DownloadError(
+            f"Checksum mismatch for {url}: expected sha256 {expected}, got {hasher.hexdigest()}"
+        )
+
+    os.replace(part, dest)
+    _discard(meta_file)
+    return dest
@@ -8,18 +8,20 @@ without bloating the core framework.
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import copy
 import hashlib
 import json
 import os
 import re
 import shutil
-import tempfile
-import zipfile
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import pathspec
 import yaml
@@ -27,10 +29,26 @@ from packaging import version as pkg_version
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
 
 from ._init_options import is_ai_skills_enabled
+from .archives import ArchiveError, staged_extraction
 from ._invocation_style import is_slash_skills_agent
 from ._utils import dump_frontmatter
 from .catalogs import CatalogEntry as BaseCatalogEntry
-from .catalogs import CatalogStackBase
+from .catalogs import (
+    CatalogFetchResult,
+    CatalogSearchIndex,
+    CatalogStackBase,
+    SearchIndexStore,
+    fetch_catalogs,
+    index_fetch_report,
+    open_catalog,
+    read_cache_metadata,
+    search_index_fingerprint,
+    write_cache_file,
+    write_cache_metadata,
+)
+from .manifest_cache import load_manifest, safe_load
+from . import registry_cache
+from .registry_cache import CachedRegistry, ReadOnlyDict, thaw
 
 _FALLBACK_CORE_COMMAND_NAMES = frozenset(
     {
@@ -134,6 +152,23 @@ def coerce_hook_entries(hook_config: Any) -> List[Any]:
     return hook_config if isinstance(hook_config, list) else [hook_config]
 
 
+def _remove_ignored(root: Path, ignore_fn: Callable[[str, List[str]], Set[str]]) -> None:
+    """Delete the paths under *root* that a copytree *ignore_fn* would skip.
+
+    Used when an extracted extension is moved into place rather than copied,
+    so ``.extensionignore`` still applies.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        ignored = ignore_fn(dirpath, sorted(dirnames + filenames))
+        for name in ignored:
+            path = Path(dirpath) / name
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            else:
+                path.unlink(missing_ok=True)
+        dirnames[:] = [d for d in dirnames if d not in ignored]
+
+
 @dataclass
 class CatalogEntry(BaseCatalogEntry):
     """Represents a single catalog entry in the catalog stack."""
@@ -156,14 +191,19 @@ class ExtensionManifest:
         """
         self.path = manifest_path
         self.warnings: List[str] = []
-        self.data = self._load_yaml(manifest_path)
+        self.data, self.warnings = load_manifest(manifest_path, "extension", self._parse)
+
+    def _parse(self, path: Path) -> tuple[dict, List[str]]:
+        """Load and validate *path*; used when no cached manifest matches."""
+        self.data = self._load_yaml(path)
         self._validate()
+        return self.data, self.warnings
 
     def _load_yaml(self, path: Path) -> dict:
         """Load YAML file safely."""
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
         except yaml.YAMLError as e:
             raise ValidationError(f"Invalid YAML in {path}: {e}")
         except FileNotFoundError:
@@ -426,8 +466,13 @@ class ExtensionManifest:
             return f"sha256:{hashlib.sha256(f.read()).hexdigest()}"
 
 
-class ExtensionRegistry:
-    """Manages the registry of installed extensions."""
+class ExtensionRegistry(CachedRegistry):
+    """Manages the registry of installed extensions.
+
+    Registries for the same file share one parsed snapshot per process (see
+    ``registry_cache``); ``get()``, ``list()`` and ``list_by_priority()``
+    hand out read-only views of it instead of copies.
+    """
 
     REGISTRY_FILE = ".registry"
     SCHEMA_VERSION = "1.0"
@@ -440,32 +485,28 @@ class ExtensionRegistry:
         """
         self.extensions_dir = extensions_dir
         self.registry_path = extensions_dir / self.REGISTRY_FILE
-        self.data = self._load()
+        self._load()
 
-    def _load(self) -> dict:
-        """Load registry from disk."""
-        if not self.registry_path.exists():
-            return {"schema_version": self.SCHEMA_VERSION, "extensions": {}}
+    def _default_data(self) -> dict:
+        return {"schema_version": self.SCHEMA_VERSION, "extensions": {}}
 
-        try:
-            with open(self.registry_path, "r") as f:
-                data = json.load(f)
-            # Validate loaded data is a dict (handles corrupted registry files)
-            if not isinstance(data, dict):
-                return {"schema_version": self.SCHEMA_VERSION, "extensions": {}}
-            # Normalize extensions field (handles corrupted extensions value)
-            if not isinstance(data.get("extensions"), dict):
-                data["extensions"] = {}
-            return data
-        except (json.JSONDecodeError, FileNotFoundError):
-            # Corrupted or missing registry, start fresh
-            return {"schema_version": self.SCHEMA_VERSION, "extensions": {}}
+    def _normalize(self, data: Any) -> Optional[dict]:
+        # Validate loaded data is a dict (handles corrupted registry files)
+        if not isinstance(data, dict):
+            return None
+        # Normalize extensions field (handles corrupted extensions value)
+        if not isinstance(data.get("extensions"), dict):
+            data = {**data, "extensions": {}}
+        return data
 
     def _save(self):
-        """Save registry to disk."""
+        """Save registry to disk, or once at the end of an enclosing ``batch()``."""
+        if not self._defer_save():
+            self._persist()
+
+    def _persist(self) -> None:
         self.extensions_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.registry_path, "w") as f:
-            json.dump(self.data, f, indent=2)
+        self._write()
 
     def add(self, extension_id: str, metadata: dict):
         """Add extension to registry.
@@ -558,39 +599,39 @@ class ExtensionRegistry:
     def get(self, extension_id: str) -> Optional[dict]:
         """Get extension metadata from registry.
 
-        Returns a deep copy to prevent callers from accidentally mutating
-        nested internal registry state without going through the write path.
+        Returns a read-only view so callers cannot mutate internal
+        registry state without going through the write path; use
+        ``copy.deepcopy()`` or ``dict()`` for a mutable copy.
 
         Args:
             extension_id: Extension ID
 
         Returns:
-            Deep copy of extension metadata, or None if not found or corrupted
+            Read-only extension metadata, or None if not found or corrupted
         """
-        extensions = self.data.get("extensions")
+        extensions = self._view().get("extensions")
         if not isinstance(extensions, dict):
             return None
         entry = extensions.get(extension_id)
         # Return None for missing or corrupted (non-dict) entries
         if entry is None or not isinstance(entry, dict):
             return None
-        return copy.deepcopy(entry)
+        return entry
 
     def list(self) -> Dict[str, dict]:
         """Get all installed extensions with valid metadata.
 
-        Returns a deep copy of extensions with dict metadata only.
         Corrupted entries (non-dict values) are filtered out.
 
         Returns:
-            Dictionary of extension_id -> metadata (deep copies), empty dict if corrupted
+            Dictionary of extension_id -> read-only metadata, empty dict if corrupted
         """
-        extensions = self.data.get("extensions", {}) or {}
+        extensions = self._view().get("extensions", {}) or {}
         if not isinstance(extensions, dict):
             return {}
         # Filter to only valid dict entries to match type contract
         return {
-            ext_id: copy.deepcopy(meta)
+            ext_id: meta
             for ext_id, meta in extensions.items()
             if isinstance(meta, dict)
         }
@@ -598,13 +639,13 @@ class ExtensionRegistry:
     def keys(self) -> set:
         """Get all extension IDs including corrupted entries.
 
-        Lightweight method that returns IDs without deep-copying metadata.
+        Lightweight method that returns IDs without touching metadata.
         Use this when you only need to check which extensions are tracked.
 
         Returns:
             Set of extension IDs (includes corrupted entries)
         """
-        extensions = self.data.get("extensions", {}) or {}
+        extensions = self._view().get("extensions", {}) or {}
         if not isinstance(extensions, dict):
             return set()
         return set(extensions.keys())
@@ -618,7 +659,7 @@ class ExtensionRegistry:
         Returns:
             True if extension is installed, False if not or registry corrupted
         """
-        extensions = self.data.get("extensions")
+        extensions = self._view().get("extensions")
         if not isinstance(extensions, dict):
             return False
         return extension_id in extensions
@@ -634,10 +675,10 @@ class ExtensionRegistry:
             include_disabled: If True, include disabled extensions. Default False.
 
         Returns:
-            List of (extension_id, metadata_copy) tuples sorted by priority.
-            Metadata is deep-copied to prevent accidental mutation.
+            List of (extension_id, metadata) tuples sorted by priority.
+            Metadata is a read-only view with ``priority`` normalized.
         """
-        extensions = self.data.get("extensions", {}) or {}
+        extensions = self._view().get("extensions", {}) or {}
         if not isinstance(extensions, dict):
             extensions = {}
         sortable_extensions = []
@@ -647,11 +688,11 @@ class ExtensionRegistry:
             # Skip disabled extensions unless explicitly requested
             if not include_disabled and not meta.get("enabled", True):
                 continue
-            metadata_copy = copy.deepcopy(meta)
-            metadata_copy["priority"] = normalize_priority(
-                metadata_copy.get("priority", 10)
-            )
-            sortable_extensions.append((ext_id, metadata_copy))
+            raw_priority = meta.get("priority")
+            priority = normalize_priority(raw_priority)
+            if type(raw_priority) is not int or raw_priority != priority:
+                meta = ReadOnlyDict({**meta, "priority": priority})
+            sortable_extensions.append((ext_id, meta))
         return sorted(
             sortable_extensions,
             key=lambda item: (item[1]["priority"], item[0]),
@@ -1296,6 +1337,7 @@ class ExtensionManager:
         priority: int = 10,
         link_commands: bool = False,
         force: bool = False,
+        move_source: bool = False,
     ) -> ExtensionManifest:
         """Install extension from a local directory.
 
@@ -1308,6 +1350,9 @@ class ExtensionManager:
                 symlinks to a dev cache when supported by the OS.
             force: If True and extension is already installed, remove it first
                    before proceeding with installation
+            move_source: If True, *source_dir* is a staging directory on the
+                same filesystem (see ``_staged_zip``) and is renamed into
+                place instead of copied
 
         Returns:
             Installed extension manifest
@@ -1378,7 +1423,13 @@ class ExtensionManager:
             shutil.rmtree(dest_dir)
 
         ignore_fn = self._load_extensionignore(source_dir)
-        shutil.copytree(source_dir, dest_dir, ignore=ignore_fn)
+        if move_source:
+            if ignore_fn is not None:
+                _remove_ignored(source_dir, ignore_fn)
+            os.replace(source_dir, dest_dir)
+            manifest.path = dest_dir / "extension.yml"
+        else:
+            shutil.copytree(source_dir, dest_dir, ignore=ignore_fn)
 
         # Register commands with AI agents
         registered_commands = {}
@@ -1470,24 +1521,29 @@ class ExtensionManager:
         if priority < 1:
             raise ValidationError("Priority must be a positive integer (1 or higher)")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_path = Path(tmpdir)
+        with self._staged_zip(zip_path) as extension_dir:
+            # Install from extracted directory
+            return self.install_from_directory(
+                extension_dir, speckit_version, priority=priority, force=force, move_source=True
+            )
 
-            # Extract ZIP safely (prevent Zip Slip attack)
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                # Validate all paths first before extracting anything
-                temp_path_resolved = temp_path.resolve()
-                for member in zf.namelist():
-                    member_path = (temp_path / member).resolve()
-                    # Use is_relative_to for safe path containment check
-                    try:
-                        member_path.relative_to(temp_path_resolved)
-                    except ValueError:
-                        raise ValidationError(
-                            f"Unsafe path in ZIP archive: {member} (potential path traversal)"
-                        )
-                # Only extract after all paths are validated
-                zf.extractall(temp_path)
+    @contextlib.contextmanager
+    def _staged_zip(self, zip_path: Path) -> Iterator[Path]:
+        """Extract an extension ZIP for installation and yield its root.
+
+        The archive is extracted in one pass into a hidden staging directory
+        under the extensions directory, so ``install_from_directory`` can
+        move it into place (``move_source=True``). Whatever is left of the
+        staging directory is removed on exit.
+
+        Raises:
+            ValidationError: If the archive is unsafe, too large, or has no manifest
+        """
+        with contextlib.ExitStack() as stack:
+            try:
+                temp_path = stack.enter_context(staged_extraction(zip_path, self.extensions_dir))
+            except ArchiveError as e:
+                raise ValidationError(str(e)) from e
 
             # Find extension directory (may be nested)
             extension_dir = temp_path
@@ -1502,11 +1558,108 @@ class ExtensionManager:
 
             if not manifest_path.exists():
                 raise ValidationError("No extension.yml found in ZIP file")
+            yield extension_dir
 
-            # Install from extracted directory
-            return self.install_from_directory(
-                extension_dir, speckit_version, priority=priority, force=force
-            )
+    def install_many(
+        self,
+        sources: List[Tuple[Path, int]],
+        speckit_version: str,
+        link_commands: bool = False,
+    ) -> List[ExtensionManifest]:
+        """Install several extensions as one transaction.
+
+        Every manifest is loaded and checked (compatibility, already
+        installed, command conflicts with installed extensions and with
+        each other) before anything is installed. Installs then share one
+        registry write; if any of them fails, the extensions installed so
+        far are removed again and the error is re-raised.
+
+        Args:
+            sources: ``(path, priority)`` pairs; a path is an extension
+                directory or an extension ZIP file
+            speckit_version: Current spec-kit version
+            link_commands: If True, register rendered agent artifacts as
+                symlinks to a dev cache when supported by the OS.
+
+        Returns:
+            Installed extension manifests, in the order given
+
+        Raises:
+            ValidationError: If a manifest or priority is invalid, or two
+                extensions conflict
+            CompatibilityError: If an extension is incompatible
+            ExtensionError: If an extension is already installed
+        """
+        with contextlib.ExitStack() as stack:
+            staged: List[Tuple[Path, int, ExtensionManifest]] = []
+            extracted: Set[Path] = set()
+            for source, priority in sources:
+                if priority < 1:
+                    raise ValidationError("Priority must be a positive integer (1 or higher)")
+                source_dir = source
+                if source.is_file():
+                    source_dir = stack.enter_context(self._staged_zip(source))
+                    extracted.add(source_dir)
+                staged.append((source_dir, priority, ExtensionManifest(source_dir / "extension.yml")))
+
+            seen_ids: Set[str] = set()
+            declared: Dict[str, str] = {}
+            for _, _, manifest in staged:
+                if manifest.id in seen_ids:
+                    raise ValidationError(f"Extension '{manifest.id}' is listed more than once")
+                seen_ids.add(manifest.id)
+                self.check_compatibility(manifest, speckit_version)
+                if self.registry.is_installed(manifest.id):
+                    raise ExtensionError(
+                        f"Extension '{manifest.id}' is already installed. "
+                        f"Use 'specify extension remove {manifest.id}' first."
+                    )
+                self._validate_install_conflicts(manifest)
+                names = self._collect_manifest_command_names(manifest)
+                collisions = [
+                    f"{name} (also provided by extension '{declared[name]}')"
+                    for name in sorted(names)
+                    if name in declared
+                ]
+                if collisions:
+                    raise ValidationError(
+                        f"Extension '{manifest.id}' commands conflict with other extensions being installed:\n- "
+                        + "\n- ".join(collisions)
+                    )
+                declared.update(dict.fromkeys(names, manifest.id))
+
+            installed: List[str] = []
+            with self.registry.batch():
+                try:
+                    for source_dir, priority, manifest in staged:
+                        self.install_from_directory(
+                            source_dir,
+                            speckit_version,
+                            priority=priority,
+                            link_commands=link_commands,
+                            move_source=source_dir in extracted,
+                        )
+                        installed.append(manifest.id)
+                except BaseException:
+                    self.rollback_install(installed)
+                    raise
+            return [manifest for _, _, manifest in staged]
+
+    def rollback_install(self, extension_ids: List[str]) -> None:
+        """Remove freshly installed extensions, newest first.
+
+        Used to undo a failed ``install_many()`` (or a larger transaction
+        that included one). Unlike ``remove()``, nothing is backed up: the
+        extensions were just installed, so their directories hold no user
+        configuration. Cleanup is best-effort and never raises.
+        """
+        with self.registry.batch():
+            for extension_id in reversed(extension_ids):
+                try:
+                    self.remove(extension_id, keep_config=True)
+                    shutil.rmtree(self.extensions_dir / extension_id, ignore_errors=True)
+                except Exception:  # noqa: BLE001
+                    pass  # best-effort cleanup; don't mask the original error
 
     def remove(self, extension_id: str, keep_config: bool = False) -> bool:
         """Remove an installed extension.
@@ -1618,60 +1771,62 @@ class ExtensionManager:
 
         agent_skills_dir = resolve_skills_dir(self.project_root, agent_name)
 
-        for ext_id, metadata in self.registry.list().items():
-            updates: Dict[str, Any] = {}
+        # One registry write for all extensions instead of one per update.
+        with self.registry.batch():
+            for ext_id, metadata in self.registry.list().items():
+                updates: Dict[str, Any] = {}
 
-            registered_commands = metadata.get("registered_commands", {})
-            if (
-                isinstance(registered_commands, dict)
-                and agent_name in registered_commands
-            ):
-                command_names = self._valid_name_list(
-                    registered_commands.get(agent_name)
-                )
-                if command_names:
-                    registrar.unregister_commands(
-                        {agent_name: command_names}, self.project_root
+                registered_commands = metadata.get("registered_commands", {})
+                if (
+                    isinstance(registered_commands, dict)
+                    and agent_name in registered_commands
+                ):
+                    command_names = self._valid_name_list(
+                        registered_commands.get(agent_name)
                     )
+                    if command_names:
+                        registrar.unregister_commands(
+                            {agent_name: command_names}, self.project_root
+                        )
 
-                new_registered = copy.deepcopy(registered_commands)
-                new_registered.pop(agent_name, None)
-                updates["registered_commands"] = new_registered
+                    new_registered = copy.deepcopy(registered_commands)
+                    new_registered.pop(agent_name, None)
+                    updates["registered_commands"] = new_registered
 
-            registered_skills = self._valid_name_list(
-                metadata.get("registered_skills", [])
-            )
-            if registered_skills:
-                # Only pass the resolved skills_dir when it actually exists.
-                # Otherwise let _unregister_extension_skills fall back to
-                # scanning all known agent skills directories, which is useful
-                # for cleaning up stale entries created by earlier installs.
-                skills_dir = agent_skills_dir if agent_skills_dir.is_dir() else None
-                self._unregister_extension_skills(
-                    registered_skills, ext_id, skills_dir=skills_dir
+                registered_skills = self._valid_name_list(
+                    metadata.get("registered_skills", [])
                 )
+                if registered_skills:
+                    # Only pass the resolved skills_dir when it actually exists.
+                    # Otherwise let _unregister_extension_skills fall back to
+                    # scanning all known agent skills directories, which is useful
+                    # for cleaning up stale entries created by earlier installs.
+                    skills_dir = agent_skills_dir if agent_skills_dir.is_dir() else None
+                    self._unregister_extension_skills(
+                        registered_skills, ext_id, skills_dir=skills_dir
+                    )
 
-                # Only reconcile registry state when cleanup was scoped to a
-                # specific existing directory. When skills_dir is None,
-                # _unregister_extension_skills falls back to scanning multiple
-                # candidate directories, so agent_skills_dir cannot be used to
-                # infer what was removed.  When skills_dir is set,
-                # _unregister_extension_skills may intentionally skip deletion
-                # when ownership cannot be verified (e.g., corrupted/missing
-                # SKILL.md or mismatching metadata.source).  Only drop registry
-                # entries for skill directories that were actually removed so
-                # future cleanup attempts can still find skipped ones.
-                if skills_dir is not None:
-                    remaining_skills = [
-                        skill_name
-                        for skill_name in registered_skills
-                        if (skills_dir / skill_name).is_dir()
-                    ]
-                    if remaining_skills != registered_skills:
-                        updates["registered_skills"] = remaining_skills
-
-            if updates:
-                self.registry.update(ext_id, updates)
+                    # Only reconcile registry state when cleanup was scoped to a
+                    # specific existing directory. When skills_dir is None,
+                    # _unregister_extension_skills falls back to scanning multiple
+                    # candidate directories, so agent_skills_dir cannot be used to
+                    # infer what was removed.  When skills_dir is set,
+                    # _unregister_extension_skills may intentionally skip deletion
+                    # when ownership cannot be verified (e.g., corrupted/missing
+                    # SKILL.md or mismatching metadata.source).  Only drop registry
+                    # entries for skill directories that were actually removed so
+                    # future cleanup attempts can still find skipped ones.
+                    if skills_dir is not None:
+                        remaining_skills = [
+                            skill_name
+                            for skill_name in registered_skills
+                            if (skills_dir / skill_name).is_dir()
+                        ]
+                        if remaining_skills != registered_skills:
+                            updates["registered_skills"] = remaining_skills
+
+                if updates:
+                    self.registry.update(ext_id, updates)
 
     def register_enabled_extensions_for_agent(self, agent_name: str) -> None:
         """Register installed, enabled extensions for ``agent_name``.
@@ -1707,46 +1862,48 @@ class ExtensionManager:
             and agent_config.get("extension") != "/SKILL.md"
         )
 
-        for ext_id, metadata in self.registry.list().items():
-            if not metadata.get("enabled", True):
-                continue
-
-            manifest = self.get_extension(ext_id)
-            if manifest is None:
-                continue
+        # One registry write for all extensions instead of one per update.
+        with self.registry.batch():
+            for ext_id, metadata in self.registry.list().items():
+                if not metadata.get("enabled", True):
+                    continue
 
-            ext_dir = self.extensions_dir / ext_id
-            updates: Dict[str, Any] = {}
+                manifest = self.get_extension(ext_id)
+                if manifest is None:
+                    continue
 
-            if agent_config and not skills_mode_active:
-                registered = registrar.register_commands_for_agent(
-                    agent_name, manifest, ext_dir, self.project_root
-                )
-                registered_commands = metadata.get("registered_commands", {})
-                if not isinstance(registered_commands, dict):
-                    registered_commands = {}
-                new_registered = copy.deepcopy(registered_commands)
-                if registered:
-                    new_registered[agent_name] = registered
-                else:
-                    # Registration returned empty list (e.g., corrupted
-                    # manifest pointing at missing command files).  Clear
-                    # stale entry so later cleanup doesn't try to remove
-                    # files that were never written.
-                    new_registered.pop(agent_name, None)
-                if new_registered != registered_commands:
-                    updates["registered_commands"] = new_registered
+                ext_dir = self.extensions_dir / ext_id
+                updates: Dict[str, Any] = {}
 
-            registered_skills = self._register_extension_skills(manifest, ext_dir)
-            if registered_skills:
-                existing_skills = self._valid_name_list(
-                    metadata.get("registered_skills", [])
-                )
-                merged_skills = list(dict.fromkeys(existing_skills + registered_skills))
-                updates["registered_skills"] = merged_skills
+                if agent_config and not skills_mode_active:
+                    registered = registrar.register_commands_for_agent(
+                        agent_name, manifest, ext_dir, self.project_root
+                    )
+                    registered_commands = metadata.get("registered_commands", {})
+                    if not isinstance(registered_commands, dict):
+                        registered_commands = {}
+                    new_registered = copy.deepcopy(registered_commands)
+                    if registered:
+                        new_registered[agent_name] = registered
+                    else:
+                        # Registration returned empty list (e.g., corrupted
+                        # manifest pointing at missing command files).  Clear
+                        # stale entry so later cleanup doesn't try to remove
+                        # files that were never written.
+                        new_registered.pop(agent_name, None)
+                    if new_registered != registered_commands:
+                        updates["registered_commands"] = new_registered
+
+                registered_skills = self._register_extension_skills(manifest, ext_dir)
+                if registered_skills:
+                    existing_skills = self._valid_name_list(
+                        metadata.get("registered_skills", [])
+                    )
+                    merged_skills = list(dict.fromkeys(existing_skills + registered_skills))
+                    updates["registered_skills"] = merged_skills
 
-            if updates:
-                self.registry.update(ext_id, updates)
+                if updates:
+                    self.registry.update(ext_id, updates)
 
     def list_installed(self) -> List[Dict[str, Any]]:
         """List all installed extensions with metadata.
@@ -1960,6 +2117,9 @@ class ExtensionCatalog(CatalogStackBase):
     ENTRY_CLASS = CatalogEntry
     ERROR_TYPE = ValidationError
     VALIDATION_ERROR_TYPE = ValidationError
+    SUPPORTS_MAX_STALE = True
+    # Seconds the process waits at exit for background catalog refreshes.
+    REFRESH_EXIT_TIMEOUT = 3.0
 
     def __init__(self, project_root: Path):
         """Initialize extension catalog manager.
@@ -1972,6 +2132,15 @@ class ExtensionCatalog(CatalogStackBase):
         self.cache_dir = self.extensions_dir / ".cache"
         self.cache_file = self.cache_dir / "catalog.json"
         self.cache_metadata_file = self.cache_dir / "catalog-metadata.json"
+        # Per-catalog outcomes of the most recent multi-catalog fetch.
+        self.last_fetch_report: List[CatalogFetchResult] = []
+        # Stale-while-revalidate refreshes started by this instance.
+        self._refresh_lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._refresh_threads: List[threading.Thread] = []
+        self._search_index = SearchIndexStore(
+            self.cache_dir / "catalog-search-index.json"
+        )
 
     def _make_request(self, url: str):
         """Build a urllib Request, adding auth headers when a provider matches.
@@ -2151,57 +2320,93 @@ class ExtensionCatalog(CatalogStackBase):
         Raises:
             ExtensionError: If catalog cannot be fetched or has invalid format
         """
-        import urllib.error
+        cache_file, cache_meta_file = self._get_cache_paths(entry.url)
+        return self._serve_catalog(
+            entry.url,
+            cache_file,
+            cache_meta_file,
+            force_refresh=force_refresh,
+            max_stale=entry.max_stale,
+        )
 
-        # Determine cache file paths (backward compat for default catalog)
-        if entry.url == self.DEFAULT_CATALOG_URL:
-            cache_file = self.cache_file
-            cache_meta_file = self.cache_metadata_file
-            is_valid = not force_refresh and self.is_cache_valid()
-        else:
-            url_hash = hashlib.sha256(entry.url.encode()).hexdigest()[:16]
-            cache_file = self.cache_dir / f"catalog-{url_hash}.json"
-            cache_meta_file = self.cache_dir / f"catalog-{url_hash}-metadata.json"
-            is_valid = False
-            if not force_refresh and cache_file.exists() and cache_meta_file.exists():
-                try:
-                    metadata = json.loads(cache_meta_file.read_text(encoding="utf-8"))
-                    cached_at = datetime.fromisoformat(metadata.get("cached_at", ""))
-                    if cached_at.tzinfo is None:
-                        cached_at = cached_at.replace(tzinfo=timezone.utc)
-                    age = (datetime.now(timezone.utc) - cached_at).total_seconds()
-                    is_valid = age < self.CACHE_DURATION
-                except (
-                    json.JSONDecodeError,
-                    OSError,
-                    UnicodeError,
-                    ValueError,
-                    KeyError,
-                    TypeError,
-                    AttributeError,
-                ):
-                    # Cache validity is best-effort: invalid/missing metadata
-                    # fields, an unreadable metadata file (permissions / disk),
-                    # a wrongly-encoded metadata file (written by a tool using
-                    # the system locale codec), or a metadata payload that
-                    # parses to a non-mapping like ``[]`` or ``"oops"`` (so
-                    # ``metadata.get(...)`` raises ``AttributeError``) all
-                    # degrade to "cache invalid" so the caller falls through
-                    # to a network refetch instead of crashing.
-                    pass
-
-        # Use cache if valid. A previously-cached payload must clear the
-        # same shape checks as a freshly-fetched one — otherwise a once-
-        # poisoned cache (older spec-kit version, manual edit, upstream
-        # served a bad payload before the network-side guards were added)
-        # would re-crash on every invocation despite the cache being
-        # "valid" by age. If validation fails on the cached read, fall
-        # through to the network fetch path so the cache gets refreshed.
-        if is_valid:
+    def _get_cache_paths(self, url: str) -> tuple[Path, Path]:
+        """Return the ``(cache_file, metadata_file)`` pair for a catalog URL.
+
+        The DEFAULT_CATALOG_URL keeps the legacy file names for backward
+        compatibility; every other URL is cached under a hash of the URL.
+        """
+        if url == self.DEFAULT_CATALOG_URL:
+            return self.cache_file, self.cache_metadata_file
+        url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return (
+            self.cache_dir / f"catalog-{url_hash}.json",
+            self.cache_dir / f"catalog-{url_hash}-metadata.json",
+        )
+
+    def _cache_age(self, cache_file: Path, cache_meta_file: Path) -> Optional[float]:
+        """Return the age of a cached catalog in seconds.
+
+        Returns ``None`` when the cache files are missing or the metadata
+        cannot be read. Cache validity is best-effort: invalid/missing
+        metadata fields, an unreadable metadata file (permissions / disk),
+        a wrongly-encoded metadata file (written by a tool using the
+        system locale codec), or a metadata payload that parses to a
+        non-mapping like ``[]`` or ``"oops"`` (so ``metadata.get(...)``
+        raises ``AttributeError``) all degrade to "no usable cache" so the
+        caller falls through to a network refetch instead of crashing.
+        """
+        if not cache_file.exists() or not cache_meta_file.exists():
+            return None
+        try:
+            metadata = json.loads(cache_meta_file.read_text(encoding="utf-8"))
+            cached_at = datetime.fromisoformat(metadata.get("cached_at", ""))
+            if cached_at.tzinfo is None:
+                cached_at = cached_at.replace(tzinfo=timezone.utc)
+            return (datetime.now(timezone.utc) - cached_at).total_seconds()
+        except (
+            json.JSONDecodeError,
+            OSError,
+            UnicodeError,
+            ValueError,
+            KeyError,
+            TypeError,
+            AttributeError,
+        ):
+            return None
+
+    def _serve_catalog(
+        self,
+        url: str,
+        cache_file: Path,
+        cache_meta_file: Path,
+        *,
+        force_refresh: bool = False,
+        max_stale: int = 0,
+    ) -> Dict[str, Any]:
+        """Return a catalog from its cache, falling back to the network.
+
+        A cache younger than ``CACHE_DURATION`` is served as-is. A cache
+        that expired less than ``max_stale`` seconds ago is also served
+        immediately, and a background refresh brings it up to date for
+        the next lookup (stale-while-revalidate), so neither network
+        latency nor a network outage blocks the caller. Older caches are
+        refetched in the foreground; if that fetch fails on the network,
+        the expired cache is served anyway with a warning rather than
+        failing the command (unless ``force_refresh`` asked for fresh data).
+
+        A previously-cached payload must clear the same shape checks as a
+        freshly-fetched one — otherwise a once-poisoned cache (older
+        spec-kit version, manual edit, upstream served a bad payload
+        before the network-side guards were added) would re-crash on every
+        invocation despite the cache being "valid" by age. If validation
+        fails on the cached read, fall through to the network fetch path
+        so the cache gets refreshed.
+        """
+        age = None if force_refresh else self._cache_age(cache_file, cache_meta_file)
+        if age is not None and age < self.CACHE_DURATION + max(max_stale, 0):
             try:
                 cached_data = json.loads(cache_file.read_text(encoding="utf-8"))
-                self._validate_catalog_payload(cached_data, entry.url)
-                return cached_data
+                self._validate_catalog_payload(cached_data, url)
             except (json.JSONDecodeError, OSError, UnicodeError, ExtensionError):
                 # Cache is best-effort: a JSON-decode failure, an OS-level
                 # read failure (permissions / disk / handle limit), or a
@@ -2209,13 +2414,135 @@ class ExtensionCatalog(CatalogStackBase):
                 # client all fall through to the network fetch path. Only
                 # the network failure is surfaced to the caller.
                 pass
+            else:
+                if age >= self.CACHE_DURATION:
+                    self._refresh_in_background(url, cache_file, cache_meta_file)
+                return cached_data
+
+        try:
+            return self._fetch_catalog_url(url, cache_file, cache_meta_file, force_refresh)
+        except (ExtensionError, OSError) as exc:
+            # URLError (and a read timeout) are OSErrors; a bad payload is not.
+            network_failure = isinstance(exc, OSError) or isinstance(exc.__cause__, OSError)
+            stale_data = None
+            if network_failure and not force_refresh:
+                stale_data = self._read_expired_cache(url, cache_file)
+            if stale_data is None:
+                raise
+            import sys
+
+            print(
+                f"Warning: {exc}; using the expired cached copy instead.",
+                file=sys.stderr,
+            )
+            return stale_data
+
+    def _read_expired_cache(self, url: str, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Return a cached catalog regardless of its age, or None if unusable."""
+        try:
+            cached_data = json.loads(cache_file.read_text(encoding="utf-8"))
+            self._validate_catalog_payload(cached_data, url)
+        except (json.JSONDecodeError, OSError, UnicodeError, ExtensionError):
+            return None
+        return cached_data
+
+    def _refresh_in_background(
+        self, url: str, cache_file: Path, cache_meta_file: Path
+    ) -> None:
+        """Refresh a stale catalog cache on a background thread.
+
+        At most one refresh per URL runs at a time. The thread is a daemon,
+        and the process waits at most ``REFRESH_EXIT_TIMEOUT`` seconds for
+        it at exit, so a one-shot command finishes the refresh without
+        hanging on a slow network. A refresh cut short or failed leaves the
+        stale cache in place (cache writes are atomic) and the next lookup
+        retries.
+        """
+        with self._refresh_lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+
+        def refresh() -> None:
+            try:
+                self._fetch_catalog_url(url, cache_file, cache_meta_file)
+            except Exception:
+                pass  # Keep serving the stale cache; retried on next lookup
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(url)
+
+        thread = threading.Thread(
+            target=refresh,
+            name=f"catalog-refresh-{len(self._refresh_threads)}",
+            daemon=True,
+        )
+        if not self._refresh_threads:
+            atexit.register(self.wait_for_refreshes, self.REFRESH_EXIT_TIMEOUT)
+        self._refresh_threads.append(thread)
+        thread.start()
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> None:
+        """Block until background catalog refreshes have finished.
+
+        *timeout* bounds the total wait across all refreshes.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in list(self._refresh_threads):
+            thread.join(
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+
+    def _fetch_catalog_url(
+        self,
+        url: str,
+        cache_file: Path,
+        cache_meta_file: Path,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch a catalog from the network and refresh its cache files.
+
+        When an (expired) cache exists, the request is conditional on the
+        ``ETag`` / ``Last-Modified`` stored in its metadata. A ``304 Not
+        Modified`` answer re-serves the cached payload and only bumps
+        ``cached_at``, so an unchanged catalog is neither downloaded nor
+        re-parsed.
+
+        Raises:
+            ExtensionError: If catalog cannot be fetched or has invalid format
+        """
+        import urllib.error
 
-        # Fetch from network
+        metadata = (
+            read_cache_metadata(cache_meta_file)
+            if not force_refresh and cache_file.exists()
+            else {}
+        )
         try:
-            with self._open_url(entry.url, timeout=10) as response:
-                catalog_data = json.loads(response.read())
+            response = open_catalog(
+                self._open_url, url, timeout=10, metadata=metadata
+            )
+            if response.not_modified:
+                try:
+                    cached_data = json.loads(cache_file.read_text(encoding="utf-8"))
+                    self._validate_catalog_payload(cached_data, url)
+                except (json.JSONDecodeError, OSError, UnicodeError, ExtensionError):
+                    # The cache we revalidated is unusable after all;
+                    # download the catalog unconditionally.
+                    response = open_catalog(self._open_url, url, timeout=10)
+                else:
+                    write_cache_metadata(
+                        cache_meta_file,
+                        {
+                            **metadata,
+                            "cached_at": datetime.now(timezone.utc).isoformat(),
+                            "catalog_url": url,
+                        },
+                    )
+                    return cached_data
 
-            self._validate_catalog_payload(catalog_data, entry.url)
+            catalog_data = json.loads(response.body)
+            self._validate_catalog_payload(catalog_data, url)
 
             # Save to cache. Both files are explicitly UTF-8 to match the
             # ``read_text(encoding="utf-8")`` on the read side and the
@@ -2226,21 +2553,21 @@ class ExtensionCatalog(CatalogStackBase):
             # network refetch on every invocation. The write itself is
             # best-effort, matching the read side: an unwritable cache dir
             # (read-only checkout, permissions) must not fail a fetch whose
-            # payload was already fetched and validated.
+            # payload was already fetched and validated. Each file is
+            # replaced atomically, so a refresh killed mid-write never
+            # leaves a truncated payload behind.
             try:
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
-                cache_file.write_text(
-                    json.dumps(catalog_data, indent=2), encoding="utf-8"
-                )
-                cache_meta_file.write_text(
+                write_cache_file(cache_file, json.dumps(catalog_data, indent=2))
+                write_cache_file(
+                    cache_meta_file,
                     json.dumps(
                         {
                             "cached_at": datetime.now(timezone.utc).isoformat(),
-                            "catalog_url": entry.url,
+                            "catalog_url": url,
+                            **response.validators,
                         },
                         indent=2,
                     ),
-                    encoding="utf-8",
                 )
             except OSError:
                 pass  # Cache is best-effort; proceed with fetched data
@@ -2248,9 +2575,9 @@ class ExtensionCatalog(CatalogStackBase):
             return catalog_data
 
         except urllib.error.URLError as e:
-            raise ExtensionError(f"Failed to fetch catalog from {entry.url}: {e}")
+            raise ExtensionError(f"Failed to fetch catalog from {url}: {e}") from e
         except json.JSONDecodeError as e:
-            raise ExtensionError(f"Invalid JSON in catalog from {entry.url}: {e}")
+            raise ExtensionError(f"Invalid JSON in catalog from {url}: {e}")
 
     def _get_merged_extensions(
         self, force_refresh: bool = False
@@ -2280,16 +2607,22 @@ class ExtensionCatalog(CatalogStackBase):
         merged: Dict[str, Dict[str, Any]] = {}
         any_success = False
 
-        for catalog_entry in active_catalogs:
-            try:
-                catalog_data = self._fetch_single_catalog(catalog_entry, force_refresh)
-                any_success = True
-            except ExtensionError as e:
+        # Fetch concurrently; results come back in priority order.
+        self.last_fetch_report = fetch_catalogs(
+            active_catalogs,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            ExtensionError,
+        )
+        for result in self.last_fetch_report:
+            catalog_entry = result.entry
+            if not result.ok:
                 print(
-                    f"Warning: Could not fetch catalog '{catalog_entry.name}': {e}",
+                    f"Warning: Could not fetch catalog '{catalog_entry.name}': {result.error}",
                     file=sys.stderr,
                 )
                 continue
+            any_success = True
+            catalog_data = result.data
 
             for ext_id, ext_data in catalog_data.get("extensions", {}).items():
                 # Per-entry guard: ``_fetch_single_catalog`` already validates
@@ -2327,31 +2660,8 @@ class ExtensionCatalog(CatalogStackBase):
         Returns:
             True if cache exists and is within cache duration
         """
-        if not self.cache_file.exists() or not self.cache_metadata_file.exists():
-            return False
-
-        try:
-            metadata = json.loads(self.cache_metadata_file.read_text(encoding="utf-8"))
-            cached_at = datetime.fromisoformat(metadata.get("cached_at", ""))
-            if cached_at.tzinfo is None:
-                cached_at = cached_at.replace(tzinfo=timezone.utc)
-            age_seconds = (datetime.now(timezone.utc) - cached_at).total_seconds()
-            return age_seconds < self.CACHE_DURATION
-        except (
-            json.JSONDecodeError,
-            OSError,
-            UnicodeError,
-            ValueError,
-            KeyError,
-            TypeError,
-            AttributeError,
-        ):
-            # ``AttributeError`` covers the case where the metadata file is
-            # valid JSON but parses to a non-mapping (``[]``, ``"oops"``,
-            # ``42``) so ``metadata.get(...)`` would otherwise crash. All
-            # decode/shape failures degrade to "cache invalid" so the
-            # caller falls through to a network refetch.
-            return False
+        age = self._cache_age(self.cache_file, self.cache_metadata_file)
+        return age is not None and age < self.CACHE_DURATION
 
     def fetch_catalog(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Fetch extension catalog from URL or cache.
@@ -2365,69 +2675,57 @@ class ExtensionCatalog(CatalogStackBase):
         Raises:
             ExtensionError: If catalog cannot be fetched
         """
-        catalog_url = self.get_catalog_url()
+        active = self.get_active_catalogs()
+        catalog_url = active[0].url if active else self.DEFAULT_CATALOG_URL
+        max_stale = active[0].max_stale if active else 0
 
-        # Check the cache first unless ``force_refresh`` was requested,
-        # then fall through to a network fetch. Match the
-        # ``_fetch_single_catalog`` cache contract: a poisoned or
+        # Match the ``_fetch_single_catalog`` cache contract: a poisoned or
         # unreadable cache silently falls through to a network refetch
-        # rather than crashing the caller. ``_validate_catalog_payload``
-        # is reused here so a cache written by an older client
-        # (pre-validation) is rejected and refreshed instead of returning
-        # the stale malformed payload. ``is_cache_valid`` itself swallows
-        # OSError/UnicodeError on the metadata read, so a cache-validity
-        # check can't crash this method before the read-side fallback
-        # runs.
-        if not force_refresh and self.is_cache_valid():
-            try:
-                cached_data = json.loads(self.cache_file.read_text(encoding="utf-8"))
-                self._validate_catalog_payload(cached_data, catalog_url)
-                return cached_data
-            except (json.JSONDecodeError, OSError, UnicodeError, ExtensionError):
-                pass  # Fall through to network fetch
-
-        try:
-            import urllib.error
-
-            with self._open_url(catalog_url, timeout=10) as response:
-                catalog_data = json.loads(response.read())
-
-            # Validate catalog structure. Reuses the same helper as
-            # ``_fetch_single_catalog`` so all three branches (root type,
-            # missing keys, nested-mapping type) stay consistent.
-            self._validate_catalog_payload(catalog_data, catalog_url)
-
-            # Save to cache. Explicit UTF-8 on both writes mirrors the
-            # ``read_text(encoding="utf-8")`` on the read side and the
-            # ``integrations/catalog.py`` precedent — otherwise platforms
-            # whose default encoding isn't UTF-8 would write locale-encoded
-            # bytes the read path can't decode, forcing an unnecessary
-            # refetch on every invocation. Like the read side, the write
-            # is best-effort: an unwritable cache dir must not abort a
-            # fetch whose payload was already fetched and validated.
-            try:
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
-                self.cache_file.write_text(
-                    json.dumps(catalog_data, indent=2), encoding="utf-8"
-                )
+        # rather than crashing the caller, and a recently expired cache is
+        # served while it is refreshed in the background.
+        return self._serve_catalog(
+            catalog_url,
+            self.cache_file,
+            self.cache_metadata_file,
+            force_refresh=force_refresh,
+            max_stale=max_stale,
+        )
 
-                # Save cache metadata
-                metadata = {
-                    "cached_at": datetime.now(timezone.utc).isoformat(),
-                    "catalog_url": catalog_url,
-                }
-                self.cache_metadata_file.write_text(
-                    json.dumps(metadata, indent=2), encoding="utf-8"
-                )
-            except OSError:
-                pass  # Cache is best-effort; proceed with fetched data
+    def _search_index_fingerprint(self) -> Optional[str]:
+        """Fingerprint the active catalog caches, or ``None`` if any is stale."""
+        parts = []
+        for entry in self.get_active_catalogs():
+            cache_file, cache_meta_file = self._get_cache_paths(entry.url)
+            age = self._cache_age(cache_file, cache_meta_file)
+            if age is None or age >= self.CACHE_DURATION:
+                return None
+            parts.append(
+                [
+                    entry.url,
+                    entry.name,
+                    entry.install_allowed,
+                    read_cache_metadata(cache_meta_file),
+                ]
+            )
+        return search_index_fingerprint(parts)
 
-            return catalog_data
+    def _get_search_index(self) -> CatalogSearchIndex:
+        """Return the search index over the merged extensions.
 
-        except urllib.error.URLError as e:
-            raise ExtensionError(f"Failed to fetch catalog from {catalog_url}: {e}")
-        except json.JSONDecodeError as e:
-            raise ExtensionError(f"Invalid JSON in catalog: {e}")
+        While every active catalog is served from a fresh cache, the index
+        persisted when those caches were written is reused and no catalog
+        is re-read. Otherwise the catalogs are fetched and merged as usual
+        and the index is rebuilt.
+        """
+        index = self._search_index.lookup(self._search_index_fingerprint())
+        if index is not None:
+            self.last_fetch_report = index_fetch_report(
+                self.get_active_catalogs(),
+                lambda entry: self._get_cache_paths(entry.url)[1],
+            )
+            return index
+        merged = self._get_merged_extensions()
+        return self._search_index.build(merged, self._search_index_fingerprint())
 
     def search(
         self,
@@ -2438,6 +2736,9 @@ class ExtensionCatalog(CatalogStackBase):
     ) -> List[Dict[str, Any]]:
         """Search catalog for extensions across all active catalogs.
 
+        Matches are ranked: an exact id or name first, then prefix and
+        whole-word matches, then any other substring match.
+
         Args:
             query: Search query (searches name, description, tags)
             tag: Filter by specific tag
@@ -2448,40 +2749,9 @@ class ExtensionCatalog(CatalogStackBase):
             List of matching extension metadata, each annotated with
             ``_catalog_name`` and ``_install_allowed`` from its source catalog.
         """
-        all_extensions = self._get_merged_extensions()
-
-        results = []
-
-        for ext_data in all_extensions:
-            ext_id = ext_data["id"]
-
-            # Apply filters
-            if verified_only and not ext_data.get("verified", False):
-                continue
-
-            if author and ext_data.get("author", "").lower() != author.lower():
-                continue
-
-            if tag and tag.lower() not in [t.lower() for t in ext_data.get("tags", [])]:
-                continue
-
-            if query:
-                # Search in name, description, and tags
-                query_lower = query.lower()
-                searchable_text = " ".join(
-                    [
-                        ext_data.get("name", ""),
-                        ext_data.get("description", ""),
-                        ext_id,
-                    ]
-                    + ext_data.get("tags", [])
-                ).lower()
-
-                if query_lower not in searchable_text:
-                    continue
-
-            results.append(ext_data)
-
+        results = self._get_search_index().search(query, tag=tag, author=author)
+        if verified_only:
+            results = [ext for ext in results if ext.get("verified", False)]
         return results
 
     def get_extension_info(self, extension_id: str) -> Optional[Dict[str, Any]]:
@@ -2496,11 +2766,7 @@ class ExtensionCatalog(CatalogStackBase):
             Extension metadata (annotated with ``_catalog_name`` and
             ``_install_allowed``) or None if not found.
         """
-        all_extensions = self._get_merged_extensions()
-        for ext_data in all_extensions:
-            if ext_data["id"] == extension_id:
-                return ext_data
-        return None
+        return self._get_search_index().get(extension_id)
 
     def download_extension(
         self, extension_id: str, target_dir: Optional[Path] = None
@@ -2514,11 +2780,20 @@ class ExtensionCatalog(CatalogStackBase):
         Returns:
             Path to downloaded ZIP file
 
+        The ZIP is streamed to disk, checked against the entry's ``sha256``
+        when the catalog publishes one, and an interrupted download is
+        resumed on the next call (see :mod:`specify_cli.downloads`). A copy
+        in the shared download cache is used instead when there is one (see
+        :mod:`specify_cli.download_cache`).
+
         Raises:
             ExtensionError: If extension not found or download fails
         """
         import urllib.error
 
+        from . import download_cache
+        from .downloads import DownloadError, download_file
+
         # Get extension info from catalog
         ext_info = self.get_extension_info(extension_id)
         if not ext_info:
@@ -2555,6 +2830,12 @@ class ExtensionCatalog(CatalogStackBase):
         zip_filename = f"{extension_id}-{version}.zip"
         zip_path = target_dir / zip_filename
 
+        # Another project may already have downloaded this exact artifact.
+        sha256 = ext_info.get("sha256")
+        if download_cache.fetch(download_url, version, sha256, zip_path):
+            return zip_path
+        catalog_download_url = download_url
+
         extra_headers = None
         resolved_download_url = self._resolve_github_release_asset_api_url(download_url)
         if resolved_download_url:
@@ -2563,23 +2844,30 @@ class ExtensionCatalog(CatalogStackBase):
 
         # Download the ZIP file
         try:
-            with self._open_url(
-                download_url, timeout=60, extra_headers=extra_headers
-            ) as response:
-                zip_data = response.read()
-
-            zip_path.write_bytes(zip_data)
-            return zip_path
-
+            download_file(
+                self._open_url,
+                download_url,
+                zip_path,
+                timeout=60,
+                extra_headers=extra_headers,
+                sha256=sha256,
+                description=f"Downloading {extension_id}",
+            )
         except urllib.error.URLError as e:
             raise ExtensionError(
                 f"Failed to download extension from {download_url}: {e}"
             )
+        except DownloadError as e:
+            raise ExtensionError(f"Failed to download extension '{extension_id}': {e}")
         except IOError as e:
             raise ExtensionError(f"Failed to save extension ZIP: {e}")
 
+        download_cache.store(catalog_download_url, version, zip_path, sha256)
+        return zip_path
+
     def clear_cache(self):
         """Clear the catalog cache (both legacy and URL-hash-based files)."""
+        self._search_index.clear()
         if self.cache_file.exists():
             self.cache_file.unlink()
         if self.cache_metadata_file.exists():
@@ -2872,18 +3160,14 @@ class HookExecutor:
     def get_project_config(self) -> Dict[str, Any]:
         """Load project-level extension configuration.
 
+        The parsed file is cached per process until its mtime or size
+        changes; each call returns a fresh copy the caller may modify.
+
         Returns:
             Extension configuration dictionary
         """
-        if not self.config_file.exists():
-            return {
-                "installed": [],
-                "settings": {"auto_execute_hooks": True},
-                "hooks": {},
-            }
-
         try:
-            result = yaml.safe_load(self.config_file.read_text(encoding="utf-8"))
+            result = thaw(registry_cache.load(self.config_file, safe_load))
             # Coerce non-dict root (including None for an empty file) to the
             # fully-normalized default so callers always get guaranteed fields.
             if not isinstance(result, dict):
@@ -2912,6 +3196,7 @@ class HookExecutor:
                     ]
             return result
         except (yaml.YAMLError, OSError, UnicodeError):
+            # Missing, unreadable or malformed: use the default configuration.
             return {
                 "installed": [],
                 "settings": {"auto_execute_hooks": True},
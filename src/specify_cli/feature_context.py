@@ -0,0 +1,269 @@
+"""Feature context for the workflow scripts, computed in one process.
+
+``check-prerequisites``, ``setup-plan`` and ``setup-tasks`` all need the same
+bundle: the project root, the active feature directory (from
+``SPECIFY_FEATURE_DIRECTORY`` or ``.specify/feature.json``), the standard
+document paths inside it and the slash-command invoke separator from
+``.specify/integration.json``. The shell implementations derive each piece
+with its own ``jq``/``python3`` call; ``specify feature context`` computes
+them together, and ``scripts/bash/common.sh`` / ``scripts/powershell/common.ps1``
+use it when the CLI is on PATH.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+FEATURE_JSON = ".specify/feature.json"
+
+# Optional documents reported in AVAILABLE_DOCS, in the scripts' order.
+OPTIONAL_DOCS = ("research.md", "data-model.md", "contracts/", "quickstart.md")
+
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+class FeatureContextError(Exception):
+    """Raised when the feature context cannot be determined or validated."""
+
+
+def _read_json_cached(path: Path) -> Any:
+    """Return the parsed JSON at *path*, or None if missing or unreadable.
+
+    Results are reused while the file's mtime and size are unchanged.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        _JSON_CACHE.pop(str(path), None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        data = None
+    _JSON_CACHE[str(path)] = (stamp, data)
+    return data
+
+
+def _logical_cwd() -> str:
+    """Return the working directory as the calling shell spells it.
+
+    ``$PWD`` keeps symlinked path components (like ``pwd`` in the scripts);
+    it is only trusted when it still names the current directory.
+    """
+    pwd = os.environ.get("PWD")
+    if pwd and os.path.isabs(pwd):
+        try:
+            if os.path.samefile(pwd, os.curdir):
+                return pwd
+        except OSError:
+            pass
+    return os.getcwd()
+
+
+def find_specify_root(start: Optional[str] = None) -> Optional[str]:
+    """Return the nearest directory at or above *start* containing ``.specify/``."""
+    current = os.path.abspath(start if start is not None else _logical_cwd())
+    while True:
+        if os.path.isdir(os.path.join(current, ".specify")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def read_feature_directory(repo_root: str) -> str:
+    """Return the raw ``feature_directory`` from ``.specify/feature.json``, or ``""``."""
+    data = _read_json_cached(Path(repo_root) / FEATURE_JSON)
+    if not isinstance(data, dict):
+        return ""
+    value = data.get("feature_directory")
+    return value if isinstance(value, str) else ""
+
+
+def persist_feature_directory(repo_root: str, value: str) -> None:
+    """Record *value* in ``.specify/feature.json`` unless it is already stored.
+
+    Absolute paths under *repo_root* are stored relative to it.
+    """
+    prefix = repo_root.rstrip(os.sep) + os.sep
+    if value.startswith(prefix):
+        value = value[len(prefix):]
+    if read_feature_directory(repo_root) == value:
+        return
+    path = Path(repo_root) / FEATURE_JSON
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"feature_directory": value}, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+
+
+def read_invoke_separator(repo_root: str) -> str:
+    """Return the default integration's slash-command separator (``.`` or ``-``)."""
+    state = _read_json_cached(Path(repo_root) / ".specify" / "integration.json")
+    if not isinstance(state, dict):
+        return "."
+    key = state.get("default_integration") or state.get("integration") or ""
+    settings = state.get("integration_settings")
+    if isinstance(key, str) and isinstance(settings, dict):
+        entry = settings.get(key)
+        if isinstance(entry, dict) and entry.get("invoke_separator") in {".", "-"}:
+            return entry["invoke_separator"]
+    return "."
+
+
+def format_speckit_command(command_name: str, separator: str) -> str:
+    """Render a ``/speckit`` command hint, e.g. ``plan`` -> ``/speckit.plan``."""
+    name = command_name.lstrip("/")
+    for prefix in ("speckit.", "speckit-"):
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            break
+    return f"/speckit{separator}{name.replace('.', separator)}"
+
+
+@dataclass(frozen=True)
+class FeatureContext:
+    """Paths and settings for the active feature."""
+
+    repo_root: str
+    branch: str
+    feature_dir: str
+    invoke_separator: str = "."
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.feature_dir, name)
+
+    @property
+    def paths(self) -> Dict[str, str]:
+        """The variables ``get_feature_paths`` exports, in the same order."""
+        return {
+            "REPO_ROOT": self.repo_root,
+            "CURRENT_BRANCH": self.branch,
+            "FEATURE_DIR": self.feature_dir,
+            "FEATURE_SPEC": self.path("spec.md"),
+            "IMPL_PLAN": self.path("plan.md"),
+            "TASKS": self.path("tasks.md"),
+            "RESEARCH": self.path("research.md"),
+            "DATA_MODEL": self.path("data-model.md"),
+            "QUICKSTART": self.path("quickstart.md"),
+            "CONTRACTS_DIR": self.path("contracts"),
+        }
+
+    def available_docs(self, include_tasks: bool = False) -> List[str]:
+        """Return the optional documents present in the feature directory."""
+        docs = []
+        for name in OPTIONAL_DOCS:
+            if name.endswith("/"):
+                directory = self.path(name.rstrip("/"))
+                try:
+                    if os.path.isdir(directory) and any(os.scandir(directory)):
+                        docs.append(name)
+                except OSError:
+                    pass
+            elif os.path.isfile(self.path(name)):
+                docs.append(name)
+        if include_tasks and os.path.isfile(self.path("tasks.md")):
+            docs.append("tasks.md")
+        return docs
+
+    def command_hint(self, command_name: str) -> str:
+        return format_speckit_command(command_name, self.invoke_separator)
+
+    def validate(
+        self,
+        *,
+        require_plan: bool = False,
+        require_spec: bool = False,
+        require_tasks: bool = False,
+    ) -> None:
+        """Check the feature documents the calling script depends on.
+
+        Raises:
+            FeatureContextError: With the scripts' two-line error message.
+        """
+        if not (require_plan or require_spec or require_tasks):
+            return
+        if not os.path.isdir(self.feature_dir):
+            raise FeatureContextError(
+                f"ERROR: Feature directory not found: {self.feature_dir}\n"
+                f"Run {self.command_hint('specify')} first to create the feature structure."
+            )
+        checks = (
+            (require_plan, "plan.md", "plan", "to create the implementation plan"),
+            (require_spec, "spec.md", "specify", "to create the feature structure"),
+            (require_tasks, "tasks.md", "tasks", "to create the task list"),
+        )
+        for required, name, command, purpose in checks:
+            if required and not os.path.isfile(self.path(name)):
+                raise FeatureContextError(
+                    f"ERROR: {name} not found in {self.feature_dir}\n"
+                    f"Run {self.command_hint(command)} first {purpose}."
+                )
+
+    def to_dict(self, include_tasks: bool = False) -> Dict[str, Any]:
+        data: Dict[str, Any] = dict(self.paths)
+        data["AVAILABLE_DOCS"] = self.available_docs(include_tasks)
+        data["INVOKE_SEPARATOR"] = self.invoke_separator
+        return data
+
+
+def resolve_feature_context(
+    *,
+    env: Optional[Mapping[str, str]] = None,
+    start: Optional[str] = None,
+    fallback_root: Optional[str] = None,
+) -> FeatureContext:
+    """Work out the active feature the way ``get_feature_paths`` does.
+
+    The project root is the nearest ``.specify/`` directory above *start*
+    (default: the working directory), else *fallback_root*. The feature
+    directory comes from ``SPECIFY_FEATURE_DIRECTORY`` (which is then
+    persisted to ``feature.json``) or from ``.specify/feature.json``.
+
+    Raises:
+        FeatureContextError: If no project root or feature directory is found.
+    """
+    env = os.environ if env is None else env
+    repo_root = find_specify_root(start)
+    if repo_root is None:
+        if fallback_root is None:
+            raise FeatureContextError(
+                "ERROR: Not a Spec Kit project (no .specify/ directory found)."
+            )
+        repo_root = os.path.abspath(fallback_root)
+
+    explicit = env.get("SPECIFY_FEATURE_DIRECTORY", "")
+    if explicit:
+        feature_dir = explicit
+        persist_feature_directory(repo_root, explicit)
+    elif os.path.isfile(os.path.join(repo_root, FEATURE_JSON)):
+        feature_dir = read_feature_directory(repo_root)
+        if not feature_dir:
+            raise FeatureContextError(
+                "ERROR: Feature directory not found. Set SPECIFY_FEATURE_DIRECTORY "
+                "or ensure .specify/feature.json contains feature_directory."
+            )
+    else:
+        raise FeatureContextError(
+            "ERROR: Feature directory not found. Set SPECIFY_FEATURE_DIRECTORY "
+            "or run the specify command to create .specify/feature.json."
+        )
+    if not os.path.isabs(feature_dir):
+        feature_dir = os.path.join(repo_root, feature_dir)
+
+    return FeatureContext(
+        repo_root=repo_root,
+        branch=env.get("SPECIFY_FEATURE", ""),
+        feature_dir=feature_dir,
+        invoke_separator=read_invoke_separator(repo_root),
+    )
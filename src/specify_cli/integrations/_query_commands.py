@@ -259,6 +259,7 @@ def integration_search(
     query: Optional[str] = typer.Argument(None, help="Search query (optional)"),
     tag: Optional[str] = typer.Option(None, "--tag", help="Filter by tag"),
     author: Optional[str] = typer.Option(None, "--author", help="Filter by author"),
+    verbose: bool = typer.Option(False, "--verbose", help="Show per-catalog fetch timings"),
 ):
     """Search for integrations in the active catalog stack."""
     from . import INTEGRATION_REGISTRY
@@ -267,7 +268,7 @@ def integration_search(
         IntegrationCatalogError,
         IntegrationValidationError,
     )
-    from .. import _require_specify_project
+    from .. import _print_catalog_fetch_report, _require_specify_project
 
     project_root = _require_specify_project()
     integration_config = _read_integration_json(project_root)
@@ -295,6 +296,9 @@ def integration_search(
             console.print("\nTip: The catalog may be temporarily unavailable. Try again later.")
         raise typer.Exit(1)
 
+    if verbose:
+        _print_catalog_fetch_report(catalog)
+
     if not results:
         console.print("\n[yellow]No integrations found matching criteria[/yellow]")
         if query or tag or author:
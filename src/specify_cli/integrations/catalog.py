@@ -21,7 +21,15 @@ from typing import Any, Dict, List, Optional, Tuple
 import yaml
 from packaging import version as pkg_version
 
-from ..catalogs import CatalogEntry, CatalogStackBase
+from ..catalogs import (
+    CatalogEntry,
+    CatalogFetchResult,
+    CatalogStackBase,
+    fetch_catalogs,
+    open_catalog,
+    read_cache_metadata,
+    write_cache_metadata,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -71,6 +79,8 @@ class IntegrationCatalog(CatalogStackBase):
     def __init__(self, project_root: Path) -> None:
         self.project_root = project_root
         self.cache_dir = project_root / ".specify" / "integrations" / ".cache"
+        # Per-catalog outcomes of the most recent multi-catalog fetch.
+        self.last_fetch_report: List[CatalogFetchResult] = []
 
     def get_active_catalogs(self) -> List[IntegrationCatalogEntry]:
         """Return the ordered list of active integration catalogs.
@@ -162,15 +172,39 @@ class IntegrationCatalog(CatalogStackBase):
                 except OSError:
                     pass  # Cache cleanup is best-effort; ignore deletion failures.
 
+        # An expired cache is revalidated with a conditional request; a
+        # 304 keeps the cached payload and only refreshes its timestamp.
+        metadata = (
+            read_cache_metadata(cache_meta)
+            if not force_refresh and cache_file.exists()
+            else {}
+        )
         try:
             from specify_cli.authentication.http import open_url
 
-            with open_url(entry.url, timeout=10) as resp:
-                # Validate final URL after redirects
-                final_url = resp.geturl()
-                if final_url != entry.url:
-                    self._validate_catalog_url(final_url)
-                catalog_data = json.loads(resp.read())
+            response = open_catalog(
+                open_url, entry.url, timeout=10, metadata=metadata
+            )
+            if response.not_modified:
+                try:
+                    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError, UnicodeError):
+                    cached = None
+                if isinstance(cached, dict):
+                    write_cache_metadata(
+                        cache_meta,
+                        {
+                            **metadata,
+                            "cached_at": datetime.now(timezone.utc).isoformat(),
+                        },
+                    )
+                    return cached
+                response = open_catalog(open_url, entry.url, timeout=10)
+
+            # Validate final URL after redirects
+            if response.url != entry.url:
+                self._validate_catalog_url(response.url)
+            catalog_data = json.loads(response.body)
 
             if not isinstance(catalog_data, dict):
                 raise IntegrationCatalogError(
@@ -196,6 +230,7 @@ class IntegrationCatalog(CatalogStackBase):
                         {
                             "cached_at": datetime.now(timezone.utc).isoformat(),
                             "catalog_url": entry.url,
+                            **response.validators,
                         },
                         indent=2,
                     ),
@@ -230,16 +265,22 @@ class IntegrationCatalog(CatalogStackBase):
         merged: Dict[str, Dict[str, Any]] = {}
         any_success = False
 
-        for entry in active:
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-                any_success = True
-            except IntegrationCatalogError as exc:
+        # Fetch concurrently; results come back in priority order.
+        self.last_fetch_report = fetch_catalogs(
+            active,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            IntegrationCatalogError,
+        )
+        for result in self.last_fetch_report:
+            entry = result.entry
+            if not result.ok:
                 print(
-                    f"Warning: Could not fetch catalog '{entry.name}': {exc}",
+                    f"Warning: Could not fetch catalog '{entry.name}': {result.error}",
                     file=sys.stderr,
                 )
                 continue
+            any_success = True
+            data = result.data
 
             for integ_id, integ_data in data.get("integrations", {}).items():
                 if not isinstance(integ_data, dict):
@@ -0,0 +1,192 @@
+"""Cache of parsed and validated extension/preset manifests.
+
+``ExtensionManifest`` and ``PresetManifest`` are built for every installed
+extension or preset whenever commands are listed, resolved or reconciled.
+Parsing ``extension.yml``/``preset.yml`` with PyYAML and re-running
+validation dominates that cost, so the validated result is kept in memory
+and, for manifests inside a project, as JSON under
+``.specify/cache/manifests/``. Entries are keyed by absolute path, so
+:func:`ensure_cache_dir` git-ignores ``.specify/cache/`` for projects that
+commit ``.specify/``.
+
+An entry is reused while the manifest's path, mtime and size are unchanged.
+Files modified within ``_RACY_WINDOW_NS`` of being cached could change
+again without changing mtime or size, so their SHA-256 is compared as
+well; a file whose content hash still matches (e.g. after ``touch``) is
+also reused without parsing. Manifests whose validated data does not
+survive a JSON round trip (dates, non-string keys) are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from .archives import STAGING_PREFIX
+
+# Bump when manifest validation changes what it stores or normalizes, so
+# entries written by older releases are ignored.
+_MANIFEST_CACHE_VERSION = 1
+
+_RACY_WINDOW_NS = 2_000_000_000
+
+# libyaml's loader is several times faster than the pure-Python one and
+# accepts the same documents; it is optional in PyYAML builds.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_MEMORY: Dict[str, Dict[str, Any]] = {}
+
+ManifestParser = Callable[[Path], Tuple[Dict[str, Any], List[str]]]
+
+
+def safe_load(stream: Any) -> Any:
+    """``yaml.safe_load`` using the C loader when PyYAML was built with it."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def cache_dir_for(manifest_path: Path) -> Optional[Path]:
+    """Return ``.specify/cache/manifests`` for a manifest inside a project.
+
+    Manifests outside a ``.specify`` directory (e.g. a package being
+    installed from a temporary directory) get ``None`` and are not cached,
+    and so do manifests in a staging directory from
+    :func:`~specify_cli.archives.staged_extraction`, which is moved or
+    deleted straight after the install.
+    """
+    for parent in manifest_path.parents:
+        if parent.name.startswith(STAGING_PREFIX):
+            return None
+        if parent.name == ".specify":
+            return parent / "cache" / "manifests"
+    return None
+
+
+def ensure_cache_dir(cache_dir: Path) -> None:
+    """Create *cache_dir* (a ``.specify/cache/<name>`` directory).
+
+    Also writes ``.specify/cache/.gitignore`` ignoring everything, since
+    cache entries only mean something on the machine that wrote them.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir.parent / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text(
+            "# Machine-specific caches written by specify; safe to delete.\n*\n",
+            encoding="utf-8",
+        )
+
+
+def _cache_file(cache_dir: Path, kind: str, key: str) -> Path:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return cache_dir / f"{kind}-{digest}.json"
+
+
+def _read_entry(cache_file: Path) -> Optional[Dict[str, Any]]:
+    try:
+        entry = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, UnicodeError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _write_entry(cache_file: Path, entry: Dict[str, Any]) -> None:
+    try:
+        ensure_cache_dir(cache_file.parent)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(cache_file)
+    except OSError:
+        pass  # Cache is best-effort; the manifest was still loaded.
+
+
+def _sha256(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _round_trips(data: Any) -> bool:
+    try:
+        return json.loads(json.dumps(data)) == data
+    except (TypeError, ValueError):
+        return False
+
+
+def load_manifest(
+    manifest_path: Path, kind: str, parse: ManifestParser
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Return the validated ``(data, warnings)`` for *manifest_path*.
+
+    *parse* loads and validates the file and raises the manifest class's
+    validation error; it only runs when no cached entry matches. *kind*
+    (``"extension"``, ``"preset"``) keeps entries of different manifest
+    types apart. The returned objects are fresh copies the caller may
+    mutate.
+    """
+    key = str(Path(os.path.abspath(manifest_path)))
+    try:
+        st = os.stat(key)
+    except OSError:
+        return parse(manifest_path)  # Raises the "not found" error.
+    stamp = [st.st_mtime_ns, st.st_size]
+
+    cache_dir = cache_dir_for(Path(key))
+    cache_file = _cache_file(cache_dir, kind, key) if cache_dir else None
+    memo_key = f"{kind}:{key}"
+    entry = _MEMORY.get(memo_key)
+    if entry is None and cache_file is not None:
+        entry = _read_entry(cache_file)
+    if entry is not None and (
+        entry.get("version") != _MANIFEST_CACHE_VERSION
+        or entry.get("path") != key
+        or not isinstance(entry.get("data"), dict)
+    ):
+        entry = None
+
+    if entry is not None and entry.get("stamp") == stamp:
+        racy = stamp[0] >= entry.get("cached_at_ns", 0) - _RACY_WINDOW_NS
+        if not racy:
+            _MEMORY[memo_key] = entry
+            return json.loads(json.dumps(entry["data"])), list(entry.get("warnings", []))
+        if _sha256(Path(key)) == entry.get("sha256"):
+            now = time.time_ns()
+            if stamp[0] < now - _RACY_WINDOW_NS:
+                # Old enough now: re-stamp so later loads skip the hash.
+                entry = dict(entry, cached_at_ns=now)
+                if cache_file is not None:
+                    _write_entry(cache_file, entry)
+            _MEMORY[memo_key] = entry
+            return json.loads(json.dumps(entry["data"])), list(entry.get("warnings", []))
+
+    # Hash before parsing: if the file changes in between, the stored
+    # hash and stamp are stale and the next load parses again.
+    sha = _sha256(Path(key))
+    if entry is not None and sha is not None and sha == entry.get("sha256"):
+        data, warnings = entry["data"], entry.get("warnings", [])
+    else:
+        data, warnings = parse(manifest_path)
+        if sha is None or not _round_trips(data):
+            _MEMORY.pop(memo_key, None)
+            return data, warnings
+        data, warnings = json.loads(json.dumps(data)), list(warnings)
+
+    entry = {
+        "version": _MANIFEST_CACHE_VERSION,
+        "path": key,
+        "stamp": stamp,
+        "sha256": sha,
+        "cached_at_ns": time.time_ns(),
+        "data": data,
+        "warnings": warnings,
+    }
+    _MEMORY[memo_key] = entry
+    if cache_file is not None:
+        _write_entry(cache_file, entry)
+    return json.loads(json.dumps(data)), list(warnings)
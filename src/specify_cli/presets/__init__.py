@@ -7,16 +7,15 @@ Presets are self-contained, versioned collections of templates
 customize the Spec-Driven Development workflow.
 """
 
+import contextlib
 import copy
 import json
 import hashlib
 import os
-import tempfile
-import zipfile
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Dict, List, Any
+from typing import TYPE_CHECKING, Optional, Dict, Iterator, List, Any, Set, Tuple
 
 if TYPE_CHECKING:
     from ..agents import CommandRegistrar
@@ -27,10 +26,24 @@ import yaml
 from packaging import version as pkg_version
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
 
+from ..catalogs import (
+    CatalogFetchResult,
+    CatalogSearchIndex,
+    SearchIndexStore,
+    fetch_catalogs,
+    index_fetch_report,
+    open_catalog,
+    read_cache_metadata,
+    search_index_fingerprint,
+    write_cache_metadata,
+)
 from ..extensions import REINSTALL_COMMAND, ExtensionRegistry, normalize_priority
 from .._init_options import is_ai_skills_enabled
+from ..archives import ArchiveError, staged_extraction
 from ..integrations.base import IntegrationBase
 from .._utils import dump_frontmatter
+from ..manifest_cache import ensure_cache_dir, load_manifest, safe_load
+from ..registry_cache import CachedRegistry, ReadOnlyDict
 
 
 def _substitute_core_template(
@@ -133,14 +146,19 @@ class PresetManifest:
             PresetValidationError: If manifest is invalid
         """
         self.path = manifest_path
-        self.data = self._load_yaml(manifest_path)
+        self.data, _ = load_manifest(manifest_path, "preset", self._parse)
+
+    def _parse(self, path: Path) -> tuple[dict, list]:
+        """Load and validate *path*; used when no cached manifest matches."""
+        self.data = self._load_yaml(path)
         self._validate()
+        return self.data, []
 
     def _load_yaml(self, path: Path) -> dict:
         """Load YAML file safely."""
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
         except yaml.YAMLError as e:
             raise PresetValidationError(f"Invalid YAML in {path}: {e}")
         except FileNotFoundError:
@@ -309,8 +327,12 @@ class PresetManifest:
             return f"sha256:{hashlib.sha256(f.read()).hexdigest()}"
 
 
-class PresetRegistry:
-    """Manages the registry of installed presets."""
+class PresetRegistry(CachedRegistry):
+    """Manages the registry of installed presets.
+
+    Shares its parsed snapshot per process like ``ExtensionRegistry``;
+    reads return read-only views.
+    """
 
     REGISTRY_FILE = ".registry"
     SCHEMA_VERSION = "1.0"
@@ -323,40 +345,31 @@ class PresetRegistry:
         """
         self.packs_dir = packs_dir
         self.registry_path = packs_dir / self.REGISTRY_FILE
-        self.data = self._load()
+        self._load()
 
-    def _load(self) -> dict:
-        """Load registry from disk."""
-        if not self.registry_path.exists():
-            return {
-                "schema_version": self.SCHEMA_VERSION,
-                "presets": {}
-            }
+    def _default_data(self) -> dict:
+        return {
+            "schema_version": self.SCHEMA_VERSION,
+            "presets": {}
+        }
 
-        try:
-            with open(self.registry_path, 'r') as f:
-                data = json.load(f)
-            # Validate loaded data is a dict (handles corrupted registry files)
-            if not isinstance(data, dict):
-                return {
-                    "schema_version": self.SCHEMA_VERSION,
-                    "presets": {}
-                }
-            # Normalize presets field (handles corrupted presets value)
-            if not isinstance(data.get("presets"), dict):
-                data["presets"] = {}
-            return data
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {
-                "schema_version": self.SCHEMA_VERSION,
-                "presets": {}
-            }
+    def _normalize(self, data: Any) -> Optional[dict]:
+        # Validate loaded data is a dict (handles corrupted registry files)
+        if not isinstance(data, dict):
+            return None
+        # Normalize presets field (handles corrupted presets value)
+        if not isinstance(data.get("presets"), dict):
+            data = {**data, "presets": {}}
+        return data
 
     def _save(self):
-        """Save registry to disk."""
+        """Save registry to disk, or once at the end of an enclosing ``batch()``."""
+        if not self._defer_save():
+            self._persist()
+
+    def _persist(self) -> None:
         self.packs_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.registry_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        self._write()
 
     def add(self, pack_id: str, metadata: dict):
         """Add preset to registry.
@@ -442,39 +455,38 @@ class PresetRegistry:
     def get(self, pack_id: str) -> Optional[dict]:
         """Get preset metadata from registry.
 
-        Returns a deep copy to prevent callers from accidentally mutating
-        nested internal registry state without going through the write path.
+        Returns a read-only view so callers cannot mutate internal
+        registry state without going through the write path.
 
         Args:
             pack_id: Preset ID
 
         Returns:
-            Deep copy of preset metadata, or None if not found or corrupted
+            Read-only preset metadata, or None if not found or corrupted
         """
-        packs = self.data.get("presets")
+        packs = self._view().get("presets")
         if not isinstance(packs, dict):
             return None
         entry = packs.get(pack_id)
         # Return None for missing or corrupted (non-dict) entries
         if entry is None or not isinstance(entry, dict):
             return None
-        return copy.deepcopy(entry)
+        return entry
 
     def list(self) -> Dict[str, dict]:
         """Get all installed presets with valid metadata.
 
-        Returns a deep copy of presets with dict metadata only.
         Corrupted entries (non-dict values) are filtered out.
 
         Returns:
-            Dictionary of pack_id -> metadata (deep copies), empty dict if corrupted
+            Dictionary of pack_id -> read-only metadata, empty dict if corrupted
         """
-        packs = self.data.get("presets", {}) or {}
+        packs = self._view().get("presets", {}) or {}
         if not isinstance(packs, dict):
             return {}
         # Filter to only valid dict entries to match type contract
         return {
-            pack_id: copy.deepcopy(meta)
+            pack_id: meta
             for pack_id, meta in packs.items()
             if isinstance(meta, dict)
         }
@@ -482,13 +494,13 @@ class PresetRegistry:
     def keys(self) -> set:
         """Get all preset IDs including corrupted entries.
 
-        Lightweight method that returns IDs without deep-copying metadata.
+        Lightweight method that returns IDs without touching metadata.
         Use this when you only need to check which presets are tracked.
 
         Returns:
             Set of preset IDs (includes corrupted entries)
         """
-        packs = self.data.get("presets", {}) or {}
+        packs = self._view().get("presets", {}) or {}
         if not isinstance(packs, dict):
             return set()
         return set(packs.keys())
@@ -504,10 +516,10 @@ class PresetRegistry:
             include_disabled: If True, include disabled presets. Default False.
 
         Returns:
-            List of (pack_id, metadata_copy) tuples sorted by priority.
-            Metadata is deep-copied to prevent accidental mutation.
+            List of (pack_id, metadata) tuples sorted by priority.
+            Metadata is a read-only view with ``priority`` normalized.
         """
-        packs = self.data.get("presets", {}) or {}
+        packs = self._view().get("presets", {}) or {}
         if not isinstance(packs, dict):
             packs = {}
         sortable_packs = []
@@ -517,9 +529,11 @@ class PresetRegistry:
             # Skip disabled presets unless explicitly requested
             if not include_disabled and not meta.get("enabled", True):
                 continue
-            metadata_copy = copy.deepcopy(meta)
-            metadata_copy["priority"] = normalize_priority(metadata_copy.get("priority", 10))
-            sortable_packs.append((pack_id, metadata_copy))
+            raw_priority = meta.get("priority")
+            priority = normalize_priority(raw_priority)
+            if type(raw_priority) is not int or raw_priority != priority:
+                meta = ReadOnlyDict({**meta, "priority": priority})
+            sortable_packs.append((pack_id, meta))
         return sorted(
             sortable_packs,
             key=lambda item: (item[1]["priority"], item[0]),
@@ -534,7 +548,7 @@ class PresetRegistry:
         Returns:
             True if pack is installed, False if not or registry corrupted
         """
-        packs = self.data.get("presets")
+        packs = self._view().get("presets")
         if not isinstance(packs, dict):
             return False
         return pack_id in packs
@@ -1501,6 +1515,7 @@ class PresetManager:
         source_dir: Path,
         speckit_version: str,
         priority: int = 10,
+        move_source: bool = False,
     ) -> PresetManifest:
         """Install preset from a local directory.
 
@@ -1508,6 +1523,9 @@ class PresetManager:
             source_dir: Path to preset directory
             speckit_version: Current spec-kit version
             priority: Resolution priority (lower = higher precedence, default 10)
+            move_source: If True, *source_dir* is a staging directory on the
+                same filesystem (see ``_staged_zip``) and is renamed into
+                place instead of copied
 
         Returns:
             Installed preset manifest
@@ -1516,6 +1534,16 @@ class PresetManager:
             PresetValidationError: If manifest is invalid or priority is invalid
             PresetCompatibilityError: If pack is incompatible
         """
+        manifest = self._install_directory(source_dir, speckit_version, priority, move_source)
+        # Reconcile all affected commands from the full priority stack so that
+        # install order doesn't determine the winning command file.
+        self._reconcile_after_install([manifest])
+        return manifest
+
+    def _install_directory(
+        self, source_dir: Path, speckit_version: str, priority: int, move_source: bool = False
+    ) -> PresetManifest:
+        """Install a preset without reconciling overridden commands."""
         # Validate priority
         if priority < 1:
             raise PresetValidationError("Priority must be a positive integer (1 or higher)")
@@ -1535,86 +1563,98 @@ class PresetManager:
         if dest_dir.exists():
             shutil.rmtree(dest_dir)
 
-        shutil.copytree(source_dir, dest_dir)
-
-        # Pre-register the preset so that composition resolution can see it
-        # in the priority stack when resolving composed command content.
-        self.registry.add(manifest.id, {
-            "version": manifest.version,
-            "source": "local",
-            "manifest_hash": manifest.get_hash(),
-            "enabled": True,
-            "priority": priority,
-            "registered_commands": {},
-            "registered_skills": [],
-        })
-
-        registered_commands: Dict[str, List[str]] = {}
-        registered_skills: List[str] = []
-        try:
-            # Register command overrides with AI agents and persist the result
-            # immediately so cleanup can recover even if installation stops
-            # before later phases complete.
-            registered_commands = self._register_commands(manifest, dest_dir)
-            self.registry.update(manifest.id, {
-                "registered_commands": registered_commands,
+        if move_source:
+            os.replace(source_dir, dest_dir)
+            manifest.path = dest_dir / "preset.yml"
+        else:
+            shutil.copytree(source_dir, dest_dir)
+
+        # One registry write for the whole install: saves inside the batch
+        # only update the in-process registry cache, which the resolver
+        # reads, and the file is written once when the block exits
+        # (including after a rollback).
+        with self.registry.batch():
+            # Pre-register the preset so that composition resolution can see it
+            # in the priority stack when resolving composed command content.
+            self.registry.add(manifest.id, {
+                "version": manifest.version,
+                "source": "local",
+                "manifest_hash": manifest.get_hash(),
+                "enabled": True,
+                "priority": priority,
+                "registered_commands": {},
+                "registered_skills": [],
             })
 
-            # Update corresponding skills when skills mode was previously used
-            # and persist that result as well.
-            registered_skills = self._register_skills(manifest, dest_dir)
-            self.registry.update(manifest.id, {
-                "registered_skills": registered_skills,
-            })
-        except Exception:
-            # Roll back all side effects. Note: if _register_commands or
-            # _register_skills raised mid-way (e.g. I/O error after writing
-            # some files), registered_commands/registered_skills may be empty
-            # and some agent command files could be orphaned. Removing dest_dir
-            # (which contains .composed/) and the registry entry ensures the
-            # preset system is consistent even if orphaned files remain.
-            if registered_commands:
-                self._unregister_commands(registered_commands)
-            if registered_skills:
-                self._unregister_skills(registered_skills, dest_dir)
+            registered_commands: Dict[str, List[str]] = {}
+            registered_skills: List[str] = []
             try:
-                if dest_dir.exists():
-                    shutil.rmtree(dest_dir)
-            except OSError:
-                pass  # best-effort cleanup; don't mask the original error
-            self.registry.remove(manifest.id)
-            raise
+                # Register command overrides with AI agents and record the result
+                # immediately so cleanup can recover even if installation stops
+                # before later phases complete.
+                registered_commands = self._register_commands(manifest, dest_dir)
+                self.registry.update(manifest.id, {
+                    "registered_commands": registered_commands,
+                })
 
-        # Reconcile all affected commands from the full priority stack so that
-        # install order doesn't determine the winning command file.
+                # Update corresponding skills when skills mode was previously used
+                # and record that result as well.
+                registered_skills = self._register_skills(manifest, dest_dir)
+                self.registry.update(manifest.id, {
+                    "registered_skills": registered_skills,
+                })
+            except Exception:
+                # Roll back all side effects. Note: if _register_commands or
+                # _register_skills raised mid-way (e.g. I/O error after writing
+                # some files), registered_commands/registered_skills may be empty
+                # and some agent command files could be orphaned. Removing dest_dir
+                # (which contains .composed/) and the registry entry ensures the
+                # preset system is consistent even if orphaned files remain.
+                if registered_commands:
+                    self._unregister_commands(registered_commands)
+                if registered_skills:
+                    self._unregister_skills(registered_skills, dest_dir)
+                try:
+                    if dest_dir.exists():
+                        shutil.rmtree(dest_dir)
+                except OSError:
+                    pass  # best-effort cleanup; don't mask the original error
+                self.registry.remove(manifest.id)
+                raise
+
+        return manifest
+
+    def _reconcile_after_install(self, manifests: List[PresetManifest]) -> None:
+        """Reconcile the commands overridden by newly installed presets."""
         # Apply the same extension-installed filter as _register_commands to
         # avoid reconciling extension commands when the extension isn't installed.
         extensions_dir = self.project_root / ".specify" / "extensions"
         cmd_names = []
-        for t in manifest.templates:
-            if t.get("type") != "command":
-                continue
-            name = t["name"]
-            parts = name.split(".")
-            if len(parts) >= 3 and parts[0] == "speckit":
-                ext_id = parts[1]
-                if not (extensions_dir / ext_id).is_dir():
+        for manifest in manifests:
+            for t in manifest.templates:
+                if t.get("type") != "command":
                     continue
-            cmd_names.append(name)
+                name = t["name"]
+                parts = name.split(".")
+                if len(parts) >= 3 and parts[0] == "speckit":
+                    ext_id = parts[1]
+                    if not (extensions_dir / ext_id).is_dir():
+                        continue
+                if name not in cmd_names:
+                    cmd_names.append(name)
         if cmd_names:
             try:
                 self._reconcile_composed_commands(cmd_names)
                 self._reconcile_skills(cmd_names)
             except Exception as exc:
                 import warnings
+                ids = ", ".join(manifest.id for manifest in manifests)
                 warnings.warn(
-                    f"Post-install reconciliation failed for {manifest.id}: {exc}. "
+                    f"Post-install reconciliation failed for {ids}: {exc}. "
                     f"Agent command files may not reflect the current priority stack.",
-                    stacklevel=2,
+                    stacklevel=3,
                 )
 
-        return manifest
-
     def install_from_zip(
         self,
         zip_path: Path,
@@ -1639,21 +1679,25 @@ class PresetManager:
         if priority < 1:
             raise PresetValidationError("Priority must be a positive integer (1 or higher)")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_path = Path(tmpdir)
+        with self._staged_zip(zip_path) as pack_dir:
+            return self.install_from_directory(pack_dir, speckit_version, priority, move_source=True)
 
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                temp_path_resolved = temp_path.resolve()
-                for member in zf.namelist():
-                    member_path = (temp_path / member).resolve()
-                    try:
-                        member_path.relative_to(temp_path_resolved)
-                    except ValueError:
-                        raise PresetValidationError(
-                            f"Unsafe path in ZIP archive: {member} "
-                            "(potential path traversal)"
-                        )
-                zf.extractall(temp_path)
+    @contextlib.contextmanager
+    def _staged_zip(self, zip_path: Path) -> Iterator[Path]:
+        """Extract a preset ZIP for installation and yield its root.
+
+        The archive is extracted in one pass into a hidden staging directory
+        under the presets directory, so the root can be moved into place
+        rather than copied. The staging directory is removed on exit.
+
+        Raises:
+            PresetValidationError: If the archive is unsafe, too large, or has no manifest
+        """
+        with contextlib.ExitStack() as stack:
+            try:
+                temp_path = stack.enter_context(staged_extraction(zip_path, self.presets_dir))
+            except ArchiveError as e:
+                raise PresetValidationError(str(e)) from e
 
             pack_dir = temp_path
             manifest_path = pack_dir / "preset.yml"
@@ -1668,8 +1712,84 @@ class PresetManager:
                 raise PresetValidationError(
                     "No preset.yml found in ZIP file"
                 )
+            yield pack_dir
 
-            return self.install_from_directory(pack_dir, speckit_version, priority)
+    def install_many(
+        self,
+        sources: List[Tuple[Path, int]],
+        speckit_version: str,
+    ) -> List[PresetManifest]:
+        """Install several presets as one transaction.
+
+        Every manifest is loaded and checked before anything is installed.
+        Installs share one registry write and one reconciliation pass over
+        the commands they override; if any install fails, the presets
+        installed so far are removed again and the error is re-raised.
+
+        Args:
+            sources: ``(path, priority)`` pairs; a path is a preset
+                directory or a preset ZIP file
+            speckit_version: Current spec-kit version
+
+        Returns:
+            Installed preset manifests, in the order given
+
+        Raises:
+            PresetValidationError: If a manifest or priority is invalid
+            PresetCompatibilityError: If a preset is incompatible
+            PresetError: If a preset is already installed
+        """
+        with contextlib.ExitStack() as stack:
+            staged: List[Tuple[Path, int, PresetManifest]] = []
+            extracted: Set[Path] = set()
+            for source, priority in sources:
+                if priority < 1:
+                    raise PresetValidationError("Priority must be a positive integer (1 or higher)")
+                source_dir = source
+                if source.is_file():
+                    source_dir = stack.enter_context(self._staged_zip(source))
+                    extracted.add(source_dir)
+                staged.append((source_dir, priority, PresetManifest(source_dir / "preset.yml")))
+
+            seen_ids: Set[str] = set()
+            for _, _, manifest in staged:
+                if manifest.id in seen_ids:
+                    raise PresetValidationError(f"Preset '{manifest.id}' is listed more than once")
+                seen_ids.add(manifest.id)
+                self.check_compatibility(manifest, speckit_version)
+                if self.registry.is_installed(manifest.id):
+                    raise PresetError(
+                        f"Preset '{manifest.id}' is already installed. "
+                        f"Use 'specify preset remove {manifest.id}' first."
+                    )
+
+            installed: List[str] = []
+            with self.registry.batch():
+                try:
+                    for source_dir, priority, manifest in staged:
+                        self._install_directory(
+                            source_dir, speckit_version, priority, source_dir in extracted
+                        )
+                        installed.append(manifest.id)
+                except BaseException:
+                    self.rollback_install(installed)
+                    raise
+            manifests = [manifest for _, _, manifest in staged]
+            self._reconcile_after_install(manifests)
+            return manifests
+
+    def rollback_install(self, pack_ids: List[str]) -> None:
+        """Remove freshly installed presets, newest first.
+
+        Used to undo a failed ``install_many()`` (or a larger transaction
+        that included one). Cleanup is best-effort and never raises.
+        """
+        with self.registry.batch():
+            for pack_id in reversed(pack_ids):
+                try:
+                    self.remove(pack_id)
+                except Exception:  # noqa: BLE001
+                    pass  # best-effort cleanup; don't mask the original error
 
     def remove(self, pack_id: str) -> bool:
         """Remove an installed preset.
@@ -1835,6 +1955,11 @@ class PresetCatalog:
         self.cache_dir = self.presets_dir / ".cache"
         self.cache_file = self.cache_dir / "catalog.json"
         self.cache_metadata_file = self.cache_dir / "catalog-metadata.json"
+        # Per-catalog outcomes of the most recent multi-catalog fetch.
+        self.last_fetch_report: List[CatalogFetchResult] = []
+        self._search_index = SearchIndexStore(
+            self.cache_dir / "catalog-search-index.json"
+        )
 
     def _validate_catalog_url(self, url: str) -> None:
         """Validate that a catalog URL uses HTTPS (localhost HTTP allowed).
@@ -1978,6 +2103,11 @@ class PresetCatalog:
             if not url:
                 continue
             self._validate_catalog_url(url)
+            if "max_stale" in item:
+                raise PresetValidationError(
+                    f"max_stale is not supported for catalog '{item.get('name', idx + 1)}' "
+                    f"(only extension catalogs serve stale caches)"
+                )
             raw_priority = item.get("priority", idx + 1)
             # Reject bools explicitly: ``bool`` is a subclass of ``int`` so
             # ``int(True)`` silently returns 1, which would let a YAML
@@ -2157,11 +2287,56 @@ class PresetCatalog:
                 # Only the network failure is surfaced to the caller.
                 pass
 
+        return self._fetch_catalog_url(
+            entry.url, cache_file, metadata_file, force_refresh
+        )
+
+    def _fetch_catalog_url(
+        self,
+        url: str,
+        cache_file: Path,
+        metadata_file: Path,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch a catalog from the network and refresh its cache files.
+
+        When an (expired) cache for *url* exists, the request is
+        conditional on the ``ETag`` / ``Last-Modified`` stored in its
+        metadata. A ``304 Not Modified`` answer re-serves the cached
+        payload and only bumps ``cached_at``.
+
+        Raises:
+            PresetError: If catalog cannot be fetched
+        """
+        metadata: Dict[str, Any] = {}
+        if not force_refresh and cache_file.exists():
+            metadata = read_cache_metadata(metadata_file)
+            if metadata.get("catalog_url") != url:
+                metadata = {}  # legacy cache files written for another URL
         try:
-            with self._open_url(entry.url, timeout=10) as response:
-                catalog_data = json.loads(response.read())
+            response = open_catalog(
+                self._open_url, url, timeout=10, metadata=metadata
+            )
+            if response.not_modified:
+                try:
+                    cached_data = json.loads(cache_file.read_text(encoding="utf-8"))
+                    self._validate_catalog_payload(cached_data, url)
+                except (json.JSONDecodeError, OSError, UnicodeError, PresetError):
+                    # The cache we revalidated is unusable after all;
+                    # download the catalog unconditionally.
+                    response = open_catalog(self._open_url, url, timeout=10)
+                else:
+                    write_cache_metadata(
+                        metadata_file,
+                        {
+                            **metadata,
+                            "cached_at": datetime.now(timezone.utc).isoformat(),
+                        },
+                    )
+                    return cached_data
 
-            self._validate_catalog_payload(catalog_data, entry.url)
+            catalog_data = json.loads(response.body)
+            self._validate_catalog_payload(catalog_data, url)
 
             # Both files are written explicitly as UTF-8 to match the
             # ``read_text(encoding="utf-8")`` on the read side and the
@@ -2180,7 +2355,8 @@ class PresetCatalog:
                 )
                 metadata = {
                     "cached_at": datetime.now(timezone.utc).isoformat(),
-                    "catalog_url": entry.url,
+                    "catalog_url": url,
+                    **response.validators,
                 }
                 metadata_file.write_text(
                     json.dumps(metadata, indent=2), encoding="utf-8"
@@ -2194,7 +2370,7 @@ class PresetCatalog:
             if isinstance(e, PresetError):
                 raise
             raise PresetError(
-                f"Failed to fetch preset catalog from {entry.url}: {e}"
+                f"Failed to fetch preset catalog from {url}: {e}"
             )
 
     def _get_merged_packs(self, force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
@@ -2208,25 +2384,31 @@ class PresetCatalog:
         active_catalogs = self.get_active_catalogs()
         merged: Dict[str, Dict[str, Any]] = {}
 
-        for entry in reversed(active_catalogs):
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-                for pack_id, pack_data in data.get("presets", {}).items():
-                    # Per-entry guard: ``_fetch_single_catalog`` already
-                    # validates that ``data["presets"]`` is a mapping, but it
-                    # does not (and should not) validate every entry shape
-                    # there — one malformed entry shouldn't poison an
-                    # otherwise valid catalog. Skip non-mapping entries here
-                    # so a payload like ``{"presets": {"foo": [], "bar":
-                    # {...}}}`` still merges the valid entries without
-                    # crashing on ``**pack_data``. Mirrors
-                    # ``integrations/catalog.py:245``.
-                    if not isinstance(pack_data, dict):
-                        continue
-                    pack_data_with_catalog = {**pack_data, "_catalog_name": entry.name, "_install_allowed": entry.install_allowed}
-                    merged[pack_id] = pack_data_with_catalog
-            except PresetError:
+        # Fetch concurrently, then merge lowest-precedence first so
+        # higher-precedence catalogs overwrite on ID conflicts.
+        self.last_fetch_report = fetch_catalogs(
+            active_catalogs,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            PresetError,
+        )
+        for result in reversed(self.last_fetch_report):
+            if not result.ok:
                 continue
+            entry, data = result.entry, result.data
+            for pack_id, pack_data in data.get("presets", {}).items():
+                # Per-entry guard: ``_fetch_single_catalog`` already
+                # validates that ``data["presets"]`` is a mapping, but it
+                # does not (and should not) validate every entry shape
+                # there — one malformed entry shouldn't poison an
+                # otherwise valid catalog. Skip non-mapping entries here
+                # so a payload like ``{"presets": {"foo": [], "bar":
+                # {...}}}`` still merges the valid entries without
+                # crashing on ``**pack_data``. Mirrors
+                # ``integrations/catalog.py:245``.
+                if not isinstance(pack_data, dict):
+                    continue
+                pack_data_with_catalog = {**pack_data, "_catalog_name": entry.name, "_install_allowed": entry.install_allowed}
+                merged[pack_id] = pack_data_with_catalog
 
         return merged
 
@@ -2308,48 +2490,45 @@ class PresetCatalog:
                 # fall through to network fetch.
                 pass
 
-        try:
-            with self._open_url(catalog_url, timeout=10) as response:
-                catalog_data = json.loads(response.read())
-
-            # Validate catalog structure. Reuses the same helper as
-            # ``_fetch_single_catalog`` so all three branches (root type,
-            # missing keys, nested-mapping type) stay consistent.
-            self._validate_catalog_payload(catalog_data, catalog_url)
-
-            # Save to cache. Explicit UTF-8 on both writes mirrors the
-            # ``read_text(encoding="utf-8")`` on the read side and the
-            # ``integrations/catalog.py`` precedent — otherwise platforms
-            # whose default encoding isn't UTF-8 would write
-            # locale-encoded bytes the read path can't decode, forcing an
-            # unnecessary refetch on every invocation. Like the read
-            # side, the write is best-effort: an unwritable cache dir
-            # must not be re-raised as a ``PresetError`` for a payload
-            # that was already fetched and validated.
-            try:
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
-                self.cache_file.write_text(
-                    json.dumps(catalog_data, indent=2), encoding="utf-8"
-                )
+        return self._fetch_catalog_url(
+            catalog_url, self.cache_file, self.cache_metadata_file, force_refresh
+        )
 
-                metadata = {
-                    "cached_at": datetime.now(timezone.utc).isoformat(),
-                    "catalog_url": catalog_url,
-                }
-                self.cache_metadata_file.write_text(
-                    json.dumps(metadata, indent=2), encoding="utf-8"
-                )
-            except OSError:
-                pass  # Cache is best-effort; proceed with fetched data
+    def _search_index_fingerprint(self) -> Optional[str]:
+        """Fingerprint the active catalog caches, or ``None`` if any is stale."""
+        parts = []
+        for entry in self.get_active_catalogs():
+            if not self._is_url_cache_valid(entry.url):
+                return None
+            _, metadata_file = self._get_cache_paths(entry.url)
+            parts.append(
+                [
+                    entry.url,
+                    entry.name,
+                    entry.install_allowed,
+                    read_cache_metadata(metadata_file),
+                ]
+            )
+        return search_index_fingerprint(parts)
 
-            return catalog_data
+    def _get_search_index(self) -> CatalogSearchIndex:
+        """Return the search index over the merged presets.
 
-        except (ImportError, Exception) as e:
-            if isinstance(e, PresetError):
-                raise
-            raise PresetError(
-                f"Failed to fetch preset catalog from {catalog_url}: {e}"
+        Reuses the index persisted alongside the catalog caches while they
+        are all fresh; otherwise merges the catalogs and rebuilds it.
+        """
+        index = self._search_index.lookup(self._search_index_fingerprint())
+        if index is not None:
+            self.last_fetch_report = index_fetch_report(
+                self.get_active_catalogs(),
+                lambda entry: self._get_cache_paths(entry.url)[1],
             )
+            return index
+        packs = self._get_merged_packs()
+        return self._search_index.build(
+            [{**pack_data, "id": pack_id} for pack_id, pack_data in packs.items()],
+            self._search_index_fingerprint(),
+        )
 
     def search(
         self,
@@ -2360,7 +2539,9 @@ class PresetCatalog:
         """Search catalog for presets.
 
         Searches across all active catalogs (merged by priority) so that
-        community and custom catalogs are included in results.
+        community and custom catalogs are included in results. Matches are
+        ranked: an exact id or name first, then prefix and whole-word
+        matches, then any other substring match.
 
         Args:
             query: Search query (searches name, description, tags)
@@ -2371,38 +2552,10 @@ class PresetCatalog:
             List of matching preset metadata
         """
         try:
-            packs = self._get_merged_packs()
+            index = self._get_search_index()
         except PresetError:
             return []
-
-        results = []
-
-        for pack_id, pack_data in packs.items():
-            if author and pack_data.get("author", "").lower() != author.lower():
-                continue
-
-            if tag and tag.lower() not in [
-                t.lower() for t in pack_data.get("tags", [])
-            ]:
-                continue
-
-            if query:
-                query_lower = query.lower()
-                searchable_text = " ".join(
-                    [
-                        pack_data.get("name", ""),
-                        pack_data.get("description", ""),
-                        pack_id,
-                    ]
-                    + pack_data.get("tags", [])
-                ).lower()
-
-                if query_lower not in searchable_text:
-                    continue
-
-            results.append({**pack_data, "id": pack_id})
-
-        return results
+        return index.search(query, tag=tag, author=author)
 
     def get_pack_info(
         self, pack_id: str
@@ -2418,13 +2571,10 @@ class PresetCatalog:
             Pack metadata or None if not found
         """
         try:
-            packs = self._get_merged_packs()
+            index = self._get_search_index()
         except PresetError:
             return None
-
-        if pack_id in packs:
-            return {**packs[pack_id], "id": pack_id}
-        return None
+        return index.get(pack_id)
 
     def download_pack(
         self, pack_id: str, target_dir: Optional[Path] = None
@@ -2438,11 +2588,20 @@ class PresetCatalog:
         Returns:
             Path to downloaded ZIP file
 
+        The ZIP is streamed to disk, checked against the entry's ``sha256``
+        when the catalog publishes one, and an interrupted download is
+        resumed on the next call (see :mod:`specify_cli.downloads`). A copy
+        in the shared download cache is used instead when there is one (see
+        :mod:`specify_cli.download_cache`).
+
         Raises:
             PresetError: If pack not found or download fails
         """
         import urllib.error
 
+        from .. import download_cache
+        from ..downloads import DownloadError, download_file
+
         pack_info = self.get_pack_info(pack_id)
         if not pack_info:
             raise PresetError(
@@ -2491,6 +2650,12 @@ class PresetCatalog:
         zip_filename = f"{pack_id}-{version}.zip"
         zip_path = target_dir / zip_filename
 
+        # Another project may already have downloaded this exact artifact.
+        sha256 = pack_info.get("sha256")
+        if download_cache.fetch(download_url, version, sha256, zip_path):
+            return zip_path
+        catalog_download_url = download_url
+
         extra_headers = None
         resolved_download_url = self._resolve_github_release_asset_api_url(download_url)
         if resolved_download_url:
@@ -2498,27 +2663,108 @@ class PresetCatalog:
             extra_headers = {"Accept": "application/octet-stream"}
 
         try:
-            with self._open_url(download_url, timeout=60, extra_headers=extra_headers) as response:
-                zip_data = response.read()
-
-            zip_path.write_bytes(zip_data)
-            return zip_path
-
+            download_file(
+                self._open_url,
+                download_url,
+                zip_path,
+                timeout=60,
+                extra_headers=extra_headers,
+                sha256=sha256,
+                description=f"Downloading {pack_id}",
+            )
         except urllib.error.URLError as e:
             raise PresetError(
                 f"Failed to download preset from {download_url}: {e}"
             )
+        except DownloadError as e:
+            raise PresetError(f"Failed to download preset '{pack_id}': {e}")
         except IOError as e:
             raise PresetError(f"Failed to save preset ZIP: {e}")
 
+        download_cache.store(catalog_download_url, version, zip_path, sha256)
+        return zip_path
+
     def clear_cache(self):
         """Clear all catalog cache files, including per-URL hashed caches."""
+        self._search_index.clear()
         if self.cache_dir.exists():
             for f in self.cache_dir.iterdir():
                 if f.is_file() and f.name.startswith("catalog"):
                     f.unlink(missing_ok=True)
 
 
+#: Bumped whenever composition output changes, orphaning on-disk entries.
+_COMPOSED_CACHE_VERSION = 1
+#: Composed ``resolve_content`` results by layer-stack key (see
+#: ``PresetResolver._composed_cache_key``), shared by every resolver.
+_COMPOSED_CONTENT_CACHE: Dict[tuple, str] = {}
+_COMPOSED_CONTENT_CACHE_SIZE = 256
+
+
+def _remember_composed(key: tuple, content: str) -> None:
+    """Store a composed result, evicting the oldest entries past the limit."""
+    _COMPOSED_CONTENT_CACHE.pop(key, None)
+    _COMPOSED_CONTENT_CACHE[key] = content
+    while len(_COMPOSED_CONTENT_CACHE) > _COMPOSED_CONTENT_CACHE_SIZE:
+        del _COMPOSED_CONTENT_CACHE[next(iter(_COMPOSED_CONTENT_CACHE))]
+
+
+class ResolutionIndex:
+    """Cached view of the tiers a :class:`PresetResolver` walks.
+
+    Every lookup used to re-read both registries, re-list the extensions
+    directory and stat each candidate path in every tier. The index does
+    each of those once: one directory listing answers all existence checks
+    in that directory, the preset and extension priority lists (and
+    extension manifests) are read on first use, and resolved paths and
+    layer stacks are memoized per template name and type.
+
+    An index is only valid for the :attr:`stamp` it was built under — the
+    mtime and size of both ``.registry`` files and of the tier directories.
+    ``PresetResolver`` rebuilds it whenever the stamp changes, so installing,
+    removing or reprioritising a preset or extension, or adding an override
+    or core file, is seen by the next lookup. Files added inside an already
+    installed preset or extension directory are only picked up by a new
+    resolver (or after :meth:`PresetResolver.invalidate`).
+    """
+
+    def __init__(self, stamp: tuple) -> None:
+        self.stamp = stamp
+        self.presets: Optional[List[tuple]] = None
+        self.extensions: Optional[List[tuple]] = None
+        self.extension_manifests: Dict[str, Any] = {}
+        self.resolved: Dict[tuple, Optional[Path]] = {}
+        self.layers: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._listings: Dict[Path, Dict[str, bool]] = {}
+
+    def _listing(self, directory: Path) -> Dict[str, bool]:
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = {}
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                listing[entry.name] = True
+                            elif entry.is_file():
+                                listing[entry.name] = False
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            self._listings[directory] = listing
+        return listing
+
+    def exists(self, path: Path) -> bool:
+        """Return whether *path* exists, listing its directory at most once."""
+        return path.name in self._listing(path.parent)
+
+    def is_dir(self, path: Path) -> bool:
+        """Return whether *path* is a directory, listing its parent at most once."""
+        return self._listing(path.parent).get(path.name, False)
+
+
 class PresetResolver:
     """Resolves template names to file paths using a priority stack.
 
@@ -2527,20 +2773,64 @@ class PresetResolver:
     2. .specify/presets/<preset-id>/          - Installed presets
     3. .specify/extensions/<ext-id>/templates/ - Extension-provided templates
     4. .specify/templates/                    - Core templates (shipped with Spec Kit)
+
+    Lookups share a :class:`ResolutionIndex`, so repeated resolution on one
+    resolver scans each tier once.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, cache_composed: bool = False):
         """Initialize preset resolver.
 
         Args:
             project_root: Path to project root directory
+            cache_composed: Also persist composed ``resolve_content`` results
+                under ``.specify/cache/composed/`` so later processes reuse
+                them. Composed results are always memoized in memory.
         """
         self.project_root = project_root
+        self.cache_composed = cache_composed
         self.templates_dir = project_root / ".specify" / "templates"
         self.presets_dir = project_root / ".specify" / "presets"
         self.overrides_dir = self.templates_dir / "overrides"
         self.extensions_dir = project_root / ".specify" / "extensions"
         self._manifest_cache: Dict[str, Optional["PresetManifest"]] = {}
+        self._index: Optional[ResolutionIndex] = None
+
+    def _resolution_stamp(self) -> tuple:
+        """Return the stat signature a :class:`ResolutionIndex` is valid for."""
+        watched = (
+            self.presets_dir / PresetRegistry.REGISTRY_FILE,
+            self.extensions_dir / ExtensionRegistry.REGISTRY_FILE,
+            self.presets_dir,
+            self.extensions_dir,
+            self.templates_dir,
+            self.templates_dir / "commands",
+            self.templates_dir / "scripts",
+            self.overrides_dir,
+            self.overrides_dir / "scripts",
+        )
+        stamp = []
+        for path in watched:
+            try:
+                st = path.stat()
+            except OSError:
+                stamp.append(None)
+            else:
+                stamp.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    def _get_index(self) -> ResolutionIndex:
+        """Return the current resolution index, rebuilding it if stale."""
+        stamp = self._resolution_stamp()
+        if self._index is None or self._index.stamp != stamp:
+            self._index = ResolutionIndex(stamp)
+            self._manifest_cache.clear()
+        return self._index
+
+    def invalidate(self) -> None:
+        """Drop cached resolution state, e.g. after editing preset files in place."""
+        self._index = None
+        self._manifest_cache.clear()
 
     def _get_manifest(self, pack_dir: Path) -> Optional["PresetManifest"]:
         """Get a cached preset manifest, parsing it on first access."""
@@ -2556,6 +2846,37 @@ class PresetResolver:
                 self._manifest_cache[key] = None
         return self._manifest_cache[key]
 
+    def _get_presets_by_priority(self, index: ResolutionIndex) -> List[tuple]:
+        """Return the enabled presets as ``(pack_id, metadata)`` by priority."""
+        if index.presets is None:
+            index.presets = (
+                PresetRegistry(self.presets_dir).list_by_priority()
+                if index.is_dir(self.presets_dir)
+                else []
+            )
+        return index.presets
+
+    def _get_extension_manifest(self, index: ResolutionIndex, ext_id: str) -> Any:
+        """Return the parsed ``extension.yml`` of *ext_id*, or ``None``."""
+        if ext_id not in index.extension_manifests:
+            from ..extensions import ExtensionManifest, ValidationError
+
+            manifest = None
+            manifest_path = self.extensions_dir / ext_id / "extension.yml"
+            if manifest_path.is_file():
+                try:
+                    manifest = ExtensionManifest(manifest_path)
+                except (
+                    ValidationError,
+                    yaml.YAMLError,
+                    OSError,
+                    TypeError,
+                    AttributeError,
+                ):
+                    manifest = None
+            index.extension_manifests[ext_id] = manifest
+        return index.extension_manifests[ext_id]
+
     def _get_all_extensions_by_priority(self) -> list[tuple[int, str, dict | None]]:
         """Build unified list of registered and unregistered extensions sorted by priority.
 
@@ -2566,6 +2887,12 @@ class PresetResolver:
         Returns:
             List of (priority, ext_id, metadata_or_none) tuples sorted by priority.
         """
+        index = self._get_index()
+        if index.extensions is None:
+            index.extensions = self._scan_extensions_by_priority()
+        return list(index.extensions)
+
+    def _scan_extensions_by_priority(self) -> list[tuple[int, str, dict | None]]:
         if not self.extensions_dir.exists():
             return []
 
@@ -2630,6 +2957,21 @@ class PresetResolver:
         Returns:
             Path to the resolved template file, or None if not found
         """
+        index = self._get_index()
+        key = (template_name, template_type, skip_presets)
+        if key not in index.resolved:
+            index.resolved[key] = self._resolve_in(
+                index, template_name, template_type, skip_presets
+            )
+        return index.resolved[key]
+
+    def _resolve_in(
+        self,
+        index: ResolutionIndex,
+        template_name: str,
+        template_type: str,
+        skip_presets: bool,
+    ) -> Optional[Path]:
         # Determine subdirectory based on template type
         if template_type == "template":
             subdirs = ["templates", ""]
@@ -2650,53 +2992,52 @@ class PresetResolver:
             override = self.overrides_dir / "scripts" / f"{template_name}{ext}"
         else:
             override = self.overrides_dir / f"{template_name}{ext}"
-        if override.exists():
+        if index.exists(override):
             return override
 
         # Priority 2: Installed presets (sorted by priority — lower number wins)
-        if not skip_presets and self.presets_dir.exists():
-            registry = PresetRegistry(self.presets_dir)
-            for pack_id, _metadata in registry.list_by_priority():
+        if not skip_presets:
+            for pack_id, _metadata in self._get_presets_by_priority(index):
                 pack_dir = self.presets_dir / pack_id
                 for subdir in subdirs:
                     if subdir:
                         candidate = pack_dir / subdir / f"{template_name}{ext}"
                     else:
                         candidate = pack_dir / f"{template_name}{ext}"
-                    if candidate.exists():
+                    if index.exists(candidate):
                         return candidate
 
         # Priority 3: Extension-provided templates (sorted by priority — lower number wins)
         for _priority, ext_id, _metadata in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            if not ext_dir.is_dir():
+            if not index.is_dir(ext_dir):
                 continue
             for subdir in subdirs:
                 if subdir:
                     candidate = ext_dir / subdir / f"{template_name}{ext}"
                 else:
                     candidate = ext_dir / f"{template_name}{ext}"
-                if candidate.exists():
+                if index.exists(candidate):
                     return candidate
 
         # Priority 4: Core templates
         if template_type == "template":
             core = self.templates_dir / f"{template_name}.md"
-            if core.exists():
+            if index.exists(core):
                 return core
         elif template_type == "command":
             core = self.templates_dir / "commands" / f"{template_name}.md"
-            if core.exists():
+            if index.exists(core):
                 return core
             # Fallback: speckit.<stem> → <stem>.md
             stem = self._core_stem(template_name)
             if stem:
                 core = self.templates_dir / "commands" / f"{stem}.md"
-                if core.exists():
+                if index.exists(core):
                     return core
         elif template_type == "script":
             core = self.templates_dir / "scripts" / f"{template_name}{ext}"
-            if core.exists():
+            if index.exists(core):
                 return core
 
         # Priority 5: Bundled core_pack (wheel install) or repo-root templates
@@ -2711,7 +3052,7 @@ class PresetResolver:
                 candidate = _core_pack / "templates" / f"{template_name}.md"
             elif template_type == "command":
                 candidate = _core_pack / "commands" / f"{template_name}.md"
-                if not candidate.exists():
+                if not index.exists(candidate):
                     stem = self._core_stem(template_name)
                     if stem:
                         candidate = _core_pack / "commands" / f"{stem}.md"
@@ -2719,7 +3060,7 @@ class PresetResolver:
                 candidate = _core_pack / "scripts" / f"{template_name}{ext}"
             else:
                 candidate = _core_pack / f"{template_name}.md"
-            if candidate.exists():
+            if index.exists(candidate):
                 return candidate
         else:
             # Source-checkout / editable install: templates live at repo root
@@ -2728,7 +3069,7 @@ class PresetResolver:
                 candidate = repo_root / "templates" / f"{template_name}.md"
             elif template_type == "command":
                 candidate = repo_root / "templates" / "commands" / f"{template_name}.md"
-                if not candidate.exists():
+                if not index.exists(candidate):
                     stem = self._core_stem(template_name)
                     if stem:
                         candidate = repo_root / "templates" / "commands" / f"{stem}.md"
@@ -2736,7 +3077,7 @@ class PresetResolver:
                 candidate = repo_root / "scripts" / f"{template_name}{ext}"
             else:
                 candidate = repo_root / f"{template_name}.md"
-            if candidate.exists():
+            if index.exists(candidate):
                 return candidate
 
         return None
@@ -2770,16 +3111,11 @@ class PresetResolver:
         if not self.extensions_dir.exists():
             return None
 
-        from ..extensions import ExtensionManifest, ValidationError
-
+        index = self._get_index()
         for _priority, ext_id, _metadata in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            manifest_path = ext_dir / "extension.yml"
-            if not manifest_path.is_file():
-                continue
-            try:
-                manifest = ExtensionManifest(manifest_path)
-            except (ValidationError, OSError, TypeError, AttributeError):
+            manifest = self._get_extension_manifest(index, ext_id)
+            if manifest is None:
                 continue
             for cmd_info in manifest.commands:
                 if cmd_info.get("name") != cmd_name:
@@ -2827,13 +3163,12 @@ class PresetResolver:
         if str(self.overrides_dir) in resolved_str:
             return {"path": resolved_str, "source": "project override"}
 
-        if str(self.presets_dir) in resolved_str and self.presets_dir.exists():
-            registry = PresetRegistry(self.presets_dir)
-            for pack_id, _metadata in registry.list_by_priority():
+        index = self._get_index()
+        if str(self.presets_dir) in resolved_str:
+            for pack_id, meta in self._get_presets_by_priority(index):
                 pack_dir = self.presets_dir / pack_id
                 try:
                     resolved.relative_to(pack_dir)
-                    meta = registry.get(pack_id)
                     version = meta.get("version", "?") if meta else "?"
                     return {
                         "path": resolved_str,
@@ -2844,7 +3179,7 @@ class PresetResolver:
 
         for _priority, ext_id, ext_meta in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            if not ext_dir.is_dir():
+            if not index.is_dir(ext_dir):
                 continue
             try:
                 resolved.relative_to(ext_dir)
@@ -2881,6 +3216,20 @@ class PresetResolver:
         Returns:
             List of layer dicts ordered highest-to-lowest priority.
         """
+        index = self._get_index()
+        key = (template_name, template_type)
+        if key not in index.layers:
+            index.layers[key] = self._collect_layers_in(
+                index, template_name, template_type
+            )
+        return [dict(layer) for layer in index.layers[key]]
+
+    def _collect_layers_in(
+        self,
+        index: ResolutionIndex,
+        template_name: str,
+        template_type: str,
+    ) -> List[Dict[str, Any]]:
         if template_type == "template":
             subdirs = ["templates", ""]
         elif template_type == "command":
@@ -2902,7 +3251,7 @@ class PresetResolver:
                     candidate = base_dir / subdir / f"{template_name}{ext}"
                 else:
                     candidate = base_dir / f"{template_name}{ext}"
-                if candidate.exists():
+                if index.exists(candidate):
                     return candidate
             return None
 
@@ -2911,7 +3260,7 @@ class PresetResolver:
             override = self.overrides_dir / "scripts" / f"{template_name}{ext}"
         else:
             override = self.overrides_dir / f"{template_name}{ext}"
-        if override.exists():
+        if index.exists(override):
             layers.append({
                 "path": override,
                 "source": "project override",
@@ -2919,97 +3268,89 @@ class PresetResolver:
             })
 
         # Priority 2: Installed presets (sorted by priority — lower number = higher precedence)
-        if self.presets_dir.exists():
-            registry = PresetRegistry(self.presets_dir)
-            for pack_id, metadata in registry.list_by_priority():
-                pack_dir = self.presets_dir / pack_id
-                # Read strategy and manifest file path from preset manifest
-                strategy = "replace"
-                manifest_file_path = None
-                manifest_has_strategy = False
-                manifest_found_entry = False
-                manifest = self._get_manifest(pack_dir)
-                if manifest:
-                    for tmpl in manifest.templates:
-                        if (tmpl.get("name") == template_name
-                                and tmpl.get("type") == template_type):
-                            strategy = tmpl.get("strategy", "replace")
-                            manifest_has_strategy = "strategy" in tmpl
-                            manifest_file_path = tmpl.get("file")
-                            manifest_found_entry = True
-                            break
-                # Use manifest file path if specified, otherwise convention-based
-                # lookup — but only when the manifest doesn't exist or doesn't
-                # list this template, so preset.yml stays authoritative.
-                candidate = None
-                if manifest_file_path:
-                    manifest_candidate = pack_dir / manifest_file_path
-                    if manifest_candidate.exists():
-                        candidate = manifest_candidate
-                    # Explicit file path that doesn't exist: skip convention
-                    # fallback to avoid masking typos or picking up unintended files.
-                elif not manifest_found_entry:
-                    # Manifest doesn't list this template — check convention paths
-                    candidate = _find_in_subdirs(pack_dir)
-                if candidate:
-                    # Legacy fallback: if manifest doesn't explicitly declare a
-                    # strategy, check the command file's frontmatter for any valid
-                    # strategy. Skip when the manifest entry includes strategy key
-                    # (even if it's "replace") to avoid overriding explicit declarations.
-                    if not manifest_has_strategy and strategy == "replace" and template_type == "command":
-                        try:
-                            cmd_content = candidate.read_text(encoding="utf-8")
-                            lines = cmd_content.splitlines(keepends=True)
-                            if lines and lines[0].rstrip("\r\n") == "---":
-                                fence_end = -1
-                                for fi, fline in enumerate(lines[1:], start=1):
-                                    if fline.rstrip("\r\n") == "---":
-                                        fence_end = fi
-                                        break
-                                if fence_end > 0:
-                                    fm_text = "".join(lines[1:fence_end])
-                                    fm_data = yaml.safe_load(fm_text)
-                                    if isinstance(fm_data, dict):
-                                        fm_strategy = fm_data.get("strategy")
-                                        if isinstance(fm_strategy, str) and fm_strategy.lower() in VALID_PRESET_STRATEGIES:
-                                            strategy = fm_strategy.lower()
-                        except (yaml.YAMLError, OSError):
-                            # Best-effort legacy frontmatter parsing: keep default
-                            # strategy ("replace") when content is unreadable/invalid.
-                            pass
-                    version = metadata.get("version", "?") if metadata else "?"
-                    layers.append({
-                        "path": candidate,
-                        "source": f"{pack_id} v{version}",
-                        "strategy": strategy,
-                    })
+        for pack_id, metadata in self._get_presets_by_priority(index):
+            pack_dir = self.presets_dir / pack_id
+            # Read strategy and manifest file path from preset manifest
+            strategy = "replace"
+            manifest_file_path = None
+            manifest_has_strategy = False
+            manifest_found_entry = False
+            manifest = self._get_manifest(pack_dir)
+            if manifest:
+                for tmpl in manifest.templates:
+                    if (tmpl.get("name") == template_name
+                            and tmpl.get("type") == template_type):
+                        strategy = tmpl.get("strategy", "replace")
+                        manifest_has_strategy = "strategy" in tmpl
+                        manifest_file_path = tmpl.get("file")
+                        manifest_found_entry = True
+                        break
+            # Use manifest file path if specified, otherwise convention-based
+            # lookup — but only when the manifest doesn't exist or doesn't
+            # list this template, so preset.yml stays authoritative.
+            candidate = None
+            if manifest_file_path:
+                manifest_candidate = pack_dir / manifest_file_path
+                if index.exists(manifest_candidate):
+                    candidate = manifest_candidate
+                # Explicit file path that doesn't exist: skip convention
+                # fallback to avoid masking typos or picking up unintended files.
+            elif not manifest_found_entry:
+                # Manifest doesn't list this template — check convention paths
+                candidate = _find_in_subdirs(pack_dir)
+            if candidate:
+                # Legacy fallback: if manifest doesn't explicitly declare a
+                # strategy, check the command file's frontmatter for any valid
+                # strategy. Skip when the manifest entry includes strategy key
+                # (even if it's "replace") to avoid overriding explicit declarations.
+                if not manifest_has_strategy and strategy == "replace" and template_type == "command":
+                    try:
+                        cmd_content = candidate.read_text(encoding="utf-8")
+                        lines = cmd_content.splitlines(keepends=True)
+                        if lines and lines[0].rstrip("\r\n") == "---":
+                            fence_end = -1
+                            for fi, fline in enumerate(lines[1:], start=1):
+                                if fline.rstrip("\r\n") == "---":
+                                    fence_end = fi
+                                    break
+                            if fence_end > 0:
+                                fm_text = "".join(lines[1:fence_end])
+                                fm_data = yaml.safe_load(fm_text)
+                                if isinstance(fm_data, dict):
+                                    fm_strategy = fm_data.get("strategy")
+                                    if isinstance(fm_strategy, str) and fm_strategy.lower() in VALID_PRESET_STRATEGIES:
+                                        strategy = fm_strategy.lower()
+                    except (yaml.YAMLError, OSError):
+                        # Best-effort legacy frontmatter parsing: keep default
+                        # strategy ("replace") when content is unreadable/invalid.
+                        pass
+                version = metadata.get("version", "?") if metadata else "?"
+                layers.append({
+                    "path": candidate,
+                    "source": f"{pack_id} v{version}",
+                    "strategy": strategy,
+                })
 
         # Priority 3: Extension-provided templates (always "replace")
         for _priority, ext_id, ext_meta in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            if not ext_dir.is_dir():
+            if not index.is_dir(ext_dir):
                 continue
             # Try convention-based lookup first
             candidate = _find_in_subdirs(ext_dir)
-            # If not found and this is a command, check extension manifest
+            # If not found and this is a command, check extension manifest.
+            # An invalid manifest falls back to the convention-based lookup
+            # already attempted above.
             if candidate is None and template_type == "command":
-                ext_manifest_path = ext_dir / "extension.yml"
-                if ext_manifest_path.exists():
-                    try:
-                        from ..extensions import ExtensionManifest, ValidationError as ExtValidationError
-                        ext_manifest = ExtensionManifest(ext_manifest_path)
-                        for cmd in ext_manifest.commands:
-                            if cmd.get("name") == template_name:
-                                cmd_file = cmd.get("file")
-                                if cmd_file:
-                                    c = ext_dir / cmd_file
-                                    if c.exists():
-                                        candidate = c
-                                break
-                    except (ExtValidationError, yaml.YAMLError):
-                        # Invalid extension manifest — fall back to
-                        # convention-based lookup (already attempted above).
-                        pass
+                ext_manifest = self._get_extension_manifest(index, ext_id)
+                for cmd in ext_manifest.commands if ext_manifest else ():
+                    if cmd.get("name") == template_name:
+                        cmd_file = cmd.get("file")
+                        if cmd_file:
+                            c = ext_dir / cmd_file
+                            if index.exists(c):
+                                candidate = c
+                        break
             if candidate:
                 if ext_meta:
                     version = ext_meta.get("version", "?")
@@ -3026,22 +3367,22 @@ class PresetResolver:
         core = None
         if template_type == "template":
             c = self.templates_dir / f"{template_name}.md"
-            if c.exists():
+            if index.exists(c):
                 core = c
         elif template_type == "command":
             c = self.templates_dir / "commands" / f"{template_name}.md"
-            if c.exists():
+            if index.exists(c):
                 core = c
             else:
                 # Fallback: speckit.<stem> → <stem>.md
                 stem = self._core_stem(template_name)
                 if stem:
                     c = self.templates_dir / "commands" / f"{stem}.md"
-                    if c.exists():
+                    if index.exists(c):
                         core = c
         elif template_type == "script":
             c = self.templates_dir / "scripts" / f"{template_name}{ext}"
-            if c.exists():
+            if index.exists(c):
                 core = c
         if core:
             layers.append({
@@ -3052,7 +3393,7 @@ class PresetResolver:
         else:
             # Priority 5: Bundled core_pack (wheel install) or repo-root
             # templates (source-checkout), matching resolve()'s tier-5 fallback.
-            bundled = self._find_bundled_core(template_name, template_type, ext)
+            bundled = self._find_bundled_core(template_name, template_type, ext, index)
             if bundled:
                 layers.append({
                     "path": bundled,
@@ -3067,6 +3408,7 @@ class PresetResolver:
         template_name: str,
         template_type: str,
         ext: str,
+        index: Optional[ResolutionIndex] = None,
     ) -> Optional[Path]:
         """Find a core template from the bundled pack or source checkout.
 
@@ -3079,6 +3421,7 @@ class PresetResolver:
         except ImportError:
             return None
 
+        exists = index.exists if index is not None else Path.exists
         stem = self._core_stem(template_name)
         names = [template_name]
         if stem and stem != template_name:
@@ -3095,7 +3438,7 @@ class PresetResolver:
                     c = core_pack / "scripts" / f"{name}{ext}"
                 else:
                     c = core_pack / f"{name}.md"
-                if c.exists():
+                if exists(c):
                     return c
         else:
             repo_root = Path(__file__).parent.parent.parent
@@ -3108,7 +3451,7 @@ class PresetResolver:
                     c = repo_root / "scripts" / f"{name}{ext}"
                 else:
                     c = repo_root / f"{name}.md"
-                if c.exists():
+                if exists(c):
                     return c
         return None
 
@@ -3144,6 +3487,72 @@ class PresetResolver:
         if layers[0]["strategy"] == "replace":
             return layers[0]["path"].read_text(encoding="utf-8")
 
+        key = self._composed_cache_key(template_name, template_type, layers)
+        if key is None:
+            return self._compose_layers(layers, template_type)
+        content = _COMPOSED_CONTENT_CACHE.get(key)
+        if content is None and self.cache_composed:
+            content = self._read_composed_cache(key)
+        if content is None:
+            content = self._compose_layers(layers, template_type)
+            if content is not None and self.cache_composed:
+                self._write_composed_cache(key, content)
+        if content is not None:
+            _remember_composed(key, content)
+        return content
+
+    @staticmethod
+    def _composed_cache_key(
+        template_name: str,
+        template_type: str,
+        layers: List[Dict[str, Any]],
+    ) -> Optional[tuple]:
+        """Key a composition by the layers it reads, down to the base layer.
+
+        Each layer contributes its path, mtime, size and strategy, so editing,
+        adding, removing or re-prioritising any contributing file changes
+        the key. Returns ``None`` if a layer cannot be stat-ed.
+        """
+        parts = []
+        for layer in layers:
+            try:
+                st = layer["path"].stat()
+            except OSError:
+                return None
+            parts.append(
+                (str(layer["path"]), st.st_mtime_ns, st.st_size, layer["strategy"])
+            )
+            if layer["strategy"] == "replace":
+                break  # The base layer; nothing below it is read.
+        return (template_name, template_type, tuple(parts))
+
+    def _composed_cache_file(self, key: tuple) -> Path:
+        payload = json.dumps([_COMPOSED_CACHE_VERSION, key])
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self.project_root / ".specify" / "cache" / "composed" / f"{digest}.md"
+
+    def _read_composed_cache(self, key: tuple) -> Optional[str]:
+        try:
+            return self._composed_cache_file(key).read_text(encoding="utf-8")
+        except (OSError, UnicodeError):
+            return None
+
+    def _write_composed_cache(self, key: tuple, content: str) -> None:
+        cache_file = self._composed_cache_file(key)
+        try:
+            ensure_cache_dir(cache_file.parent)
+            tmp = cache_file.with_name(f"{cache_file.name}.tmp")
+            tmp.write_text(content, encoding="utf-8")
+            tmp.replace(cache_file)
+        except OSError:
+            pass  # Cache is best-effort; the composed content is still returned
+
+    def _compose_layers(
+        self,
+        layers: List[Dict[str, Any]],
+        template_type: str,
+    ) -> Optional[str]:
+        """Compose *layers* (highest priority first) with their strategies."""
         # Composition: build content bottom-up from the effective base.
         # The base is the nearest replace layer scanning from highest priority
         # downward. Only layers above the base contribute to composition.
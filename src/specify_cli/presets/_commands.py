@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import typer
 import yaml
@@ -62,14 +63,125 @@ def preset_list():
         console.print()
 
 
+_MAX_PARALLEL_DOWNLOADS = 4
+
+
+def _stage_presets(
+    names: List[str],
+    project_root: Path,
+    download_dir: Path,
+    versions: Optional[Dict[str, str]] = None,
+) -> List[Path]:
+    """Resolve preset IDs to directories or ZIPs for ``install_many``.
+
+    Every ID is resolved first (a bundled preset, else the catalog), so an
+    unknown ID or a discovery-only catalog fails the batch before anything
+    is downloaded. Catalog downloads then run in parallel into
+    *download_dir*. When *versions* maps a preset ID to a version, a
+    bundled or catalog preset with a different version is rejected.
+
+    Raises:
+        PresetError: If an ID cannot be resolved or downloaded
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .. import _locate_bundled_preset
+    from ..extensions import REINSTALL_COMMAND
+    from . import PresetCatalog, PresetError, PresetManifest
+
+    def check_version(pack_id: str, version: Optional[str]) -> None:
+        expected = (versions or {}).get(pack_id)
+        if expected is not None and str(version) != expected:
+            raise PresetError(
+                f"Preset '{pack_id}' is locked to version {expected}, "
+                f"but version {version} is available"
+            )
+
+    sources: List[Optional[Path]] = []
+    downloads: Dict[int, str] = {}
+    catalog = None
+    for name in names:
+        bundled_path = _locate_bundled_preset(name)
+        if bundled_path:
+            if versions:
+                manifest = PresetManifest(bundled_path / "preset.yml")
+                check_version(manifest.id, manifest.version)
+            sources.append(bundled_path)
+            continue
+
+        if catalog is None:
+            catalog = PresetCatalog(project_root)
+        pack_info = catalog.get_pack_info(name)
+        if not pack_info:
+            raise PresetError(f"Preset '{name}' not found in catalog")
+        if pack_info.get("bundled") and not pack_info.get("download_url"):
+            raise PresetError(
+                f"Preset '{name}' is bundled with spec-kit but could not be found "
+                f"in the installed package. Try reinstalling spec-kit: {REINSTALL_COMMAND}"
+            )
+        if not pack_info.get("_install_allowed", True):
+            catalog_name = pack_info.get("_catalog_name", "unknown")
+            raise PresetError(
+                f"Preset '{name}' is from the '{catalog_name}' catalog which is "
+                f"discovery-only (install not allowed)."
+            )
+        check_version(name, pack_info.get("version"))
+        downloads[len(sources)] = name
+        sources.append(None)
+
+    if downloads:
+        download_dir.mkdir(parents=True, exist_ok=True)
+        workers = min(len(downloads), _MAX_PARALLEL_DOWNLOADS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                index: pool.submit(catalog.download_pack, pack_id, download_dir)
+                for index, pack_id in downloads.items()
+            }
+            for index, future in futures.items():
+                sources[index] = future.result()
+    return sources
+
+
+def _add_presets(names: List[str], manager, speckit_version: str, priority: int) -> None:
+    """Install several presets in one transaction (``specify preset add a b c``)."""
+    import tempfile
+
+    from . import PresetCompatibilityError, PresetError, PresetValidationError
+
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with console.status(f"[cyan]Installing {len(names)} presets[/cyan]"):
+                sources = _stage_presets(names, manager.project_root, Path(tmpdir))
+                manifests = manager.install_many(
+                    [(source, priority) for source in sources], speckit_version
+                )
+    except PresetCompatibilityError as e:
+        console.print(f"[red]Compatibility Error:[/red] {e}")
+        console.print("No presets were installed.")
+        raise typer.Exit(1)
+    except PresetValidationError as e:
+        console.print(f"[red]Validation Error:[/red] {e}")
+        console.print("No presets were installed.")
+        raise typer.Exit(1)
+    except PresetError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        console.print("No presets were installed.")
+        raise typer.Exit(1)
+
+    for manifest in manifests:
+        console.print(f"[green]✓[/green] Preset '{manifest.name}' v{manifest.version} installed (priority {priority})")
+
+
 @preset_app.command("add")
 def preset_add(
-    preset_id: str = typer.Argument(None, help="Preset ID to install from catalog"),
+    preset_id: Optional[List[str]] = typer.Argument(
+        None, help="Preset ID(s) to install from catalog; several are installed together or not at all"
+    ),
     from_url: str = typer.Option(None, "--from", help="Install from a URL (ZIP file)"),
     dev: str = typer.Option(None, "--dev", help="Install from local directory (development mode)"),
     priority: int = typer.Option(10, "--priority", help="Resolution priority (lower = higher precedence, default 10)"),
 ):
-    """Install a preset."""
+    """Install one or more presets."""
     from .. import _locate_bundled_preset, _require_specify_project, get_speckit_version
     from . import (
         PresetManager,
@@ -88,6 +200,15 @@ def preset_add(
     manager = PresetManager(project_root)
     speckit_version = get_speckit_version()
 
+    if isinstance(preset_id, list):
+        if len(preset_id) > 1:
+            if from_url or dev:
+                console.print("[red]Error:[/red] --from and --dev can only be used when adding a single preset")
+                raise typer.Exit(1)
+            _add_presets(preset_id, manager, speckit_version, priority)
+            return
+        preset_id = preset_id[0] if preset_id else None
+
     try:
         if dev:
             dev_path = Path(dev).resolve()
@@ -266,9 +387,10 @@ def preset_search(
     query: str = typer.Argument(None, help="Search query"),
     tag: str = typer.Option(None, "--tag", help="Filter by tag"),
     author: str = typer.Option(None, "--author", help="Filter by author"),
+    verbose: bool = typer.Option(False, "--verbose", help="Show per-catalog fetch timings"),
 ):
     """Search for presets in the catalog."""
-    from .. import _require_specify_project
+    from .. import _print_catalog_fetch_report, _require_specify_project
     from . import PresetCatalog, PresetError
 
     project_root = _require_specify_project()
@@ -279,6 +401,8 @@ def preset_search(
     except PresetError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
+    if verbose:
+        _print_catalog_fetch_report(catalog)
 
     if not results:
         console.print("[yellow]No presets found matching your criteria.[/yellow]")
@@ -706,6 +830,35 @@ def preset_catalog_remove(
         console.print("\n[dim]No catalogs remain in config. Built-in defaults will be used.[/dim]")
 
 
+def resolve_command(
+    template_name: str = typer.Argument(..., help="Template name (e.g. spec-template)"),
+    template_type: str = typer.Option("template", "--type", help="Template type: template, command, or script"),
+    content: bool = typer.Option(False, "--content", help="Print the composed content instead of the path"),
+    root: Path = typer.Option(None, "--root", help="Project root (default: current directory)"),
+    project_only: bool = typer.Option(False, "--project-only", help="Ignore the templates bundled with Spec Kit"),
+):
+    """Print the resolved path (or composed content) of a template.
+
+    Plain output for scripts: exits 1 when the template does not resolve.
+    """
+    from .resolve import TEMPLATE_TYPES, run
+
+    if template_type not in TEMPLATE_TYPES:
+        raise typer.BadParameter(
+            f"must be one of: {', '.join(TEMPLATE_TYPES)}", param_hint="--type"
+        )
+    raise typer.Exit(
+        run(
+            template_name,
+            template_type,
+            root=root,
+            content=content,
+            project_only=project_only,
+        )
+    )
+
+
 def register(app: typer.Typer) -> None:
     """Attach the preset command group to the root Typer app."""
     app.add_typer(preset_app, name="preset")
+    app.command("resolve")(resolve_command)
@@ -0,0 +1,129 @@
+"""Resolve templates for the shell scripts in a single process.
+
+``scripts/bash/common.sh`` and ``scripts/powershell/common.ps1`` call this
+(as ``specify resolve``) before falling back to walking the priority stack
+themselves, so a lookup costs one interpreter start instead of one per
+preset manifest::
+
+    specify resolve tasks-template --root "$REPO_ROOT" --project-only
+    python -m specify_cli.presets.resolve spec-template --content
+
+Exit status is 0 when the template resolves, 1 when it does not (or its
+layers cannot be composed) and 2 for usage errors, so callers can treat
+anything else as "resolver unavailable".
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+TEMPLATE_TYPES = ("template", "command", "script")
+
+BUNDLED_SOURCE = "core (bundled)"
+
+
+def resolve_for_scripts(
+    project_root: Path,
+    template_name: str,
+    template_type: str = "template",
+    *,
+    content: bool = False,
+    project_only: bool = False,
+) -> Optional[str]:
+    """Return the resolved path (or composed content) for *template_name*.
+
+    With ``project_only`` the templates bundled with Spec Kit are ignored,
+    matching the shell resolvers, which only look under ``.specify/``.
+
+    Raises:
+        PresetValidationError: If the layers cannot be composed.
+        OSError: If a layer cannot be read.
+    """
+    from . import PresetResolver
+
+    resolver = PresetResolver(project_root)
+    if not content:
+        path = resolver.resolve(template_name, template_type)
+        if path is None:
+            return None
+        if project_only and not _is_within(path, project_root / ".specify"):
+            return None
+        return str(path)
+
+    if project_only:
+        layers = resolver.collect_all_layers(template_name, template_type)
+        # Only the layers down to the first "replace" contribute content.
+        for layer in layers:
+            if layer["source"] == BUNDLED_SOURCE:
+                return None
+            if layer["strategy"] == "replace":
+                break
+    return resolver.resolve_content(template_name, template_type)
+
+
+def _is_within(path: Path, root: Path) -> bool:
+    try:
+        path.resolve().relative_to(root.resolve())
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def run(
+    template_name: str,
+    template_type: str = "template",
+    *,
+    root: Optional[Path] = None,
+    content: bool = False,
+    project_only: bool = False,
+) -> int:
+    """Resolve *template_name* and write the result to stdout.
+
+    Returns the process exit status (0 found, 1 not found or failed).
+    """
+    from . import PresetError
+
+    project_root = root if root is not None else Path.cwd()
+    try:
+        result = resolve_for_scripts(
+            project_root,
+            template_name,
+            template_type,
+            content=content,
+            project_only=project_only,
+        )
+    except (PresetError, OSError, UnicodeDecodeError) as exc:
+        print(f"Error: failed to resolve {template_name!r}: {exc}", file=sys.stderr)
+        return 1
+    if result is None:
+        return 1
+    sys.stdout.write(result if content else result + "\n")
+    sys.stdout.flush()
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m specify_cli.presets.resolve",
+        description="Print the resolved path (or composed content) of a template.",
+    )
+    parser.add_argument("name", help="Template name, e.g. spec-template")
+    parser.add_argument("--type", dest="template_type", choices=TEMPLATE_TYPES, default="template")
+    parser.add_argument("--content", action="store_true", help="Print the composed content instead of the path")
+    parser.add_argument("--root", type=Path, default=None, help="Project root (default: current directory)")
+    parser.add_argument("--project-only", action="store_true", help="Ignore the templates bundled with Spec Kit")
+    args = parser.parse_args(argv)
+    return run(
+        args.name,
+        args.template_type,
+        root=args.root,
+        content=args.content,
+        project_only=args.project_only,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""Per-process cache of the registry and config files under ``.specify``.
+
+``ExtensionRegistry``, ``PresetRegistry``, ``WorkflowRegistry`` and
+``StepRegistry`` are constructed by every manager, resolver and command that
+looks at installed packages, often several times per command, and
+``HookExecutor`` re-reads ``extensions.yml`` for every hook it renders. The
+files are small but parsing them and deep-copying their contents on every
+access adds up, so parsed content is kept here keyed by absolute path and
+reused while the file's mtime and size are unchanged. Like
+``manifest_cache``, a file modified within ``_RACY_WINDOW_NS`` of being
+cached is also compared byte-for-byte, since it could change again without
+changing its stamp.
+
+Cached values are frozen into ``ReadOnlyDict``/``ReadOnlyList``: they are
+shared by every reader, so they are handed out without copying and any
+attempt to mutate them raises ``TypeError``. ``thaw()`` returns a plain,
+mutable deep copy.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+import yaml
+
+from .manifest_cache import _RACY_WINDOW_NS
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError(
+        f"{type(self).__name__} is a read-only registry view; "
+        "update it through the registry (or copy it with thaw())"
+    )
+
+
+class ReadOnlyDict(dict):
+    """A ``dict`` that rejects mutation; ``copy``/``deepcopy`` return plain dicts."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """A ``list`` that rejects mutation; ``copy``/``deepcopy`` return plain lists."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return thaw(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+# Views can end up in data written back as YAML (e.g. a hook entry copied
+# into extensions.yml); dump them like the plain containers they wrap.
+for _name in ("SafeDumper", "Dumper", "CSafeDumper", "CDumper"):
+    _dumper = getattr(yaml, _name, None)
+    if _dumper is not None:
+        _dumper.add_representer(ReadOnlyDict, yaml.representer.SafeRepresenter.represent_dict)
+        _dumper.add_representer(ReadOnlyList, yaml.representer.SafeRepresenter.represent_list)
+
+
+def freeze(value: Any) -> Any:
+    """Return *value* with every dict and list replaced by a read-only view.
+
+    Already frozen containers are returned as-is, so re-freezing a mostly
+    frozen structure only rebuilds the parts that changed.
+    """
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return ReadOnlyList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a plain, mutable deep copy of a (possibly frozen) structure."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+class _Entry(NamedTuple):
+    stamp: Optional[Tuple[int, int]]  # (mtime_ns, size); None while the file is missing
+    cached_at_ns: int
+    raw: Optional[bytes]
+    value: Any
+
+
+_CACHE: Dict[str, _Entry] = {}
+
+
+def _key(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+def _stamp(key: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load(path: Path, parse: Callable[[bytes], Any]) -> Any:
+    """Return the frozen result of ``parse(path.read_bytes())``, cached.
+
+    Raises ``FileNotFoundError`` when *path* does not exist (unless a batch
+    has published content for it, see ``publish()``), and whatever *parse*
+    raises for malformed content; failures are not cached. A path is always
+    expected to be read with the same *parse*.
+    """
+    key = _key(path)
+    stamp = _stamp(key)
+    entry = _CACHE.get(key)
+    if entry is not None and entry.stamp == stamp:
+        if stamp is None:
+            return entry.value
+        if stamp[0] < entry.cached_at_ns - _RACY_WINDOW_NS:
+            return entry.value
+        raw = Path(key).read_bytes()
+        if raw == entry.raw:
+            now = time.time_ns()
+            if stamp[0] < now - _RACY_WINDOW_NS:
+                # Old enough now: later loads can trust the stamp alone.
+                _CACHE[key] = entry._replace(cached_at_ns=now)
+            return entry.value
+    elif stamp is None:
+        _CACHE.pop(key, None)
+        raise FileNotFoundError(f"No such file: {key}")
+    else:
+        raw = Path(key).read_bytes()
+
+    value = freeze(parse(raw))
+    _CACHE[key] = _Entry(stamp, time.time_ns(), raw, value)
+    return value
+
+
+def publish(path: Path, value: Any) -> Any:
+    """Make *value* the cached content of *path* without writing it.
+
+    Used while a registry batches its saves: other registries for the same
+    file in this process see the pending state until the batch writes it,
+    at which point the stamp changes and ``store_json()`` replaces the
+    entry. Returns the frozen value.
+    """
+    key = _key(path)
+    value = freeze(value)
+    stamp = _stamp(key)
+    raw = Path(key).read_bytes() if stamp is not None else None
+    _CACHE[key] = _Entry(stamp, time.time_ns(), raw, value)
+    return value
+
+
+def store_json(path: Path, data: Any) -> Any:
+    """Write *data* to *path* as indented JSON and cache what was written.
+
+    Returns the frozen content as a later ``load()`` would see it. Raises
+    ``OSError`` if the file cannot be written; the cached entry is dropped
+    in that case.
+    """
+    key = _key(path)
+    raw = json.dumps(data, indent=2).encode("utf-8")
+    try:
+        Path(key).write_bytes(raw)
+    except OSError:
+        _CACHE.pop(key, None)
+        raise
+    value = freeze(json.loads(raw))
+    _CACHE[key] = _Entry(_stamp(key), time.time_ns(), raw, value)
+    return value
+
+
+def forget(path: Path) -> None:
+    """Drop any cached content for *path*."""
+    _CACHE.pop(_key(path), None)
+
+
+class CachedRegistry:
+    """Shared loading, copy-on-write data and batched saves for JSON registries.
+
+    Subclasses set ``registry_path`` and implement ``_default_data()`` and
+    ``_persist()`` (which writes ``self.data`` with ``_write()``), and may
+    override ``_normalize()``. Reads should go through ``_view()``, which
+    returns the shared read-only snapshot until ``data`` is first accessed;
+    from then on the instance works on its own mutable copy until the next
+    save.
+    """
+
+    registry_path: Path
+
+    _snapshot: Any
+    _data: Optional[Dict[str, Any]] = None
+    _batch_depth: int = 0
+    _save_pending: bool = False
+
+    def _default_data(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _normalize(self, data: Any) -> Any:
+        """Return *data* fixed up to the registry's shape, or None to reset it."""
+        return data if isinstance(data, dict) else None
+
+    def _persist(self) -> None:
+        raise NotImplementedError
+
+    def _read(self) -> Any:
+        """Return the parsed registry file; subclasses may add access checks."""
+        return load(self.registry_path, json.loads)
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the registry snapshot from disk (or the process cache)."""
+        try:
+            data = self._normalize(self._read())
+        except (FileNotFoundError, ValueError):
+            # Missing, corrupted or undecodable registry: start fresh.
+            data = None
+        if data is None:
+            data = self._default_data()
+        self._data = None
+        self._snapshot = freeze(data)
+        return self._snapshot
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Mutable registry content, copied from the shared snapshot on first use."""
+        if self._data is None:
+            self._data = thaw(self._snapshot)
+        return self._data
+
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = value
+
+    def _view(self) -> Dict[str, Any]:
+        """Read-only registry content, including unsaved changes to ``data``."""
+        if self._data is None:
+            return self._snapshot
+        return freeze(self._data)
+
+    def _write(self) -> None:
+        self._snapshot = store_json(self.registry_path, self.data)
+        self._data = None
+
+    def _defer_save(self) -> bool:
+        """Return True (and publish the pending state) inside a ``batch()``."""
+        if not self._batch_depth:
+            return False
+        self._snapshot = publish(self.registry_path, self.data)
+        self._data = None
+        self._save_pending = True
+        return True
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[Any]:
+        """Group several registry writes into one save.
+
+        Saves requested inside the block only update the in-process cache,
+        so other registries for the same file still see them; the file is
+        written once when the outermost block exits, including when it
+        exits with an exception, so on-disk state matches what the
+        unbatched writes would have left behind.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._save_pending:
+                self._save_pending = False
+                try:
+                    self._persist()
+                except BaseException:
+                    # Don't leave unsaved state visible to other readers.
+                    forget(self.registry_path)
+                    raise
@@ -73,6 +73,10 @@ class StepContext:
     #: Current run ID.
     run_id: str | None = None
 
+    #: Expression namespace built lazily by the evaluator.  Not copied
+    #: by ``dataclasses.replace``, so per-item contexts get their own.
+    _namespace: Any = field(default=None, init=False, repr=False, compare=False)
+
 
 @dataclass
 class StepResult:
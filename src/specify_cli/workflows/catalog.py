@@ -20,6 +20,22 @@ from typing import Any
 
 import yaml
 
+from ..catalogs import (
+    CatalogFetchResult,
+    CatalogSearchIndex,
+    SearchIndexStore,
+    fetch_catalogs,
+    index_fetch_report,
+    open_catalog,
+    read_cache_metadata,
+    search_index_fingerprint,
+    write_cache_metadata,
+)
+from ..registry_cache import CachedRegistry
+
+#: Workflow and step search does not match tags (``--tag`` filters on them).
+_SEARCH_FIELDS = ("name", "description", "id")
+
 
 # ---------------------------------------------------------------------------
 # Errors
@@ -55,11 +71,12 @@ class WorkflowCatalogEntry:
 # ---------------------------------------------------------------------------
 
 
-class WorkflowRegistry:
+class WorkflowRegistry(CachedRegistry):
     """Manages the registry of installed workflows.
 
     Tracks installed workflows and their metadata in
-    ``.specify/workflows/workflow-registry.json``.
+    ``.specify/workflows/workflow-registry.json``. ``get()`` and ``list()``
+    return read-only views of a snapshot shared per process.
     """
 
     REGISTRY_FILE = "workflow-registry.json"
@@ -69,24 +86,26 @@ class WorkflowRegistry:
         self.project_root = project_root
         self.workflows_dir = project_root / ".specify" / "workflows"
         self.registry_path = self.workflows_dir / self.REGISTRY_FILE
-        self.data = self._load()
+        self._load()
 
-    def _load(self) -> dict[str, Any]:
-        """Load registry from disk or create default."""
-        if self.registry_path.exists():
-            try:
-                with open(self.registry_path, encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                # Corrupted registry file — reset to default
-                return {"schema_version": self.SCHEMA_VERSION, "workflows": {}}
+    def _default_data(self) -> dict[str, Any]:
         return {"schema_version": self.SCHEMA_VERSION, "workflows": {}}
 
+    def _normalize(self, data: Any) -> dict[str, Any] | None:
+        if not isinstance(data, dict):
+            return None
+        if not isinstance(data.get("workflows"), dict):
+            data = {**data, "workflows": {}}
+        return data
+
     def save(self) -> None:
-        """Persist registry to disk."""
+        """Persist registry to disk, or once at the end of an enclosing ``batch()``."""
+        if not self._defer_save():
+            self._persist()
+
+    def _persist(self) -> None:
         self.workflows_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.registry_path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+        self._write()
 
     def add(self, workflow_id: str, metadata: dict[str, Any]) -> None:
         """Add or update an installed workflow entry."""
@@ -102,7 +121,7 @@ class WorkflowRegistry:
 
     def remove(self, workflow_id: str) -> bool:
         """Remove an installed workflow entry. Returns True if found."""
-        if workflow_id in self.data["workflows"]:
+        if workflow_id in self._view()["workflows"]:
             del self.data["workflows"][workflow_id]
             self.save()
             return True
@@ -110,15 +129,15 @@ class WorkflowRegistry:
 
     def get(self, workflow_id: str) -> dict[str, Any] | None:
         """Get metadata for an installed workflow."""
-        return self.data["workflows"].get(workflow_id)
+        return self._view()["workflows"].get(workflow_id)
 
     def list(self) -> dict[str, dict[str, Any]]:
         """Return all installed workflows."""
-        return dict(self.data["workflows"])
+        return self._view()["workflows"]
 
     def is_installed(self, workflow_id: str) -> bool:
         """Check if a workflow is installed."""
-        return workflow_id in self.data["workflows"]
+        return workflow_id in self._view()["workflows"]
 
 
 # ---------------------------------------------------------------------------
@@ -150,6 +169,11 @@ class WorkflowCatalog:
         self.project_root = project_root
         self.workflows_dir = project_root / ".specify" / "workflows"
         self.cache_dir = self.workflows_dir / ".cache"
+        # Per-catalog outcomes of the most recent multi-catalog fetch.
+        self.last_fetch_report: list[CatalogFetchResult] = []
+        self._search_index = SearchIndexStore(
+            self.cache_dir / "workflow-catalog-search-index.json", _SEARCH_FIELDS
+        )
 
     # -- Catalog resolution -----------------------------------------------
 
@@ -210,6 +234,12 @@ class WorkflowCatalog:
             if not url:
                 continue
             self._validate_catalog_url(url)
+            if "max_stale" in item:
+                raise WorkflowValidationError(
+                    f"max_stale is not supported for catalog "
+                    f"'{item.get('name', idx + 1)}' "
+                    f"(only extension catalogs serve stale caches)"
+                )
             try:
                 priority = int(item.get("priority", idx + 1))
             except (TypeError, ValueError):
@@ -347,10 +377,31 @@ class WorkflowCatalog:
 
         _validate_catalog_url(entry.url)
 
+        # An expired cache is revalidated with a conditional request; a
+        # 304 keeps the cached payload and only refreshes its timestamp.
+        metadata = (
+            read_cache_metadata(meta_file)
+            if not force_refresh and cache_file.exists()
+            else {}
+        )
         try:
-            with _open_url(entry.url, timeout=30) as resp:
-                _validate_catalog_url(resp.geturl())
-                data = json.loads(resp.read().decode("utf-8"))
+            response = open_catalog(
+                _open_url, entry.url, timeout=30, metadata=metadata
+            )
+            if response.not_modified:
+                try:
+                    with open(cache_file, encoding="utf-8") as f:
+                        cached = json.load(f)
+                except (json.JSONDecodeError, ValueError, OSError):
+                    cached = None
+                if isinstance(cached, dict):
+                    write_cache_metadata(
+                        meta_file, {**metadata, "fetched_at": time.time()}
+                    )
+                    return cached
+                response = open_catalog(_open_url, entry.url, timeout=30)
+            _validate_catalog_url(response.url)
+            data = json.loads(response.body.decode("utf-8"))
         except Exception as exc:
             # Fall back to cache if available
             if cache_file.exists():
@@ -375,7 +426,14 @@ class WorkflowCatalog:
             with open(cache_file, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2)
             with open(meta_file, "w", encoding="utf-8") as f:
-                json.dump({"url": entry.url, "fetched_at": time.time()}, f)
+                json.dump(
+                    {
+                        "url": entry.url,
+                        "fetched_at": time.time(),
+                        **response.validators,
+                    },
+                    f,
+                )
         except OSError:
             pass  # Proceed without caching if disk write fails
 
@@ -389,14 +447,19 @@ class WorkflowCatalog:
         merged: dict[str, dict[str, Any]] = {}
         fetch_errors = 0
 
-        # Process later/higher-numbered entries first so earlier/lower-numbered
-        # entries overwrite them on workflow ID conflicts.
-        for entry in reversed(catalogs):
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-            except WorkflowCatalogError:
+        # Fetch concurrently, then process later/higher-numbered entries
+        # first so earlier/lower-numbered entries overwrite them on
+        # workflow ID conflicts.
+        self.last_fetch_report = fetch_catalogs(
+            catalogs,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            WorkflowCatalogError,
+        )
+        for result in reversed(self.last_fetch_report):
+            if not result.ok:
                 fetch_errors += 1
                 continue
+            entry, data = result.entry, result.data
             workflows = data.get("workflows", {})
             # Handle both dict and list formats
             if isinstance(workflows, dict):
@@ -421,6 +484,37 @@ class WorkflowCatalog:
             )
         return merged
 
+    def _search_index_fingerprint(self) -> str | None:
+        """Fingerprint the active catalog caches, or ``None`` if any is stale."""
+        parts = []
+        for entry in self.get_active_catalogs():
+            if not self._is_url_cache_valid(entry.url):
+                return None
+            _, meta_file = self._get_cache_paths(entry.url)
+            parts.append(
+                [entry.url, entry.name, entry.install_allowed, read_cache_metadata(meta_file)]
+            )
+        return search_index_fingerprint(parts)
+
+    def _get_search_index(self) -> CatalogSearchIndex:
+        """Return the search index over the merged workflows.
+
+        Reuses the index persisted alongside the catalog caches while they
+        are all fresh; otherwise merges the catalogs and rebuilds it.
+        """
+        index = self._search_index.lookup(self._search_index_fingerprint())
+        if index is not None:
+            self.last_fetch_report = index_fetch_report(
+                self.get_active_catalogs(),
+                lambda entry: self._get_cache_paths(entry.url)[1],
+            )
+            return index
+        merged = self._get_merged_workflows()
+        return self._search_index.build(
+            [{**wf_data, "id": wf_id} for wf_id, wf_data in merged.items()],
+            self._search_index_fingerprint(),
+        )
+
     # -- Public API -------------------------------------------------------
 
     def search(
@@ -428,39 +522,12 @@ class WorkflowCatalog:
         query: str | None = None,
         tag: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Search workflows across all configured catalogs."""
-        merged = self._get_merged_workflows()
-        results: list[dict[str, Any]] = []
-
-        for wf_id, wf_data in merged.items():
-            wf_data.setdefault("id", wf_id)
-            if query:
-                q = query.lower()
-                searchable = " ".join(
-                    [
-                        wf_data.get("name", ""),
-                        wf_data.get("description", ""),
-                        wf_data.get("id", ""),
-                    ]
-                ).lower()
-                if q not in searchable:
-                    continue
-            if tag:
-                raw_tags = wf_data.get("tags", [])
-                tags = raw_tags if isinstance(raw_tags, list) else []
-                normalized_tags = [t.lower() for t in tags if isinstance(t, str)]
-                if tag.lower() not in normalized_tags:
-                    continue
-            results.append(wf_data)
-        return results
+        """Search workflows across all configured catalogs, best match first."""
+        return self._get_search_index().search(query, tag=tag)
 
     def get_workflow_info(self, workflow_id: str) -> dict[str, Any] | None:
         """Get details for a specific workflow from the catalog."""
-        merged = self._get_merged_workflows()
-        wf = merged.get(workflow_id)
-        if wf:
-            wf.setdefault("id", workflow_id)
-        return wf
+        return self._get_search_index().get(workflow_id)
 
     def get_catalog_configs(self) -> list[dict[str, Any]]:
         """Return current catalog configuration as a list of dicts."""
@@ -623,11 +690,12 @@ class StepCatalogEntry:
 # ---------------------------------------------------------------------------
 
 
-class StepRegistry:
+class StepRegistry(CachedRegistry):
     """Manages the registry of installed custom step types.
 
     Tracks installed step types and their metadata in
-    ``.specify/workflows/steps/step-registry.json``.
+    ``.specify/workflows/steps/step-registry.json``. ``get()`` and ``list()``
+    return read-only views of a snapshot shared per process.
     """
 
     REGISTRY_FILE = "step-registry.json"
@@ -637,7 +705,7 @@ class StepRegistry:
         self.project_root = project_root
         self.steps_dir = project_root / ".specify" / "workflows" / "steps"
         self.registry_path = self.steps_dir / self.REGISTRY_FILE
-        self.data = self._load()
+        self._load()
 
     def _has_symlinked_parent(self) -> bool:
         """Return True if any directory under .specify/workflows/steps is a symlink."""
@@ -648,47 +716,52 @@ class StepRegistry:
                 return True
         return False
 
-    def _load(self) -> dict[str, Any]:
-        """Load registry from disk or create default."""
-        default_registry: dict[str, Any] = {"schema_version": self.SCHEMA_VERSION, "steps": {}}
+    def _default_data(self) -> dict[str, Any]:
+        return {"schema_version": self.SCHEMA_VERSION, "steps": {}}
+
+    def _read(self) -> Any:
         # Defense-in-depth: refuse to read the registry if any parent directory
         # under .specify/workflows/steps is a symlink, which could redirect the
         # read outside the project root.
         if self._has_symlinked_parent():
-            return default_registry
+            return None
         # Defense-in-depth: also refuse to read a symlinked registry file,
         # which could redirect the read outside the project root.
         if self.registry_path.is_symlink():
-            return default_registry
-        if self.registry_path.exists():
-            try:
-                with open(self.registry_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                # Validate shape: must be a dict with a dict "steps" field
-                if not isinstance(data, dict):
-                    return default_registry
-                if not isinstance(data.get("steps"), dict):
-                    data["steps"] = {}
-                return data
-            except (json.JSONDecodeError, ValueError, OSError, UnicodeError):
-                return default_registry
-        return default_registry
+            return None
+        try:
+            return super()._read()
+        except FileNotFoundError:
+            raise
+        except OSError:
+            return None
+
+    def _normalize(self, data: Any) -> dict[str, Any] | None:
+        # Validate shape: must be a dict with a dict "steps" field
+        if not isinstance(data, dict):
+            return None
+        if not isinstance(data.get("steps"), dict):
+            data = {**data, "steps": {}}
+        return data
 
     def save(self) -> None:
-        """Persist registry to disk.
+        """Persist registry to disk, or once at the end of an enclosing ``batch()``.
 
         Raises ``StepValidationError`` with a clear message on filesystem
         errors (read-only fs, permission denied, ...) so callers can surface
         a clean error to the user rather than an unhandled ``OSError``.
         """
+        if not self._defer_save():
+            self._persist()
+
+    def _persist(self) -> None:
         if self._has_symlinked_parent() or self.registry_path.is_symlink():
             raise StepValidationError(
                 "Refusing to write step registry through a symlinked path."
             )
         try:
             self.steps_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.registry_path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2)
+            self._write()
         except OSError as exc:
             raise StepValidationError(
                 f"Failed to write step registry at {self.registry_path}: {exc}"
@@ -710,7 +783,7 @@ class StepRegistry:
 
     def remove(self, step_id: str) -> bool:
         """Remove an installed step entry. Returns True if found."""
-        if step_id in self.data["steps"]:
+        if step_id in self._view()["steps"]:
             del self.data["steps"][step_id]
             self.save()
             return True
@@ -718,15 +791,15 @@ class StepRegistry:
 
     def get(self, step_id: str) -> dict[str, Any] | None:
         """Get metadata for an installed step."""
-        return self.data["steps"].get(step_id)
+        return self._view()["steps"].get(step_id)
 
     def list(self) -> dict[str, dict[str, Any]]:
         """Return all installed steps."""
-        return dict(self.data["steps"])
+        return self._view()["steps"]
 
     def is_installed(self, step_id: str) -> bool:
         """Check if a step is installed."""
-        return step_id in self.data["steps"]
+        return step_id in self._view()["steps"]
 
 
 # ---------------------------------------------------------------------------
@@ -758,6 +831,11 @@ class StepCatalog:
         self.project_root = project_root
         self.steps_dir = project_root / ".specify" / "workflows" / "steps"
         self.cache_dir = self.steps_dir / ".cache"
+        # Per-catalog outcomes of the most recent multi-catalog fetch.
+        self.last_fetch_report: list[CatalogFetchResult] = []
+        self._search_index = SearchIndexStore(
+            self.cache_dir / "step-catalog-search-index.json", _SEARCH_FIELDS
+        )
 
     def _is_cache_path_safe(self) -> bool:
         """Return False if any component of the cache path is a symlink."""
@@ -825,6 +903,12 @@ class StepCatalog:
             if not url:
                 continue
             self._validate_catalog_url(url)
+            if "max_stale" in item:
+                raise StepValidationError(
+                    f"max_stale is not supported for catalog "
+                    f"'{item.get('name', idx + 1)}' "
+                    f"(only extension catalogs serve stale caches)"
+                )
             try:
                 priority = int(item.get("priority", idx + 1))
             except (TypeError, ValueError):
@@ -964,10 +1048,31 @@ class StepCatalog:
 
         _validate_url(entry.url)
 
+        # An expired cache is revalidated with a conditional request; a
+        # 304 keeps the cached payload and only refreshes its timestamp.
+        metadata = (
+            read_cache_metadata(meta_file)
+            if cache_safe and not force_refresh and cache_file.exists()
+            else {}
+        )
         try:
-            with _open_url(entry.url, timeout=30) as resp:
-                _validate_url(resp.geturl())
-                data = json.loads(resp.read().decode("utf-8"))
+            response = open_catalog(
+                _open_url, entry.url, timeout=30, metadata=metadata
+            )
+            if response.not_modified:
+                try:
+                    with open(cache_file, encoding="utf-8") as f:
+                        cached = json.load(f)
+                except (json.JSONDecodeError, ValueError, OSError):
+                    cached = None
+                if isinstance(cached, dict):
+                    write_cache_metadata(
+                        meta_file, {**metadata, "fetched_at": time.time()}
+                    )
+                    return cached
+                response = open_catalog(_open_url, entry.url, timeout=30)
+            _validate_url(response.url)
+            data = json.loads(response.body.decode("utf-8"))
         except Exception as exc:
             if cache_safe and cache_file.exists():
                 try:
@@ -993,7 +1098,14 @@ class StepCatalog:
                 with open(cache_file, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2)
                 with open(meta_file, "w", encoding="utf-8") as f:
-                    json.dump({"url": entry.url, "fetched_at": time.time()}, f)
+                    json.dump(
+                        {
+                            "url": entry.url,
+                            "fetched_at": time.time(),
+                            **response.validators,
+                        },
+                        f,
+                    )
             except OSError:
                 pass  # Proceed without caching if disk write fails
 
@@ -1007,12 +1119,16 @@ class StepCatalog:
         merged: dict[str, dict[str, Any]] = {}
         fetch_errors = 0
 
-        for entry in reversed(catalogs):
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-            except StepCatalogError:
+        self.last_fetch_report = fetch_catalogs(
+            catalogs,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            StepCatalogError,
+        )
+        for result in reversed(self.last_fetch_report):
+            if not result.ok:
                 fetch_errors += 1
                 continue
+            entry, data = result.entry, result.data
             steps = data.get("steps", {})
             if isinstance(steps, dict):
                 for step_id, step_data in steps.items():
@@ -1038,39 +1154,51 @@ class StepCatalog:
             raise StepCatalogError("All configured step catalogs failed to fetch.")
         return merged
 
+    def _search_index_fingerprint(self) -> str | None:
+        """Fingerprint the active catalog caches, or ``None`` if any is stale."""
+        if not self._is_cache_path_safe():
+            return None
+        parts = []
+        for entry in self.get_active_catalogs():
+            if not self._is_url_cache_valid(entry.url):
+                return None
+            _, meta_file = self._get_cache_paths(entry.url)
+            parts.append(
+                [entry.url, entry.name, entry.install_allowed, read_cache_metadata(meta_file)]
+            )
+        return search_index_fingerprint(parts)
+
+    def _get_search_index(self) -> CatalogSearchIndex:
+        """Return the search index over the merged steps.
+
+        Reuses the index persisted alongside the catalog caches while they
+        are all fresh; otherwise merges the catalogs and rebuilds it.
+        """
+        index = self._search_index.lookup(self._search_index_fingerprint())
+        if index is not None:
+            self.last_fetch_report = index_fetch_report(
+                self.get_active_catalogs(),
+                lambda entry: self._get_cache_paths(entry.url)[1],
+            )
+            return index
+        merged = self._get_merged_steps()
+        return self._search_index.build(
+            [{**step_data, "id": step_id} for step_id, step_data in merged.items()],
+            self._search_index_fingerprint(),
+        )
+
     # -- Public API -------------------------------------------------------
 
     def search(
         self,
         query: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Search step types across all configured catalogs."""
-        merged = self._get_merged_steps()
-        results: list[dict[str, Any]] = []
-
-        for step_id, step_data in merged.items():
-            step_data.setdefault("id", step_id)
-            if query:
-                q = query.lower()
-                searchable = " ".join(
-                    [
-                        str(step_data.get("name") or ""),
-                        str(step_data.get("description") or ""),
-                        str(step_data.get("id") or ""),
-                    ]
-                ).lower()
-                if q not in searchable:
-                    continue
-            results.append(step_data)
-        return results
+        """Search step types across all configured catalogs, best match first."""
+        return self._get_search_index().search(query)
 
     def get_step_info(self, step_id: str) -> dict[str, Any] | None:
         """Get details for a specific step from the catalog."""
-        merged = self._get_merged_steps()
-        step = merged.get(step_id)
-        if step:
-            step.setdefault("id", step_id)
-        return step
+        return self._get_search_index().get(step_id)
 
     def get_catalog_configs(self) -> list[dict[str, Any]]:
         """Return current catalog configuration as a list of dicts."""
@@ -3,20 +3,27 @@
 The engine is the orchestrator that:
 - Parses workflow YAML definitions
 - Validates step configurations and requirements
-- Executes steps sequentially, dispatching to the correct step type
+- Executes steps sequentially (or as a dependency graph when the
+  workflow opts into ``execution: dag``), dispatching to the correct
+  step type
 - Manages state persistence for resume capability
 - Handles control flow (branching, loops, fan-out/fan-in)
 """
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import os
 import re
+import tempfile
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterator
 
 import yaml
 
@@ -52,6 +59,14 @@ class WorkflowDefinition:
         if not isinstance(self.default_options, dict):
             self.default_options = {}
 
+        # Execution mode: "sequential" (default) or "dag", where
+        # top-level steps run as soon as their dependencies complete.
+        self.execution: str = workflow.get("execution", "sequential")
+        self.max_concurrency: Any = workflow.get("max_concurrency")
+
+        # Run log writer options (flush policy, rotation, in-memory copy).
+        self.log_options: dict[str, Any] = workflow.get("log") or {}
+
         # Requirements (declared but not yet enforced at runtime;
         # enforcement is a planned enhancement)
         self.requires: dict[str, Any] = data.get("requires", {})
@@ -187,9 +202,82 @@ def validate_workflow(definition: WorkflowDefinition) -> list[str]:
     seen_ids: set[str] = set()
     _validate_steps(definition.steps, seen_ids, errors)
 
+    # -- Execution mode ---------------------------------------------------
+    if definition.execution not in ("sequential", "dag"):
+        errors.append(
+            f"Invalid workflow.execution {definition.execution!r}. "
+            f"Must be 'sequential' or 'dag'."
+        )
+    mc = definition.max_concurrency
+    if mc is not None and (not isinstance(mc, int) or isinstance(mc, bool) or mc < 1):
+        errors.append(
+            f"workflow.max_concurrency must be a positive integer, got {mc!r}."
+        )
+    if definition.execution == "dag":
+        _validate_dag(definition.steps, errors)
+
+    # -- Run log ----------------------------------------------------------
+    _validate_log_options(definition.log_options, errors)
+
     return errors
 
 
+def _validate_log_options(options: Any, errors: list[str]) -> None:
+    """Validate the ``workflow.log`` mapping."""
+    if not isinstance(options, dict):
+        errors.append("'workflow.log' must be a mapping (or omitted).")
+        return
+    for key, value in options.items():
+        if key == "flush":
+            valid = value in ("event", "state") or (
+                isinstance(value, int) and not isinstance(value, bool) and value > 0
+            )
+            if not valid:
+                errors.append(
+                    f"workflow.log.flush must be 'event', 'state', or a "
+                    f"positive integer, got {value!r}."
+                )
+        elif key in ("max_bytes", "backup_count"):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                errors.append(
+                    f"workflow.log.{key} must be a non-negative integer, "
+                    f"got {value!r}."
+                )
+        elif key == "keep_in_memory":
+            if not isinstance(value, bool):
+                errors.append(
+                    f"workflow.log.keep_in_memory must be a boolean, "
+                    f"got {type(value).__name__}."
+                )
+        else:
+            errors.append(f"Unknown workflow.log option {key!r}.")
+
+
+def _validate_dag(steps: list[dict[str, Any]], errors: list[str]) -> None:
+    """Validate top-level ``depends_on`` references and reject cycles."""
+    top_ids = {
+        s.get("id") for s in steps if isinstance(s, dict) and s.get("id")
+    }
+    for step_config in steps:
+        if not isinstance(step_config, dict):
+            continue
+        depends_on = step_config.get("depends_on")
+        if not isinstance(depends_on, list):
+            continue
+        for dep in depends_on:
+            if isinstance(dep, str) and dep not in top_ids:
+                errors.append(
+                    f"Step {step_config.get('id')!r} depends on unknown "
+                    f"top-level step {dep!r}."
+                )
+
+    cycle = _find_dependency_cycle(step_dependencies(steps))
+    if cycle:
+        errors.append(
+            "Circular step dependencies: " + " -> ".join(cycle) + "."
+        )
+
+
 def _validate_steps(
     steps: list[dict[str, Any]],
     seen_ids: set[str],
@@ -248,6 +336,28 @@ def _validate_steps(
                     f"boolean, got {type(coe).__name__}."
                 )
 
+        # `depends_on` declares explicit dependencies for DAG execution
+        # (``workflow.execution: dag``); sequential runs ignore it.
+        if "depends_on" in step_config:
+            deps = step_config["depends_on"]
+            if not isinstance(deps, list) or not all(
+                isinstance(d, str) for d in deps
+            ):
+                errors.append(
+                    f"Step {step_id!r}: 'depends_on' must be a list of "
+                    f"step IDs."
+                )
+
+        # Expressions are compiled (and cached) up front so syntax errors
+        # surface at validation time rather than mid-run.
+        for key, value in step_config.items():
+            if key in _NESTED_STEP_KEYS and isinstance(value, (list, dict)):
+                continue
+            errors.extend(
+                f"Step {step_id!r}: {message}"
+                for message in _expression_errors(value)
+            )
+
         # Recursively validate nested steps
         for nested_key in ("then", "else", "steps"):
             nested = step_config.get(nested_key)
@@ -275,11 +385,336 @@ def _validate_steps(
             errors.extend(fan_errors)
 
 
+# Step-config keys holding nested step definitions (validated recursively).
+_NESTED_STEP_KEYS = frozenset({"then", "else", "steps", "cases", "default", "step"})
+
+
+def _expression_errors(value: Any) -> list[str]:
+    """Return syntax errors for the ``{{ ... }}`` templates in *value*."""
+    from .expressions import compile_template
+
+    if isinstance(value, str):
+        if "{{" not in value:
+            return []
+        try:
+            compile_template(value)
+        except ValueError as exc:
+            return [str(exc)]
+        return []
+    errors: list[str] = []
+    if isinstance(value, dict):
+        for item in value.values():
+            errors.extend(_expression_errors(item))
+    elif isinstance(value, list):
+        for item in value:
+            errors.extend(_expression_errors(item))
+    return errors
+
+
+# -- Step Dependencies ----------------------------------------------------
+
+# ``steps.<id>`` references inside ``{{ ... }}`` expressions.
+_STEP_REF_PATTERN = re.compile(r"(?<![\w.])steps\.([\w-]+)")
+_EXPR_BLOCK_PATTERN = re.compile(r"\{\{(.+?)\}\}")
+
+
+def _nested_step_ids(step_config: dict[str, Any]) -> set[str]:
+    """Return the IDs of every step nested under *step_config*."""
+    ids: set[str] = set()
+    nested: list[Any] = []
+    for key in ("then", "else", "steps", "default"):
+        value = step_config.get(key)
+        if isinstance(value, list):
+            nested.extend(value)
+    cases = step_config.get("cases")
+    if isinstance(cases, dict):
+        for case_steps in cases.values():
+            if isinstance(case_steps, list):
+                nested.extend(case_steps)
+    fan_step = step_config.get("step")
+    if isinstance(fan_step, dict):
+        nested.append(fan_step)
+    for child in nested:
+        if isinstance(child, dict):
+            if child.get("id"):
+                ids.add(child["id"])
+            ids |= _nested_step_ids(child)
+    return ids
+
+
+def _referenced_step_ids(value: Any) -> set[str]:
+    """Return step IDs referenced as ``steps.<id>`` in expressions in *value*."""
+    refs: set[str] = set()
+    if isinstance(value, str):
+        if "{{" in value:
+            for block in _EXPR_BLOCK_PATTERN.findall(value):
+                refs.update(_STEP_REF_PATTERN.findall(block))
+    elif isinstance(value, dict):
+        for item in value.values():
+            refs |= _referenced_step_ids(item)
+    elif isinstance(value, list):
+        for item in value:
+            refs |= _referenced_step_ids(item)
+    return refs
+
+
+def step_dependencies(steps: list[dict[str, Any]]) -> dict[str, list[str]]:
+    """Return the dependencies of each top-level step, keyed by step ID.
+
+    A step depends on the steps listed in its ``depends_on``, the steps a
+    ``fan-in`` names in ``wait_for``, and every top-level step referenced
+    through ``{{ steps.<id>... }}`` anywhere in its configuration
+    (including nested bodies).  References to a nested step count as a
+    dependency on the top-level step that contains it.  Self-references
+    and unknown IDs are dropped.
+    """
+    owner: dict[str, str] = {}
+    for idx, step_config in enumerate(steps):
+        if not isinstance(step_config, dict):
+            continue
+        step_id = step_config.get("id", f"step-{idx}")
+        owner[step_id] = step_id
+        for nested_id in _nested_step_ids(step_config):
+            owner.setdefault(nested_id, step_id)
+
+    graph: dict[str, list[str]] = {}
+    for idx, step_config in enumerate(steps):
+        if not isinstance(step_config, dict):
+            continue
+        step_id = step_config.get("id", f"step-{idx}")
+        candidates: list[str] = []
+        for key in ("depends_on", "wait_for"):
+            declared = step_config.get(key)
+            if isinstance(declared, list):
+                candidates.extend(d for d in declared if isinstance(d, str))
+        candidates.extend(sorted(_referenced_step_ids(step_config)))
+        deps: list[str] = []
+        for ref in candidates:
+            dep = owner.get(ref)
+            if dep is not None and dep != step_id and dep not in deps:
+                deps.append(dep)
+        graph[step_id] = deps
+    return graph
+
+
+def _find_dependency_cycle(graph: dict[str, list[str]]) -> list[str]:
+    """Return one dependency cycle in *graph* (first node repeated), or ``[]``."""
+    visiting: list[str] = []
+    done: set[str] = set()
+
+    def visit(node: str) -> list[str]:
+        if node in done:
+            return []
+        if node in visiting:
+            return visiting[visiting.index(node):] + [node]
+        visiting.append(node)
+        for dep in graph.get(node, []):
+            cycle = visit(dep)
+            if cycle:
+                return cycle
+        visiting.pop()
+        done.add(node)
+        return []
+
+    for node in graph:
+        cycle = visit(node)
+        if cycle:
+            return cycle
+    return []
+
+
 # -- Run State Persistence ------------------------------------------------
 
 
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write *content* to *path* via an fsynced temp file and rename."""
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(content)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+class RunLog:
+    """Long-lived, buffered writer for a run's ``log.jsonl``.
+
+    Keeps the log file open between entries instead of reopening it for
+    every event.  ``flush`` selects when buffered entries reach disk:
+
+    - ``"event"`` (default) — after every entry.
+    - ``"state"`` — whenever the run state is saved.
+    - a positive integer *N* — after every *N* entries.
+
+    Whatever the policy, the log is flushed and closed when the run
+    leaves the ``running`` status.  When ``max_bytes`` is non-zero the
+    file is rotated before it would grow past that size: ``log.jsonl``
+    becomes ``log.jsonl.1``, older files shift up, and at most
+    ``backup_count`` rotated files are kept.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        flush: str | int = "event",
+        max_bytes: int = 0,
+        backup_count: int = 3,
+    ) -> None:
+        self.path = path
+        self.flush_policy = flush
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._handle: IO[str] | None = None
+        self._size = 0
+        self._pending = 0
+
+    def write(self, entry: dict[str, Any]) -> None:
+        """Write one entry, rotating and flushing according to the policy."""
+        line = json.dumps(entry) + "\n"
+        line_size = len(line.encode("utf-8"))
+        handle = self._open()
+        if self.max_bytes and self._size and self._size + line_size > self.max_bytes:
+            self._rotate()
+            handle = self._open()
+        handle.write(line)
+        self._size += line_size
+        self._pending += 1
+        if self.flush_policy == "event" or (
+            isinstance(self.flush_policy, int)
+            and self._pending >= self.flush_policy
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Push buffered entries to disk."""
+        if self._handle is not None:
+            self._handle.flush()
+        self._pending = 0
+
+    def close(self) -> None:
+        """Flush and close the log file; the next write reopens it."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._pending = 0
+
+    def _open(self) -> IO[str]:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.path, "a", encoding="utf-8")
+            self._size = self._handle.tell()
+        return self._handle
+
+    def _rotate(self) -> None:
+        self.close()
+        if self.backup_count < 1:
+            self.path.unlink()
+            return
+        for idx in range(self.backup_count - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{idx}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{idx + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+
+
+def _run_log_files(runs_dir: Path) -> list[Path]:
+    """Return the run's log files, newest first (``log.jsonl``, ``.1``, …)."""
+    files: list[Path] = []
+    current = runs_dir / "log.jsonl"
+    if current.exists():
+        files.append(current)
+    idx = 1
+    while True:
+        rotated = runs_dir / f"log.jsonl.{idx}"
+        if not rotated.exists():
+            break
+        files.append(rotated)
+        idx += 1
+    return files
+
+
+def _parse_log_line(line: str) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def iter_run_log(runs_dir: Path) -> Iterator[dict[str, Any]]:
+    """Stream a run's log entries oldest first, across rotated files.
+
+    Reads one line at a time; malformed lines (e.g. a write cut short)
+    are skipped.
+    """
+    for path in reversed(_run_log_files(runs_dir)):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                entry = _parse_log_line(line)
+                if entry is not None:
+                    yield entry
+
+
+def _tail_lines(path: Path, count: int, block_size: int = 65536) -> list[str]:
+    """Return up to the last *count* lines of *path*, reading from the end."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return lines[-count:] if count else []
+
+
+def tail_run_log(runs_dir: Path, count: int) -> list[dict[str, Any]]:
+    """Return the last *count* log entries of a run, oldest first.
+
+    Reads backwards from the end of ``log.jsonl`` (falling back to
+    rotated files when it holds fewer entries) so the cost depends on
+    *count*, not on the size of the log.
+    """
+    if count < 1:
+        return []
+    collected: deque[dict[str, Any]] = deque()
+    for path in _run_log_files(runs_dir):
+        entries = [
+            entry
+            for entry in map(_parse_log_line, _tail_lines(path, count))
+            if entry is not None
+        ]
+        collected.extendleft(reversed(entries))
+        if len(collected) >= count:
+            break
+    return list(collected)[-count:]
+
+
 class RunState:
-    """Manages workflow run state for persistence and resume."""
+    """Manages workflow run state for persistence and resume.
+
+    State is persisted as a ``state.json`` snapshot plus an append-only
+    ``journal.jsonl``.  While a run is ``running``, ``save()`` appends
+    one journal record holding the run header and only the step results
+    recorded (via ``record_step``) since the previous save, so the cost
+    of a checkpoint does not grow with the number of steps.  The journal
+    is compacted into a fresh snapshot every
+    ``JOURNAL_COMPACT_THRESHOLD`` records and whenever the run leaves
+    the ``running`` status.  Snapshots are written to a temp file,
+    fsynced, and atomically renamed into place; ``load()`` replays any
+    journal records newer than the snapshot.
+    """
+
+    #: Journal records appended before ``save()`` compacts into a snapshot.
+    JOURNAL_COMPACT_THRESHOLD = 64
 
     # ``run_id`` is interpolated into a filesystem path (``runs/<run_id>``)
     # by both ``save()`` and ``load()``. Constrain it to a charset that
@@ -330,10 +765,29 @@ class RunState:
         self.current_step_index = 0
         self.current_step_id: str | None = None
         self.step_results: dict[str, dict[str, Any]] = {}
+        # Top-level steps finished by a DAG-mode run; resume skips them.
+        self.completed_steps: list[str] = []
         self.inputs: dict[str, Any] = {}
         self.created_at = datetime.now(timezone.utc).isoformat()
         self.updated_at = self.created_at
         self.log_entries: list[dict[str, Any]] = []
+        #: Keep appended log entries in ``log_entries``; disable for long
+        #: runs that only need the on-disk log.
+        self.keep_log_entries = True
+        self._log = RunLog(self.runs_dir / "log.jsonl")
+        # Serialises persistence and result recording so concurrent
+        # fan-out workers can share one run without interleaving writes
+        # or mutating ``step_results`` while ``save()`` serialises it.
+        self._lock = threading.RLock()
+        # Journal bookkeeping: the sequence number of the last persisted
+        # record, records appended since the last snapshot, step IDs
+        # recorded since the last save, and what is already on disk.
+        self._journal_seq = 0
+        self._journal_records = 0
+        self._dirty_steps: set[str] = set()
+        self._persisted_keys: set[str] = set()
+        self._persisted_results: dict[str, dict[str, Any]] | None = None
+        self._saved_inputs: str | None = None
 
     @property
     def runs_dir(self) -> Path:
@@ -341,26 +795,152 @@ class RunState:
 
     def save(self) -> None:
         """Persist current state to disk."""
-        self.updated_at = datetime.now(timezone.utc).isoformat()
-        runs_dir = self.runs_dir
-        runs_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self.updated_at = datetime.now(timezone.utc).isoformat()
+            runs_dir = self.runs_dir
+            runs_dir.mkdir(parents=True, exist_ok=True)
 
-        state_data = {
-            "run_id": self.run_id,
-            "workflow_id": self.workflow_id,
+            # ``step_results`` replaced wholesale (rather than updated
+            # through ``record_step``) cannot be journaled as a delta.
+            if (
+                self._persisted_results is not self.step_results
+                or self.status != RunStatus.RUNNING
+                or self._journal_records >= self.JOURNAL_COMPACT_THRESHOLD
+            ):
+                self._write_snapshot(runs_dir)
+            else:
+                self._append_journal(runs_dir)
+
+            inputs_json = json.dumps({"inputs": self.inputs}, indent=2)
+            if inputs_json != self._saved_inputs:
+                _atomic_write_text(runs_dir / "inputs.json", inputs_json)
+                self._saved_inputs = inputs_json
+
+            if self.status != RunStatus.RUNNING:
+                self._log.close()
+            elif self._log.flush_policy == "state":
+                self._log.flush()
+
+    def configure_log(
+        self,
+        *,
+        flush: str | int = "event",
+        max_bytes: int = 0,
+        backup_count: int = 3,
+        keep_in_memory: bool = True,
+    ) -> None:
+        """Configure the run log writer (see ``RunLog``)."""
+        with self._lock:
+            self._log.close()
+            self._log = RunLog(
+                self.runs_dir / "log.jsonl",
+                flush=flush,
+                max_bytes=max_bytes,
+                backup_count=backup_count,
+            )
+            self.keep_log_entries = keep_in_memory
+            if not keep_in_memory:
+                self.log_entries.clear()
+
+    def record_step(self, step_id: str, step_data: dict[str, Any]) -> None:
+        """Record the result of a step under ``step_id``.
+
+        Call this again after mutating a recorded result in place so the
+        next ``save()`` journals the change.
+        """
+        with self._lock:
+            self.step_results[step_id] = step_data
+            self._dirty_steps.add(step_id)
+
+    def _header(self) -> dict[str, Any]:
+        return {
             "status": self.status.value,
             "current_step_index": self.current_step_index,
             "current_step_id": self.current_step_id,
+            "completed_steps": self.completed_steps,
+            "updated_at": self.updated_at,
+        }
+
+    def _write_snapshot(self, runs_dir: Path) -> None:
+        """Write a full ``state.json`` snapshot and drop the journal."""
+        state_data = {
+            "run_id": self.run_id,
+            "workflow_id": self.workflow_id,
+            **self._header(),
             "step_results": self.step_results,
             "created_at": self.created_at,
-            "updated_at": self.updated_at,
+            "journal_seq": self._journal_seq,
         }
-        with open(runs_dir / "state.json", "w", encoding="utf-8") as f:
-            json.dump(state_data, f, indent=2)
+        _atomic_write_text(
+            runs_dir / "state.json", json.dumps(state_data, indent=2)
+        )
+        # Journal records up to ``journal_seq`` are now in the snapshot;
+        # ``load()`` skips them even if the unlink below never happens.
+        journal = runs_dir / "journal.jsonl"
+        if journal.exists():
+            journal.unlink()
+        self._journal_records = 0
+        self._dirty_steps.clear()
+        self._persisted_results = self.step_results
+        self._persisted_keys = set(self.step_results)
+
+    def _append_journal(self, runs_dir: Path) -> None:
+        """Append the header and changed step results to the journal."""
+        dirty = self._dirty_steps
+        if len(self.step_results) != len(self._persisted_keys):
+            # Keys added directly to ``step_results``.
+            dirty |= self.step_results.keys() - self._persisted_keys
+        self._journal_seq += 1
+        record = {
+            "journal_seq": self._journal_seq,
+            **self._header(),
+            "step_results": {
+                key: self.step_results[key]
+                for key in sorted(dirty)
+                if key in self.step_results
+            },
+        }
+        with open(runs_dir / "journal.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._journal_records += 1
+        self._persisted_keys |= dirty
+        dirty.clear()
+
+    @staticmethod
+    def _read_state_data(runs_dir: Path) -> tuple[dict[str, Any], int]:
+        """Read ``state.json`` and replay newer journal records over it.
+
+        Returns the merged state data and the number of journal records
+        replayed.  Raises ``FileNotFoundError`` when the run has no snapshot.  A
+        truncated final journal line (a write interrupted mid-record) is
+        ignored.
+        """
+        state_path = runs_dir / "state.json"
+        if not state_path.exists():
+            msg = f"Run state not found: {state_path}"
+            raise FileNotFoundError(msg)
 
-        inputs_data = {"inputs": self.inputs}
-        with open(runs_dir / "inputs.json", "w", encoding="utf-8") as f:
-            json.dump(inputs_data, f, indent=2)
+        with open(state_path, encoding="utf-8") as f:
+            state_data = json.load(f)
+        replayed = 0
+
+        journal = runs_dir / "journal.jsonl"
+        if journal.exists():
+            base_seq = state_data.get("journal_seq", 0)
+            results = dict(state_data.get("step_results") or {})
+            with open(journal, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if record.get("journal_seq", 0) <= base_seq:
+                        continue
+                    results.update(record.pop("step_results", {}))
+                    state_data.update(record)
+                    replayed += 1
+            state_data["step_results"] = results
+        return state_data, replayed
 
     @classmethod
     def load(cls, run_id: str, project_root: Path) -> RunState:
@@ -379,13 +959,7 @@ class RunState:
         """
         cls._validate_run_id(run_id)
         runs_dir = project_root / ".specify" / "workflows" / "runs" / run_id
-        state_path = runs_dir / "state.json"
-        if not state_path.exists():
-            msg = f"Run state not found: {state_path}"
-            raise FileNotFoundError(msg)
-
-        with open(state_path, encoding="utf-8") as f:
-            state_data = json.load(f)
+        state_data, replayed = cls._read_state_data(runs_dir)
 
         state = cls(
             run_id=state_data["run_id"],
@@ -396,26 +970,68 @@ class RunState:
         state.current_step_index = state_data.get("current_step_index", 0)
         state.current_step_id = state_data.get("current_step_id")
         state.step_results = state_data.get("step_results", {})
+        state.completed_steps = state_data.get("completed_steps", [])
         state.created_at = state_data.get("created_at", "")
         state.updated_at = state_data.get("updated_at", "")
+        state._journal_seq = state_data.get("journal_seq", 0)
+        state._journal_records = replayed
+        state._persisted_results = state.step_results
+        state._persisted_keys = set(state.step_results)
 
         inputs_path = runs_dir / "inputs.json"
         if inputs_path.exists():
             with open(inputs_path, encoding="utf-8") as f:
                 inputs_data = json.load(f)
             state.inputs = inputs_data.get("inputs", {})
+            state._saved_inputs = json.dumps({"inputs": state.inputs}, indent=2)
 
         return state
 
     def append_log(self, entry: dict[str, Any]) -> None:
         """Append a log entry to the run log."""
         entry["timestamp"] = datetime.now(timezone.utc).isoformat()
-        self.log_entries.append(entry)
+        with self._lock:
+            if self.keep_log_entries:
+                self.log_entries.append(entry)
+            self._log.write(entry)
+
+    def tail_log(self, count: int) -> list[dict[str, Any]]:
+        """Return the last *count* entries of the on-disk run log."""
+        with self._lock:
+            self._log.flush()
+        return tail_run_log(self.runs_dir, count)
+
+
+class _WorkerRunState:
+    """Per-worker view of a ``RunState`` used by concurrent execution.
+
+    Concurrent fan-out items and DAG-mode steps each run against one of
+    these.  Persistence (step results, log, ``save()``) goes to the
+    shared parent run, but ``status`` and the current-step cursor are
+    tracked per worker so one worker's failure cannot race another
+    worker's outcome.  The engine combines outcomes in a deterministic
+    order once the workers finish.  A fan-out nested inside a worker
+    wraps that worker's view in turn.
+    """
+
+    def __init__(self, parent: RunState | _WorkerRunState) -> None:
+        self._parent = parent
+        self.status = RunStatus.RUNNING
+        self.current_step_id: str | None = None
+        self.current_step_index = parent.current_step_index
+
+    @property
+    def step_results(self) -> dict[str, dict[str, Any]]:
+        return self._parent.step_results
+
+    def record_step(self, step_id: str, step_data: dict[str, Any]) -> None:
+        self._parent.record_step(step_id, step_data)
+
+    def save(self) -> None:
+        self._parent.save()
 
-        runs_dir = self.runs_dir
-        runs_dir.mkdir(parents=True, exist_ok=True)
-        with open(runs_dir / "log.jsonl", "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+    def append_log(self, entry: dict[str, Any]) -> None:
+        self._parent.append_log(entry)
 
 
 # -- Workflow Engine ------------------------------------------------------
@@ -507,6 +1123,7 @@ class WorkflowEngine:
             workflow_id=definition.id,
             project_root=self.project_root,
         )
+        self._configure_run_log(state, definition)
 
         # Persist a copy of the workflow definition so resume can
         # reload it even if the original source is no longer available
@@ -535,7 +1152,10 @@ class WorkflowEngine:
 
         # Execute steps
         try:
-            self._execute_steps(definition.steps, context, state, STEP_REGISTRY)
+            if definition.execution == "dag":
+                self._execute_dag(definition, context, state, STEP_REGISTRY)
+            else:
+                self._execute_steps(definition.steps, context, state, STEP_REGISTRY)
         except KeyboardInterrupt:
             state.status = RunStatus.PAUSED
             state.append_log({"event": "workflow_interrupted"})
@@ -580,6 +1200,7 @@ class WorkflowEngine:
             definition = WorkflowDefinition.from_yaml(run_copy)
         else:
             definition = self.load_workflow(state.workflow_id)
+        self._configure_run_log(state, definition)
 
         # Merge any newly-supplied inputs over the persisted ones and
         # re-validate through the same typing path as the initial run.
@@ -609,10 +1230,15 @@ class WorkflowEngine:
         step_offset = state.current_step_index
 
         try:
-            self._execute_steps(
-                remaining_steps, context, state, STEP_REGISTRY,
-                step_offset=step_offset,
-            )
+            if definition.execution == "dag":
+                # DAG runs skip the top-level steps recorded in
+                # ``completed_steps`` and re-run everything else.
+                self._execute_dag(definition, context, state, STEP_REGISTRY)
+            else:
+                self._execute_steps(
+                    remaining_steps, context, state, STEP_REGISTRY,
+                    step_offset=step_offset,
+                )
         except KeyboardInterrupt:
             state.status = RunStatus.PAUSED
             state.append_log({"event": "workflow_interrupted"})
@@ -630,11 +1256,23 @@ class WorkflowEngine:
         state.save()
         return state
 
+    @staticmethod
+    def _configure_run_log(state: RunState, definition: WorkflowDefinition) -> None:
+        """Apply ``workflow.log`` options to the run's log writer.
+
+        Unknown keys are ignored here; ``validate_workflow`` reports them.
+        """
+        options = definition.log_options
+        if not isinstance(options, dict):
+            return
+        known = ("flush", "max_bytes", "backup_count", "keep_in_memory")
+        state.configure_log(**{k: v for k, v in options.items() if k in known})
+
     def _execute_steps(
         self,
         steps: list[dict[str, Any]],
         context: StepContext,
-        state: RunState,
+        state: RunState | _WorkerRunState,
         registry: dict[str, Any],
         *,
         step_offset: int = 0,
@@ -690,7 +1328,7 @@ class WorkflowEngine:
                 "status": result.status.value,
             }
             context.steps[step_id] = step_data
-            state.step_results[step_id] = step_data
+            state.record_step(step_id, step_data)
 
             state.append_log(
                 {
@@ -818,39 +1456,50 @@ class WorkflowEngine:
                                 return
                             if orig and ns_copy["id"] in context.steps:
                                 context.steps[orig] = context.steps[ns_copy["id"]]
-                                state.step_results[orig] = context.steps[ns_copy["id"]]
+                                state.record_step(orig, context.steps[ns_copy["id"]])
 
             # Fan-out: execute nested step template per item with unique IDs
             if step_type == "fan-out":
                 items = result.output.get("items", [])
                 template = result.output.get("step_template", {})
                 if template and items:
-                    fan_out_results = []
-                    for item_idx, item_val in enumerate(result.output["items"]):
-                        context.item = item_val
-                        # Per-item ID: parentId:templateId:index
-                        item_step = dict(template)
-                        base_id = item_step.get("id", "item")
-                        item_step["id"] = f"{step_id}:{base_id}:{item_idx}"
-                        self._execute_steps(
-                            [item_step], context, state, registry,
-                            step_offset=-1,
+                    max_concurrency = result.output.get("max_concurrency", 1)
+                    if (
+                        isinstance(max_concurrency, int)
+                        and not isinstance(max_concurrency, bool)
+                        and max_concurrency > 1
+                        and len(items) > 1
+                    ):
+                        fan_out_results = self._execute_fan_out_concurrent(
+                            step_id, template, items, max_concurrency,
+                            context, state, registry,
                         )
-                        # Collect per-item result for fan-in
-                        item_result = context.steps.get(item_step["id"], {})
-                        fan_out_results.append(item_result.get("output", {}))
-                        if state.status in (
-                            RunStatus.PAUSED,
-                            RunStatus.FAILED,
-                            RunStatus.ABORTED,
-                        ):
-                            break
+                    else:
+                        fan_out_results = []
+                        for item_idx, item_val in enumerate(items):
+                            context.item = item_val
+                            item_step = self._fan_out_item_step(
+                                step_id, template, item_idx
+                            )
+                            self._execute_steps(
+                                [item_step], context, state, registry,
+                                step_offset=-1,
+                            )
+                            # Collect per-item result for fan-in
+                            item_result = context.steps.get(item_step["id"], {})
+                            fan_out_results.append(item_result.get("output", {}))
+                            if state.status in (
+                                RunStatus.PAUSED,
+                                RunStatus.FAILED,
+                                RunStatus.ABORTED,
+                            ):
+                                break
                     context.item = None
                     # Preserve original output and add collected results
                     fan_out_output = dict(result.output)
                     fan_out_output["results"] = fan_out_results
                     context.steps[step_id]["output"] = fan_out_output
-                    state.step_results[step_id]["output"] = fan_out_output
+                    state.record_step(step_id, context.steps[step_id])
                     if state.status in (
                         RunStatus.PAUSED,
                         RunStatus.FAILED,
@@ -861,7 +1510,216 @@ class WorkflowEngine:
                     # Empty items or no template — normalize output
                     result.output["results"] = []
                     context.steps[step_id]["output"] = result.output
-                    state.step_results[step_id]["output"] = result.output
+                    state.record_step(step_id, context.steps[step_id])
+
+    def _execute_dag(
+        self,
+        definition: WorkflowDefinition,
+        context: StepContext,
+        state: RunState,
+        registry: dict[str, Any],
+    ) -> None:
+        """Execute top-level steps as a dependency graph.
+
+        Every step whose dependencies (see :func:`step_dependencies`) have
+        completed is started on a thread pool bounded by
+        ``workflow.max_concurrency``.  Each step runs against its own
+        ``StepContext`` copy taken when it starts, and its results are
+        merged back into ``context.steps`` when it finishes, so
+        dependants always see their dependencies' outputs.
+
+        Once a step pauses, fails, or aborts, no further steps are
+        started; steps already running finish, and the stopped step that
+        comes first in definition order decides the run status.
+        """
+        steps = definition.steps
+        graph = step_dependencies(steps)
+        stopping = (RunStatus.PAUSED, RunStatus.FAILED, RunStatus.ABORTED)
+
+        done = set(state.completed_steps)
+        pending: list[tuple[int, str, dict[str, Any]]] = [
+            (idx, step_config.get("id", f"step-{idx}"), step_config)
+            for idx, step_config in enumerate(steps)
+            if step_config.get("id", f"step-{idx}") not in done
+        ]
+        if not pending:
+            return
+
+        max_workers = definition.max_concurrency
+        if not isinstance(max_workers, int) or max_workers < 1:
+            max_workers = len(pending)
+
+        def run_step(
+            step_config: dict[str, Any], step_context: StepContext
+        ) -> _WorkerRunState:
+            step_state = _WorkerRunState(state)
+            self._execute_steps(
+                [step_config], step_context, step_state, registry,
+                step_offset=-1,
+            )
+            return step_state
+
+        running: dict[
+            Future[_WorkerRunState],
+            tuple[int, str, dict[str, dict[str, Any]], StepContext],
+        ] = {}
+        stopped: list[tuple[int, RunStatus]] = []
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            thread_name_prefix="workflow-dag",
+        )
+        try:
+            while True:
+                if not stopped:
+                    for entry in list(pending):
+                        idx, step_id, step_config = entry
+                        if not all(dep in done for dep in graph.get(step_id, [])):
+                            continue
+                        pending.remove(entry)
+                        snapshot = dict(context.steps)
+                        step_context = dataclasses.replace(
+                            context, steps=dict(snapshot)
+                        )
+                        future = executor.submit(run_step, step_config, step_context)
+                        running[future] = (idx, step_id, snapshot, step_context)
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    idx, step_id, snapshot, step_context = running.pop(future)
+                    step_state = future.result()
+                    for key, value in step_context.steps.items():
+                        if snapshot.get(key) is not value:
+                            context.steps[key] = value
+                    if step_state.status in stopping:
+                        stopped.append((idx, step_state.status))
+                    else:
+                        done.add(step_id)
+                        with state._lock:
+                            state.completed_steps.append(step_id)
+                        state.save()
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        if stopped:
+            state.status = min(stopped)[1]
+            return
+        if pending:
+            blocked = ", ".join(repr(step_id) for _, step_id, _ in pending)
+            msg = f"Steps {blocked} have unsatisfiable or circular dependencies."
+            raise ValueError(msg)
+
+    @staticmethod
+    def _fan_out_item_step(
+        step_id: str, template: dict[str, Any], item_idx: int
+    ) -> dict[str, Any]:
+        """Return a copy of the fan-out template with a per-item ID.
+
+        Per-item IDs take the form ``parentId:templateId:index``.
+        """
+        item_step = dict(template)
+        base_id = item_step.get("id", "item")
+        item_step["id"] = f"{step_id}:{base_id}:{item_idx}"
+        return item_step
+
+    def _execute_fan_out_concurrent(
+        self,
+        step_id: str,
+        template: dict[str, Any],
+        items: list[Any],
+        max_concurrency: int,
+        context: StepContext,
+        state: RunState | _WorkerRunState,
+        registry: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Run fan-out items on a bounded thread pool.
+
+        Each item executes against its own ``StepContext`` copy (with a
+        snapshot of ``context.steps`` and ``item`` set to that item) and
+        its own ``_WorkerRunState``, so workers never observe each
+        other's ``item`` or status.  Once an item pauses, fails, or
+        aborts, items that have not started yet are skipped; items
+        already running are allowed to finish.
+
+        Outcomes are combined in item order, which keeps ``results``
+        and the final run status identical to a sequential run that
+        stopped at the same item: ``results`` holds item outputs up to
+        and including the first item that stopped the run, and that
+        item's status becomes the run status.  Every item that ran has
+        its step results merged back into ``context.steps`` in item
+        order.
+        """
+        stop = threading.Event()
+        stopping = (RunStatus.PAUSED, RunStatus.FAILED, RunStatus.ABORTED)
+
+        def run_item(
+            item_idx: int, item_val: Any
+        ) -> tuple[StepContext, _WorkerRunState] | None:
+            if stop.is_set():
+                return None
+            item_context = dataclasses.replace(
+                context, steps=dict(context.steps), item=item_val,
+            )
+            item_state = _WorkerRunState(state)
+            item_step = self._fan_out_item_step(step_id, template, item_idx)
+            try:
+                self._execute_steps(
+                    [item_step], item_context, item_state, registry,
+                    step_offset=-1,
+                )
+            except BaseException:
+                stop.set()
+                raise
+            if item_state.status in stopping:
+                stop.set()
+            return item_context, item_state
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(items)),
+            thread_name_prefix=f"fan-out-{step_id}",
+        )
+        try:
+            futures = [
+                executor.submit(run_item, idx, val)
+                for idx, val in enumerate(items)
+            ]
+            outcomes = [future.result() for future in futures]
+        except KeyboardInterrupt:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        except BaseException:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        fan_out_results: list[dict[str, Any]] = []
+        final_status: RunStatus | None = None
+        for item_idx, outcome in enumerate(outcomes):
+            if outcome is None:
+                continue
+            item_context, item_state = outcome
+            for key, value in item_context.steps.items():
+                if context.steps.get(key) is not value:
+                    context.steps[key] = value
+            if final_status is not None:
+                continue
+            item_id = self._fan_out_item_step(step_id, template, item_idx)["id"]
+            item_result = item_context.steps.get(item_id, {})
+            fan_out_results.append(item_result.get("output", {}))
+            if item_state.status in stopping:
+                final_status = item_state.status
+        if final_status is not None:
+            state.status = final_status
+        return fan_out_results
 
     def _resolve_inputs(
         self,
@@ -1004,11 +1862,11 @@ class WorkflowEngine:
         for run_dir in sorted(runs_dir.iterdir()):
             if not run_dir.is_dir():
                 continue
-            state_path = run_dir / "state.json"
-            if state_path.exists():
-                with open(state_path, encoding="utf-8") as f:
-                    state_data = json.load(f)
-                runs.append(state_data)
+            try:
+                state_data, _ = RunState._read_state_data(run_dir)
+            except FileNotFoundError:
+                continue
+            runs.append(state_data)
         return runs
 
 
@@ -7,9 +7,11 @@ the evaluator only walks the namespace and applies a fixed set of filters.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
-from typing import Any
+from collections.abc import Iterator, Mapping
+from typing import Any, Callable, NamedTuple
 
 
 # -- Custom filters -------------------------------------------------------
@@ -76,193 +78,439 @@ def _filter_from_json(value: Any) -> Any:
         raise ValueError(f"from_json: invalid JSON: {exc}") from exc
 
 
-# -- Expression resolution ------------------------------------------------
+# -- Expression compilation -----------------------------------------------
+#
+# Expressions are compiled in one pass: a regex tokenizer feeds a Pratt
+# (top-down operator precedence) parser, and each parse rule returns a
+# closure over the namespace.  From loosest to tightest binding:
+#
+#   or  <  and  <  not  <  comparisons / in  <  | filter  <  . and [ ]
+#
+# which matches Jinja2, so ``x | default(0) > 1`` compares the filtered
+# value and ``not a == b`` negates the comparison.
+
+#: Size of the LRU caches holding compiled expressions and templates.
+COMPILE_CACHE_SIZE = 1024
+
+# A compiled expression: evaluates against a namespace mapping.
+_Compiled = Callable[[Mapping[str, Any]], Any]
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<number>-?\d+(?:\.\d+)?(?![\w-]))
+    | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<op>==|!=|>=|<=|[<>|()\[\],.])
+    | (?P<name>\w[\w-]*)
+    """,
+    re.VERBOSE,
+)
+_STRING_ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+
+_COMPARISON_OPS = ("==", "!=", ">", "<", ">=", "<=")
+
+# Left binding power of each infix token.  ``not`` only appears infix as
+# the first half of ``not in``.
+_BINDING_POWER = {
+    "or": 10,
+    "and": 20,
+    **{op: 40 for op in _COMPARISON_OPS},
+    "in": 40,
+    "not": 40,
+    "|": 50,
+    ".": 60,
+    "[": 60,
+}
+# Right binding power of prefix ``not``: looser than comparisons.
+_NOT_BINDING_POWER = 30
+
+_LITERAL_NAMES: dict[str, Any] = {
+    "true": True,
+    "false": False,
+    "none": None,
+    "null": None,
+}
+
+# Filters and the number of arguments each accepts (min, max).
+_FILTERS: dict[str, tuple[Callable[..., Any], int, int]] = {
+    "default": (_filter_default, 0, 1),
+    "join": (_filter_join, 0, 1),
+    "map": (_filter_map, 1, 1),
+    "contains": (_filter_contains, 1, 1),
+}
+
+
+class _Token(NamedTuple):
+    kind: str  # "number", "string", "op", "name" or "end"
+    text: str
+    pos: int
+
+
+def _tokenize(source: str) -> list[_Token]:
+    """Split *source* into tokens, ending with an ``end`` token."""
+    tokens: list[_Token] = []
+    pos = 0
+    while pos < len(source):
+        match = _TOKEN_PATTERN.match(source, pos)
+        if match is None:
+            msg = (
+                f"Invalid expression {source!r}: unexpected character "
+                f"{source[pos]!r} at position {pos}"
+            )
+            raise ValueError(msg)
+        kind = match.lastgroup or ""
+        if kind != "space":
+            tokens.append(_Token(kind, match.group(), pos))
+        pos = match.end()
+    tokens.append(_Token("end", "", len(source)))
+    return tokens
+
+
+def _mapping_or_empty(value: Any) -> Any:
+    # An empty dict is returned as-is (not replaced by a fresh one) so
+    # keys the engine adds to it later stay visible through the cache.
+    return value if value or isinstance(value, dict) else {}
+
+
+# Namespace entries and how each is derived from its StepContext
+# attribute.  `context` is engine-managed runtime metadata, present even
+# outside a run so templates referencing it never error: `run_id` falls
+# back to an empty string when no run is active (dry-run, validation,
+# ad-hoc evaluator usage). The value is the same one Spec Kit prints as
+# `Run ID:` at the end of `workflow run` — auto-generated runs use an
+# 8-character uuid4 hex; operator-supplied ids may be any alphanumeric
+# string with hyphens or underscores.
+_NAMESPACE_SOURCES: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "inputs": ("inputs", _mapping_or_empty),
+    "steps": ("steps", _mapping_or_empty),
+    "item": ("item", lambda value: value),
+    "fan_in": ("fan_in", _mapping_or_empty),
+    "context": ("run_id", lambda value: {"run_id": value or ""}),
+}
+_MISSING = object()
+
+
+class _Namespace(Mapping[str, Any]):
+    """Lazily-populated variable namespace bound to a StepContext.
+
+    Entries are derived from the context on first lookup and memoized
+    against the attribute they came from, so an entry is rebuilt only
+    after that attribute is reassigned (e.g. ``context.item`` moving to
+    the next fan-out item).  In-place changes such as a new key in
+    ``context.steps`` are visible immediately because the entry *is* the
+    context's dict.
+    """
 
-_EXPR_PATTERN = re.compile(r"\{\{(.+?)\}\}")
+    __slots__ = ("_context", "_entries")
+
+    def __init__(self, context: Any) -> None:
+        self._context = context
+        self._entries: dict[str, tuple[Any, Any]] = {}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        source = _NAMESPACE_SOURCES.get(name)
+        if source is None:
+            return default
+        attr, derive = source
+        raw = getattr(self._context, attr, _MISSING)
+        if raw is _MISSING and name != "context":
+            return default
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] is raw:
+            return entry[1]
+        value = derive(None if raw is _MISSING else raw)
+        self._entries[name] = (raw, value)
+        return value
 
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
 
-def _resolve_dot_path(obj: Any, path: str) -> Any:
-    """Resolve a dotted path like ``steps.specify.output.file`` against *obj*.
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in _NAMESPACE_SOURCES if name in self)
 
-    Supports dict key access and list indexing (e.g., ``task_list[0]``).
-    """
-    parts = path.split(".")
-    current = obj
-    for part in parts:
-        # Handle list indexing: name[0]
-        idx_match = re.match(r"^([\w-]+)\[(\d+)\]$", part)
-        if idx_match:
-            key, idx = idx_match.group(1), int(idx_match.group(2))
-            if isinstance(current, dict):
-                current = current.get(key)
-            else:
-                return None
-            if isinstance(current, list) and 0 <= idx < len(current):
-                current = current[idx]
-            else:
-                return None
-        elif isinstance(current, dict):
-            current = current.get(part)
-        else:
-            return None
-        if current is None:
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, name: object) -> bool:
+        return self.get(name, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+
+def _build_namespace(context: Any) -> Mapping[str, Any]:
+    """Return the (cached) variable namespace for a StepContext."""
+    namespace = getattr(context, "_namespace", None)
+    if namespace is None:
+        namespace = _Namespace(context)
+        try:
+            context._namespace = namespace
+        except AttributeError:  # contexts without a settable attribute
+            pass
+    return namespace
+
+
+def _constant(value: Any) -> _Compiled:
+    return lambda _ns: value
+
+
+def _get_attribute(value: Any, key: str) -> Any:
+    return value.get(key) if isinstance(value, dict) else None
+
+
+def _get_item(value: Any, key: Any) -> Any:
+    if isinstance(value, list):
+        if isinstance(key, int) and not isinstance(key, bool) and 0 <= key < len(value):
+            return value[key]
+        return None
+    if isinstance(value, dict):
+        try:
+            return value.get(key)
+        except TypeError:  # unhashable key
             return None
-    return current
-
-
-def _build_namespace(context: Any) -> dict[str, Any]:
-    """Build the variable namespace from a StepContext."""
-    ns: dict[str, Any] = {}
-    if hasattr(context, "inputs"):
-        ns["inputs"] = context.inputs or {}
-    if hasattr(context, "steps"):
-        ns["steps"] = context.steps or {}
-    if hasattr(context, "item"):
-        ns["item"] = context.item
-    if hasattr(context, "fan_in"):
-        ns["fan_in"] = context.fan_in or {}
-    # Engine-managed runtime metadata. Always present (even outside a
-    # run) so templates referencing it never error: `run_id` falls back
-    # to an empty string when no run is active (dry-run, validation,
-    # ad-hoc evaluator usage). The value is the same one Spec Kit
-    # prints as `Run ID:` at the end of `workflow run` — auto-generated
-    # runs use an 8-character uuid4 hex; operator-supplied ids may be
-    # any alphanumeric string with hyphens or underscores.
-    run_id = getattr(context, "run_id", None) or ""
-    ns["context"] = {"run_id": run_id}
-    return ns
-
-
-def _evaluate_simple_expression(expr: str, namespace: dict[str, Any]) -> Any:
-    """Evaluate a simple expression against the namespace.
+    return None
+
+
+class _Parser:
+    """Pratt parser compiling one expression's tokens into a closure."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.tokens = _tokenize(source)
+        self.index = 0
+        # Nesting depth of (), [] and filter argument lists; a closing
+        # bracket is only a valid continuation inside one.
+        self.depth = 0
+
+    # -- Token helpers --------------------------------------------------
+
+    def peek(self, offset: int = 0) -> _Token:
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)]
+
+    def advance(self) -> _Token:
+        token = self.peek()
+        self.index += 1
+        return token
+
+    def error(self, message: str, token: _Token) -> ValueError:
+        where = "end of expression" if token.kind == "end" else f"position {token.pos}"
+        return ValueError(f"Invalid expression {self.source!r}: {message} at {where}")
+
+    def expect(self, text: str) -> _Token:
+        token = self.advance()
+        if token.kind != "op" or token.text != text:
+            raise self.error(f"expected {text!r}", token)
+        return token
+
+    def infix_power(self, token: _Token) -> int:
+        if token.kind not in ("op", "name"):
+            return 0
+        if token.text == "not":
+            next_token = self.peek(1)
+            return _BINDING_POWER["not"] if next_token.text == "in" else 0
+        if token.kind == "name" and token.text not in ("and", "or", "in"):
+            return 0
+        return _BINDING_POWER.get(token.text, 0)
+
+    # -- Grammar --------------------------------------------------------
+
+    def parse(self) -> _Compiled:
+        if self.peek().kind == "end":
+            msg = f"Invalid expression {self.source!r}: empty expression"
+            raise ValueError(msg)
+        compiled = self.expression(0)
+        token = self.peek()
+        if token.kind != "end":
+            raise self.error(f"unexpected {token.text!r}", token)
+        return compiled
+
+    def expression(self, right_power: int) -> _Compiled:
+        left = self.prefix(self.advance())
+        while right_power < self.infix_power(self.peek()):
+            left = self.infix(self.advance(), left)
+        return left
+
+    def prefix(self, token: _Token) -> _Compiled:
+        if token.kind == "number":
+            return _constant(float(token.text) if "." in token.text else int(token.text))
+        if token.kind == "string":
+            return _constant(
+                _STRING_ESCAPE_PATTERN.sub(r"\1", token.text[1:-1])
+            )
+        if token.kind == "name":
+            if token.text == "not":
+                operand = self.expression(_NOT_BINDING_POWER)
+                return lambda ns: not operand(ns)
+            if token.text in ("and", "or", "in"):
+                raise self.error(f"unexpected {token.text!r}", token)
+            lowered = token.text.lower()
+            if lowered in _LITERAL_NAMES:
+                return _constant(_LITERAL_NAMES[lowered])
+            name = token.text
+            return lambda ns: ns.get(name)
+        if token.kind == "op" and token.text == "(":
+            self.depth += 1
+            inner = self.expression(0)
+            self.expect(")")
+            self.depth -= 1
+            return inner
+        if token.kind == "op" and token.text == "[":
+            items = self.sequence("]")
+            return lambda ns: [item(ns) for item in items]
+        raise self.error(
+            "unexpected end" if token.kind == "end" else f"unexpected {token.text!r}",
+            token,
+        )
+
+    def sequence(self, closer: str) -> list[_Compiled]:
+        """Parse comma-separated expressions up to *closer* (already opened)."""
+        self.depth += 1
+        items: list[_Compiled] = []
+        while not (self.peek().kind == "op" and self.peek().text == closer):
+            items.append(self.expression(0))
+            if self.peek().kind == "op" and self.peek().text == ",":
+                self.advance()
+            elif not (self.peek().kind == "op" and self.peek().text == closer):
+                raise self.error(f"expected ',' or {closer!r}", self.peek())
+        self.advance()
+        self.depth -= 1
+        return items
+
+    def infix(self, token: _Token, left: _Compiled) -> _Compiled:
+        op = token.text
+        if op == "or":
+            right = self.expression(_BINDING_POWER["or"])
+            return lambda ns: bool(left(ns)) or bool(right(ns))
+        if op == "and":
+            right = self.expression(_BINDING_POWER["and"])
+            return lambda ns: bool(left(ns)) and bool(right(ns))
+        if op == "not":
+            self.advance()  # the "in" of "not in"
+            right = self.expression(_BINDING_POWER["in"])
+            return _compile_comparison("not in", left, right)
+        if op in _COMPARISON_OPS or op == "in":
+            right = self.expression(_BINDING_POWER[op])
+            return _compile_comparison(op, left, right)
+        if op == "|":
+            return self.filter(left)
+        if op == ".":
+            key_token = self.advance()
+            if key_token.kind not in ("name", "number"):
+                raise self.error("expected an attribute name after '.'", key_token)
+            keys = key_token.text.split(".")
+
+            def attribute(ns: Mapping[str, Any]) -> Any:
+                value = left(ns)
+                for key in keys:
+                    value = _get_attribute(value, key)
+                return value
+
+            return attribute
+        # op == "["
+        self.depth += 1
+        index = self.expression(0)
+        self.expect("]")
+        self.depth -= 1
+        return lambda ns: _get_item(left(ns), index(ns))
+
+    def filter(self, operand: _Compiled) -> _Compiled:
+        name_token = self.advance()
+        if name_token.kind != "name":
+            raise self.error("expected a filter name after '|'", name_token)
+        name = name_token.text
+
+        # `from_json` is strict: it takes no arguments and tolerates no
+        # trailing tokens, so every mis-wired form (`from_json()`,
+        # `from_json('x')`, `from_json)`, `from_json extra`) fails loudly
+        # instead of silently returning the unparsed value.
+        if name == "from_json":
+            if not self.at_continuation():
+                rest = self.source[name_token.pos:].strip()
+                msg = (
+                    "from_json: expected '| from_json' with no arguments or "
+                    f"trailing tokens, got '| {rest}'"
+                )
+                raise ValueError(msg)
+            return lambda ns: _filter_from_json(operand(ns))
+
+        args: list[_Compiled] = []
+        if self.peek().kind == "op" and self.peek().text == "(":
+            self.advance()
+            args = self.sequence(")")
+
+        spec = _FILTERS.get(name)
+        if spec is None:
+            # Unknown filters pass the value through unchanged.
+            return operand
+        filter_fn, min_args, max_args = spec
+        if not min_args <= len(args) <= max_args:
+            expected = str(min_args) if min_args == max_args else f"{min_args}-{max_args}"
+            msg = (
+                f"Invalid expression {self.source!r}: filter {name!r} takes "
+                f"{expected} argument(s), got {len(args)}"
+            )
+            raise ValueError(msg)
+        if not args:
+            return lambda ns: filter_fn(operand(ns))
+        if len(args) == 1:
+            (argument,) = args
+            return lambda ns: filter_fn(operand(ns), argument(ns))
+        return lambda ns: filter_fn(operand(ns), *(arg(ns) for arg in args))
+
+    def at_continuation(self) -> bool:
+        """Return whether the next token may follow a complete operand."""
+        token = self.peek()
+        if token.kind == "end":
+            return True
+        if token.kind == "op" and token.text in (")", "]", ","):
+            return self.depth > 0
+        return self.infix_power(token) > 0 and token.text not in (".", "[")
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_simple_expression(expr: str) -> _Compiled:
+    """Compile a simple expression into a callable over the namespace.
 
     Supports:
-    - Dot-path access: ``steps.specify.output.file``
+    - Dot-path access and indexing: ``steps.specify.output.file``, ``task_list[0]``
     - Comparisons: ``==``, ``!=``, ``>``, ``<``, ``>=``, ``<=``
-    - Boolean operators: ``and``, ``or``, ``not``
+    - Boolean operators: ``and``, ``or``, ``not`` (short-circuiting)
     - ``in``, ``not in``
     - Pipe filters: ``| default('...')``, ``| join(', ')``, ``| contains('...')``, ``| from_json``, ``| map('...')``
-    - String and numeric literals
+    - String, numeric, boolean, null and list literals
+    - Parenthesized grouping
+
+    Compiled forms are cached by source string, so loop conditions and
+    templates evaluated repeatedly are parsed only once.  Syntax errors
+    raise ``ValueError``.
     """
-    expr = expr.strip()
+    return _Parser(expr.strip()).parse()
 
-    # String literal — check before pipes and operators so quoted strings
-    # containing | or operator keywords are not mis-parsed.
-    if (expr.startswith("'") and expr.endswith("'")) or (
-        expr.startswith('"') and expr.endswith('"')
-    ):
-        return expr[1:-1]
 
-    # Handle pipe filters
-    if "|" in expr:
-        parts = expr.split("|", 1)
-        value = _evaluate_simple_expression(parts[0].strip(), namespace)
-        filter_expr = parts[1].strip()
+def _compile_comparison(op: str, left: _Compiled, right: _Compiled) -> _Compiled:
+    """Return a callable applying comparison *op* to two compiled operands."""
+    if op == "==":
+        return lambda ns: left(ns) == right(ns)
+    if op == "!=":
+        return lambda ns: left(ns) != right(ns)
+    if op in (">", "<", ">=", "<="):
+        return lambda ns: _safe_compare(left(ns), right(ns), op)
 
-        # `from_json` is strict: it takes no arguments and tolerates no
-        # trailing tokens. Match on the leading filter name and require the
-        # whole filter to be exactly `from_json`, so every mis-wired form
-        # (`from_json()`, `from_json('x')`, `from_json)`, `from_json extra`)
-        # fails loudly instead of silently falling through to the
-        # unknown-filter path and returning the unparsed value. (filter_expr
-        # is already stripped above.)
-        leading = re.match(r"\w+", filter_expr)
-        if leading and leading.group(0) == "from_json":
-            if filter_expr != "from_json":
-                raise ValueError(
-                    "from_json: expected '| from_json' with no arguments or "
-                    f"trailing tokens, got '| {filter_expr}'"
-                )
-            return _filter_from_json(value)
-
-        # Parse filter name and argument
-        filter_match = re.match(r"(\w+)\((.+)\)", filter_expr)
-        if filter_match:
-            fname = filter_match.group(1)
-            farg = _evaluate_simple_expression(filter_match.group(2).strip(), namespace)
-            if fname == "default":
-                return _filter_default(value, farg)
-            if fname == "join":
-                return _filter_join(value, farg)
-            if fname == "map":
-                return _filter_map(value, farg)
-            if fname == "contains":
-                return _filter_contains(value, farg)
-        # Filter without args
-        filter_name = filter_expr.strip()
-        if filter_name == "default":
-            return _filter_default(value)
-        return value
-
-    # Boolean operators — parse 'or' first (lower precedence) so that
-    # 'a or b and c' is evaluated as 'a or (b and c)'.
-    if " or " in expr:
-        parts = expr.split(" or ", 1)
-        left = _evaluate_simple_expression(parts[0].strip(), namespace)
-        right = _evaluate_simple_expression(parts[1].strip(), namespace)
-        return bool(left) or bool(right)
-
-    if " and " in expr:
-        parts = expr.split(" and ", 1)
-        left = _evaluate_simple_expression(parts[0].strip(), namespace)
-        right = _evaluate_simple_expression(parts[1].strip(), namespace)
-        return bool(left) and bool(right)
-
-    if expr.startswith("not "):
-        inner = _evaluate_simple_expression(expr[4:].strip(), namespace)
-        return not bool(inner)
-
-    # Comparison operators (order matters — check multi-char ops first)
-    for op in ("!=", "==", ">=", "<=", ">", "<", " not in ", " in "):
-        if op in expr:
-            parts = expr.split(op, 1)
-            left = _evaluate_simple_expression(parts[0].strip(), namespace)
-            right = _evaluate_simple_expression(parts[1].strip(), namespace)
-            if op == "==":
-                return left == right
-            if op == "!=":
-                return left != right
-            if op == ">":
-                return _safe_compare(left, right, ">")
-            if op == "<":
-                return _safe_compare(left, right, "<")
-            if op == ">=":
-                return _safe_compare(left, right, ">=")
-            if op == "<=":
-                return _safe_compare(left, right, "<=")
-            if op == " in ":
-                return left in right if right is not None else False
-            if op == " not in ":
-                return left not in right if right is not None else True
-
-    # Numeric literal
-    try:
-        if "." in expr:
-            return float(expr)
-        return int(expr)
-    except (ValueError, TypeError):
-        pass
+    def membership(ns: Mapping[str, Any]) -> bool:
+        lhs, rhs = left(ns), right(ns)
+        try:
+            if op == "in":
+                return lhs in rhs if rhs is not None else False
+            return lhs not in rhs if rhs is not None else True
+        except TypeError:
+            return op != "in"
 
-    # Boolean literal
-    if expr.lower() == "true":
-        return True
-    if expr.lower() == "false":
-        return False
-
-    # Null
-    if expr.lower() in ("none", "null"):
-        return None
+    return membership
 
-    # List literal (simple)
-    if expr.startswith("[") and expr.endswith("]"):
-        inner = expr[1:-1].strip()
-        if not inner:
-            return []
-        items = [_evaluate_simple_expression(i.strip(), namespace) for i in inner.split(",")]
-        return items
 
-    # Variable reference (dot-path)
-    return _resolve_dot_path(namespace, expr)
+def _evaluate_simple_expression(expr: str, namespace: Mapping[str, Any]) -> Any:
+    """Evaluate a simple expression against the namespace."""
+    return _compile_simple_expression(expr)(namespace)
 
 
 def _safe_compare(left: Any, right: Any, op: str) -> bool:
@@ -288,6 +536,114 @@ def _safe_compare(left: Any, right: Any, op: str) -> bool:
     return False
 
 
+# -- Templates --------------------------------------------------------------
+
+def _find_block_end(template: str, start: int) -> int:
+    """Return the index of the ``}}`` closing the block opened before *start*.
+
+    Quoted strings inside the block are skipped, so ``'}}'`` in a filter
+    argument does not end it.  Returns -1 when the block is unterminated.
+    """
+    quote = ""
+    pos = start
+    while pos < len(template):
+        char = template[pos]
+        if quote:
+            if char == "\\":
+                pos += 1
+            elif char == quote:
+                quote = ""
+        elif char in ("'", '"'):
+            quote = char
+        elif template.startswith("}}", pos):
+            return pos
+        pos += 1
+    # An unbalanced quote: fall back to the first closing braces.
+    return template.find("}}", start)
+
+
+def _split_template(template: str) -> list[tuple[bool, str]]:
+    """Split *template* into ``(is_expression, text)`` parts."""
+    parts: list[tuple[bool, str]] = []
+    position = 0
+    while True:
+        start = template.find("{{", position)
+        if start == -1:
+            break
+        end = _find_block_end(template, start + 2)
+        if end == -1:
+            break
+        if end == start + 2:  # "{{}}" is literal text
+            parts.append((False, template[position:end + 2]))
+            position = end + 2
+            continue
+        if start > position:
+            parts.append((False, template[position:start]))
+        parts.append((True, template[start + 2:end]))
+        position = end + 2
+    if position < len(template):
+        parts.append((False, template[position:]))
+    return parts
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_template(template: str) -> _Compiled:
+    """Compile a template string with ``{{ ... }}`` expressions.
+
+    Returns a callable that evaluates the template against a namespace
+    (see ``_build_namespace``).  Results are cached by template string.
+    """
+    # Single expression: return typed value
+    stripped = _split_template(template.strip())
+    if len(stripped) == 1 and stripped[0][0]:
+        return _compile_simple_expression(stripped[0][1])
+
+    # Multi-expression: string interpolation
+    parts: list[str | _Compiled] = [
+        _compile_simple_expression(text) if is_expression else text
+        for is_expression, text in _split_template(template)
+    ]
+    if not parts:
+        return _constant(template)
+    if len(parts) == 1 and isinstance(parts[0], str):
+        return _constant(parts[0])
+
+    def interpolate(ns: Mapping[str, Any]) -> str:
+        out: list[str] = []
+        for part in parts:
+            if isinstance(part, str):
+                out.append(part)
+            else:
+                val = part(ns)
+                out.append(str(val) if val is not None else "")
+        return "".join(out)
+
+    return interpolate
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_condition(condition: str) -> Callable[[Mapping[str, Any]], bool]:
+    """Compile a condition template into a callable returning a boolean.
+
+    Plain ``"true"``/``"false"`` strings (with or without ``{{ }}``) are
+    treated as booleans so that ``condition: "false"`` behaves as
+    expected.  Results are cached by condition string.
+    """
+    evaluate = compile_template(condition)
+
+    def check(ns: Mapping[str, Any]) -> bool:
+        result = evaluate(ns)
+        if isinstance(result, str):
+            lower = result.lower()
+            if lower == "false":
+                return False
+            if lower == "true":
+                return True
+        return bool(result)
+
+    return check
+
+
 def evaluate_expression(template: str, context: Any) -> Any:
     """Evaluate a template string with ``{{ ... }}`` expressions.
 
@@ -310,35 +666,19 @@ def evaluate_expression(template: str, context: Any) -> Any:
     """
     if not isinstance(template, str):
         return template
+    # Literal text needs neither compiling nor a namespace.
+    if "{{" not in template:
+        return template
 
-    namespace = _build_namespace(context)
-
-    # Single expression: return typed value
-    match = _EXPR_PATTERN.fullmatch(template.strip())
-    if match:
-        return _evaluate_simple_expression(match.group(1).strip(), namespace)
-
-    # Multi-expression: string interpolation
-    def _replacer(m: re.Match[str]) -> str:
-        val = _evaluate_simple_expression(m.group(1).strip(), namespace)
-        return str(val) if val is not None else ""
-
-    return _EXPR_PATTERN.sub(_replacer, template)
+    return compile_template(template)(_build_namespace(context))
 
 
 def evaluate_condition(condition: str, context: Any) -> bool:
     """Evaluate a condition expression and return a boolean.
 
-    Convenience wrapper around ``evaluate_expression`` that coerces
-    the result to bool.
+    Like ``evaluate_expression`` but coerces the result to bool; the
+    compiled condition is cached (see ``compile_condition``).
     """
-    result = evaluate_expression(condition, context)
-    # Treat plain "false"/"true" strings as booleans so that
-    # condition: "false" (without {{ }}) behaves as expected.
-    if isinstance(result, str):
-        lower = result.lower()
-        if lower == "false":
-            return False
-        if lower == "true":
-            return True
-    return bool(result)
+    if not isinstance(condition, str):
+        return bool(condition)
+    return compile_condition(condition)(_build_namespace(context))
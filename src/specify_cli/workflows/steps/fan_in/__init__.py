@@ -12,8 +12,11 @@ class FanInStep(StepBase):
     """Join point that aggregates results from ``wait_for:`` steps.
 
     Reads completed step outputs from ``context.steps`` and collects
-    them into ``output.results``.  Does not block; relies on the
-    engine executing steps sequentially.
+    them into ``output.results``.  The step itself does not block: in
+    sequential runs the ``wait_for`` steps have already executed, and
+    in DAG runs (``workflow.execution: dag``) the engine treats
+    ``wait_for`` as dependencies, so fan-in starts only after every
+    listed step has completed.
     """
 
     type_key = "fan-in"
@@ -12,9 +12,10 @@ class FanOutStep(StepBase):
     """Dispatch a step template for each item in a collection.
 
     The engine executes the nested ``step:`` template once per item,
-    setting ``context.item`` for each iteration.  Execution is
-    currently sequential; ``max_concurrency`` is accepted but not
-    enforced.
+    setting ``context.item`` for each iteration.  With the default
+    ``max_concurrency`` of 1 items run sequentially; a larger value
+    runs up to that many items at once on a worker pool, each with its
+    own ``context.item``.  ``output.results`` is always in item order.
     """
 
     type_key = "fan-out"
@@ -66,6 +67,16 @@ class FanOutStep(StepBase):
                 f"Fan-out step {config.get('id', '?')!r} is missing "
                 f"'step' field (nested step template)."
             )
+        max_concurrency = config.get("max_concurrency", 1)
+        if (
+            not isinstance(max_concurrency, int)
+            or isinstance(max_concurrency, bool)
+            or max_concurrency < 1
+        ):
+            errors.append(
+                f"Fan-out step {config.get('id', '?')!r}: 'max_concurrency' "
+                f"must be a positive integer, got {max_concurrency!r}."
+            )
         step = config.get("step")
         if step is not None and not isinstance(step, dict):
             errors.append(
@@ -74,15 +74,29 @@ def strip_ansi(text: str) -> str:
 
 
 @pytest.fixture(autouse=True)
-def _isolate_auth_config(monkeypatch):
-    """Ensure no test reads the real ~/.specify/auth.json."""
+def _isolate_auth_config(monkeypatch, tmp_path_factory):
+    """Ensure no test reads the real ~/.specify/auth.json or token cache."""
     from specify_cli.authentication import http as _auth_http
+    from specify_cli.authentication import token_cache as _token_cache
     monkeypatch.setattr(_auth_http, "_config_override", [])
+    cache_file = tmp_path_factory.mktemp("auth") / "token-cache.json"
+    monkeypatch.setattr(_token_cache, "_default_cache_path", lambda: cache_file)
+    _token_cache.clear()
     # Also clear the per-process cache so tests that unset _config_override
     # won't see a previously cached real-file result.
     monkeypatch.setattr(_auth_http, "_config_cache", None)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_download_cache(monkeypatch, tmp_path_factory):
+    """Give every test an empty user-level download cache."""
+    from specify_cli import download_cache as _download_cache
+    cache_dir = tmp_path_factory.mktemp("download-cache")
+    monkeypatch.delenv("SPECIFY_CACHE_DIR", raising=False)
+    monkeypatch.delenv("SPECIFY_CACHE_MAX_MB", raising=False)
+    monkeypatch.setattr(_download_cache, "_default_cache_dir", lambda: cache_dir)
+
+
 @pytest.fixture
 def clean_environ(monkeypatch):
     """Strip any real GH_TOKEN / GITHUB_TOKEN from the test environment."""
@@ -190,7 +190,7 @@ class TestCatalogFetch:
             return FakeResponse(catalog_data, url)
 
         import specify_cli.authentication.http as _auth_http
-        monkeypatch.setattr(_auth_http.urllib.request, "urlopen", fake_urlopen)
+        monkeypatch.setattr(_auth_http, "_urlopen", fake_urlopen)
 
     def test_fetch_and_search_all(self, tmp_path, monkeypatch):
         monkeypatch.setenv("HOME", str(tmp_path))
@@ -501,7 +501,7 @@ class TestIntegrationListCatalog:
             def __exit__(self, *a):
                 pass
 
-        monkeypatch.setattr(_auth_http.urllib.request, "urlopen",
+        monkeypatch.setattr(_auth_http, "_urlopen",
                             lambda req, timeout=10: FakeResponse(catalog, req if isinstance(req, str) else req.full_url))
 
         old = os.getcwd()
@@ -1256,6 +1256,18 @@ class TestCatalogSourceManagement:
             cat.get_active_catalogs()
         assert str(cfg_path) in str(exc_info.value)
 
+    def test_load_catalog_config_rejects_max_stale(self, tmp_path, monkeypatch):
+        self._isolate(tmp_path, monkeypatch)
+        cfg_path = tmp_path / ".specify" / "integration-catalogs.yml"
+        cfg_path.parent.mkdir(parents=True, exist_ok=True)
+        cfg_path.write_text(
+            yaml.dump({"catalogs": [{"url": "https://a.example.com/c.json", "max_stale": 60}]}),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(IntegrationValidationError, match="max_stale is not supported"):
+            IntegrationCatalog(tmp_path).get_active_catalogs()
+
     @pytest.mark.parametrize("raw_name", [None, "   "])
     def test_load_catalog_config_defaults_blank_names(
         self, tmp_path, monkeypatch, raw_name
@@ -127,6 +127,21 @@ class TestRegistry:
         finally:
             INTEGRATION_REGISTRY.pop("stub", None)
 
+    def test_cli_import_defers_integrations(self):
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys\n"
+            "import specify_cli\n"
+            "assert not [m for m in sys.modules if m.startswith('specify_cli.integrations')]\n"
+            "assert 'claude' in specify_cli.AGENT_CONFIG\n"
+        )
+        src = str(Path(__file__).resolve().parents[2] / "src")
+        env = dict(os.environ, PYTHONPATH=src)
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
 
 class TestRegistryCompleteness:
     """Every expected integration must be registered."""
@@ -0,0 +1,202 @@
+"""Tests for single-pass ZIP extraction (``specify_cli.archives``)."""
+
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+EXTENSION_MANIFEST = {
+    "schema_version": "1.0",
+    "extension": {
+        "id": "zip-ext",
+        "name": "Zip Extension",
+        "version": "1.0.0",
+        "description": "An extension installed from a ZIP",
+    },
+    "requires": {"speckit_version": ">=0.1.0"},
+    "provides": {
+        "commands": [
+            {"name": "speckit.zip-ext.hello", "file": "commands/hello.md", "description": "Hello"}
+        ]
+    },
+}
+
+PRESET_MANIFEST = {
+    "schema_version": "1.0",
+    "preset": {
+        "id": "zip-pack",
+        "name": "Zip Preset",
+        "version": "1.0.0",
+        "description": "A preset installed from a ZIP",
+    },
+    "requires": {"speckit_version": ">=0.1.0"},
+    "provides": {
+        "templates": [
+            {"type": "template", "name": "spec-template", "file": "templates/spec-template.md"}
+        ]
+    },
+}
+
+
+def _zip(path: Path, members: dict) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    project = tmp_path / "project"
+    (project / ".specify").mkdir(parents=True)
+    return project
+
+
+class TestExtractZip:
+    def test_extracts_nested_members(self, tmp_path):
+        from specify_cli.archives import extract_zip
+
+        archive = _zip(tmp_path / "a.zip", {"top.txt": "top", "a/b/c.txt": "deep", "empty/": ""})
+        dest = tmp_path / "out"
+        dest.mkdir()
+
+        extract_zip(archive, dest)
+
+        assert (dest / "top.txt").read_text() == "top"
+        assert (dest / "a" / "b" / "c.txt").read_text() == "deep"
+        assert (dest / "empty").is_dir()
+
+    @pytest.mark.parametrize("name", ["../evil.txt", "a/../../evil.txt", "/etc/evil", "C:/evil.txt", "..\\evil.txt"])
+    def test_unsafe_names_are_rejected(self, tmp_path, name):
+        from specify_cli.archives import ArchiveError, extract_zip
+
+        archive = _zip(tmp_path / "a.zip", {"ok.txt": "ok", name: "evil"})
+        dest = tmp_path / "out"
+        dest.mkdir()
+
+        with pytest.raises(ArchiveError, match="Unsafe path"):
+            extract_zip(archive, dest)
+        assert not (tmp_path / "evil.txt").exists()
+
+    def test_entry_count_limit(self, tmp_path):
+        from specify_cli.archives import ArchiveError, extract_zip
+
+        archive = _zip(tmp_path / "a.zip", {f"f{i}.txt": "x" for i in range(5)})
+        dest = tmp_path / "out"
+        dest.mkdir()
+
+        with pytest.raises(ArchiveError, match="5 entries"):
+            extract_zip(archive, dest, max_entries=4)
+        assert list(dest.iterdir()) == []
+
+    def test_total_size_limit(self, tmp_path):
+        from specify_cli.archives import ArchiveError, extract_zip
+
+        archive = tmp_path / "bomb.zip"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("zeros.bin", b"\0" * 100_000)
+        dest = tmp_path / "out"
+        dest.mkdir()
+
+        with pytest.raises(ArchiveError, match="100000 bytes"):
+            extract_zip(archive, dest, max_total_bytes=50_000)
+        assert list(dest.iterdir()) == []
+
+    def test_invalid_zip(self, tmp_path):
+        from specify_cli.archives import ArchiveError, extract_zip
+
+        archive = tmp_path / "a.zip"
+        archive.write_bytes(b"not a zip")
+
+        with pytest.raises(ArchiveError, match="Invalid ZIP file"):
+            extract_zip(archive, tmp_path)
+
+    def test_staging_directory_is_removed(self, tmp_path):
+        from specify_cli.archives import staged_extraction
+
+        archive = _zip(tmp_path / "a.zip", {"a.txt": "a"})
+        with staged_extraction(archive, tmp_path / "parent") as staging:
+            assert staging.parent == tmp_path / "parent"
+            assert (staging / "a.txt").is_file()
+
+        assert list((tmp_path / "parent").iterdir()) == []
+
+
+class TestInstallFromZip:
+    def test_extension_is_moved_into_place(self, tmp_path, project_dir):
+        from specify_cli.extensions import ExtensionManager
+
+        archive = _zip(tmp_path / "ext.zip", {
+            "zip-ext/extension.yml": yaml.safe_dump(EXTENSION_MANIFEST),
+            "zip-ext/commands/hello.md": "# Hello\n",
+            "zip-ext/tests/test_hello.py": "",
+            "zip-ext/.extensionignore": "tests/\n",
+        })
+        manager = ExtensionManager(project_dir)
+
+        with patch("shutil.copytree") as copytree:
+            manager.install_from_zip(archive, "0.1.0")
+        copytree.assert_not_called()
+
+        installed = manager.extensions_dir / "zip-ext"
+        assert (installed / "commands" / "hello.md").is_file()
+        assert not (installed / "tests").exists()
+        assert not (installed / ".extensionignore").exists()
+        assert manager.registry.get("zip-ext")["manifest_hash"]
+        assert [p.name for p in manager.extensions_dir.iterdir() if p.name.startswith(".staging")] == []
+
+    def test_staged_manifests_leave_no_cache_entries(self, tmp_path, project_dir):
+        import json
+        from specify_cli.extensions import ExtensionManager
+
+        archive = _zip(tmp_path / "ext.zip", {
+            "extension.yml": yaml.safe_dump(EXTENSION_MANIFEST),
+            "commands/hello.md": "# Hello\n",
+        })
+        manager = ExtensionManager(project_dir)
+        for _ in range(3):
+            manager.install_from_zip(archive, "0.1.0", force=True)
+
+        cache_dir = project_dir / ".specify" / "cache" / "manifests"
+        paths = [json.loads(f.read_text())["path"] for f in cache_dir.glob("*.json")]
+        assert all(Path(path).exists() for path in paths), paths
+
+    def test_unsafe_extension_zip_is_rejected(self, tmp_path, project_dir):
+        from specify_cli.extensions import ExtensionManager, ValidationError
+
+        archive = _zip(tmp_path / "ext.zip", {
+            "extension.yml": yaml.safe_dump(EXTENSION_MANIFEST),
+            "../escape.txt": "x",
+        })
+        manager = ExtensionManager(project_dir)
+
+        with pytest.raises(ValidationError, match="Unsafe path"):
+            manager.install_from_zip(archive, "0.1.0")
+        assert list(manager.extensions_dir.iterdir()) == []
+
+    def test_preset_is_moved_into_place(self, tmp_path, project_dir):
+        from specify_cli.presets import PresetManager
+
+        archive = _zip(tmp_path / "pack.zip", {
+            "preset.yml": yaml.safe_dump(PRESET_MANIFEST),
+            "templates/spec-template.md": "# Spec\n",
+        })
+        manager = PresetManager(project_dir)
+
+        manager.install_from_zip(archive, "0.1.0")
+
+        installed = manager.presets_dir / "zip-pack"
+        assert (installed / "templates" / "spec-template.md").is_file()
+        assert [p.name for p in manager.presets_dir.iterdir() if p.name.startswith(".staging")] == []
+
+    def test_preset_zip_without_manifest(self, tmp_path, project_dir):
+        from specify_cli.presets import PresetManager, PresetValidationError
+
+        archive = _zip(tmp_path / "pack.zip", {"templates/spec-template.md": "# Spec\n"})
+        manager = PresetManager(project_dir)
+
+        with pytest.raises(PresetValidationError, match="No preset.yml found"):
+            manager.install_from_zip(archive, "0.1.0")
+        assert [p.name for p in manager.presets_dir.iterdir() if p.name.startswith(".staging")] == []
@@ -16,6 +16,7 @@ from __future__ import annotations
 import base64
 import json
 import os
+import time
 
 import pytest
 
@@ -526,6 +527,184 @@ class TestAzureDevOpsAuth:
             assert AzureDevOpsAuth().resolve_token(entry) is None
 
 
+# ---------------------------------------------------------------------------
+# Token cache — azure-cli / azure-ad tokens reused until near expiry
+# ---------------------------------------------------------------------------
+
+
+def _az_result(token: str, expires_in: float):
+    import time
+    from unittest.mock import MagicMock
+    result = MagicMock()
+    result.returncode = 0
+    result.stdout = json.dumps({"accessToken": token, "expires_on": int(time.time() + expires_in)})
+    return result
+
+
+class TestTokenCache:
+    def _cli_entry(self, **kwargs) -> AuthConfigEntry:
+        return AuthConfigEntry(
+            hosts=("dev.azure.com",), provider="azure-devops", auth="azure-cli", **kwargs
+        )
+
+    def test_azure_cli_token_is_reused_until_expiry(self):
+        from unittest.mock import patch
+        entry = self._cli_entry()
+        with patch("specify_cli.authentication.azure_devops.subprocess.run",
+                   return_value=_az_result("tok", 3600)) as run:
+            assert AzureDevOpsAuth().resolve_token(entry) == "tok"
+            assert AzureDevOpsAuth().resolve_token(entry) == "tok"
+        assert run.call_count == 1
+
+    def test_token_near_expiry_is_refreshed(self):
+        from unittest.mock import patch
+        entry = self._cli_entry()
+        with patch("specify_cli.authentication.azure_devops.subprocess.run",
+                   side_effect=[_az_result("old", 60), _az_result("new", 3600)]) as run:
+            assert AzureDevOpsAuth().resolve_token(entry) == "old"
+            assert AzureDevOpsAuth().resolve_token(entry) == "new"
+        assert run.call_count == 2
+
+    def test_legacy_expires_on_string_is_parsed(self):
+        from datetime import datetime, timedelta
+        payload = {"expiresOn": (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S.%f")}
+        expires_at = AzureDevOpsAuth._az_cli_expiry(payload)
+        assert expires_at == pytest.approx(
+            (datetime.now() + timedelta(hours=1)).timestamp(), abs=5
+        )
+
+    def test_azure_ad_honors_expires_in(self, monkeypatch):
+        from unittest.mock import MagicMock, patch
+        monkeypatch.setenv("MY_SECRET", "secret-value")
+        entry = AuthConfigEntry(
+            hosts=("dev.azure.com",), provider="azure-devops", auth="azure-ad",
+            tenant_id="tid", client_id="cid", client_secret_env="MY_SECRET",
+        )
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = b'{"access_token": "ad-token", "expires_in": 3599}'
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        with patch("urllib.request.urlopen", return_value=mock_resp) as urlopen:
+            assert AzureDevOpsAuth().resolve_token(entry) == "ad-token"
+            assert AzureDevOpsAuth().resolve_token(entry) == "ad-token"
+        assert urlopen.call_count == 1
+
+    def test_cache_off_acquires_every_time(self):
+        from unittest.mock import patch
+        entry = self._cli_entry(token_cache="off")
+        with patch("specify_cli.authentication.azure_devops.subprocess.run",
+                   return_value=_az_result("tok", 3600)) as run:
+            AzureDevOpsAuth().resolve_token(entry)
+            AzureDevOpsAuth().resolve_token(entry)
+        assert run.call_count == 2
+
+    def test_shared_cache_is_reused_by_later_processes(self):
+        from unittest.mock import patch
+        from specify_cli.authentication import token_cache
+        entry = self._cli_entry(token_cache="shared")
+        with patch("specify_cli.authentication.azure_devops.subprocess.run",
+                   return_value=_az_result("tok", 3600)):
+            AzureDevOpsAuth().resolve_token(entry)
+
+        cache_file = token_cache._default_cache_path()
+        if os.name != "nt":
+            assert cache_file.stat().st_mode & 0o777 == 0o600
+        token_cache.clear()  # as in a fresh process
+        with patch("specify_cli.authentication.azure_devops.subprocess.run") as run:
+            assert AzureDevOpsAuth().resolve_token(entry) == "tok"
+        run.assert_not_called()
+
+    def test_memory_cache_does_not_write_file(self):
+        from unittest.mock import patch
+        from specify_cli.authentication import token_cache
+        with patch("specify_cli.authentication.azure_devops.subprocess.run",
+                   return_value=_az_result("tok", 3600)):
+            AzureDevOpsAuth().resolve_token(self._cli_entry())
+        assert not token_cache._default_cache_path().exists()
+
+    def test_open_url_401_refreshes_cached_token(self, monkeypatch):
+        import urllib.error
+        from unittest.mock import MagicMock, patch
+        from specify_cli.authentication import http as _mod
+        entry = self._cli_entry()
+        monkeypatch.setattr(_mod, "_config_override", [entry])
+        sent = []
+
+        def fake_open(req, timeout=None):
+            sent.append(req.get_header("Authorization"))
+            if len(sent) == 1:
+                raise urllib.error.HTTPError("url", 401, "Unauthorized", {}, None)
+            return MagicMock()
+
+        opener = MagicMock()
+        opener.open.side_effect = fake_open
+        with patch("specify_cli.authentication.azure_devops.subprocess.run",
+                   side_effect=[_az_result("revoked", 3600), _az_result("fresh", 3600)]), \
+             patch("specify_cli.authentication.http.urllib.request.build_opener", return_value=opener):
+            _mod.open_url("https://dev.azure.com/org/catalog.json")
+        assert sent == ["Bearer revoked", "Bearer fresh"]
+
+    def test_slow_acquisition_does_not_block_other_entries(self):
+        import threading
+        from specify_cli.authentication import token_cache
+        from specify_cli.authentication.token_cache import AccessToken
+        slow_entry = self._cli_entry()
+        other_entry = AuthConfigEntry(hosts=("example.com",), provider="azure-devops", auth="azure-cli")
+        started, release = threading.Event(), threading.Event()
+
+        def slow_acquire():
+            started.set()
+            release.wait(2)
+            return AccessToken("slow", time.time() + 3600)
+
+        thread = threading.Thread(target=token_cache.get_token, args=(slow_entry, slow_acquire))
+        thread.start()
+        try:
+            assert started.wait(5)
+            other = token_cache.get_token(other_entry, lambda: AccessToken("other", time.time() + 3600))
+            assert other == "other"
+            assert thread.is_alive()  # answered while the slow one was in flight
+        finally:
+            release.set()
+            thread.join()
+
+    def test_concurrent_callers_share_one_acquisition(self):
+        import threading
+        from specify_cli.authentication import token_cache
+        from specify_cli.authentication.token_cache import AccessToken
+        entry = self._cli_entry()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def acquire():
+            calls.append(1)
+            time.sleep(0.05)
+            return AccessToken("tok", time.time() + 3600)
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(token_cache.get_token(entry, acquire))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == ["tok"] * 8
+        assert len(calls) == 1
+
+    def test_invalid_token_cache_mode_raises(self, tmp_path):
+        cfg = tmp_path / "auth.json"
+        cfg.write_text(json.dumps({"providers": [{
+            "hosts": ["dev.azure.com"], "provider": "azure-devops",
+            "auth": "azure-cli", "token_cache": "disk",
+        }]}))
+        with pytest.raises(ValueError, match="token_cache"):
+            load_auth_config(cfg)
+
+
 # ---------------------------------------------------------------------------
 # open_url / build_request — positive tests
 # ---------------------------------------------------------------------------
@@ -594,7 +773,7 @@ class TestAuthenticatedHttp:
             resp.__enter__ = lambda s: s
             resp.__exit__ = MagicMock(return_value=False)
             return resp
-        with patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=fake_urlopen):
+        with patch("specify_cli.authentication.http._urlopen", side_effect=fake_urlopen):
             open_url("https://example.com/file.json")
         assert captured["req"].get_header("Authorization") is None
 
@@ -609,7 +788,7 @@ class TestAuthenticatedHttp:
             resp.__enter__ = lambda s: s
             resp.__exit__ = MagicMock(return_value=False)
             return resp
-        with patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=fake_urlopen):
+        with patch("specify_cli.authentication.http._urlopen", side_effect=fake_urlopen):
             open_url("https://github.com/org/repo")
         assert captured["req"].get_header("Authorization") is None
 
@@ -632,7 +811,7 @@ class TestAuthenticatedHttp:
         mock_opener = MagicMock()
         mock_opener.open.side_effect = fake_side_effect
         with patch("specify_cli.authentication.http.urllib.request.build_opener", return_value=mock_opener), \
-             patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=fake_side_effect):
+             patch("specify_cli.authentication.http._urlopen", side_effect=fake_side_effect):
             open_url("https://github.com/org/repo")
         assert call_count == 2
 
@@ -676,7 +855,7 @@ class TestAuthenticatedHttpNegative:
         from unittest.mock import patch
         from specify_cli.authentication.http import open_url
         self._set_config(monkeypatch, [])
-        with patch("specify_cli.authentication.http.urllib.request.urlopen",
+        with patch("specify_cli.authentication.http._urlopen",
                     side_effect=urllib.error.URLError("refused")):
             with pytest.raises(urllib.error.URLError):
                 open_url("https://example.com/file")
@@ -686,7 +865,7 @@ class TestAuthenticatedHttpNegative:
         from unittest.mock import patch
         from specify_cli.authentication.http import open_url
         self._set_config(monkeypatch, [])
-        with patch("specify_cli.authentication.http.urllib.request.urlopen",
+        with patch("specify_cli.authentication.http._urlopen",
                     side_effect=socket.timeout("timed out")):
             with pytest.raises(socket.timeout):
                 open_url("https://example.com/file")
@@ -888,7 +1067,7 @@ class TestFetchLatestReleaseTagDelegation:
         from specify_cli._version import _fetch_latest_release_tag
         self._set_config(monkeypatch, [])
         captured, side_effect = self._capture_request()
-        with patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=side_effect):
+        with patch("specify_cli.authentication.http._urlopen", side_effect=side_effect):
             _fetch_latest_release_tag()
         assert captured["request"].get_header("Authorization") is None
 
@@ -897,6 +1076,6 @@ class TestFetchLatestReleaseTagDelegation:
         from specify_cli._version import _fetch_latest_release_tag
         self._set_config(monkeypatch, [])
         captured, side_effect = self._capture_request()
-        with patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=side_effect):
+        with patch("specify_cli.authentication.http._urlopen", side_effect=side_effect):
             _fetch_latest_release_tag()
         assert captured["request"].get_header("Accept") == "application/vnd.github+json"
@@ -0,0 +1,308 @@
+"""Tests for batch installs (``install_many``, multi-package ``add`` and ``specify sync``)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+
+def _write_extension(root: Path, ext_id: str, command: str = "hello") -> Path:
+    ext_dir = root / ext_id
+    (ext_dir / "commands").mkdir(parents=True)
+    (ext_dir / "commands" / f"{command}.md").write_text(
+        "---\ndescription: Test command\n---\n\n# Hello\n", encoding="utf-8"
+    )
+    (ext_dir / "extension.yml").write_text(
+        yaml.safe_dump(
+            {
+                "schema_version": "1.0",
+                "extension": {
+                    "id": ext_id,
+                    "name": f"Extension {ext_id}",
+                    "version": "1.0.0",
+                    "description": "A test extension",
+                },
+                "requires": {"speckit_version": ">=0.1.0"},
+                "provides": {
+                    "commands": [{"name": f"speckit.{ext_id}.{command}", "file": f"commands/{command}.md"}]
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    return ext_dir
+
+
+def _write_preset(root: Path, pack_id: str) -> Path:
+    pack_dir = root / pack_id
+    (pack_dir / "templates").mkdir(parents=True)
+    (pack_dir / "templates" / "spec-template.md").write_text("# Spec\n", encoding="utf-8")
+    (pack_dir / "preset.yml").write_text(
+        yaml.safe_dump(
+            {
+                "schema_version": "1.0",
+                "preset": {
+                    "id": pack_id,
+                    "name": f"Preset {pack_id}",
+                    "version": "1.0.0",
+                    "description": "A test preset",
+                },
+                "requires": {"speckit_version": ">=0.1.0"},
+                "provides": {
+                    "templates": [
+                        {"type": "template", "name": "spec-template", "file": "templates/spec-template.md"}
+                    ]
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    return pack_dir
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    project = tmp_path / "project"
+    (project / ".specify").mkdir(parents=True)
+    return project
+
+
+@pytest.fixture
+def packages(tmp_path):
+    return tmp_path / "packages"
+
+
+def _count_writes():
+    from specify_cli import registry_cache
+
+    return patch.object(registry_cache, "store_json", side_effect=registry_cache.store_json)
+
+
+class TestExtensionInstallMany:
+    def test_installs_all_with_one_registry_write(self, project_dir, packages):
+        from specify_cli.extensions import ExtensionManager
+
+        sources = [(_write_extension(packages, "alpha"), 10), (_write_extension(packages, "beta"), 3)]
+        manager = ExtensionManager(project_dir)
+
+        with _count_writes() as writes:
+            manifests = manager.install_many(sources, "0.1.5")
+
+        assert [m.id for m in manifests] == ["alpha", "beta"]
+        assert writes.call_count == 1
+        assert ExtensionManager(project_dir).registry.get("beta")["priority"] == 3
+        assert (project_dir / ".specify" / "extensions" / "alpha" / "extension.yml").exists()
+
+    def test_failure_rolls_back_earlier_installs(self, project_dir, packages):
+        from specify_cli.extensions import ExtensionError, ExtensionManager
+
+        sources = [(_write_extension(packages, "alpha"), 10), (_write_extension(packages, "beta"), 10)]
+        manager = ExtensionManager(project_dir)
+        original = ExtensionManager.install_from_directory
+
+        def install(self, source_dir, *args, **kwargs):
+            if source_dir.name == "beta":
+                raise ExtensionError("boom")
+            return original(self, source_dir, *args, **kwargs)
+
+        with patch.object(ExtensionManager, "install_from_directory", install):
+            with pytest.raises(ExtensionError, match="boom"):
+                manager.install_many(sources, "0.1.5")
+
+        assert ExtensionManager(project_dir).registry.keys() == set()
+        assert not (project_dir / ".specify" / "extensions" / "alpha").exists()
+
+    def test_duplicate_ids_are_rejected_before_installing(self, project_dir, packages):
+        from specify_cli.extensions import ExtensionManager, ValidationError
+
+        alpha = _write_extension(packages, "alpha")
+        manager = ExtensionManager(project_dir)
+
+        with pytest.raises(ValidationError, match="more than once"):
+            manager.install_many([(alpha, 10), (alpha, 10)], "0.1.5")
+        assert not (project_dir / ".specify" / "extensions" / "alpha").exists()
+
+    def test_already_installed_is_rejected_before_installing(self, project_dir, packages):
+        from specify_cli.extensions import ExtensionError, ExtensionManager
+
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(_write_extension(packages, "alpha"), "0.1.5", register_commands=False)
+        beta = _write_extension(packages, "beta")
+
+        with pytest.raises(ExtensionError, match="already installed"):
+            manager.install_many([(beta, 10), (packages / "alpha", 10)], "0.1.5")
+        assert not ExtensionManager(project_dir).registry.is_installed("beta")
+
+
+class TestPresetInstallMany:
+    def test_installs_all_with_one_registry_write(self, project_dir, packages):
+        from specify_cli.presets import PresetManager
+
+        sources = [(_write_preset(packages, "one"), 10), (_write_preset(packages, "two"), 5)]
+        manager = PresetManager(project_dir)
+
+        with _count_writes() as writes:
+            manifests = manager.install_many(sources, "0.1.5")
+
+        assert [m.id for m in manifests] == ["one", "two"]
+        assert writes.call_count == 1
+        assert PresetManager(project_dir).registry.get("two")["priority"] == 5
+
+    def test_invalid_manifest_installs_nothing(self, project_dir, packages):
+        from specify_cli.presets import PresetManager, PresetValidationError
+
+        one = _write_preset(packages, "one")
+        broken = packages / "broken"
+        broken.mkdir()
+        (broken / "preset.yml").write_text("schema_version: '1.0'\n", encoding="utf-8")
+
+        with pytest.raises(PresetValidationError):
+            PresetManager(project_dir).install_many([(one, 10), (broken, 10)], "0.1.5")
+        assert not PresetManager(project_dir).registry.is_installed("one")
+
+
+class TestBatchAddCommands:
+    def test_extension_add_installs_several(self, project_dir, packages):
+        from typer.testing import CliRunner
+        from specify_cli import app
+        from specify_cli.extensions import ExtensionManager
+
+        alpha = _write_extension(packages, "alpha")
+        beta = _write_extension(packages, "beta")
+
+        with patch.object(Path, "cwd", return_value=project_dir):
+            result = CliRunner().invoke(app, ["extension", "add", str(alpha), str(beta), "--dev"])
+
+        assert result.exit_code == 0, result.output
+        assert "2 extensions installed" in result.output
+        assert ExtensionManager(project_dir).registry.keys() == {"alpha", "beta"}
+
+    def test_extension_add_several_rejects_force(self, project_dir, packages):
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        alpha = _write_extension(packages, "alpha")
+        beta = _write_extension(packages, "beta")
+
+        with patch.object(Path, "cwd", return_value=project_dir):
+            result = CliRunner().invoke(app, ["extension", "add", str(alpha), str(beta), "--dev", "--force"])
+
+        assert result.exit_code == 1
+        assert "single extension" in result.output
+
+    def test_extension_add_failure_installs_nothing(self, project_dir, packages):
+        from typer.testing import CliRunner
+        from specify_cli import app
+        from specify_cli.extensions import ExtensionManager
+
+        alpha = _write_extension(packages, "alpha")
+
+        with patch.object(Path, "cwd", return_value=project_dir):
+            result = CliRunner().invoke(
+                app, ["extension", "add", str(alpha), str(packages / "missing"), "--dev"]
+            )
+
+        assert result.exit_code == 1
+        assert "No extensions were installed" in result.output
+        assert not ExtensionManager(project_dir).registry.is_installed("alpha")
+
+    def test_preset_add_installs_several(self, project_dir, packages):
+        from typer.testing import CliRunner
+        from specify_cli import app
+        from specify_cli.presets import PresetManager
+
+        _write_preset(packages, "one")
+        _write_preset(packages, "two")
+
+        with patch.object(Path, "cwd", return_value=project_dir), patch(
+            "specify_cli._locate_bundled_preset", side_effect=lambda name: packages / name
+        ):
+            result = CliRunner().invoke(app, ["preset", "add", "one", "two", "--priority", "4"])
+
+        assert result.exit_code == 0, result.output
+        registry = PresetManager(project_dir).registry
+        assert registry.get("one")["priority"] == 4
+        assert registry.get("two")["priority"] == 4
+
+
+class TestSync:
+    def _bundled(self, packages):
+        return (
+            patch("specify_cli._locate_bundled_extension", side_effect=lambda n: packages / "ext" / n),
+            patch(
+                "specify_cli._locate_bundled_preset",
+                side_effect=lambda n: (packages / "presets" / n) if (packages / "presets" / n).exists() else None,
+            ),
+        )
+
+    def _sync(self, project_dir, packages, *args):
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        ext_patch, preset_patch = self._bundled(packages)
+        with patch.object(Path, "cwd", return_value=project_dir), ext_patch, preset_patch:
+            return CliRunner().invoke(app, ["sync", *args])
+
+    def test_missing_lockfile_is_an_error(self, project_dir, packages):
+        result = self._sync(project_dir, packages)
+
+        assert result.exit_code == 1
+        assert "--write-lock" in result.output
+
+    def test_write_lock_then_sync_restores_packages(self, project_dir, packages):
+        from specify_cli.extensions import ExtensionManager
+        from specify_cli.presets import PresetManager
+
+        ExtensionManager(project_dir).install_from_directory(
+            _write_extension(packages / "ext", "alpha"), "0.1.5", register_commands=False, priority=4
+        )
+        PresetManager(project_dir).install_from_directory(_write_preset(packages / "presets", "one"), "0.1.5")
+
+        result = self._sync(project_dir, packages, "--write-lock")
+        assert result.exit_code == 0, result.output
+        lock = yaml.safe_load((project_dir / ".specify" / "lock.yml").read_text(encoding="utf-8"))
+        assert lock["extensions"] == {"alpha": {"version": "1.0.0", "priority": 4}}
+        assert lock["presets"] == {"one": {"version": "1.0.0", "priority": 10}}
+
+        ExtensionManager(project_dir).remove("alpha")
+        PresetManager(project_dir).remove("one")
+        result = self._sync(project_dir, packages)
+
+        assert result.exit_code == 0, result.output
+        assert ExtensionManager(project_dir).registry.get("alpha")["priority"] == 4
+        assert PresetManager(project_dir).registry.is_installed("one")
+
+    def test_preset_failure_rolls_back_extensions(self, project_dir, packages):
+        from specify_cli.extensions import ExtensionManager
+        from specify_cli.presets import PresetError, PresetManager
+
+        _write_extension(packages / "ext", "alpha")
+        _write_preset(packages / "presets", "one")
+        (project_dir / ".specify" / "lock.yml").write_text(
+            yaml.safe_dump({"schema_version": "1.0", "extensions": {"alpha": {}}, "presets": {"one": {}}}),
+            encoding="utf-8",
+        )
+
+        with patch.object(PresetManager, "_install_directory", side_effect=PresetError("boom")):
+            result = self._sync(project_dir, packages)
+
+        assert result.exit_code == 1
+        assert "Nothing was installed" in result.output
+        assert not ExtensionManager(project_dir).registry.is_installed("alpha")
+        assert not (project_dir / ".specify" / "extensions" / "alpha").exists()
+
+    def test_locked_version_mismatch_is_rejected(self, project_dir, packages):
+        from specify_cli.extensions import ExtensionManager
+
+        _write_extension(packages / "ext", "alpha")
+        (project_dir / ".specify" / "lock.yml").write_text(
+            yaml.safe_dump({"schema_version": "1.0", "extensions": {"alpha": {"version": "2.0.0"}}}),
+            encoding="utf-8",
+        )
+
+        result = self._sync(project_dir, packages)
+
+        assert result.exit_code == 1
+        assert "locked to version 2.0.0" in result.output
+        assert not ExtensionManager(project_dir).registry.is_installed("alpha")
@@ -0,0 +1,122 @@
+"""Tests for lazy command loading at CLI startup."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that only the lazily loaded command groups need.
+HEAVY_MODULES = (
+    "specify_cli._version",
+    "specify_cli.commands.extension",
+    "specify_cli.commands.workflow",
+    "specify_cli.extensions",
+    "specify_cli.integrations._commands",
+    "specify_cli.presets",
+    "specify_cli.shared_infra",
+    "specify_cli.workflows",
+    "yaml",
+)
+
+
+def _loaded_modules(code: str) -> set[str]:
+    probe = (
+        f"{code}\n"
+        "import sys\n"
+        "print('\\n'.join(sys.modules), file=sys.__stderr__)"
+    )
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT / "src"))
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    return set(result.stderr.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import specify_cli",
+        "import sys\nfrom specify_cli import app\n"
+        "try:\n    app(['--version'])\nexcept SystemExit:\n    pass",
+    ],
+    ids=["import", "--version"],
+)
+def test_startup_skips_command_group_imports(code):
+    loaded = _loaded_modules(code)
+    assert "specify_cli" in loaded
+    assert sorted(loaded.intersection(HEAVY_MODULES)) == []
+
+
+def test_subcommand_imports_only_its_module():
+    loaded = _loaded_modules(
+        "from specify_cli import app\n"
+        "try:\n    app(['extension', '--help'])\nexcept SystemExit:\n    pass"
+    )
+    assert "specify_cli.commands.extension" in loaded
+    assert "specify_cli.commands.workflow" not in loaded
+    assert "specify_cli.integrations._commands" not in loaded
+
+
+def test_help_lists_lazy_commands():
+    from typer.testing import CliRunner
+    from specify_cli import SpecifyGroup, app
+
+    result = CliRunner().invoke(app, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    for name in SpecifyGroup.lazy_commands:
+        assert f" {name} " in result.output
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["self", "--help"],
+        ["cache", "--help"],
+        ["extension", "catalog", "--help"],
+        ["integration", "--help"],
+        ["preset", "--help"],
+        ["resolve", "--help"],
+        ["workflow", "step", "catalog", "--help"],
+    ],
+)
+def test_lazy_commands_resolve(args):
+    from typer.testing import CliRunner
+    from specify_cli import app
+
+    result = CliRunner().invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    assert "Usage:" in result.output
+
+
+def test_unknown_command_still_fails():
+    from typer.testing import CliRunner
+    from specify_cli import app
+
+    result = CliRunner().invoke(app, ["no-such-command"])
+
+    assert result.exit_code != 0
+    assert "No such command" in result.output
+
+
+def test_lazy_re_exports():
+    import specify_cli
+    from specify_cli import _stdout_to_stderr_when, extension_app, self_check
+    from specify_cli._version import self_check as version_self_check
+    from specify_cli.commands.extension import extension_app as ext_app
+    from specify_cli.commands.workflow import _stdout_to_stderr_when as to_stderr
+
+    assert self_check is version_self_check
+    assert extension_app is ext_app
+    assert _stdout_to_stderr_when is to_stderr
+    with pytest.raises(AttributeError):
+        specify_cli.no_such_attribute
@@ -0,0 +1,150 @@
+"""Tests for keep-alive connection reuse in ``open_url``."""
+
+import http.server
+import threading
+import urllib.error
+
+import pytest
+
+from specify_cli.authentication.config import AuthConfigEntry
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address[1], self.headers.get("Authorization")))
+        if self.path.startswith("/redirect"):
+            target = f"http://127.0.0.1:{server.server_port}/final"
+            self.send_response(302)
+            self.send_header("Location", target)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            body = b"not found"
+            self.send_response(404)
+        else:
+            body = b"x" * 4096
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        if self.path == "/close":
+            self.send_header("Connection", "close")
+        self.close_connection = self.path in ("/close", "/drop")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    from specify_cli.authentication import connection_pool
+
+    connection_pool.clear()
+    yield
+    connection_pool.clear()
+
+
+def _get(url, **kwargs):
+    from specify_cli.authentication.http import open_url
+
+    with open_url(url, **kwargs) as response:
+        return response.read()
+
+
+def _ports(server):
+    return [port for _, port, _ in server.requests]
+
+
+class TestConnectionReuse:
+    def test_sequential_requests_share_one_connection(self, server):
+        from specify_cli.authentication import connection_pool
+
+        base = f"http://127.0.0.1:{server.server_port}"
+        for path in ("/a", "/b", "/c"):
+            assert _get(base + path) == b"x" * 4096
+
+        assert len(set(_ports(server))) == 1
+        assert connection_pool.stats() == connection_pool.PoolStats(opened=1, reused=2)
+
+    def test_response_closed_before_end_is_not_reused(self, server):
+        from specify_cli.authentication import connection_pool
+        from specify_cli.authentication.http import open_url
+
+        base = f"http://127.0.0.1:{server.server_port}"
+        with open_url(base + "/a") as response:
+            response.read(10)
+        _get(base + "/b")
+
+        assert len(set(_ports(server))) == 2
+        assert connection_pool.stats().reused == 0
+
+    def test_connection_close_is_honored(self, server):
+        from specify_cli.authentication import connection_pool
+
+        base = f"http://127.0.0.1:{server.server_port}"
+        _get(base + "/close")
+        _get(base + "/a")
+
+        assert connection_pool.stats() == connection_pool.PoolStats(opened=2, reused=0)
+
+    @pytest.mark.parametrize("detect_stale", [True, False])
+    def test_connection_dropped_by_server_is_replaced(self, server, monkeypatch, detect_stale):
+        from specify_cli.authentication import connection_pool
+
+        if not detect_stale:
+            # Only find out when the request fails, then retry it.
+            monkeypatch.setattr(connection_pool, "_is_reusable", lambda conn: True)
+
+        base = f"http://127.0.0.1:{server.server_port}"
+        # The server closes the connection without announcing it, as when
+        # it times out an idle keep-alive connection.
+        _get(base + "/drop")
+
+        assert _get(base + "/b") == b"x" * 4096
+        assert connection_pool.stats().opened == 2
+
+    def test_http_error_does_not_poison_connection(self, server):
+        base = f"http://127.0.0.1:{server.server_port}"
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            _get(base + "/missing")
+        excinfo.value.close()
+
+        assert _get(base + "/a") == b"x" * 4096
+
+    def test_refused_connection_raises_urlerror(self, server):
+        port = server.server_port
+        server.shutdown()
+        server.server_close()
+
+        with pytest.raises(urllib.error.URLError):
+            _get(f"http://127.0.0.1:{port}/a", timeout=2)
+
+    def test_auth_is_still_stripped_on_cross_host_redirect(self, server, monkeypatch):
+        from specify_cli.authentication import http as _auth_http
+
+        monkeypatch.setattr(_auth_http, "_config_override", [
+            AuthConfigEntry(hosts=("localhost",), provider="github", auth="bearer", token="secret"),
+        ])
+        _get(f"http://localhost:{server.server_port}/redirect")
+        _get(f"http://localhost:{server.server_port}/again")
+
+        auth = {path: header for path, _, header in server.requests}
+        assert auth["/redirect"] == "Bearer secret"
+        assert auth["/final"] is None
+        assert auth["/again"] == "Bearer secret"
@@ -0,0 +1,224 @@
+"""Tests for the shared download cache (``specify_cli.download_cache``)."""
+
+import hashlib
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tests.test_downloads import PAYLOAD, URL, FakeServer
+
+MiB = 1024 * 1024
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file(tmp_path: Path, name: str, data: bytes) -> Path:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+class TestStore:
+    def test_round_trip_is_keyed_by_url_and_version(self, tmp_path):
+        from specify_cli import download_cache
+
+        download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"one"))
+
+        assert download_cache.read_bytes(URL, "1.0.0") == b"one"
+        assert download_cache.read_bytes(URL, "2.0.0") is None
+        assert download_cache.read_bytes(URL + "?x", "1.0.0") is None
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        from specify_cli import download_cache
+
+        download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"same"))
+        download_cache.store("https://mirror.example.com/a.zip", "1.0.0", _file(tmp_path, "b.zip", b"same"))
+
+        assert len(download_cache.list_entries()) == 2
+        assert len(list((download_cache.cache_dir() / "blobs").glob("*/*"))) == 1
+        assert download_cache.total_size() == 4
+
+    def test_unversioned_downloads_are_not_cached(self, tmp_path):
+        from specify_cli import download_cache
+
+        assert download_cache.store(URL, None, _file(tmp_path, "a.zip", b"x")) is None
+        assert download_cache.store(URL, "unknown", _file(tmp_path, "a.zip", b"x")) is None
+        assert download_cache.list_entries() == []
+
+    def test_checksum_mismatch_is_not_cached(self, tmp_path):
+        from specify_cli import download_cache
+
+        path = _file(tmp_path, "a.zip", b"x")
+        assert download_cache.store(URL, "1.0.0", path, sha256=_sha(b"y")) is None
+        assert download_cache.store(URL, "1.0.0", path, sha256="sha256:" + _sha(b"x")) is not None
+        assert download_cache.read_bytes(URL, "1.0.0", _sha(b"x")) == b"x"
+        assert download_cache.read_bytes(URL, "1.0.0") is None
+
+    def test_corrupted_blob_is_dropped(self, tmp_path):
+        from specify_cli import download_cache
+
+        blob = download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"good"))
+        blob.write_bytes(b"evil")
+
+        assert download_cache.read_bytes(URL, "1.0.0") is None
+        assert not blob.exists()
+        assert download_cache.list_entries() == []
+
+    def test_least_recently_used_blobs_are_evicted(self, tmp_path, monkeypatch):
+        from specify_cli import download_cache
+
+        monkeypatch.setenv("SPECIFY_CACHE_MAX_MB", str(2.5 / 1024))  # 2.5 KiB
+        with patch("time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+            download_cache.store(URL, "1", _file(tmp_path, "1.zip", b"1" * 1024))
+            download_cache.store(URL, "2", _file(tmp_path, "2.zip", b"2" * 1024))
+            assert download_cache.lookup(URL, "1") is not None
+            download_cache.store(URL, "3", _file(tmp_path, "3.zip", b"3" * 1024))
+
+        assert sorted(e.version for e in download_cache.list_entries()) == ["1", "3"]
+
+    def test_zero_size_limit_disables_caching(self, tmp_path, monkeypatch):
+        from specify_cli import download_cache
+
+        download_cache.store(URL, "0.9.0", _file(tmp_path, "old.zip", b"old"))
+        monkeypatch.setenv("SPECIFY_CACHE_MAX_MB", "0")
+
+        assert download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"x")) is None
+        # Blobs stored before the cache was turned off are not served either.
+        assert download_cache.read_bytes(URL, "0.9.0") is None
+        assert download_cache.fetch(URL, "0.9.0", None, tmp_path / "out.zip") is None
+
+    def test_concurrent_stores_keep_every_entry(self, tmp_path):
+        import threading
+        from specify_cli import download_cache
+
+        files = [_file(tmp_path, f"{i}.zip", f"payload-{i}".encode()) for i in range(16)]
+        barrier = threading.Barrier(len(files))
+
+        def worker(i):
+            barrier.wait()
+            download_cache.store(URL, str(i), files[i])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(files))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(int(e.version) for e in download_cache.list_entries()) == list(range(16))
+        assert list(download_cache.cache_dir().glob("*.tmp")) == []
+
+    def test_cache_dir_can_be_overridden(self, tmp_path, monkeypatch):
+        from specify_cli import download_cache
+
+        monkeypatch.setenv("SPECIFY_CACHE_DIR", str(tmp_path / "ci-cache"))
+        download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"x"))
+
+        assert (tmp_path / "ci-cache" / "index.json").is_file()
+
+
+class TestPrune:
+    def test_prune_by_age_and_orphans(self, tmp_path):
+        from specify_cli import download_cache
+
+        with patch("time.time", return_value=1000.0):
+            download_cache.store(URL, "old", _file(tmp_path, "1.zip", b"old"))
+        download_cache.store(URL, "new", _file(tmp_path, "2.zip", b"new"))
+        orphan = download_cache.cache_dir() / "blobs" / "ff" / ("f" * 64)
+        orphan.parent.mkdir(parents=True)
+        orphan.write_bytes(b"orphan")
+
+        removed, freed = download_cache.prune(older_than=86400)
+
+        assert (removed, freed) == (2, 9)
+        assert [e.version for e in download_cache.list_entries()] == ["new"]
+        assert not orphan.exists()
+
+    def test_prune_keeps_fresh_temporary_files(self, tmp_path):
+        from specify_cli import download_cache
+
+        download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"x"))
+        in_flight = download_cache.cache_dir() / "blobs" / "ab" / "abc.123.tmp"
+        in_flight.parent.mkdir(parents=True)
+        in_flight.write_bytes(b"partial")
+
+        download_cache.prune()
+
+        assert in_flight.exists()
+
+    def test_clear_removes_everything(self, tmp_path):
+        from specify_cli import download_cache
+
+        download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"x"))
+
+        assert download_cache.clear() > 0
+        assert not download_cache.cache_dir().exists()
+
+
+class TestCatalogDownloadsUseCache:
+    def test_second_project_reuses_extension_download(self, tmp_path):
+        from specify_cli.extensions import ExtensionCatalog
+
+        ext_info = {"id": "ext", "version": "1.0.0", "download_url": URL, "sha256": _sha(PAYLOAD)}
+        server = FakeServer()
+        paths = []
+        for name in ("one", "two"):
+            project = tmp_path / name
+            (project / ".specify").mkdir(parents=True)
+            catalog = ExtensionCatalog(project)
+            with patch.object(catalog, "get_extension_info", return_value=ext_info), \
+                 patch.object(catalog, "_open_url", server):
+                paths.append(catalog.download_extension("ext"))
+
+        assert len(server.requests) == 1
+        assert paths[1].read_bytes() == PAYLOAD
+        assert paths[1].is_relative_to(tmp_path / "two")
+
+    def test_new_version_is_downloaded(self, tmp_path):
+        from specify_cli.presets import PresetCatalog
+
+        project = tmp_path / "project"
+        (project / ".specify").mkdir(parents=True)
+        catalog = PresetCatalog(project)
+        server = FakeServer()
+        for version in ("1.0.0", "1.1.0"):
+            pack_info = {"id": "pack", "version": version, "download_url": URL}
+            with patch.object(catalog, "get_pack_info", return_value=pack_info), \
+                 patch.object(catalog, "_open_url", server):
+                catalog.download_pack("pack", target_dir=tmp_path / "downloads")
+
+        assert len(server.requests) == 2
+
+
+class TestCacheCommands:
+    def test_list_and_clear(self, tmp_path):
+        from typer.testing import CliRunner
+        from specify_cli import app, download_cache
+
+        download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"x" * 2048))
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["cache", "list"])
+        assert result.exit_code == 0, result.output
+        assert "1.0.0" in result.output
+        assert "2.0 KiB" in result.output
+
+        result = runner.invoke(app, ["cache", "clear"])
+        assert result.exit_code == 0, result.output
+        assert download_cache.list_entries() == []
+
+    @pytest.mark.parametrize("args", [["--max-size", "0"], ["--older-than", "0"]])
+    def test_prune(self, tmp_path, args):
+        from typer.testing import CliRunner
+        from specify_cli import app, download_cache
+
+        with patch("time.time", return_value=1000.0):
+            download_cache.store(URL, "1.0.0", _file(tmp_path, "a.zip", b"x"))
+
+        result = CliRunner().invoke(app, ["cache", "prune", *args])
+
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 cached download(s)" in result.output
+        assert download_cache.list_entries() == []
@@ -0,0 +1,193 @@
+"""Tests for streaming, resumable downloads (``specify_cli.downloads``)."""
+
+import hashlib
+import http.client
+import io
+import json
+import urllib.error
+from unittest.mock import patch
+
+import pytest
+
+URL = "https://example.com/pkg.zip"
+PAYLOAD = bytes(range(256)) * 1024  # 256 KiB, several chunks
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, body: bytes, status: int = 200, headers: dict | None = None, fail_after: int | None = None):
+        super().__init__(body)
+        self.status = status
+        self.headers = {"Content-Length": str(len(body)), **(headers or {})}
+        self.read_sizes = []
+        self._fail_after = fail_after
+
+    def read(self, size=-1):
+        self.read_sizes.append(size)
+        if self._fail_after is not None and self.tell() >= self._fail_after:
+            raise http.client.IncompleteRead(b"")
+        return super().read(size)
+
+
+class FakeServer:
+    """``open_url`` stand-in serving PAYLOAD and honoring Range/If-Range."""
+
+    def __init__(self, etag: str = '"v1"', fail_after: int | None = None):
+        self.etag = etag
+        self.fail_after = fail_after
+        self.requests = []
+
+    def __call__(self, url, timeout=10, extra_headers=None):
+        headers = dict(extra_headers or {})
+        self.requests.append(headers)
+        fail_after, self.fail_after = self.fail_after, None
+        range_header = headers.get("Range")
+        if range_header and headers.get("If-Range") == self.etag:
+            start = int(range_header[len("bytes="):-1])
+            if start >= len(PAYLOAD):
+                raise urllib.error.HTTPError(url, 416, "Range Not Satisfiable", {}, None)
+            return FakeResponse(
+                PAYLOAD[start:],
+                status=206,
+                headers={"ETag": self.etag, "Content-Range": f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}"},
+            )
+        return FakeResponse(PAYLOAD, headers={"ETag": self.etag}, fail_after=fail_after)
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class TestDownloadFile:
+    def test_streams_in_chunks_and_renames(self, tmp_path):
+        from specify_cli.downloads import CHUNK_SIZE, download_file
+
+        responses = []
+
+        def open_url(url, timeout=10, extra_headers=None):
+            responses.append(FakeResponse(PAYLOAD))
+            return responses[-1]
+
+        dest = download_file(open_url, URL, tmp_path / "pkg.zip", sha256=_sha(PAYLOAD))
+
+        assert dest.read_bytes() == PAYLOAD
+        assert set(responses[0].read_sizes) == {CHUNK_SIZE}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["pkg.zip"]
+
+    def test_checksum_mismatch_discards_partial(self, tmp_path):
+        from specify_cli.downloads import DownloadError, download_file
+
+        with pytest.raises(DownloadError, match="Checksum mismatch"):
+            download_file(FakeServer(), URL, tmp_path / "pkg.zip", sha256="sha256:" + "0" * 64)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_checksum_is_rejected(self):
+        from specify_cli.downloads import DownloadError, normalize_sha256
+
+        assert normalize_sha256("sha256:" + "AB" * 32) == "ab" * 32
+        assert normalize_sha256("ab" * 32) == "ab" * 32
+        assert normalize_sha256("") is None
+        with pytest.raises(DownloadError):
+            normalize_sha256("not-a-digest")
+
+    def test_interrupted_download_resumes(self, tmp_path):
+        from specify_cli.downloads import DownloadError, download_file
+
+        server = FakeServer(fail_after=100_000)
+        dest = tmp_path / "pkg.zip"
+        with pytest.raises(DownloadError, match="resume"):
+            download_file(server, URL, dest, sha256=_sha(PAYLOAD))
+        part = tmp_path / "pkg.zip.part"
+        assert 0 < part.stat().st_size < len(PAYLOAD)
+        done = part.stat().st_size
+
+        download_file(server, URL, dest, sha256=_sha(PAYLOAD))
+
+        assert dest.read_bytes() == PAYLOAD
+        assert server.requests[1]["Range"] == f"bytes={done}-"
+        assert server.requests[1]["If-Range"] == '"v1"'
+        assert not part.exists()
+        assert not (tmp_path / "pkg.zip.part.json").exists()
+
+    def test_full_response_to_range_request_restarts(self, tmp_path):
+        from specify_cli.downloads import download_file
+
+        (tmp_path / "pkg.zip.part").write_bytes(b"stale bytes")
+        (tmp_path / "pkg.zip.part.json").write_text(json.dumps({"url": URL, "validator": '"old"'}))
+        server = FakeServer(etag='"new"')
+
+        download_file(server, URL, tmp_path / "pkg.zip", sha256=_sha(PAYLOAD))
+
+        assert "Range" in server.requests[0]
+        assert (tmp_path / "pkg.zip").read_bytes() == PAYLOAD
+
+    def test_partial_without_validator_is_not_resumed(self, tmp_path):
+        from specify_cli.downloads import download_file
+
+        (tmp_path / "pkg.zip.part").write_bytes(PAYLOAD[:1000])
+        server = FakeServer()
+
+        download_file(server, URL, tmp_path / "pkg.zip")
+
+        assert "Range" not in server.requests[0]
+        assert (tmp_path / "pkg.zip").read_bytes() == PAYLOAD
+
+    def test_unsatisfiable_range_restarts(self, tmp_path):
+        from specify_cli.downloads import download_file
+
+        (tmp_path / "pkg.zip.part").write_bytes(PAYLOAD + b"extra")
+        (tmp_path / "pkg.zip.part.json").write_text(json.dumps({"url": URL, "validator": '"v1"'}))
+        server = FakeServer()
+
+        download_file(server, URL, tmp_path / "pkg.zip")
+
+        assert len(server.requests) == 2
+        assert "Range" not in server.requests[1]
+        assert (tmp_path / "pkg.zip").read_bytes() == PAYLOAD
+
+    def test_truncated_body_keeps_partial(self, tmp_path):
+        from specify_cli.downloads import DownloadError, download_file
+
+        def open_url(url, timeout=10, extra_headers=None):
+            return FakeResponse(PAYLOAD[:10], headers={"Content-Length": str(len(PAYLOAD)), "ETag": '"v1"'})
+
+        with pytest.raises(DownloadError, match="incomplete"):
+            download_file(open_url, URL, tmp_path / "pkg.zip")
+        assert (tmp_path / "pkg.zip.part").read_bytes() == PAYLOAD[:10]
+        assert not (tmp_path / "pkg.zip").exists()
+
+
+class TestCatalogDownloads:
+    def test_download_extension_verifies_catalog_sha256(self, tmp_path):
+        from specify_cli.extensions import ExtensionCatalog, ExtensionError
+
+        project = tmp_path / "project"
+        (project / ".specify").mkdir(parents=True)
+        catalog = ExtensionCatalog(project)
+        ext_info = {
+            "id": "ext",
+            "version": "1.0.0",
+            "download_url": URL,
+            "sha256": _sha(b"something else"),
+        }
+
+        with patch.object(catalog, "get_extension_info", return_value=ext_info), \
+             patch.object(catalog, "_open_url", FakeServer()):
+            with pytest.raises(ExtensionError, match="Checksum mismatch"):
+                catalog.download_extension("ext", target_dir=tmp_path / "downloads")
+        assert list((tmp_path / "downloads").iterdir()) == []
+
+    def test_download_pack_streams_to_target(self, tmp_path):
+        from specify_cli.presets import PresetCatalog
+
+        project = tmp_path / "project"
+        (project / ".specify").mkdir(parents=True)
+        catalog = PresetCatalog(project)
+        pack_info = {"id": "pack", "version": "1.0.0", "download_url": URL, "sha256": _sha(PAYLOAD)}
+
+        with patch.object(catalog, "get_pack_info", return_value=pack_info), \
+             patch.object(catalog, "_open_url", FakeServer()):
+            path = catalog.download_pack("pack", target_dir=tmp_path / "downloads")
+
+        assert path.name == "pack-1.0.0.zip"
+        assert path.read_bytes() == PAYLOAD
@@ -869,8 +869,10 @@ class TestExtensionRegistry:
         assert stored["version"] == "1.0.0"
         assert stored["nested"]["key"] == "original"
 
-    def test_get_returns_deep_copy(self, temp_dir):
-        """Test that get() returns deep copies for nested structures."""
+    def test_get_returns_read_only_view(self, temp_dir):
+        """Test that get() returns a view that rejects nested mutation."""
+        import copy
+
         extensions_dir = temp_dir / "extensions"
         extensions_dir.mkdir()
 
@@ -882,7 +884,15 @@ class TestExtensionRegistry:
         registry.add("test-ext", metadata)
 
         fetched = registry.get("test-ext")
-        fetched["registered_commands"]["claude"].append("cmd2")
+        assert isinstance(fetched, dict)
+        with pytest.raises(TypeError):
+            fetched["registered_commands"]["claude"].append("cmd2")
+        with pytest.raises(TypeError):
+            fetched["version"] = "2.0.0"
+
+        # deepcopy() gives a plain, mutable copy.
+        copied = copy.deepcopy(fetched)
+        copied["registered_commands"]["claude"].append("cmd2")
 
         # Internal registry must remain unchanged.
         internal = registry.data["extensions"]["test-ext"]
@@ -908,8 +918,8 @@ class TestExtensionRegistry:
         # Non-existent should also return None
         assert registry.get("nonexistent") is None
 
-    def test_list_returns_deep_copy(self, temp_dir):
-        """Test that list() returns deep copies for nested structures."""
+    def test_list_returns_read_only_views(self, temp_dir):
+        """Test that list() returns views that reject nested mutation."""
         extensions_dir = temp_dir / "extensions"
         extensions_dir.mkdir()
 
@@ -921,7 +931,8 @@ class TestExtensionRegistry:
         registry.add("test-ext", metadata)
 
         listed = registry.list()
-        listed["test-ext"]["registered_commands"]["claude"].append("cmd2")
+        with pytest.raises(TypeError):
+            listed["test-ext"]["registered_commands"]["claude"].append("cmd2")
 
         # Internal registry must remain unchanged.
         internal = registry.data["extensions"]["test-ext"]
@@ -3650,7 +3661,7 @@ class TestExtensionCatalog:
         release_response.__exit__ = MagicMock(return_value=False)
 
         asset_response = MagicMock()
-        asset_response.read.return_value = zip_bytes
+        asset_response.read.side_effect = [zip_bytes, b""]
         asset_response.__enter__ = lambda s: s
         asset_response.__exit__ = MagicMock(return_value=False)
 
@@ -3698,7 +3709,7 @@ class TestExtensionCatalog:
         zip_bytes = zip_buf.getvalue()
 
         asset_response = MagicMock()
-        asset_response.read.return_value = zip_bytes
+        asset_response.read.side_effect = [zip_bytes, b""]
         asset_response.__enter__ = lambda s: s
         asset_response.__exit__ = MagicMock(return_value=False)
 
@@ -4221,6 +4232,450 @@ class TestCatalogStack:
         assert results[0]["_catalog_name"] == "org"
         assert results[0]["_install_allowed"] is True
 
+    # --- concurrent fetching ---
+
+    def test_merged_extensions_fetches_catalogs_concurrently(self, temp_dir):
+        """All active catalogs are in flight at once; merge stays priority-ordered."""
+        import threading
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        entries = [
+            CatalogEntry(url="https://a.example.com/c.json", name="org", priority=1, install_allowed=True),
+            CatalogEntry(url="https://b.example.com/c.json", name="mirror", priority=2, install_allowed=False),
+        ]
+        # Each fetch waits for the other: a serial loop would time out here.
+        barrier = threading.Barrier(len(entries), timeout=5)
+
+        def fetch(entry, force_refresh=False):
+            barrier.wait()
+            return {"schema_version": "1.0", "extensions": {"jira": {"name": entry.name}}}
+
+        with patch.object(catalog, "get_active_catalogs", return_value=entries), \
+             patch.object(catalog, "_fetch_single_catalog", side_effect=fetch):
+            merged = catalog._get_merged_extensions()
+
+        assert [ext["_catalog_name"] for ext in merged] == ["org"]
+        assert [r.entry.name for r in catalog.last_fetch_report] == ["org", "mirror"]
+        assert all(r.ok for r in catalog.last_fetch_report)
+
+    def test_merged_extensions_reports_failed_catalog(self, temp_dir, capsys):
+        from unittest.mock import patch
+        from specify_cli.catalogs import format_fetch_report
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        entries = [
+            CatalogEntry(url="https://a.example.com/c.json", name="down", priority=1, install_allowed=True),
+            CatalogEntry(url="https://b.example.com/c.json", name="up", priority=2, install_allowed=True),
+        ]
+
+        def fetch(entry, force_refresh=False):
+            if entry.name == "down":
+                raise ExtensionError("unreachable")
+            return {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+
+        with patch.object(catalog, "get_active_catalogs", return_value=entries), \
+             patch.object(catalog, "_fetch_single_catalog", side_effect=fetch):
+            merged = catalog._get_merged_extensions()
+
+        assert [ext["_catalog_name"] for ext in merged] == ["up"]
+        assert "Could not fetch catalog 'down'" in capsys.readouterr().err
+        report = format_fetch_report(catalog.last_fetch_report)
+        assert report[0].startswith("down: ") and "failed (unreachable)" in report[0]
+        assert report[1].startswith("up: ") and report[1].endswith("ok [https://b.example.com/c.json]")
+
+
+    # --- conditional revalidation ---
+
+    def test_expired_cache_revalidates_with_conditional_request(self, temp_dir):
+        """A 304 keeps the cached payload and only refreshes cached_at."""
+        import urllib.error
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        cached = {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+        catalog.cache_dir.mkdir(parents=True, exist_ok=True)
+        catalog.cache_file.write_text(json.dumps(cached))
+        catalog.cache_metadata_file.write_text(
+            json.dumps(
+                {
+                    "cached_at": "2020-01-01T00:00:00+00:00",
+                    "catalog_url": ExtensionCatalog.DEFAULT_CATALOG_URL,
+                    "etag": '"abc"',
+                }
+            )
+        )
+        sent = {}
+
+        def not_modified(url, timeout=10, extra_headers=None):
+            sent["headers"] = extra_headers
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+
+        with patch.object(catalog, "_open_url", side_effect=not_modified):
+            assert catalog.fetch_catalog() == cached
+
+        assert sent["headers"] == {"If-None-Match": '"abc"'}
+        assert catalog.is_cache_valid()
+        metadata = json.loads(catalog.cache_metadata_file.read_text())
+        assert metadata["etag"] == '"abc"'
+
+    def test_fetch_stores_cache_validators(self, temp_dir):
+        from unittest.mock import MagicMock, patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        payload = {"schema_version": "1.0", "extensions": {}}
+        response = MagicMock()
+        response.read.return_value = json.dumps(payload).encode()
+        response.headers = {"ETag": 'W/"v2"', "Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+        response.__enter__ = lambda s: s
+        response.__exit__ = MagicMock(return_value=False)
+
+        with patch.object(catalog, "_open_url", return_value=response) as opener:
+            assert catalog.fetch_catalog(force_refresh=True) == payload
+
+        # force_refresh never sends conditional headers.
+        assert opener.call_args.kwargs["extra_headers"] is None
+        metadata = json.loads(catalog.cache_metadata_file.read_text())
+        assert metadata["etag"] == 'W/"v2"'
+        assert metadata["last_modified"] == "Tue, 01 Sep 2026 00:00:00 GMT"
+
+    # --- stale-while-revalidate ---
+
+    def _write_aged_cache(self, catalog, payload, age_seconds):
+        from datetime import datetime, timedelta, timezone
+
+        cached_at = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+        catalog.cache_dir.mkdir(parents=True, exist_ok=True)
+        catalog.cache_file.write_text(json.dumps(payload))
+        catalog.cache_metadata_file.write_text(
+            json.dumps(
+                {
+                    "cached_at": cached_at.isoformat(),
+                    "catalog_url": ExtensionCatalog.DEFAULT_CATALOG_URL,
+                }
+            )
+        )
+
+    def test_stale_cache_served_while_refreshing(self, temp_dir):
+        """Within max_stale, the expired cache is returned and refreshed in the background."""
+        import threading
+        from unittest.mock import MagicMock, patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        stale = {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+        fresh = {"schema_version": "1.0", "extensions": {"linear": {"name": "Linear"}}}
+        self._write_aged_cache(catalog, stale, catalog.CACHE_DURATION + 60)
+        entry = CatalogEntry(
+            url=ExtensionCatalog.DEFAULT_CATALOG_URL,
+            name="default",
+            priority=1,
+            install_allowed=True,
+            max_stale=3600,
+        )
+        release = threading.Event()
+        response = MagicMock()
+        response.read.return_value = json.dumps(fresh).encode()
+        response.headers = {}
+        response.__enter__ = lambda s: s
+        response.__exit__ = MagicMock(return_value=False)
+
+        def slow_open(url, timeout=10, extra_headers=None):
+            assert release.wait(5)
+            return response
+
+        with patch.object(catalog, "_open_url", side_effect=slow_open) as opener:
+            assert catalog._fetch_single_catalog(entry) == stale
+            # A second lookup while the refresh is in flight does not start another.
+            assert catalog._fetch_single_catalog(entry) == stale
+            release.set()
+            catalog.wait_for_refreshes(timeout=5)
+
+        assert opener.call_count == 1
+        assert catalog.is_cache_valid()
+        assert catalog._fetch_single_catalog(entry) == fresh
+
+    def test_stale_cache_survives_failed_refresh(self, temp_dir):
+        import urllib.error
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        stale = {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+        self._write_aged_cache(catalog, stale, catalog.CACHE_DURATION + 60)
+        entry = CatalogEntry(
+            url=ExtensionCatalog.DEFAULT_CATALOG_URL,
+            name="default",
+            priority=1,
+            install_allowed=True,
+            max_stale=3600,
+        )
+
+        with patch.object(
+            catalog, "_open_url", side_effect=urllib.error.URLError("offline")
+        ):
+            assert catalog._fetch_single_catalog(entry) == stale
+            catalog.wait_for_refreshes(timeout=5)
+
+        assert not catalog.is_cache_valid()
+        assert json.loads(catalog.cache_file.read_text()) == stale
+
+    def test_cache_past_max_stale_fetches_in_foreground(self, temp_dir, capsys):
+        import urllib.error
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        stale = {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+        self._write_aged_cache(catalog, stale, catalog.CACHE_DURATION + 120)
+        entry = CatalogEntry(
+            url=ExtensionCatalog.DEFAULT_CATALOG_URL,
+            name="default",
+            priority=1,
+            install_allowed=True,
+            max_stale=60,
+        )
+
+        with patch.object(
+            catalog, "_open_url", side_effect=urllib.error.URLError("offline")
+        ) as opener:
+            # The network is tried first; when it fails the expired cache
+            # is served with a warning instead of failing the command.
+            assert catalog._fetch_single_catalog(entry) == stale
+        assert opener.call_count == 1
+        assert catalog._refresh_threads == []
+        assert "using the expired cached copy" in capsys.readouterr().err
+
+    def test_failed_fetch_without_usable_cache_raises(self, temp_dir):
+        import urllib.error
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        stale = {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+        self._write_aged_cache(catalog, stale, catalog.CACHE_DURATION + 120)
+        entry = CatalogEntry(
+            url=ExtensionCatalog.DEFAULT_CATALOG_URL,
+            name="default",
+            priority=1,
+            install_allowed=True,
+        )
+
+        with patch.object(
+            catalog, "_open_url", side_effect=urllib.error.URLError("offline")
+        ):
+            # An explicit refresh asks for fresh data; don't substitute the cache.
+            with pytest.raises(ExtensionError, match="Failed to fetch catalog"):
+                catalog._fetch_single_catalog(entry, force_refresh=True)
+            catalog.cache_file.write_text("not json")
+            with pytest.raises(ExtensionError, match="Failed to fetch catalog"):
+                catalog._fetch_single_catalog(entry)
+
+    def test_background_refresh_thread_is_daemon(self, temp_dir):
+        import threading
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        release = threading.Event()
+
+        def slow_fetch(*args, **kwargs):
+            release.wait(5)
+
+        with patch.object(catalog, "_fetch_catalog_url", side_effect=slow_fetch):
+            catalog._refresh_in_background("https://example.com/c.json", temp_dir / "c", temp_dir / "m")
+            try:
+                assert catalog._refresh_threads[0].daemon
+            finally:
+                release.set()
+                catalog.wait_for_refreshes(timeout=5)
+
+    def test_background_refresh_is_joined_at_exit_with_bound(self, temp_dir):
+        import threading
+        import time
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        release = threading.Event()
+
+        def slow_fetch(*args, **kwargs):
+            release.wait(5)
+
+        with patch.object(catalog, "_fetch_catalog_url", side_effect=slow_fetch), \
+             patch("specify_cli.extensions.atexit.register") as register:
+            catalog._refresh_in_background("https://a.example.com/c.json", temp_dir / "a", temp_dir / "am")
+            catalog._refresh_in_background("https://b.example.com/c.json", temp_dir / "b", temp_dir / "bm")
+            try:
+                register.assert_called_once_with(
+                    catalog.wait_for_refreshes, ExtensionCatalog.REFRESH_EXIT_TIMEOUT
+                )
+                started = time.monotonic()
+                catalog.wait_for_refreshes(timeout=0.2)
+                # The bound covers all pending refreshes, not each one.
+                assert time.monotonic() - started < 1
+            finally:
+                release.set()
+                catalog.wait_for_refreshes(timeout=5)
+
+    def test_interrupted_cache_write_keeps_previous_payload(self, temp_dir):
+        from unittest.mock import MagicMock, patch
+
+        project_dir = self._make_project(temp_dir)
+        catalog = ExtensionCatalog(project_dir)
+        old = {"schema_version": "1.0", "extensions": {"old": {"name": "Old"}}}
+        new = {"schema_version": "1.0", "extensions": {"new": {"name": "New"}}}
+        self._write_aged_cache(catalog, old, 7200)
+        response = MagicMock()
+        response.read.return_value = json.dumps(new).encode()
+        response.headers = {}
+        response.__enter__ = lambda s: s
+        response.__exit__ = MagicMock(return_value=False)
+
+        with patch.object(catalog, "_open_url", return_value=response), \
+             patch("specify_cli.catalogs.os.replace", side_effect=OSError("killed")):
+            data = catalog._fetch_catalog_url(
+                ExtensionCatalog.DEFAULT_CATALOG_URL,
+                catalog.cache_file,
+                catalog.cache_metadata_file,
+            )
+
+        assert data == new
+        assert json.loads(catalog.cache_file.read_text()) == old
+        assert sorted(p.name for p in catalog.cache_dir.iterdir()) == [
+            "catalog-metadata.json",
+            "catalog.json",
+        ]
+
+    def test_load_catalog_config_parses_max_stale(self, temp_dir):
+        import yaml as yaml_module
+
+        project_dir = self._make_project(temp_dir)
+        config_path = project_dir / ".specify" / "extension-catalogs.yml"
+        config_path.write_text(
+            yaml_module.dump(
+                {
+                    "catalogs": [
+                        {"name": "farm", "url": "https://a.example.com/c.json", "max_stale": 86400},
+                        {"name": "plain", "url": "https://b.example.com/c.json"},
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        entries = ExtensionCatalog(project_dir).get_active_catalogs()
+
+        assert [e.max_stale for e in entries] == [86400, 0]
+
+    @pytest.mark.parametrize("value", [-1, True, "1h", 1.5])
+    def test_load_catalog_config_rejects_invalid_max_stale(self, temp_dir, value):
+        import yaml as yaml_module
+
+        project_dir = self._make_project(temp_dir)
+        config_path = project_dir / ".specify" / "extension-catalogs.yml"
+        config_path.write_text(
+            yaml_module.dump(
+                {"catalogs": [{"name": "farm", "url": "https://a.example.com/c.json", "max_stale": value}]}
+            ),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValidationError, match="Invalid max_stale"):
+            ExtensionCatalog(project_dir).get_active_catalogs()
+
+    # --- search index ---
+
+    def test_search_index_matches_substrings_and_ranks(self):
+        from specify_cli.catalogs import CatalogSearchIndex
+
+        index = CatalogSearchIndex(
+            [
+                {"id": "jira-sync", "name": "Tracker Sync", "description": "Sync with Jira", "tags": ["issues"]},
+                {"id": "docs", "name": "Jira", "description": "Docs", "tags": []},
+                {"id": "jira", "name": "Issue Tracker", "description": "", "tags": ["Jira"]},
+                {"id": "notes", "name": "Notes", "description": "Meeting notes", "author": "Ann"},
+            ]
+        )
+
+        assert [e["id"] for e in index.search("jira")] == ["jira", "docs", "jira-sync"]
+        # Substring semantics are kept, including matches across words.
+        assert [e["id"] for e in index.search("er sy")] == ["jira-sync"]
+        assert [e["id"] for e in index.search("eeting")] == ["notes"]
+        assert index.search("absent") == []
+        assert [e["id"] for e in index.search(tag="JIRA")] == ["jira"]
+        assert [e["id"] for e in index.search("notes", author="ann")] == ["notes"]
+        assert index.get("docs")["name"] == "Jira"
+        assert index.get("missing") is None
+
+    def test_search_index_round_trips_through_disk(self, temp_dir):
+        from specify_cli.catalogs import CatalogSearchIndex
+
+        path = temp_dir / "index.json"
+        index = CatalogSearchIndex([{"id": "jira", "name": "Jira", "tags": ["pm"]}])
+        index.save(path, "v1")
+
+        loaded = CatalogSearchIndex.load(path, "v1")
+        assert loaded is not None
+        assert loaded.search("ji") == index.search("ji")
+        assert loaded.search(tag="pm")[0]["id"] == "jira"
+        assert CatalogSearchIndex.load(path, "v2") is None
+
+    def test_search_reuses_persisted_index_while_caches_are_fresh(self, temp_dir):
+        from unittest.mock import patch
+
+        project_dir = self._make_project(temp_dir)
+        payload = {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+        catalog = ExtensionCatalog(project_dir)
+        entries = [
+            CatalogEntry(url=ExtensionCatalog.DEFAULT_CATALOG_URL, name="default", priority=1, install_allowed=True)
+        ]
+        self._write_aged_cache(catalog, payload, 0)
+
+        with patch.object(catalog, "get_active_catalogs", return_value=entries):
+            assert catalog.search("jira")[0]["_catalog_name"] == "default"
+
+        fresh = ExtensionCatalog(project_dir)
+        with patch.object(fresh, "get_active_catalogs", return_value=entries), \
+             patch.object(fresh, "_get_merged_extensions", side_effect=AssertionError):
+            assert fresh.get_extension_info("jira")["name"] == "Jira"
+
+        # A refreshed cache invalidates the persisted index.
+        self._write_aged_cache(catalog, {"schema_version": "1.0", "extensions": {}}, 1)
+        refreshed = ExtensionCatalog(project_dir)
+        with patch.object(refreshed, "get_active_catalogs", return_value=entries):
+            assert refreshed.get_extension_info("jira") is None
+
+    def test_persisted_index_reports_source_catalogs_and_age(self, temp_dir):
+        from unittest.mock import patch
+        from specify_cli.catalogs import format_fetch_report
+
+        project_dir = self._make_project(temp_dir)
+        payload = {"schema_version": "1.0", "extensions": {"jira": {"name": "Jira"}}}
+        catalog = ExtensionCatalog(project_dir)
+        entries = [
+            CatalogEntry(url=ExtensionCatalog.DEFAULT_CATALOG_URL, name="default", priority=1, install_allowed=True)
+        ]
+        self._write_aged_cache(catalog, payload, 600)
+        with patch.object(catalog, "get_active_catalogs", return_value=entries):
+            catalog.search("jira")
+
+        fresh = ExtensionCatalog(project_dir)
+        with patch.object(fresh, "get_active_catalogs", return_value=entries), \
+             patch.object(fresh, "_get_merged_extensions", side_effect=AssertionError):
+            fresh.search("jira")
+
+        [result] = fresh.last_fetch_report
+        assert result.from_index and result.entry.name == "default"
+        assert 600 <= result.cache_age < 660
+        assert format_fetch_report(fresh.last_fetch_report) == [
+            f"default: from search index, cached 10 min ago [{ExtensionCatalog.DEFAULT_CATALOG_URL}]"
+        ]
+
 
 class TestExtensionIgnore:
     """Test .extensionignore support during extension installation."""
@@ -4900,7 +5355,6 @@ class TestDownloadExtensionBundled:
     def test_download_extension_allows_bundled_with_url(self, temp_dir):
         """download_extension should allow bundled extensions that have a download_url (newer version)."""
         from unittest.mock import patch, MagicMock
-        import urllib.request
 
         project_dir = temp_dir / "project"
         project_dir.mkdir()
@@ -4918,12 +5372,12 @@ class TestDownloadExtensionBundled:
         }
 
         mock_response = MagicMock()
-        mock_response.read.return_value = b"fake zip data"
+        mock_response.read.side_effect = [b"fake zip data", b""]
         mock_response.__enter__ = lambda s: s
         mock_response.__exit__ = MagicMock(return_value=False)
 
         with patch.object(catalog, "get_extension_info", return_value=bundled_with_url), \
-             patch.object(urllib.request, "urlopen", return_value=mock_response):
+             patch("specify_cli.authentication.http._urlopen", return_value=mock_response):
             result = catalog.download_extension("git")
             assert result.name == "git-2.0.0.zip"
 
@@ -0,0 +1,273 @@
+"""Tests for the single-process feature context (``specify feature context``)."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import requires_bash
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+COMMON_SH = PROJECT_ROOT / "scripts" / "bash" / "common.sh"
+CHECK_PREREQS_SH = PROJECT_ROOT / "scripts" / "bash" / "check-prerequisites.sh"
+
+
+def _clean_env() -> dict[str, str]:
+    env = os.environ.copy()
+    for key in list(env):
+        if key.startswith("SPECIFY_"):
+            env.pop(key)
+    return env
+
+
+@pytest.fixture
+def feature_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "proj"
+    feature = repo / "specs" / "001-my-feature"
+    (feature / "contracts").mkdir(parents=True)
+    (feature / "contracts" / "api.yaml").write_text("openapi: 3.0.0\n", encoding="utf-8")
+    (feature / "plan.md").write_text("# plan\n", encoding="utf-8")
+    (feature / "research.md").write_text("# research\n", encoding="utf-8")
+    (repo / ".specify").mkdir()
+    (repo / ".specify" / "feature.json").write_text(
+        json.dumps({"feature_directory": "specs/001-my-feature"}), encoding="utf-8"
+    )
+    (repo / ".specify" / "integration.json").write_text(
+        json.dumps({
+            "integration": "claude",
+            "integration_settings": {"claude": {"invoke_separator": "-"}},
+        }),
+        encoding="utf-8",
+    )
+    return repo
+
+
+class TestResolveFeatureContext:
+    def test_reads_feature_json_and_separator(self, feature_repo, monkeypatch):
+        from specify_cli.feature_context import resolve_feature_context
+
+        monkeypatch.chdir(feature_repo / "specs")
+        monkeypatch.delenv("PWD", raising=False)
+        context = resolve_feature_context(env={"SPECIFY_FEATURE": "001-my-feature"})
+
+        feature_dir = feature_repo / "specs" / "001-my-feature"
+        assert Path(context.repo_root) == feature_repo.resolve()
+        assert Path(context.feature_dir) == feature_dir.resolve()
+        assert context.branch == "001-my-feature"
+        assert context.invoke_separator == "-"
+        data = context.to_dict(include_tasks=True)
+        assert data["AVAILABLE_DOCS"] == ["research.md", "contracts/"]
+        assert Path(data["IMPL_PLAN"]) == (feature_dir / "plan.md").resolve()
+
+    def test_env_override_is_persisted(self, feature_repo):
+        from specify_cli.feature_context import resolve_feature_context
+
+        absolute = str(feature_repo / "specs" / "002-other")
+        context = resolve_feature_context(
+            env={"SPECIFY_FEATURE_DIRECTORY": absolute}, start=str(feature_repo)
+        )
+
+        assert context.feature_dir == absolute
+        stored = json.loads((feature_repo / ".specify" / "feature.json").read_text())
+        assert stored == {"feature_directory": "specs/002-other"}
+
+    def test_missing_feature_json_errors(self, tmp_path):
+        from specify_cli.feature_context import FeatureContextError, resolve_feature_context
+
+        (tmp_path / ".specify").mkdir()
+        with pytest.raises(FeatureContextError, match="Feature directory not found"):
+            resolve_feature_context(env={}, start=str(tmp_path))
+
+    def test_unparseable_feature_json_errors(self, feature_repo):
+        from specify_cli.feature_context import FeatureContextError, resolve_feature_context
+
+        (feature_repo / ".specify" / "feature.json").write_text("{not json", encoding="utf-8")
+        with pytest.raises(FeatureContextError, match="contains feature_directory"):
+            resolve_feature_context(env={}, start=str(feature_repo))
+
+    def test_fallback_root_without_specify_dir(self, tmp_path):
+        from specify_cli.feature_context import resolve_feature_context
+
+        context = resolve_feature_context(
+            env={"SPECIFY_FEATURE_DIRECTORY": "specs/001"},
+            start=str(tmp_path),
+            fallback_root=str(tmp_path),
+        )
+        assert context.repo_root == str(tmp_path)
+
+    def test_validate_reports_missing_documents(self, feature_repo):
+        from specify_cli.feature_context import FeatureContextError, resolve_feature_context
+
+        context = resolve_feature_context(env={}, start=str(feature_repo))
+        context.validate(require_plan=True)
+        with pytest.raises(FeatureContextError) as exc:
+            context.validate(require_plan=True, require_tasks=True)
+        assert "tasks.md not found" in str(exc.value)
+        assert "Run /speckit-tasks first" in str(exc.value)
+
+    def test_json_reads_are_cached_until_the_file_changes(self, feature_repo):
+        from unittest.mock import patch
+        from specify_cli import feature_context
+
+        path = feature_repo / ".specify" / "integration.json"
+        original = Path.read_text
+        with patch.object(Path, "read_text", autospec=True, side_effect=original) as read:
+            assert feature_context.read_invoke_separator(str(feature_repo)) == "-"
+            assert feature_context.read_invoke_separator(str(feature_repo)) == "-"
+        assert [call.args[0] for call in read.call_args_list].count(path) <= 1
+
+        path.write_text(json.dumps({"integration": "x"}) + "\n", encoding="utf-8")
+        assert feature_context.read_invoke_separator(str(feature_repo)) == "."
+
+
+class TestFeatureContextCommand:
+    def test_json_output(self, feature_repo, monkeypatch):
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        monkeypatch.chdir(feature_repo)
+        monkeypatch.delenv("PWD", raising=False)
+        monkeypatch.delenv("SPECIFY_FEATURE_DIRECTORY", raising=False)
+        result = CliRunner().invoke(app, ["feature", "context", "--json", "--require-plan"])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["AVAILABLE_DOCS"] == ["research.md", "contracts/"]
+        assert data["INVOKE_SEPARATOR"] == "-"
+        assert Path(data["FEATURE_DIR"]) == (feature_repo / "specs" / "001-my-feature").resolve()
+
+    def test_missing_requirement_exits_one(self, feature_repo, monkeypatch):
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        monkeypatch.chdir(feature_repo)
+        monkeypatch.delenv("SPECIFY_FEATURE_DIRECTORY", raising=False)
+        result = CliRunner().invoke(app, ["feature", "context", "--json", "--require-tasks"])
+
+        assert result.exit_code == 1
+        assert "tasks.md not found" in result.output
+
+
+# ── Bash wrappers ─────────────────────────────────────────────────────────
+
+
+def _native_specify_env(tmp_path: Path) -> dict[str, str]:
+    """A ``specify`` on PATH that runs this checkout's CLI and logs each call."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "specify-calls.log"
+    shim = bin_dir / "specify"
+    shim.write_text(
+        "#!/usr/bin/env bash\n"
+        f'echo "$*" >> "{log}"\n'
+        f'PYTHONPATH="{PROJECT_ROOT / "src"}" exec "{sys.executable}" '
+        '-c "import sys; from specify_cli import main; sys.argv[0] = \'specify\'; main()" "$@"\n',
+        encoding="utf-8",
+    )
+    shim.chmod(0o755)
+    env = _clean_env()
+    env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
+    env["SPECKIT_NATIVE_CLI"] = "1"
+    return env
+
+
+def _install_check_prereqs(repo: Path) -> Path:
+    d = repo / ".specify" / "scripts" / "bash"
+    d.mkdir(parents=True, exist_ok=True)
+    shutil.copy(COMMON_SH, d / "common.sh")
+    shutil.copy(CHECK_PREREQS_SH, d / "check-prerequisites.sh")
+    return d / "check-prerequisites.sh"
+
+
+def _run(script: Path, repo: Path, env: dict[str, str], *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["bash", str(script), *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+
+
+@requires_bash
+def test_check_prerequisites_matches_shell_implementation(feature_repo: Path, tmp_path: Path) -> None:
+    script = _install_check_prereqs(feature_repo)
+    native_env = _native_specify_env(tmp_path)
+    shell_env = dict(native_env, SPECKIT_NATIVE_CLI="0")
+
+    for args in (["--json"], ["--json", "--paths-only"], ["--paths-only"], []):
+        native = _run(script, feature_repo, native_env, *args)
+        shell = _run(script, feature_repo, shell_env, *args)
+        assert native.returncode == shell.returncode == 0, native.stderr + shell.stderr
+        assert native.stdout == shell.stdout
+
+    calls = (tmp_path / "specify-calls.log").read_text(encoding="utf-8").splitlines()
+    assert len(calls) == 4
+    assert all(call.startswith("feature context --shell") for call in calls)
+
+
+@requires_bash
+def test_check_prerequisites_uses_shell_implementation_by_default(
+    feature_repo: Path, tmp_path: Path
+) -> None:
+    script = _install_check_prereqs(feature_repo)
+    env = _native_specify_env(tmp_path)
+    del env["SPECKIT_NATIVE_CLI"]
+
+    result = _run(script, feature_repo, env, "--json")
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout)["FEATURE_DIR"]
+    assert not (tmp_path / "specify-calls.log").exists()
+
+
+@requires_bash
+def test_check_prerequisites_native_stderr_is_not_evaluated(
+    feature_repo: Path, tmp_path: Path
+) -> None:
+    script = _install_check_prereqs(feature_repo)
+    env = _native_specify_env(tmp_path)
+    shim = tmp_path / "bin" / "specify"
+    marker = tmp_path / "evaluated"
+    shim.write_text(
+        shim.read_text(encoding="utf-8").replace(
+            "PYTHONPATH=", f"echo 'touch {marker}' >&2\nPYTHONPATH=", 1
+        ),
+        encoding="utf-8",
+    )
+
+    result = _run(script, feature_repo, env, "--json")
+
+    assert result.returncode == 0, result.stderr
+    assert f"touch {marker}" in result.stderr
+    assert not marker.exists()
+
+
+@requires_bash
+def test_check_prerequisites_native_errors_use_invoke_separator(
+    feature_repo: Path, tmp_path: Path
+) -> None:
+    script = _install_check_prereqs(feature_repo)
+
+    result = _run(script, feature_repo, _native_specify_env(tmp_path), "--json", "--require-tasks")
+
+    assert result.returncode == 1
+    assert "tasks.md not found" in result.stderr
+    assert "/speckit-tasks" in result.stderr
+
+
+@requires_bash
+def test_check_prerequisites_native_reports_missing_feature(tmp_path: Path) -> None:
+    repo = tmp_path / "proj"
+    (repo / ".specify").mkdir(parents=True)
+    script = _install_check_prereqs(repo)
+
+    result = _run(script, repo, _native_specify_env(tmp_path), "--json")
+
+    assert result.returncode == 1
+    assert "Feature directory not found" in result.stderr
@@ -0,0 +1,217 @@
+"""Tests for the parsed-manifest cache (``specify_cli.manifest_cache``)."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+
+def _extension_manifest(ext_id: str = "test-ext", command: str = "speckit.test-ext.hello") -> dict:
+    return {
+        "schema_version": "1.0",
+        "extension": {
+            "id": ext_id,
+            "name": "Test Extension",
+            "version": "1.0.0",
+            "description": "A test extension",
+        },
+        "requires": {"speckit_version": ">=0.1.0"},
+        "provides": {"commands": [{"name": command, "file": "commands/hello.md"}]},
+    }
+
+
+def _preset_manifest() -> dict:
+    return {
+        "schema_version": "1.0",
+        "preset": {
+            "id": "test-preset",
+            "name": "Test Preset",
+            "version": "1.0.0",
+            "description": "A test preset",
+        },
+        "requires": {"speckit_version": ">=0.1.0"},
+        "provides": {
+            "templates": [
+                {"type": "template", "name": "spec-template", "file": "templates/spec.md", "strategy": "Append"}
+            ]
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_memory():
+    from specify_cli import manifest_cache
+
+    manifest_cache._MEMORY.clear()
+    yield
+    manifest_cache._MEMORY.clear()
+
+
+def _write(path: Path, data: dict, age_s: int = 60) -> Path:
+    """Write *data* as YAML with an mtime *age_s* seconds in the past."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    past = path.stat().st_mtime_ns - age_s * 1_000_000_000
+    os.utime(path, ns=(past, past))
+    return path
+
+
+@pytest.fixture
+def ext_manifest(tmp_path: Path) -> Path:
+    return _write(tmp_path / ".specify" / "extensions" / "test-ext" / "extension.yml", _extension_manifest())
+
+
+def _count_parses(module: str):
+    from specify_cli import manifest_cache
+
+    return patch(f"{module}.safe_load", side_effect=manifest_cache.safe_load)
+
+
+class TestExtensionManifestCache:
+    def test_second_load_skips_parsing(self, ext_manifest):
+        from specify_cli.extensions import ExtensionManifest
+
+        with _count_parses("specify_cli.extensions") as parse:
+            first = ExtensionManifest(ext_manifest)
+            second = ExtensionManifest(ext_manifest)
+
+        assert parse.call_count == 1
+        assert second.data == first.data
+        assert second.id == "test-ext"
+
+    def test_cache_file_is_reused_across_processes(self, ext_manifest, tmp_path):
+        from specify_cli import manifest_cache
+        from specify_cli.extensions import ExtensionManifest
+
+        ExtensionManifest(ext_manifest)
+        cache_files = list((tmp_path / ".specify" / "cache" / "manifests").glob("extension-*.json"))
+        assert len(cache_files) == 1
+        # Entries are machine-specific; keep them out of committed .specify/ trees.
+        assert (tmp_path / ".specify" / "cache" / ".gitignore").read_text(encoding="utf-8").splitlines()[-1] == "*"
+
+        manifest_cache._MEMORY.clear()  # as in a fresh process
+        with _count_parses("specify_cli.extensions") as parse:
+            manifest = ExtensionManifest(ext_manifest)
+        assert parse.call_count == 0
+        assert manifest.commands[0]["name"] == "speckit.test-ext.hello"
+
+    def test_edit_with_same_stamp_is_detected(self, tmp_path):
+        from specify_cli.extensions import ExtensionManifest
+
+        # Freshly written: mtime is within the racy window of the cache entry.
+        path = tmp_path / ".specify" / "extensions" / "test-ext" / "extension.yml"
+        path.parent.mkdir(parents=True)
+        path.write_text(yaml.safe_dump(_extension_manifest()), encoding="utf-8")
+        ExtensionManifest(path)
+
+        st = path.stat()
+        edited = _extension_manifest(command="speckit.test-ext.howdy")
+        path.write_text(yaml.safe_dump(edited), encoding="utf-8")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert path.stat().st_size == st.st_size
+
+        assert ExtensionManifest(path).commands[0]["name"] == "speckit.test-ext.howdy"
+
+    def test_changed_manifest_is_reparsed(self, ext_manifest):
+        from specify_cli.extensions import ExtensionManifest
+
+        ExtensionManifest(ext_manifest)
+        _write(ext_manifest, _extension_manifest(command="speckit.test-ext.greetings"), age_s=30)
+
+        assert ExtensionManifest(ext_manifest).commands[0]["name"] == "speckit.test-ext.greetings"
+
+    def test_touched_manifest_reuses_entry(self, ext_manifest):
+        from specify_cli.extensions import ExtensionManifest
+
+        ExtensionManifest(ext_manifest)
+        os.utime(ext_manifest)
+        with _count_parses("specify_cli.extensions") as parse:
+            ExtensionManifest(ext_manifest)
+        assert parse.call_count == 0
+
+    def test_warnings_and_normalization_are_cached(self, tmp_path):
+        from specify_cli.extensions import ExtensionManifest
+
+        path = _write(
+            tmp_path / ".specify" / "extensions" / "test-ext" / "extension.yml",
+            _extension_manifest(command="test-ext.hello"),
+        )
+        first = ExtensionManifest(path)
+        with _count_parses("specify_cli.extensions") as parse:
+            second = ExtensionManifest(path)
+
+        assert parse.call_count == 0
+        assert second.commands[0]["name"] == "speckit.test-ext.hello"
+        assert second.commands[0]["aliases"] == []
+        assert second.warnings == first.warnings
+        assert len(second.warnings) == 1
+
+    def test_returned_data_is_a_copy(self, ext_manifest):
+        from specify_cli.extensions import ExtensionManifest
+
+        ExtensionManifest(ext_manifest).data["extension"]["name"] = "mutated"
+
+        assert ExtensionManifest(ext_manifest).name == "Test Extension"
+
+    def test_invalid_manifest_is_not_cached(self, tmp_path):
+        from specify_cli.extensions import ExtensionManifest, ValidationError
+
+        data = _extension_manifest()
+        del data["requires"]
+        path = _write(tmp_path / ".specify" / "extensions" / "test-ext" / "extension.yml", data)
+
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="Missing required field: requires"):
+                ExtensionManifest(path)
+        assert not (tmp_path / ".specify" / "cache" / "manifests").exists()
+
+    def test_manifest_outside_project_is_not_written(self, tmp_path):
+        from specify_cli.extensions import ExtensionManifest
+
+        path = _write(tmp_path / "pkg" / "extension.yml", _extension_manifest())
+        ExtensionManifest(path)
+
+        assert not any(tmp_path.rglob("cache"))
+
+    def test_non_json_values_are_not_cached(self, tmp_path):
+        from specify_cli.extensions import ExtensionManifest
+
+        path = tmp_path / ".specify" / "extensions" / "test-ext" / "extension.yml"
+        _write(path, _extension_manifest())
+        path.write_text(path.read_text(encoding="utf-8") + "released: 2024-01-01\n", encoding="utf-8")
+
+        ExtensionManifest(path)
+        with _count_parses("specify_cli.extensions") as parse:
+            manifest = ExtensionManifest(path)
+        assert parse.call_count == 1
+        assert str(manifest.data["released"]) == "2024-01-01"
+
+    def test_missing_manifest_raises(self, tmp_path):
+        from specify_cli.extensions import ExtensionManifest, ValidationError
+
+        with pytest.raises(ValidationError, match="Manifest not found"):
+            ExtensionManifest(tmp_path / ".specify" / "extensions" / "x" / "extension.yml")
+
+
+class TestPresetManifestCache:
+    def test_second_load_skips_parsing(self, tmp_path):
+        from specify_cli.presets import PresetManifest
+
+        path = _write(tmp_path / ".specify" / "presets" / "test-preset" / "preset.yml", _preset_manifest())
+        PresetManifest(path)
+        with _count_parses("specify_cli.presets") as parse:
+            manifest = PresetManifest(path)
+
+        assert parse.call_count == 0
+        assert manifest.templates[0]["strategy"] == "append"
+        assert list((tmp_path / ".specify" / "cache" / "manifests").glob("preset-*.json"))
+
+
+def test_safe_load_prefers_libyaml():
+    from specify_cli import manifest_cache
+
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert manifest_cache.SafeLoader is expected
+    assert manifest_cache.safe_load("a: [1, 2]\n") == {"a": [1, 2]}
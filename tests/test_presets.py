@@ -468,18 +468,21 @@ class TestPresetRegistry:
         assert stored["version"] == "1.0.0"
         assert stored["nested"]["key"] == "original"
 
-    def test_get_returns_deep_copy(self, temp_dir):
-        """Test that get() returns a deep copy to prevent mutation."""
+    def test_get_returns_read_only_view(self, temp_dir):
+        """Test that get() returns a read-only view to prevent mutation."""
         packs_dir = temp_dir / "packs"
         packs_dir.mkdir()
         registry = PresetRegistry(packs_dir)
 
         registry.add("test-pack", {"version": "1.0.0", "nested": {"key": "original"}})
 
-        # Get and mutate the returned copy
+        # Mutating the returned view is rejected
         metadata = registry.get("test-pack")
-        metadata["version"] = "MUTATED"
-        metadata["nested"]["key"] = "MUTATED"
+        with pytest.raises(TypeError):
+            metadata["version"] = "MUTATED"
+        with pytest.raises(TypeError):
+            metadata["nested"]["key"] = "MUTATED"
+        dict(metadata)["version"] = "MUTATED"
 
         # Original should be unchanged
         fresh = registry.get("test-pack")
@@ -505,18 +508,20 @@ class TestPresetRegistry:
         # Non-existent should also return None
         assert registry.get("nonexistent") is None
 
-    def test_list_returns_deep_copy(self, temp_dir):
-        """Test that list() returns deep copies to prevent mutation."""
+    def test_list_returns_read_only_views(self, temp_dir):
+        """Test that list() returns read-only views to prevent mutation."""
         packs_dir = temp_dir / "packs"
         packs_dir.mkdir()
         registry = PresetRegistry(packs_dir)
 
         registry.add("test-pack", {"version": "1.0.0", "nested": {"key": "original"}})
 
-        # Get list and mutate
+        # Mutating the listed views is rejected
         all_packs = registry.list()
-        all_packs["test-pack"]["version"] = "MUTATED"
-        all_packs["test-pack"]["nested"]["key"] = "MUTATED"
+        with pytest.raises(TypeError):
+            all_packs["test-pack"]["version"] = "MUTATED"
+        with pytest.raises(TypeError):
+            all_packs["test-pack"]["nested"]["key"] = "MUTATED"
 
         # Original should be unchanged
         fresh = registry.get("test-pack")
@@ -1033,6 +1038,41 @@ class TestPresetResolver:
         result = resolver.resolve("hidden-template")
         assert result is None
 
+    def test_resolution_index_scans_registries_once(self, project_dir, pack_dir):
+        """Repeated lookups on one resolver reuse its resolution index."""
+        from unittest.mock import patch
+
+        PresetManager(project_dir).install_from_directory(pack_dir, "0.1.5")
+        resolver = PresetResolver(project_dir)
+
+        with patch.object(
+            PresetRegistry, "list_by_priority", autospec=True,
+            side_effect=PresetRegistry.list_by_priority,
+        ) as listed:
+            for _ in range(3):
+                assert "Custom Spec Template" in resolver.resolve("spec-template").read_text()
+                assert resolver.collect_all_layers("spec-template")[0]["source"].startswith("test-pack")
+                assert resolver.resolve_with_source("spec-template")["source"] == "test-pack v1.0.0"
+
+        assert listed.call_count == 1
+
+    def test_resolution_index_invalidated_by_tier_changes(self, project_dir, pack_dir):
+        resolver = PresetResolver(project_dir)
+        assert "Core Spec Template" in resolver.resolve("spec-template").read_text()
+
+        manager = PresetManager(project_dir)
+        manager.install_from_directory(pack_dir, "0.1.5")
+        assert "Custom Spec Template" in resolver.resolve("spec-template").read_text()
+
+        overrides_dir = project_dir / ".specify" / "templates" / "overrides"
+        overrides_dir.mkdir(parents=True)
+        (overrides_dir / "spec-template.md").write_text("# Override\n")
+        assert resolver.resolve_with_source("spec-template")["source"] == "project override"
+
+        (overrides_dir / "spec-template.md").unlink()
+        manager.remove("test-pack")
+        assert "Core Spec Template" in resolver.resolve("spec-template").read_text()
+
 
 class TestResolveCore:
     """Test PresetResolver.resolve_core() skips the installed-presets tier."""
@@ -1960,7 +2000,7 @@ class TestPresetCatalog:
         release_response.__exit__ = MagicMock(return_value=False)
 
         asset_response = MagicMock()
-        asset_response.read.return_value = zip_bytes
+        asset_response.read.side_effect = [zip_bytes, b""]
         asset_response.__enter__ = lambda s: s
         asset_response.__exit__ = MagicMock(return_value=False)
 
@@ -2008,7 +2048,7 @@ class TestPresetCatalog:
         zip_bytes = zip_buf.getvalue()
 
         asset_response = MagicMock()
-        asset_response.read.return_value = zip_bytes
+        asset_response.read.side_effect = [zip_bytes, b""]
         asset_response.__enter__ = lambda s: s
         asset_response.__exit__ = MagicMock(return_value=False)
 
@@ -2312,6 +2352,19 @@ class TestPresetCatalogMultiCatalog:
         with pytest.raises(PresetValidationError, match="Invalid priority"):
             catalog._load_catalog_config(config_path)
 
+    def test_load_catalog_config_rejects_max_stale(self, project_dir):
+        """Only extension catalogs serve stale caches; don't silently ignore it."""
+        config_path = project_dir / ".specify" / "preset-catalogs.yml"
+        config_path.write_text(yaml.dump({
+            "catalogs": [
+                {"name": "farm", "url": "https://example.com/catalog.json", "max_stale": 3600}
+            ]
+        }))
+
+        catalog = PresetCatalog(project_dir)
+        with pytest.raises(PresetValidationError, match="max_stale is not supported"):
+            catalog._load_catalog_config(config_path)
+
     def test_load_catalog_config_rejects_boolean_priority(self, project_dir):
         """A YAML ``priority: true`` is a typo, not a request for priority 1.
 
@@ -5293,6 +5346,61 @@ class TestResolveContent:
         # Core should come first, appended after
         assert content.index("Core Spec Template") < content.index("Appended Section")
 
+    def _install_append_pack(self, project_dir, temp_dir, valid_pack_data):
+        pack_data = {**valid_pack_data}
+        pack_data["preset"] = {**valid_pack_data["preset"], "id": "append-pack", "name": "Append"}
+        pack_data["provides"] = {
+            "templates": [{
+                "type": "template",
+                "name": "spec-template",
+                "file": "templates/spec-template.md",
+                "strategy": "append",
+            }]
+        }
+        pack_dir = temp_dir / "append-pack"
+        pack_dir.mkdir()
+        with open(pack_dir / "preset.yml", 'w') as f:
+            yaml.dump(pack_data, f)
+        (pack_dir / "templates").mkdir()
+        (pack_dir / "templates" / "spec-template.md").write_text("## Appended Section\n")
+        PresetManager(project_dir).install_from_directory(pack_dir, "0.1.5")
+        return project_dir / ".specify" / "presets" / "append-pack" / "templates" / "spec-template.md"
+
+    def test_resolve_content_composes_unchanged_stack_once(self, project_dir, temp_dir, valid_pack_data):
+        """Composed content is memoized by layer paths, mtimes, sizes and strategies."""
+        from unittest.mock import patch
+
+        layer = self._install_append_pack(project_dir, temp_dir, valid_pack_data)
+
+        with patch.object(
+            PresetResolver, "_compose_layers", autospec=True,
+            side_effect=PresetResolver._compose_layers,
+        ) as compose:
+            first = PresetResolver(project_dir).resolve_content("spec-template")
+            second = PresetResolver(project_dir).resolve_content("spec-template")
+            assert compose.call_count == 1
+            assert first == second
+
+            layer.write_text("## Appended Section, revised\n")
+            revised = PresetResolver(project_dir).resolve_content("spec-template")
+            assert compose.call_count == 2
+            assert "revised" in revised
+
+    def test_resolve_content_disk_cache(self, project_dir, temp_dir, valid_pack_data):
+        from unittest.mock import patch
+        from specify_cli import presets as presets_module
+
+        self._install_append_pack(project_dir, temp_dir, valid_pack_data)
+        content = PresetResolver(project_dir, cache_composed=True).resolve_content("spec-template")
+        cache_dir = project_dir / ".specify" / "cache" / "composed"
+        assert [f.read_text() for f in cache_dir.iterdir()] == [content]
+
+        # A new process (empty memory cache) reuses the on-disk result.
+        presets_module._COMPOSED_CONTENT_CACHE.clear()
+        with patch.object(PresetResolver, "_compose_layers", side_effect=AssertionError):
+            resolver = PresetResolver(project_dir, cache_composed=True)
+            assert resolver.resolve_content("spec-template") == content
+
     def test_resolve_content_prepend_strategy(self, project_dir, temp_dir, valid_pack_data):
         """Test resolve_content with prepend strategy."""
         pack_data = {**valid_pack_data}
@@ -5707,6 +5815,70 @@ class TestCollectAllLayers:
         assert layers[1]["strategy"] == "replace"
 
 
+class TestScriptResolveEntryPoint:
+    """Test the single-process resolver used by the shell scripts."""
+
+    def test_prints_resolved_path(self, project_dir, capsys):
+        from specify_cli.presets.resolve import main
+
+        assert main(["spec-template", "--root", str(project_dir)]) == 0
+        out = capsys.readouterr().out
+        expected = project_dir / ".specify" / "templates" / "spec-template.md"
+        assert out == f"{expected}\n"
+
+    def test_prints_composed_content(self, project_dir, temp_dir, valid_pack_data, capsys):
+        from specify_cli.presets.resolve import main
+
+        TestResolveContent()._install_append_pack(project_dir, temp_dir, valid_pack_data)
+
+        assert main(["spec-template", "--root", str(project_dir), "--content"]) == 0
+        out = capsys.readouterr().out
+        assert out == PresetResolver(project_dir).resolve_content("spec-template")
+        assert out.index("Core Spec Template") < out.index("Appended Section")
+        # Script lookups must not write composed results into the project.
+        assert not (project_dir / ".specify" / "cache" / "composed").exists()
+
+    def test_not_found_exits_one(self, project_dir, capsys):
+        from specify_cli.presets.resolve import main
+
+        assert main(["nonexistent", "--root", str(project_dir)]) == 1
+        assert main(["nonexistent", "--root", str(project_dir), "--content"]) == 1
+        assert capsys.readouterr().out == ""
+
+    def test_project_only_ignores_bundled_core(self, project_dir, temp_dir, capsys):
+        from unittest.mock import patch
+        from specify_cli.presets.resolve import main
+
+        core_pack = temp_dir / "core_pack"
+        (core_pack / "templates").mkdir(parents=True)
+        (core_pack / "templates" / "bundled-only.md").write_text("# Bundled\n")
+
+        args = ["bundled-only", "--root", str(project_dir)]
+        with patch("specify_cli._locate_core_pack", return_value=core_pack):
+            assert main(args) == 0
+            assert main(args + ["--content"]) == 0
+            capsys.readouterr()
+            assert main(args + ["--project-only"]) == 1
+            assert main(args + ["--project-only", "--content"]) == 1
+        assert capsys.readouterr().out == ""
+
+    def test_cli_command(self, project_dir):
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        result = CliRunner().invoke(
+            app, ["resolve", "spec-template", "--root", str(project_dir), "--content"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Core Spec Template" in result.output
+
+        result = CliRunner().invoke(
+            app, ["resolve", "nonexistent", "--root", str(project_dir)]
+        )
+        assert result.exit_code == 1
+        assert result.output == ""
+
+
 class TestRemoveReconciliation:
     """Test that removing a preset re-registers the next layer's command."""
 
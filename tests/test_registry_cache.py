@@ -0,0 +1,231 @@
+"""Tests for the per-process registry cache (``specify_cli.registry_cache``)."""
+
+import copy
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+
+def _count_writes():
+    from specify_cli import registry_cache
+
+    return patch.object(registry_cache, "store_json", side_effect=registry_cache.store_json)
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Move *path*'s mtime into the past, out of the racy window."""
+    past = path.stat().st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+class TestLoad:
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        from specify_cli import registry_cache
+
+        path = tmp_path / "data.json"
+        path.write_text('{"a": [1]}', encoding="utf-8")
+        _age(path)
+        calls = []
+
+        def parse(raw):
+            calls.append(raw)
+            return json.loads(raw)
+
+        first = registry_cache.load(path, parse)
+        second = registry_cache.load(path, parse)
+
+        assert len(calls) == 1
+        assert second is first
+        assert first == {"a": [1]}
+
+    def test_same_stamp_edit_is_detected(self, tmp_path):
+        from specify_cli import registry_cache
+
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}', encoding="utf-8")
+        st = path.stat()
+        registry_cache.load(path, json.loads)
+
+        path.write_text('{"a": 2}', encoding="utf-8")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert registry_cache.load(path, json.loads) == {"a": 2}
+
+    def test_missing_file_raises(self, tmp_path):
+        from specify_cli import registry_cache
+
+        with pytest.raises(FileNotFoundError):
+            registry_cache.load(tmp_path / "missing.json", json.loads)
+
+    def test_views_are_read_only_and_thaw_to_plain_copies(self):
+        from specify_cli.registry_cache import freeze, thaw
+
+        view = freeze({"a": [1, {"b": 2}]})
+
+        with pytest.raises(TypeError):
+            view["a"].append(3)
+        with pytest.raises(TypeError):
+            view["a"][1]["b"] = 3
+        for plain in (thaw(view), copy.deepcopy(view)):
+            plain["a"][1]["b"] = 3
+            assert type(plain) is dict and type(plain["a"]) is list
+        assert view == {"a": [1, {"b": 2}]}
+        assert json.loads(json.dumps(view)) == view
+        assert yaml.safe_load(yaml.safe_dump(view)) == view
+
+
+class TestRegistrySharing:
+    def test_registries_share_snapshot(self, tmp_path):
+        from specify_cli.extensions import ExtensionRegistry
+
+        ExtensionRegistry(tmp_path).add("ext", {"version": "1.0.0"})
+
+        assert ExtensionRegistry(tmp_path).get("ext") is ExtensionRegistry(tmp_path).get("ext")
+
+    def test_external_change_is_reloaded(self, tmp_path):
+        from specify_cli.extensions import ExtensionRegistry
+
+        ExtensionRegistry(tmp_path).add("ext", {"version": "1.0.0"})
+        path = tmp_path / ".registry"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["extensions"]["ext"]["version"] = "2.0.0-beta"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert ExtensionRegistry(tmp_path).get("ext")["version"] == "2.0.0-beta"
+
+    def test_unsaved_data_changes_are_visible(self, tmp_path):
+        from specify_cli.presets import PresetRegistry
+
+        registry = PresetRegistry(tmp_path)
+        registry.data["presets"]["pack"] = {"version": "1.0.0"}
+
+        assert registry.get("pack") == {"version": "1.0.0"}
+        assert PresetRegistry(tmp_path).get("pack") is None
+
+    def test_list_by_priority_normalizes_without_copying(self, tmp_path):
+        from specify_cli.extensions import ExtensionRegistry
+
+        registry = ExtensionRegistry(tmp_path)
+        registry.add("ok", {"priority": 5})
+        registry.add("legacy", {"version": "1.0.0"})
+
+        result = dict(registry.list_by_priority())
+
+        assert result["ok"] is registry.get("ok")
+        assert result["legacy"]["priority"] == 10
+        assert "priority" not in registry.get("legacy")
+
+    def test_step_registry_get_is_read_only(self, tmp_path):
+        from specify_cli.workflows.catalog import StepRegistry
+
+        registry = StepRegistry(tmp_path)
+        registry.add("my-step", {"name": "My Step"})
+
+        with pytest.raises(TypeError):
+            StepRegistry(tmp_path).get("my-step")["name"] = "changed"
+        assert StepRegistry(tmp_path).get("my-step")["name"] == "My Step"
+
+
+class TestBatch:
+    def test_batch_writes_once(self, tmp_path):
+        from specify_cli.extensions import ExtensionRegistry
+
+        registry = ExtensionRegistry(tmp_path)
+        with _count_writes() as writes:
+            with registry.batch():
+                registry.add("ext", {"version": "1.0.0"})
+                registry.update("ext", {"enabled": False})
+                registry.update("ext", {"priority": 3})
+                assert not (tmp_path / ".registry").exists()
+                # Pending state is visible to other registries in this process.
+                assert ExtensionRegistry(tmp_path).get("ext")["priority"] == 3
+
+        assert writes.call_count == 1
+        stored = json.loads((tmp_path / ".registry").read_text(encoding="utf-8"))
+        assert stored["extensions"]["ext"]["enabled"] is False
+        assert stored["extensions"]["ext"]["priority"] == 3
+
+    def test_batch_saves_on_error(self, tmp_path):
+        from specify_cli.workflows.catalog import WorkflowRegistry
+
+        registry = WorkflowRegistry(tmp_path)
+        with pytest.raises(RuntimeError):
+            with registry.batch():
+                registry.add("wf", {"name": "Workflow"})
+                raise RuntimeError("boom")
+
+        assert WorkflowRegistry(tmp_path).is_installed("wf")
+        assert (tmp_path / ".specify" / "workflows" / "workflow-registry.json").exists()
+
+    def test_preset_install_writes_registry_once(self, tmp_path):
+        from specify_cli.presets import PresetManager
+
+        project = tmp_path / "project"
+        (project / ".specify").mkdir(parents=True)
+        pack = tmp_path / "pack"
+        (pack / "templates").mkdir(parents=True)
+        (pack / "templates" / "spec-template.md").write_text("# Spec\n", encoding="utf-8")
+        (pack / "preset.yml").write_text(
+            yaml.safe_dump(
+                {
+                    "schema_version": "1.0",
+                    "preset": {
+                        "id": "test-pack",
+                        "name": "Test Pack",
+                        "version": "1.0.0",
+                        "description": "A test preset",
+                    },
+                    "requires": {"speckit_version": ">=0.1.0"},
+                    "provides": {
+                        "templates": [
+                            {"type": "template", "name": "spec-template", "file": "templates/spec-template.md"}
+                        ]
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        manager = PresetManager(project)
+        with _count_writes() as writes:
+            manager.install_from_directory(pack, "0.1.5")
+
+        assert writes.call_count == 1
+        assert manager.registry.get("test-pack")["registered_skills"] == []
+
+
+class TestHookConfig:
+    def test_project_config_is_parsed_once_and_copied(self, tmp_path):
+        from specify_cli import extensions
+        from specify_cli.extensions import HookExecutor
+
+        config_file = tmp_path / ".specify" / "extensions.yml"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text(
+            yaml.safe_dump({"hooks": {"after_tasks": [{"extension": "ext", "command": "x"}]}}),
+            encoding="utf-8",
+        )
+        executor = HookExecutor(tmp_path)
+
+        with patch.object(extensions, "safe_load", side_effect=extensions.safe_load) as parse:
+            first = executor.get_project_config()
+            first["hooks"]["after_tasks"][0]["enabled"] = False
+            second = HookExecutor(tmp_path).get_project_config()
+
+        assert parse.call_count == 1
+        assert "enabled" not in second["hooks"]["after_tasks"][0]
+        assert second["installed"] == []
+
+    def test_saved_project_config_is_reloaded(self, tmp_path):
+        from specify_cli.extensions import HookExecutor
+
+        executor = HookExecutor(tmp_path)
+        config = executor.get_project_config()
+        config["installed"].append("ext")
+        executor.save_project_config(config)
+
+        assert executor.get_project_config()["installed"] == ["ext"]
@@ -355,7 +355,7 @@ class TestBareUpgradeUvTool:
     """uv-tool happy path, bare invocation."""
 
     def test_happy_path_end_to_end(self, uv_tool_argv0, clean_environ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -378,7 +378,7 @@ class TestBareUpgradeUvTool:
     def test_one_user_action_no_prompt(self, uv_tool_argv0, clean_environ):
         # The single `invoke` represents the single user action — no prompt.
         # If a prompt existed, runner.invoke would hang waiting for input.
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -398,7 +398,7 @@ class TestAlreadyLatestUvTool:
     def test_already_latest_exits_zero_no_subprocess(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -416,7 +416,7 @@ class TestAlreadyLatestUvTool:
         # Version("1.0") == Version("1.0.0") under packaging even though their
         # canonical strings differ. The no-op message must use Version equality
         # so this prints "Already on latest release", not "... or newer".
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -433,7 +433,7 @@ class TestAlreadyLatestUvTool:
     def test_dev_build_ahead_of_release_reports_newer_noop(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -448,7 +448,7 @@ class TestAlreadyLatestUvTool:
     def test_unparseable_current_version_does_not_false_noop(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -469,7 +469,7 @@ class TestAlreadyLatestUvTool:
     def test_unparseable_resolved_target_fails_before_literal_noop(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -526,7 +526,7 @@ class TestDryRunUvTool:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -545,7 +545,7 @@ class TestDryRunUvTool:
 
     def test_dry_run_with_tag_skips_network(self, uv_tool_argv0, clean_environ):
         # --dry-run with --tag must NOT hit the network.
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ), patch("specify_cli._version.shutil.which", return_value="uv"), patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -561,7 +561,7 @@ class TestDryRunUvTool:
     def test_dry_run_rejects_unparseable_network_tag_before_preview(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -581,7 +581,7 @@ class TestDryRunUvTool:
     def test_dry_run_with_missing_uv_flags_unresolved_installer(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value=None
@@ -799,7 +799,7 @@ class TestEditableInstallMetadata:
 
 class TestTagValidationWhitespace:
     def test_tag_whitespace_is_trimmed_before_validation(self, uv_tool_argv0, clean_environ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -839,7 +839,7 @@ class TestBareUpgradePipx:
     """pipx happy path."""
 
     def test_happy_path(self, pipx_argv0, clean_environ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="pipx"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -875,7 +875,7 @@ class TestDetectionShortCircuit:
 
 class TestDryRunPipx:
     def test_dry_run_preview_names_pipx(self, pipx_argv0, clean_environ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="pipx"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -24,7 +24,7 @@ class TestInstallerMissing:
 
     def test_uv_missing_exits_3(self, uv_tool_argv0, clean_environ):
         which_results = {"specify": "/usr/local/bin/specify"}
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda n: which_results.get(n)
         ), patch("specify_cli._version._get_installed_version", return_value="0.7.5"):
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
@@ -36,7 +36,7 @@ class TestInstallerMissing:
 
     def test_pipx_missing_exits_3(self, pipx_argv0, clean_environ):
         which_results = {}
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda n: which_results.get(n)
         ), patch("specify_cli._version._get_installed_version", return_value="0.7.5"):
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
@@ -51,7 +51,7 @@ class TestInstallerMissing:
         fake_uv.parent.mkdir()
         fake_uv.write_text("#!/bin/sh\n")
         fake_uv.chmod(0o755)
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -82,7 +82,7 @@ class TestInstallerMissing:
         fake_uv.write_text("#!/bin/sh\n")
         fake_uv.chmod(0o755)
         monkeypatch.chdir(tmp_path)
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -112,7 +112,7 @@ class TestInstallerMissing:
         self, monkeypatch, uv_tool_argv0, clean_environ, tmp_path
     ):
         monkeypatch.chdir(tmp_path)
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version._get_installed_version", return_value="0.7.5"), patch(
             "specify_cli._version._assemble_installer_argv",
@@ -148,7 +148,7 @@ class TestInstallerMissing:
             fake_uv.unlink()
             raise FileNotFoundError(str(fake_uv))
 
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which",
             side_effect=lambda name: str(fake_uv) if name == "uv" else None,
         ), patch("specify_cli._version.subprocess.run", side_effect=fake_run), patch(
@@ -170,7 +170,7 @@ class TestInstallerMissing:
         fake_uv.parent.mkdir()
         fake_uv.write_text("#!/bin/sh\n")
         fake_uv.chmod(0o644)
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version.os.access", return_value=False), patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -202,7 +202,7 @@ class TestInstallerMissing:
         fake_uv.write_text("#!/bin/sh\n")
         fake_uv.chmod(0o644)
         monkeypatch.chdir(tmp_path)
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version.os.access", return_value=False), patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -232,7 +232,7 @@ class TestInstallerMissing:
     def test_real_installer_exit_126_is_not_treated_as_invalid_path(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -249,7 +249,7 @@ class TestInstallerMissing:
         self, uv_tool_argv0, clean_environ, tmp_path
     ):
         fake_uv = tmp_path / "missing-installer" / "uv"
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -281,7 +281,7 @@ class TestInstallerMissing:
         fake_uv.parent.mkdir()
         fake_uv.write_text("#!/usr/bin/env bash\n", encoding="utf-8")
         fake_uv.chmod(0o755)
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version._get_installed_version", return_value="0.7.5"), patch(
             "specify_cli._version._assemble_installer_argv",
@@ -308,7 +308,7 @@ class TestInstallerMissing:
     def test_bare_invalid_installer_message_does_not_call_it_a_path(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version._get_installed_version", return_value="0.7.5"), patch(
             "specify_cli._version._assemble_installer_argv",
@@ -341,7 +341,7 @@ class TestInstallerMissing:
         fake_uv.write_text("#!/usr/bin/env bash\n", encoding="utf-8")
         fake_uv.chmod(0o755)
         invalid_error = OSError(errno.ENOEXEC, "Exec format error")
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version._get_installed_version", return_value="0.7.5"), patch(
             "specify_cli._version._assemble_installer_argv",
@@ -370,7 +370,7 @@ class TestInstallerMissing:
         fake_uv.write_text("#!/usr/bin/env bash\n", encoding="utf-8")
         fake_uv.chmod(0o755)
         transient_error = OSError(errno.EMFILE, "Too many open files")
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", side_effect=lambda name: None
         ), patch("specify_cli._version._get_installed_version", return_value="0.7.5"), patch(
             "specify_cli._version._assemble_installer_argv",
@@ -397,7 +397,7 @@ class TestInstallerFailed:
     """Installer non-zero exit → propagate code, print rollback hint."""
 
     def test_installer_exit_2_propagates(self, uv_tool_argv0, clean_environ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -420,7 +420,7 @@ class TestInstallerFailed:
         assert mock_run.call_count == 1
 
     def test_installer_exit_127_propagates(self, uv_tool_argv0, clean_environ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -434,7 +434,7 @@ class TestInstallerFailed:
         self, uv_tool_argv0, clean_environ, monkeypatch
     ):
         monkeypatch.setenv("SPECIFY_UPGRADE_TIMEOUT_SECS", "12")
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -453,7 +453,7 @@ class TestInstallerFailed:
         self, uv_tool_argv0, clean_environ, monkeypatch
     ):
         monkeypatch.setenv("SPECIFY_UPGRADE_TIMEOUT_SECS", "nan")
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -474,7 +474,7 @@ class TestInstallerFailed:
     def test_real_installer_exit_124_is_not_treated_as_timeout(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -488,7 +488,7 @@ class TestInstallerFailed:
         assert "Upgrade timed out while waiting for the installer subprocess." not in out
 
     def test_pipx_failure_prints_pipx_rollback_hint(self, pipx_argv0, clean_environ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="pipx"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -506,7 +506,7 @@ class TestInstallerFailed:
     def test_rollback_hint_accepts_normalizable_stable_snapshot(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="v0.7.5"
@@ -526,7 +526,7 @@ class TestInstallerFailed:
     def test_prerelease_failure_degrades_rollback_hint_to_releases_page(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="1.0.0rc1"
@@ -23,7 +23,7 @@ class TestUvxEphemeral:
         uvx_ephemeral_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run:
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
@@ -42,7 +42,7 @@ class TestUvxEphemeral:
         clean_environ,
     ):
         with patch(
-            "specify_cli.authentication.http.urllib.request.urlopen",
+            "specify_cli.authentication.http._urlopen",
             side_effect=AssertionError("non-upgradable uvx path must not hit network"),
         ):
             result = runner.invoke(app, ["self", "upgrade"])
@@ -65,7 +65,7 @@ class TestSourceCheckout:
 
         with patch("specify_cli._version._editable_marker_seen", return_value=True), patch(
             "specify_cli._version._source_checkout_path", return_value=fake_tree
-        ), patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        ), patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run:
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
@@ -85,7 +85,7 @@ class TestSourceCheckout:
     ):
         with patch("specify_cli._version._editable_marker_seen", return_value=True), patch(
             "specify_cli._version._source_checkout_path", return_value=None
-        ), patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        ), patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run:
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
@@ -109,7 +109,7 @@ class TestUnsupported:
     ):
         with patch("specify_cli._version._editable_marker_seen", return_value=False), patch(
             "specify_cli._version.shutil.which", return_value=None
-        ), patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        ), patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run:
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
@@ -136,7 +136,7 @@ class TestUnsupported:
         with patch("specify_cli._version._editable_marker_seen", return_value=False), patch(
             "specify_cli._version.shutil.which", return_value=None
         ), patch(
-            "specify_cli.authentication.http.urllib.request.urlopen",
+            "specify_cli.authentication.http._urlopen",
             side_effect=AssertionError("unsupported guidance should not require network"),
         ):
             result = runner.invoke(app, ["self", "upgrade"])
@@ -162,7 +162,7 @@ class TestDryRunNonUpgradablePaths:
         uvx_ephemeral_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen:
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen:
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
             result = runner.invoke(app, ["self", "upgrade", "--dry-run"])
         assert result.exit_code == 0
@@ -177,7 +177,7 @@ class TestDryRunNonUpgradablePaths:
     ):
         with patch("specify_cli._version._editable_marker_seen", return_value=False), patch(
             "specify_cli._version.shutil.which", return_value=None
-        ), patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen:
+        ), patch("specify_cli.authentication.http._urlopen") as mock_urlopen:
             mock_urlopen.return_value = mock_urlopen_response({"tag_name": "v0.7.6"})
             result = runner.invoke(app, ["self", "upgrade", "--dry-run"])
         assert result.exit_code == 0
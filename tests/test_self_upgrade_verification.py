@@ -32,7 +32,7 @@ class TestVerificationMismatch:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -55,7 +55,7 @@ class TestVerificationMismatch:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -77,7 +77,7 @@ class TestVerificationMismatch:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.9.0"
@@ -97,7 +97,7 @@ class TestVerificationMismatch:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -117,7 +117,7 @@ class TestVerificationMismatch:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -137,7 +137,7 @@ class TestVerificationMismatch:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="0.7.5"
@@ -277,7 +277,7 @@ class TestResolutionFailures:
 
     def test_offline_exits_1_with_phase1_string(self, uv_tool_argv0, clean_environ):
         with patch(
-            "specify_cli.authentication.http.urllib.request.urlopen",
+            "specify_cli.authentication.http._urlopen",
             side_effect=urllib.error.URLError("nope"),
         ):
             result = runner.invoke(app, ["self", "upgrade"])
@@ -292,7 +292,7 @@ class TestResolutionFailures:
             hdrs={},  # type: ignore[arg-type]
             fp=None,
         )
-        with patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=err):
+        with patch("specify_cli.authentication.http._urlopen", side_effect=err):
             result = runner.invoke(app, ["self", "upgrade"])
         assert result.exit_code == 1
         assert (
@@ -308,7 +308,7 @@ class TestResolutionFailures:
             hdrs={},  # type: ignore[arg-type]
             fp=None,
         )
-        with patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=err):
+        with patch("specify_cli.authentication.http._urlopen", side_effect=err):
             result = runner.invoke(app, ["self", "upgrade"])
         assert result.exit_code == 1
         assert "Upgrade aborted: HTTP 500" in strip_ansi(result.output)
@@ -337,7 +337,7 @@ class TestResolutionFailures:
             hdrs={},  # type: ignore[arg-type]
             fp=None,
         )
-        with patch("specify_cli.authentication.http.urllib.request.urlopen", side_effect=err):
+        with patch("specify_cli.authentication.http._urlopen", side_effect=err):
             result = runner.invoke(app, ["self", "upgrade"])
         assert result.exit_code == 1
         assert expected in strip_ansi(result.output)
@@ -345,7 +345,7 @@ class TestResolutionFailures:
     def test_unparseable_resolved_release_tag_exits_1_without_traceback(
         self, uv_tool_argv0, clean_environ
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.subprocess.run"
         ) as mock_run, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -480,7 +480,7 @@ class TestUnknownCurrent:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="unknown"
@@ -502,7 +502,7 @@ class TestUnknownCurrent:
         uv_tool_argv0,
         clean_environ,
     ):
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli._version.shutil.which", return_value="uv"
         ), patch("specify_cli._version.subprocess.run") as mock_run, patch(
             "specify_cli._version._get_installed_version", return_value="unknown"
@@ -529,7 +529,7 @@ class TestTokenScrubbing:
         monkeypatch.setenv("GITHUB_TOKEN", SENTINEL_GITHUB_TOKEN)
         response = mock_urlopen_response({"tag_name": "v0.7.6"})
 
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli.authentication.http.urllib.request.build_opener"
         ) as mock_build_opener, patch(
             "specify_cli._version.shutil.which", return_value="uv"
@@ -562,7 +562,7 @@ class TestTokenScrubbing:
         monkeypatch.setenv("GitHub_Token", SENTINEL_GITHUB_TOKEN)
         response = mock_urlopen_response({"tag_name": "v0.7.6"})
 
-        with patch("specify_cli.authentication.http.urllib.request.urlopen") as mock_urlopen, patch(
+        with patch("specify_cli.authentication.http._urlopen") as mock_urlopen, patch(
             "specify_cli.authentication.http.urllib.request.build_opener"
         ) as mock_build_opener, patch(
             "specify_cli._version.shutil.which", return_value="uv"
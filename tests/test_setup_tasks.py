@@ -4,6 +4,7 @@ import json
 import os
 import shutil
 import subprocess
+import sys
 from pathlib import Path
  
 import pytest
@@ -602,6 +603,179 @@ def test_setup_tasks_bash_errors_without_feature_context(
     assert result.returncode != 0
     assert "Feature directory not found" in result.stderr
  
+def _install_specify_shim(tmp_path: Path, body: str) -> dict[str, str]:
+    """Put a fake ``specify`` on PATH, opt in to using it, and return the env."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    shim = bin_dir / "specify"
+    shim.write_text(f"#!/usr/bin/env bash\n{body}\n", encoding="utf-8")
+    shim.chmod(0o755)
+    env = _clean_env()
+    env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
+    env["SPECKIT_NATIVE_CLI"] = "1"
+    return env
+
+
+def _native_specify_env(tmp_path: Path) -> dict[str, str]:
+    """A ``specify`` on PATH that runs this checkout's CLI and logs each call."""
+    log = tmp_path / "specify-calls.log"
+    body = (
+        f'echo "$*" >> "{log}"\n'
+        f'PYTHONPATH="{PROJECT_ROOT / "src"}" exec "{sys.executable}" '
+        '-c "import sys; from specify_cli import main; sys.argv[0] = \'specify\'; main()" "$@"'
+    )
+    return _install_specify_shim(tmp_path, body)
+
+
+@requires_bash
+def test_setup_tasks_bash_uses_native_resolver(tasks_repo: Path, tmp_path: Path) -> None:
+    """
+    With SPECKIT_NATIVE_CLI=1, setup-tasks.sh resolves the template through a
+    single ``specify resolve`` call and gets the same answer as the shell lookup.
+    """
+    _minimal_feature(tasks_repo)
+    preset_dir = tasks_repo / ".specify" / "presets" / "test-preset" / "templates"
+    preset_dir.mkdir(parents=True, exist_ok=True)
+    preset_file = preset_dir / "tasks-template.md"
+    preset_file.write_text("# preset tasks template\n", encoding="utf-8")
+    (tasks_repo / ".specify" / "presets" / ".registry").write_text(
+        json.dumps({"presets": {"test-preset": {"priority": 1, "enabled": True}}}),
+        encoding="utf-8",
+    )
+    script = tasks_repo / ".specify" / "scripts" / "bash" / "setup-tasks.sh"
+
+    env = _native_specify_env(tmp_path)
+    result = subprocess.run(
+        ["bash", str(script), "--json"],
+        cwd=tasks_repo,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+
+    assert result.returncode == 0, result.stderr + result.stdout
+    data = json.loads(result.stdout)
+    assert Path(data["TASKS_TEMPLATE"]).resolve() == preset_file.resolve()
+    calls = (tmp_path / "specify-calls.log").read_text(encoding="utf-8").splitlines()
+    resolve_calls = [call for call in calls if call.startswith("resolve ")]
+    assert len(resolve_calls) == 1
+    assert resolve_calls[0].startswith("resolve tasks-template --root ")
+    assert resolve_calls[0].endswith("--project-only")
+
+
+@requires_bash
+def test_setup_tasks_bash_does_not_start_specify_by_default(
+    tasks_repo: Path, tmp_path: Path
+) -> None:
+    """Without SPECKIT_NATIVE_CLI=1 the shell lookup runs even with ``specify`` on PATH."""
+    _minimal_feature(tasks_repo)
+    preset_dir = tasks_repo / ".specify" / "presets" / "test-preset" / "templates"
+    preset_dir.mkdir(parents=True, exist_ok=True)
+    preset_file = preset_dir / "tasks-template.md"
+    preset_file.write_text("# preset tasks template\n", encoding="utf-8")
+    (tasks_repo / ".specify" / "presets" / ".registry").write_text(
+        json.dumps({"presets": {"test-preset": {"priority": 1, "enabled": True}}}),
+        encoding="utf-8",
+    )
+    script = tasks_repo / ".specify" / "scripts" / "bash" / "setup-tasks.sh"
+
+    env = _native_specify_env(tmp_path)
+    del env["SPECKIT_NATIVE_CLI"]
+    result = subprocess.run(
+        ["bash", str(script), "--json"],
+        cwd=tasks_repo,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+
+    assert result.returncode == 0, result.stderr + result.stdout
+    assert Path(json.loads(result.stdout)["TASKS_TEMPLATE"]).resolve() == preset_file.resolve()
+    assert not (tmp_path / "specify-calls.log").exists()
+
+
+@requires_bash
+def test_setup_tasks_bash_native_resolver_missing_template_errors(
+    tasks_repo: Path, tmp_path: Path
+) -> None:
+    """The native resolver ignores bundled templates, like the shell lookup."""
+    _minimal_feature(tasks_repo)
+    (tasks_repo / ".specify" / "templates" / "tasks-template.md").unlink()
+    script = tasks_repo / ".specify" / "scripts" / "bash" / "setup-tasks.sh"
+
+    result = subprocess.run(
+        ["bash", str(script), "--json"],
+        cwd=tasks_repo,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=_native_specify_env(tmp_path),
+    )
+
+    assert result.returncode != 0
+    assert "ERROR" in result.stderr
+    assert "tasks-template" in result.stderr
+
+
+@requires_bash
+def test_bash_resolve_template_content_uses_native_resolver(
+    tasks_repo: Path, tmp_path: Path
+) -> None:
+    """resolve_template_content returns the CLI output byte for byte."""
+    content = "# core\n\nbody\n\n"
+    (tasks_repo / ".specify" / "templates" / "tasks-template.md").write_text(
+        content, encoding="utf-8"
+    )
+    script = tasks_repo / ".specify" / "scripts" / "bash" / "common.sh"
+
+    result = subprocess.run(
+        [
+            "bash",
+            "-c",
+            'source "$1"; out=$(resolve_template_content tasks-template "$PWD"; printf x); printf "%s" "${out%x}"',
+            "bash",
+            str(script),
+        ],
+        cwd=tasks_repo,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=_native_specify_env(tmp_path),
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == content
+
+
+@requires_bash
+def test_setup_tasks_bash_falls_back_when_specify_lacks_resolve(
+    tasks_repo: Path, tmp_path: Path
+) -> None:
+    """
+    An older ``specify`` without the resolve command (usage error, exit 2)
+    must not break template lookup: the shell resolver takes over.
+    """
+    _minimal_feature(tasks_repo)
+    script = tasks_repo / ".specify" / "scripts" / "bash" / "setup-tasks.sh"
+
+    env = _install_specify_shim(tmp_path, "echo \"No such command\" >&2\nexit 2")
+    result = subprocess.run(
+        ["bash", str(script), "--json"],
+        cwd=tasks_repo,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+
+    assert result.returncode == 0, result.stderr + result.stdout
+    data = json.loads(result.stdout)
+    assert Path(data["TASKS_TEMPLATE"]).name == "tasks-template.md"
+    assert Path(data["TASKS_TEMPLATE"]).is_file()
+
+
 # ===========================================================================
 # POWERSHELL TESTS
 # ===========================================================================
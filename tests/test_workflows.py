@@ -428,6 +428,131 @@ class TestExpressions:
         result = evaluate_expression("RUN_ID={{ context.run_id }}", ctx)
         assert result == "RUN_ID=deadbeef"
 
+    def test_compiled_templates_are_cached(self):
+        from specify_cli.workflows.expressions import compile_template
+
+        template = "{{ steps.review.output.choice == 'edit' }}"
+        assert compile_template(template) is compile_template(template)
+
+    def test_compiled_template_evaluates_against_fresh_namespaces(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        template = "n={{ inputs.n }} m={{ inputs.missing }}"
+        assert evaluate_expression(template, StepContext(inputs={"n": 1})) == "n=1 m="
+        assert evaluate_expression(template, StepContext(inputs={"n": 2})) == "n=2 m="
+        # List literals are rebuilt per evaluation, never shared.
+        first = evaluate_expression("{{ [] }}", StepContext())
+        first.append("x")
+        assert evaluate_expression("{{ [] }}", StepContext()) == []
+
+    def test_literal_template_without_expressions(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        assert evaluate_expression("plain text", StepContext()) == "plain text"
+        assert evaluate_expression("", StepContext()) == ""
+
+    def test_operator_precedence_and_grouping(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        ctx = StepContext(inputs={"n": 5})
+        assert evaluate_expression("{{ true or false and false }}", ctx) is True
+        assert evaluate_expression("{{ (true or false) and false }}", ctx) is False
+        assert evaluate_expression("{{ not inputs.n > 10 }}", ctx) is True
+        # Filters bind tighter than comparisons.
+        assert evaluate_expression("{{ inputs.missing | default(7) > inputs.n }}", ctx) is True
+
+    def test_quoted_strings_containing_operators(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        ctx = StepContext(inputs={"mode": "a or b", "sep": "x"})
+        assert evaluate_expression("{{ inputs.mode == 'a or b' }}", ctx) is True
+        assert evaluate_expression("{{ inputs.sep == 'x' and 'y | z' }}", ctx) is True
+        assert evaluate_expression("{{ ['a|b', 'c,d'] | join(' + ') }}", ctx) == "a|b + c,d"
+        assert evaluate_expression("{{ inputs.missing | default('}}') }}", ctx) == "}}"
+
+    def test_boolean_operators_short_circuit(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        ctx = StepContext(inputs={"raw": "not json"})
+        assert evaluate_expression("{{ false and inputs.raw | from_json }}", ctx) is False
+        assert evaluate_expression("{{ true or inputs.raw | from_json }}", ctx) is True
+
+    def test_index_with_expression_and_key(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        ctx = StepContext(inputs={"items": ["a", "b"], "i": 1, "map": {"k": "v"}})
+        assert evaluate_expression("{{ inputs.items[inputs.i] }}", ctx) == "b"
+        assert evaluate_expression("{{ inputs.map['k'] }}", ctx) == "v"
+        assert evaluate_expression("{{ inputs.items[5] }}", ctx) is None
+
+    def test_adjacent_expressions_interpolate(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        ctx = StepContext(inputs={"a": 1, "b": 2})
+        assert evaluate_expression("{{ inputs.a }}-{{ inputs.b }}", ctx) == "1-2"
+
+    def test_syntax_errors_raise(self):
+        import pytest
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        for template in ("{{ (inputs.a }}", "{{ inputs.a inputs.b }}", "{{ a + 1 }}", "{{ x | map }}"):
+            with pytest.raises(ValueError, match="Invalid expression"):
+                evaluate_expression(template, StepContext())
+
+    def test_compiled_conditions_are_cached(self):
+        from specify_cli.workflows.expressions import compile_condition, evaluate_condition
+        from specify_cli.workflows.base import StepContext
+
+        condition = "{{ inputs.n >= 3 }}"
+        assert compile_condition(condition) is compile_condition(condition)
+        assert evaluate_condition(condition, StepContext(inputs={"n": 3})) is True
+        assert evaluate_condition(condition, StepContext(inputs={"n": 2})) is False
+        assert evaluate_condition("false", StepContext()) is False
+
+    def test_namespace_is_cached_per_context(self):
+        from specify_cli.workflows.expressions import _build_namespace, evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        ctx = StepContext()
+        namespace = _build_namespace(ctx)
+        assert _build_namespace(ctx) is namespace
+        assert evaluate_expression("{{ steps.a.output }}", ctx) is None
+        # In-place additions to the (initially empty) steps dict are seen.
+        ctx.steps["a"] = {"output": 1}
+        assert evaluate_expression("{{ steps.a.output }}", ctx) == 1
+        # Reassigned attributes invalidate the memoized entry.
+        ctx.item = "first"
+        assert evaluate_expression("{{ item }}", ctx) == "first"
+        ctx.item = "second"
+        assert evaluate_expression("{{ item }}", ctx) == "second"
+        ctx.run_id = "abc"
+        assert evaluate_expression("{{ context.run_id }}", ctx) == "abc"
+
+    def test_literal_templates_skip_namespace(self):
+        from specify_cli.workflows.expressions import evaluate_expression
+        from specify_cli.workflows.base import StepContext
+
+        ctx = StepContext()
+        assert evaluate_expression("no expressions here", ctx) == "no expressions here"
+        assert ctx._namespace is None
+
+    def test_namespace_for_plain_objects(self):
+        from types import SimpleNamespace
+        from specify_cli.workflows.expressions import evaluate_expression
+
+        ctx = SimpleNamespace(inputs={"x": 1})
+        assert evaluate_expression("{{ inputs.x }}", ctx) == 1
+        assert evaluate_expression("{{ steps }}", ctx) is None
+        assert evaluate_expression("{{ context.run_id }}", ctx) == ""
+
 
 # ===== Integration Dispatch Tests =====
 
@@ -1963,6 +2088,27 @@ steps:
         errors = validate_workflow(definition)
         assert any("lowercase alphanumeric" in e for e in errors)
 
+    def test_expression_syntax_errors(self):
+        from specify_cli.workflows.engine import WorkflowDefinition, validate_workflow
+
+        definition = WorkflowDefinition.from_string("""
+workflow:
+  id: "exprs"
+  name: "Test"
+  version: "1.0.0"
+steps:
+  - id: check
+    type: if
+    condition: "{{ (inputs.ready }}"
+    then:
+      - id: say
+        type: shell
+        run: "echo {{ inputs.name | }}"
+""")
+        errors = validate_workflow(definition)
+        assert any(e.startswith("Step 'check': Invalid expression") for e in errors)
+        assert any(e.startswith("Step 'say': Invalid expression") for e in errors)
+
     def test_no_steps(self):
         from specify_cli.workflows.engine import WorkflowDefinition, validate_workflow
 
@@ -3068,6 +3214,373 @@ steps:
 # and abort the run.
 
 
+class TestFanOutConcurrency:
+    """Test concurrent fan-out execution honouring ``max_concurrency``."""
+
+    @staticmethod
+    def _definition(max_concurrency, items):
+        from specify_cli.workflows.engine import WorkflowDefinition
+
+        return WorkflowDefinition.from_string(f"""
+schema_version: "1.0"
+workflow:
+  id: "fan-out-pool"
+  name: "Fan Out Pool"
+  version: "1.0.0"
+steps:
+  - id: seed
+    type: seed
+    values: {json.dumps(items)}
+  - id: fan
+    type: fan-out
+    items: "{{{{ steps.seed.output.values }}}}"
+    max_concurrency: {max_concurrency}
+    step:
+      id: work
+      type: probe
+      value: "{{{{ item }}}}"
+""")
+
+    @staticmethod
+    def _register_probe(monkeypatch, execute):
+        from specify_cli.workflows import STEP_REGISTRY
+        from specify_cli.workflows.base import StepBase, StepResult
+
+        class SeedStep(StepBase):
+            type_key = "seed"
+
+            def execute(self, config, context):
+                return StepResult(output={"values": config["values"]})
+
+        class ProbeStep(StepBase):
+            type_key = "probe"
+
+            def execute(self, config, context):
+                return execute(config, context)
+
+        monkeypatch.setitem(STEP_REGISTRY, "seed", SeedStep())
+        monkeypatch.setitem(STEP_REGISTRY, "probe", ProbeStep())
+
+    def test_items_run_concurrently(self, project_dir, monkeypatch):
+        """Three items meet at a barrier, which only succeeds if all three
+        are in flight at once."""
+        import threading
+        from specify_cli.workflows.base import RunStatus, StepResult
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        barrier = threading.Barrier(3, timeout=10)
+
+        def execute(config, context):
+            barrier.wait()
+            return StepResult(output={"item": context.item})
+
+        self._register_probe(monkeypatch, execute)
+        definition = self._definition(3, [1, 2, 3])
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.COMPLETED
+        results = state.step_results["fan"]["output"]["results"]
+        assert results == [{"item": 1}, {"item": 2}, {"item": 3}]
+
+    def test_concurrency_is_bounded_and_results_ordered(
+        self, project_dir, monkeypatch
+    ):
+        import threading
+        import time
+        from specify_cli.workflows.base import RunStatus, StepResult
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def execute(config, context):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            # Later items finish first so completion order differs from
+            # item order.
+            time.sleep(0.01 * (6 - context.item))
+            with lock:
+                active[0] -= 1
+            return StepResult(output={"item": context.item})
+
+        self._register_probe(monkeypatch, execute)
+        definition = self._definition(2, [1, 2, 3, 4, 5])
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.COMPLETED
+        assert peak[0] <= 2
+        results = state.step_results["fan"]["output"]["results"]
+        assert [r["item"] for r in results] == [1, 2, 3, 4, 5]
+        for idx in range(5):
+            assert f"fan:work:{idx}" in state.step_results
+
+    def test_failure_stops_pending_items(self, project_dir, monkeypatch):
+        import time
+        from specify_cli.workflows.base import RunStatus, StepResult, StepStatus
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        def execute(config, context):
+            if context.item == 1:
+                return StepResult(status=StepStatus.FAILED, error="boom")
+            time.sleep(0.05)
+            return StepResult(output={"item": context.item})
+
+        self._register_probe(monkeypatch, execute)
+        definition = self._definition(2, list(range(20)))
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.FAILED
+        results = state.step_results["fan"]["output"]["results"]
+        # Results stop at the failing item, as in a sequential run.
+        assert len(results) == 2
+        assert state.step_results["fan:work:1"]["status"] == "failed"
+        assert "fan:work:19" not in state.step_results
+
+    def test_abort_takes_precedence_by_item_order(self, project_dir, monkeypatch):
+        """The first stopping item in item order decides the run status."""
+        import threading
+        from specify_cli.workflows.base import RunStatus, StepResult, StepStatus
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        barrier = threading.Barrier(2, timeout=10)
+
+        def execute(config, context):
+            barrier.wait()
+            if context.item == 0:
+                return StepResult(
+                    status=StepStatus.FAILED, output={"aborted": True}
+                )
+            return StepResult(status=StepStatus.PAUSED)
+
+        self._register_probe(monkeypatch, execute)
+        definition = self._definition(2, [0, 1])
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.ABORTED
+
+    def test_item_context_is_isolated(self, project_dir, monkeypatch):
+        import threading
+        from specify_cli.workflows.base import RunStatus, StepResult
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        barrier = threading.Barrier(4, timeout=10)
+
+        def execute(config, context):
+            before = context.item
+            barrier.wait()
+            return StepResult(output={"before": before, "after": context.item})
+
+        self._register_probe(monkeypatch, execute)
+        definition = self._definition(4, ["a", "b", "c", "d"])
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.COMPLETED
+        for result in state.step_results["fan"]["output"]["results"]:
+            assert result["before"] == result["after"]
+
+    def test_validate_rejects_non_positive_max_concurrency(self):
+        from specify_cli.workflows.steps.fan_out import FanOutStep
+
+        step = FanOutStep()
+        for bad in (0, -1, "3", True):
+            errors = step.validate({
+                "id": "fan",
+                "items": "{{ x }}",
+                "max_concurrency": bad,
+                "step": {"id": "impl", "command": "speckit.implement"},
+            })
+            assert any("'max_concurrency'" in e for e in errors)
+
+
+class TestDagExecution:
+    """Test opt-in dependency-graph execution (``execution: dag``)."""
+
+    @staticmethod
+    def _register_probe(monkeypatch, execute):
+        from specify_cli.workflows import STEP_REGISTRY
+        from specify_cli.workflows.base import StepBase
+
+        class ProbeStep(StepBase):
+            type_key = "probe"
+
+            def execute(self, config, context):
+                return execute(config, context)
+
+        monkeypatch.setitem(STEP_REGISTRY, "probe", ProbeStep())
+
+    def test_step_dependencies_inferred(self):
+        from specify_cli.workflows.engine import step_dependencies
+
+        steps = [
+            {"id": "plan", "type": "probe"},
+            {"id": "check", "type": "if", "condition": "{{ inputs.x }}",
+             "then": [{"id": "nested", "type": "probe"}]},
+            {"id": "analyze", "type": "probe",
+             "input": {"args": "{{ steps.plan.output.file }}"}},
+            {"id": "report", "type": "probe", "depends_on": ["analyze"],
+             "message": "{{ steps.nested.output.value }} {{ steps.report.x }}"},
+            {"id": "collect", "type": "fan-in", "wait_for": ["analyze", "report"]},
+        ]
+        graph = step_dependencies(steps)
+        assert graph == {
+            "plan": [],
+            "check": [],
+            "analyze": ["plan"],
+            "report": ["analyze", "check"],
+            "collect": ["analyze", "report"],
+        }
+
+    def test_validate_dag_errors(self):
+        from specify_cli.workflows.engine import WorkflowDefinition, validate_workflow
+
+        definition = WorkflowDefinition.from_string("""
+schema_version: "1.0"
+workflow:
+  id: "dag"
+  name: "DAG"
+  version: "1.0.0"
+  execution: dag
+steps:
+  - id: a
+    type: shell
+    run: "echo {{ steps.b.output.stdout }}"
+  - id: b
+    type: shell
+    run: "echo b"
+    depends_on: [a]
+  - id: c
+    type: shell
+    run: "echo c"
+    depends_on: [missing]
+""")
+        errors = validate_workflow(definition)
+        assert any("unknown top-level step 'missing'" in e for e in errors)
+        assert any("Circular step dependencies" in e for e in errors)
+
+    def test_validate_execution_and_depends_on_types(self):
+        from specify_cli.workflows.engine import WorkflowDefinition, validate_workflow
+
+        definition = WorkflowDefinition.from_string("""
+schema_version: "1.0"
+workflow:
+  id: "dag"
+  name: "DAG"
+  version: "1.0.0"
+  execution: parallel
+  max_concurrency: 0
+steps:
+  - id: a
+    type: shell
+    run: "echo a"
+    depends_on: a
+""")
+        errors = validate_workflow(definition)
+        assert any("Invalid workflow.execution 'parallel'" in e for e in errors)
+        assert any("max_concurrency must be a positive integer" in e for e in errors)
+        assert any("'depends_on' must be a list" in e for e in errors)
+
+    def test_independent_steps_run_in_parallel(self, project_dir, monkeypatch):
+        """analyze and checklist meet at a barrier, which only succeeds if
+        both run at once; fan-in then sees both results."""
+        import threading
+        from specify_cli.workflows.base import RunStatus, StepResult
+        from specify_cli.workflows.engine import WorkflowDefinition, WorkflowEngine
+
+        barrier = threading.Barrier(2, timeout=10)
+        order = []
+
+        def execute(config, context):
+            if config["id"] != "plan":
+                assert "plan" in context.steps
+                barrier.wait()
+            order.append(config["id"])
+            return StepResult(output={"name": config["id"]})
+
+        self._register_probe(monkeypatch, execute)
+        definition = WorkflowDefinition.from_string("""
+schema_version: "1.0"
+workflow:
+  id: "dag"
+  name: "DAG"
+  version: "1.0.0"
+  execution: dag
+steps:
+  - id: collect
+    type: fan-in
+    wait_for: [analyze, checklist]
+  - id: analyze
+    type: probe
+    depends_on: [plan]
+  - id: checklist
+    type: probe
+    args: "{{ steps.plan.output.name }}"
+  - id: plan
+    type: probe
+""")
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.COMPLETED
+        assert order[0] == "plan"
+        assert state.step_results["collect"]["output"]["results"] == [
+            {"name": "analyze"},
+            {"name": "checklist"},
+        ]
+        assert sorted(state.completed_steps) == [
+            "analyze", "checklist", "collect", "plan",
+        ]
+
+    def test_failure_blocks_dependants_and_resume_skips_completed(
+        self, project_dir, monkeypatch
+    ):
+        from specify_cli.workflows.base import RunStatus, StepResult, StepStatus
+        from specify_cli.workflows.engine import WorkflowDefinition, WorkflowEngine
+
+        calls = []
+        fail = {"flaky": True}
+
+        def execute(config, context):
+            calls.append(config["id"])
+            if fail.get(config["id"]):
+                return StepResult(status=StepStatus.FAILED, error="boom")
+            return StepResult(output={"ok": True})
+
+        self._register_probe(monkeypatch, execute)
+        definition = WorkflowDefinition.from_string("""
+schema_version: "1.0"
+workflow:
+  id: "dag-resume"
+  name: "DAG Resume"
+  version: "1.0.0"
+  execution: dag
+  max_concurrency: 1
+steps:
+  - id: first
+    type: probe
+  - id: flaky
+    type: probe
+    depends_on: [first]
+  - id: last
+    type: probe
+    depends_on: [flaky]
+""")
+        engine = WorkflowEngine(project_dir)
+        state = engine.execute(definition)
+
+        assert state.status == RunStatus.FAILED
+        assert calls == ["first", "flaky"]
+        assert state.completed_steps == ["first"]
+
+        fail["flaky"] = False
+        calls.clear()
+        resumed = engine.resume(state.run_id)
+
+        assert resumed.status == RunStatus.COMPLETED
+        assert calls == ["flaky", "last"]
+        assert resumed.completed_steps == ["first", "flaky", "last"]
+
+
 class TestContinueOnError:
     """Test the `continue_on_error` step-level field."""
 
@@ -3506,6 +4019,173 @@ class TestRunState:
         assert entry["event"] == "test_event"
         assert "timestamp" in entry
 
+    def test_running_saves_append_journal_deltas(self, project_dir):
+        from specify_cli.workflows.engine import RunState
+        from specify_cli.workflows.base import RunStatus
+
+        state = RunState(run_id="journal", workflow_id="wf", project_root=project_dir)
+        state.status = RunStatus.RUNNING
+        state.save()
+        snapshot = (state.runs_dir / "state.json").read_text(encoding="utf-8")
+
+        state.record_step("one", {"status": "completed", "output": {"n": 1}})
+        state.save()
+        state.record_step("two", {"status": "completed", "output": {"n": 2}})
+        state.current_step_index = 2
+        state.save()
+
+        # The snapshot is untouched; each record carries only its delta.
+        assert (state.runs_dir / "state.json").read_text(encoding="utf-8") == snapshot
+        lines = (state.runs_dir / "journal.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [list(json.loads(line)["step_results"]) for line in lines] == [
+            ["one"], ["two"],
+        ]
+
+        loaded = RunState.load("journal", project_dir)
+        assert loaded.current_step_index == 2
+        assert loaded.step_results["one"]["output"] == {"n": 1}
+        assert loaded.step_results["two"]["output"] == {"n": 2}
+
+    def test_journal_compacts_at_threshold_and_on_status_change(
+        self, project_dir, monkeypatch
+    ):
+        from specify_cli.workflows.engine import RunState
+        from specify_cli.workflows.base import RunStatus
+
+        monkeypatch.setattr(RunState, "JOURNAL_COMPACT_THRESHOLD", 3)
+        state = RunState(run_id="compact", workflow_id="wf", project_root=project_dir)
+        state.status = RunStatus.RUNNING
+        state.save()
+        journal = state.runs_dir / "journal.jsonl"
+
+        for idx in range(3):
+            state.record_step(f"s{idx}", {"status": "completed"})
+            state.save()
+        assert len(journal.read_text(encoding="utf-8").splitlines()) == 3
+
+        state.record_step("s3", {"status": "completed"})
+        state.save()
+        assert not journal.exists()
+        snapshot = json.loads((state.runs_dir / "state.json").read_text(encoding="utf-8"))
+        assert list(snapshot["step_results"]) == ["s0", "s1", "s2", "s3"]
+
+        state.record_step("s4", {"status": "completed"})
+        state.save()
+        assert journal.exists()
+        state.status = RunStatus.COMPLETED
+        state.save()
+        assert not journal.exists()
+        loaded = RunState.load("compact", project_dir)
+        assert loaded.status == RunStatus.COMPLETED
+        assert "s4" in loaded.step_results
+
+    def test_load_ignores_torn_and_stale_journal_records(self, project_dir):
+        from specify_cli.workflows.engine import RunState
+        from specify_cli.workflows.base import RunStatus
+
+        state = RunState(run_id="torn", workflow_id="wf", project_root=project_dir)
+        state.status = RunStatus.RUNNING
+        state.save()
+        state.record_step("one", {"status": "completed"})
+        state.save()
+        journal = state.runs_dir / "journal.jsonl"
+        stale = journal.read_text(encoding="utf-8")
+
+        # A record written before the latest snapshot must not be replayed
+        # even if the journal survived compaction.
+        state.status = RunStatus.PAUSED
+        state.save()
+        journal.write_text(stale + '{"journal_seq": 9, "status": "fa', encoding="utf-8")
+
+        loaded = RunState.load("torn", project_dir)
+        assert loaded.status == RunStatus.PAUSED
+        assert "one" in loaded.step_results
+
+    def test_log_flush_policy_and_in_memory_copy(self, project_dir):
+        from specify_cli.workflows.engine import RunState
+        from specify_cli.workflows.base import RunStatus
+
+        state = RunState(run_id="log-buffer", workflow_id="wf", project_root=project_dir)
+        state.configure_log(flush=3, keep_in_memory=False)
+        log_file = state.runs_dir / "log.jsonl"
+
+        state.append_log({"event": "one"})
+        state.append_log({"event": "two"})
+        assert not log_file.exists() or log_file.read_text(encoding="utf-8") == ""
+        state.append_log({"event": "three"})
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 3
+        assert state.log_entries == []
+
+        # Leaving the running status flushes whatever is buffered.
+        state.append_log({"event": "four"})
+        state.status = RunStatus.COMPLETED
+        state.save()
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 4
+
+    def test_log_rotation_and_tail(self, project_dir):
+        from specify_cli.workflows.engine import RunState, iter_run_log, tail_run_log
+
+        state = RunState(run_id="log-rotate", workflow_id="wf", project_root=project_dir)
+        state.configure_log(max_bytes=300, backup_count=2)
+        for idx in range(30):
+            state.append_log({"event": "tick", "n": idx})
+
+        runs_dir = state.runs_dir
+        assert (runs_dir / "log.jsonl.1").exists()
+        assert (runs_dir / "log.jsonl.2").exists()
+        assert not (runs_dir / "log.jsonl.3").exists()
+        for path in runs_dir.glob("log.jsonl*"):
+            assert path.stat().st_size <= 300
+
+        streamed = [entry["n"] for entry in iter_run_log(runs_dir)]
+        assert streamed == sorted(streamed)
+        assert streamed[-1] == 29
+
+        # Tail spans rotated files when the current one is too short.
+        tail = [entry["n"] for entry in tail_run_log(runs_dir, 5)]
+        assert tail == [25, 26, 27, 28, 29]
+        wide = [entry["n"] for entry in tail_run_log(runs_dir, len(streamed))]
+        assert wide == streamed
+        assert tail_run_log(runs_dir, 0) == []
+
+    def test_validate_log_options(self):
+        from specify_cli.workflows.engine import WorkflowDefinition, validate_workflow
+
+        definition = WorkflowDefinition.from_string("""
+schema_version: "1.0"
+workflow:
+  id: "logged"
+  name: "Logged"
+  version: "1.0.0"
+  log:
+    flush: sometimes
+    max_bytes: -1
+    keep_in_memory: "no"
+    colour: red
+steps:
+  - id: a
+    type: shell
+    run: "echo a"
+""")
+        errors = validate_workflow(definition)
+        assert any("workflow.log.flush" in e for e in errors)
+        assert any("workflow.log.max_bytes" in e for e in errors)
+        assert any("workflow.log.keep_in_memory" in e for e in errors)
+        assert any("Unknown workflow.log option 'colour'" in e for e in errors)
+
+    def test_list_runs_replays_journal(self, project_dir):
+        from specify_cli.workflows.engine import RunState, WorkflowEngine
+        from specify_cli.workflows.base import RunStatus
+
+        state = RunState(run_id="listed", workflow_id="wf", project_root=project_dir)
+        state.status = RunStatus.RUNNING
+        state.save()
+        state.current_step_id = "later"
+        state.save()
+
+        runs = WorkflowEngine(project_dir).list_runs()
+        assert runs[0]["current_step_id"] == "later"
+
 
 class TestListRuns:
     """Test listing workflow runs."""
@@ -3718,6 +4398,19 @@ class TestWorkflowCatalog:
         with pytest.raises(WorkflowValidationError, match="expected a mapping"):
             catalog.get_active_catalogs()
 
+    def test_load_catalog_config_rejects_max_stale(self, project_dir):
+        from specify_cli.workflows.catalog import WorkflowCatalog, WorkflowValidationError
+
+        config_path = project_dir / ".specify" / "workflow-catalogs.yml"
+        config_path.write_text(
+            yaml.dump({"catalogs": [{"url": "https://example.com/c.json", "max_stale": 60}]}),
+            encoding="utf-8",
+        )
+
+        catalog = WorkflowCatalog(project_dir)
+        with pytest.raises(WorkflowValidationError, match="max_stale is not supported"):
+            catalog.get_active_catalogs()
+
     def test_add_catalog_malformed_yaml_raises(self, project_dir):
         """A malformed YAML config file must raise WorkflowValidationError when adding a catalog."""
         from specify_cli.workflows.catalog import WorkflowCatalog, WorkflowValidationError
@@ -3779,6 +4472,60 @@ class TestWorkflowCatalog:
         with pytest.raises(WorkflowValidationError, match="Failed to write catalog config"):
             catalog.remove_catalog(0)
 
+    def test_expired_cache_is_revalidated_with_etag(self, project_dir):
+        """A 304 answer re-serves the cached catalog and bumps fetched_at."""
+        import time
+        import urllib.error
+        from unittest.mock import patch
+        from specify_cli.workflows.catalog import WorkflowCatalog, WorkflowCatalogEntry
+
+        catalog = WorkflowCatalog(project_dir)
+        entry = WorkflowCatalogEntry(
+            url="https://example.com/catalog.json", name="c", priority=1, install_allowed=True
+        )
+
+        class FakeResponse:
+            headers = {"ETag": '"v1"', "Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+
+            def read(self):
+                return json.dumps({"workflows": {"wf": {"name": "WF"}}}).encode()
+
+            def geturl(self):
+                return entry.url
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *a):
+                return False
+
+        sent_headers = []
+
+        def fake_open_url(url, timeout=None, extra_headers=None):
+            sent_headers.append(extra_headers)
+            if extra_headers:
+                raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+            return FakeResponse()
+
+        with patch("specify_cli.authentication.http.open_url", side_effect=fake_open_url):
+            first = catalog._fetch_single_catalog(entry)
+            _, meta_file = catalog._get_cache_paths(entry.url)
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            assert meta["etag"] == '"v1"'
+            # Expire the cache.
+            meta["fetched_at"] = time.time() - catalog.CACHE_DURATION - 1
+            meta_file.write_text(json.dumps(meta), encoding="utf-8")
+
+            second = catalog._fetch_single_catalog(entry)
+
+        assert second == first == {"workflows": {"wf": {"name": "WF"}}}
+        assert sent_headers == [
+            None,
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Tue, 01 Sep 2026 00:00:00 GMT"},
+        ]
+        assert catalog._is_url_cache_valid(entry.url)
+        assert json.loads(meta_file.read_text(encoding="utf-8"))["etag"] == '"v1"'
+
 
 # ===== Integration Test =====
 
@@ -4907,6 +5654,24 @@ steps:
         )
         assert any(r["run_id"] == rid for r in listing["runs"])
 
+    def test_status_tail_includes_recent_log_events(self, project_dir):
+        wf = self._write_wf(project_dir, self._WF_DONE, "tailed")
+        rid = json.loads(
+            self._invoke(project_dir, ["workflow", "run", str(wf), "--json"]).stdout
+        )["run_id"]
+
+        single = json.loads(
+            self._invoke(
+                project_dir, ["workflow", "status", rid, "--json", "--tail", "2"]
+            ).stdout
+        )
+        assert [e["event"] for e in single["log"]] == [
+            "step_completed", "workflow_finished",
+        ]
+
+        text = self._invoke(project_dir, ["workflow", "status", rid, "--tail", "1"])
+        assert "workflow_finished" in text.stdout
+
     def test_resume_json(self, project_dir):
         wf = self._write_wf(project_dir, self._WF, "gated3")
         rid = json.loads(